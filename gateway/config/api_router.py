@@ -8,6 +8,7 @@ from sds_gateway.api_methods.views.dataset_endpoints import DatasetViewSet
 from sds_gateway.api_methods.views.federation_endpoints import FederationViewSet
 from sds_gateway.api_methods.views.file_endpoints import FileViewSet
 from sds_gateway.api_methods.views.file_endpoints import check_contents_exist
+from sds_gateway.api_methods.views.file_endpoints import check_contents_exist_batch
 from sds_gateway.users.api.views import UserViewSet
 from sds_gateway.visualizations.api_views import VisualizationViewSet
 
@@ -31,4 +32,9 @@ urlpatterns = [
         check_contents_exist,
         name="check_contents_exist",
     ),
+    path(
+        "assets/utils/check_contents_exist_batch/",
+        check_contents_exist_batch,
+        name="check_contents_exist_batch",
+    ),
 ]
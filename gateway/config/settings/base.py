@@ -210,6 +210,38 @@ OBJECT_STORE_DUAL_WRITE_STRICT: bool = env.bool(
     default=False,
 )
 
+# presigned transfers: SDK clients move file contents directly to/from the primary
+#   store using short-lived URLs signed for PRESIGNED_S3_ENDPOINT_URL, which must
+#   be reachable by clients (unlike the docker-internal PRIMARY_S3_ENDPOINT_URL)
+PRESIGNED_TRANSFERS_ENABLED: bool = env.bool(
+    "PRESIGNED_TRANSFERS_ENABLED",
+    default=False,
+)
+PRESIGNED_S3_ENDPOINT_URL: str = env.str(
+    "PRESIGNED_S3_ENDPOINT_URL",
+    default=PRIMARY_S3_ENDPOINT_URL,
+)
+PRESIGNED_URL_EXPIRY_SECONDS: int = env.int(
+    "PRESIGNED_URL_EXPIRY_SECONDS",
+    default=15 * 60,
+)
+
+# chunked upload sessions: large files are uploaded in parts written to an S3
+#   multipart upload in the primary store, so failed uploads can resume. Parts
+#   are buffered in memory while uploaded, and must be at least 5 MiB in S3.
+UPLOAD_SESSIONS_ENABLED: bool = env.bool(
+    "UPLOAD_SESSIONS_ENABLED",
+    default=True,
+)
+UPLOAD_SESSION_PART_SIZE: int = env.int(
+    "UPLOAD_SESSION_PART_SIZE",
+    default=64 * 1024 * 1024,  # 64 MiB
+)
+UPLOAD_SESSION_EXPIRY_SECONDS: int = env.int(
+    "UPLOAD_SESSION_EXPIRY_SECONDS",
+    default=24 * 60 * 60,
+)
+
 # keep AWS_* aliases mapped to primary store for backward compatibility
 # django-storages expects these values
 AWS_S3_ACCESS_KEY_ID: str = PRIMARY_ACCESS_KEY_ID
@@ -416,6 +448,16 @@ DRF_CACHE_DIR: str = env.str(
     "DRF_CACHE_DIR",
     default=str(BASE_DIR / "cache" / "drf"),
 )
+# least recently used captures are evicted above this size (default: 50 GiB)
+DRF_CACHE_MAX_BYTES: int = env.int("DRF_CACHE_MAX_BYTES", default=50 * 1024**3)
+# processes computing chunks of spectrograms; keep at 1 in daemonic (prefork)
+#   celery workers, which cannot start child processes
+SPECTROGRAM_MAX_WORKERS: int = env.int("SPECTROGRAM_MAX_WORKERS", default=1)
+# processes reading segments of captures in single-pass post-processing; 0 uses
+#   the cores of the worker (segments are processed in daemonic workers themselves)
+POST_PROCESSING_MAX_WORKERS: int = env.int("POST_PROCESSING_MAX_WORKERS", default=0)
+# DigitalRF readers kept open per process for streamed slice requests; 0 disables
+DRF_READER_POOL_SIZE: int = env.int("DRF_READER_POOL_SIZE", default=8)
 
 # TEMPLATES
 # ------------------------------------------------------------------------------
@@ -576,6 +618,16 @@ CELERY_BEAT_SCHEDULE: dict[str, dict[str, Any]] = {
         "schedule": crontab(hour="2", minute="0"),  # Run daily at 2:00 AM
         "options": {"expires": 3600},  # Task expires after 1 hour
     },
+    "cleanup-expired-presigned-uploads": {
+        "task": "sds_gateway.api_methods.tasks.cleanup_expired_presigned_uploads",
+        "schedule": crontab(hour=4, minute=30),  # Run daily at 4:30 AM
+        "options": {"expires": 3600},  # Task expires after 1 hour
+    },
+    "cleanup-expired-upload-sessions": {
+        "task": "sds_gateway.api_methods.tasks.cleanup_expired_upload_sessions",
+        "schedule": crontab(hour=4, minute=0),  # Run daily at 4:00 AM
+        "options": {"expires": 3600},  # Task expires after 1 hour
+    },
     "cleanup-orphaned-zip-files": {
         "task": "sds_gateway.api_methods.tasks.cleanup_orphaned_zip_files",
         "schedule": crontab(hour=3, minute=0),  # Run daily at 3:00 AM
@@ -227,6 +227,50 @@ class TemporaryZipFileAdmin(admin.ModelAdmin):  # pyright: ignore[reportMissingT
         return super().get_queryset(request).select_related("owner")
 
 
+@admin.register(models.FileUploadSession)
+class FileUploadSessionAdmin(admin.ModelAdmin):  # pyright: ignore[reportMissingTypeArgument]
+    list_display = (
+        "uuid",
+        "owner",
+        "formatted_size",
+        "status",
+        "created_at",
+        "expires_at",
+    )
+    search_fields = ("uuid", "owner__email", "sum_blake3")
+    list_filter = ("status",)
+    ordering = ("-created_at",)
+
+    @admin.display(description="Size", ordering="size")
+    def formatted_size(self, obj):
+        return format_file_size(obj.size)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("owner")
+
+
+@admin.register(models.PresignedUpload)
+class PresignedUploadAdmin(admin.ModelAdmin):  # pyright: ignore[reportMissingTypeArgument]
+    list_display = (
+        "uuid",
+        "owner",
+        "formatted_size",
+        "is_deleted",
+        "created_at",
+        "expires_at",
+    )
+    search_fields = ("uuid", "owner__email", "sum_blake3")
+    list_filter = ("is_deleted",)
+    ordering = ("-created_at",)
+
+    @admin.display(description="Size", ordering="size")
+    def formatted_size(self, obj):
+        return format_file_size(obj.size)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("owner")
+
+
 @admin.register(models.UserSharePermission)
 class UserSharePermissionAdmin(admin.ModelAdmin):  # pyright: ignore[reportMissingTypeArgument]
     list_display = (
@@ -0,0 +1,252 @@
+"""Bulk loading of the rows related to captures, for serializing many at once.
+
+`CaptureGetSerializer` needs, for each capture, its share permissions, datasets,
+files and file summary. Loading them per capture costs a dozen queries per row;
+`load_capture_bulk_data` loads them for a page of captures in a fixed number of
+queries, whatever the size of the page.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+from django.db.models import Count
+from django.db.models import Exists
+from django.db.models import OuterRef
+from django.db.models import Prefetch
+from django.db.models import Q
+from django.db.models import Sum
+from django.db.models import prefetch_related_objects
+
+from sds_gateway.api_methods.models import DRF_RF_FILENAME_REGEX_STR
+from sds_gateway.api_methods.models import Capture
+from sds_gateway.api_methods.models import CaptureType
+from sds_gateway.api_methods.models import Dataset
+from sds_gateway.api_methods.models import File
+from sds_gateway.api_methods.models import ItemType
+from sds_gateway.api_methods.models import UserSharePermission
+from sds_gateway.visualizations.models import PostProcessedData
+
+# serializer context key of the bulk data of the captures being serialized
+CAPTURE_BULK_DATA_KEY = "capture_bulk_data"
+
+# ordering of post-processed data in capture payloads
+POST_PROCESSED_DATA_ORDERING = ("processing_type", "-created_at")
+
+_CaptureFiles = File.captures.through
+_CaptureDatasets = Capture.datasets.through
+
+
+@dataclass
+class CaptureBulkData:
+    """Rows related to captures, by capture UUID (see `load_capture_bulk_data`).
+
+    Only the captures in `capture_uuids` were loaded: others have no entries.
+    """
+
+    capture_uuids: set[str] = field(default_factory=set)
+    # enabled share permissions, ordered by primary key
+    share_permissions: dict[str, list[UserSharePermission]] = field(
+        default_factory=dict
+    )
+    datasets: dict[str, list[Dataset]] = field(default_factory=dict)
+    # None when files were not loaded
+    files: dict[str, list[File]] | None = None
+
+    def covers(self, capture: Capture) -> bool:
+        """Whether the rows of this capture were loaded."""
+        return str(capture.uuid) in self.capture_uuids
+
+
+def _group_by_capture(pairs: Any) -> dict[str, list[Any]]:
+    """Lists of related rows by capture UUID, from (capture UUID, row) pairs."""
+    grouped: dict[str, list[Any]] = {}
+    seen: set[tuple[str, Any]] = set()
+    for capture_uuid, row in pairs:
+        key = (str(capture_uuid), row.pk)
+        if key in seen:
+            continue
+        seen.add(key)
+        grouped.setdefault(str(capture_uuid), []).append(row)
+    return grouped
+
+
+def _load_datasets(captures: Sequence[Capture]) -> dict[str, list[Dataset]]:
+    """Non-deleted datasets of captures, linked by M2M or FK."""
+    links = _CaptureDatasets.objects.filter(
+        capture_id__in=[capture.pk for capture in captures],
+        dataset__is_deleted=False,
+    ).select_related("dataset")
+    fk_datasets = Dataset.objects.in_bulk(
+        {capture.dataset_id for capture in captures if capture.dataset_id},
+    )
+    return _group_by_capture(
+        [
+            *((link.capture_id, link.dataset) for link in links),
+            *(
+                (capture.pk, fk_datasets[capture.dataset_id])
+                for capture in captures
+                if capture.dataset_id in fk_datasets
+                and not fk_datasets[capture.dataset_id].is_deleted
+            ),
+        ]
+    )
+
+
+def _load_files(captures: Sequence[Capture]) -> dict[str, list[File]]:
+    """Non-deleted files of captures, linked by M2M or FK."""
+    capture_ids = [capture.pk for capture in captures]
+    links = _CaptureFiles.objects.filter(
+        capture_id__in=capture_ids,
+        file__is_deleted=False,
+    ).select_related("file")
+    fk_files = File.objects.filter(capture_id__in=capture_ids, is_deleted=False)
+    return _group_by_capture(
+        [
+            *((link.capture_id, link.file) for link in links),
+            *((file.capture_id, file) for file in fk_files),
+        ]
+    )
+
+
+def _set_files_summaries(captures: Sequence[Capture]) -> None:
+    """Cache the file statistics of captures on them, with one GROUP BY per link.
+
+    Files linked by both M2M and FK are counted once, with the M2M links.
+    """
+    capture_ids = [capture.pk for capture in captures]
+
+    def aggregates(prefix: str) -> dict[str, Any]:
+        data_file = Q(**{f"{prefix}name__regex": DRF_RF_FILENAME_REGEX_STR})
+        return {
+            "total_count": Count(f"{prefix}pk"),
+            "total_size": Sum(f"{prefix}size"),
+            "data_count": Count(f"{prefix}pk", filter=data_file),
+            "data_size": Sum(f"{prefix}size", filter=data_file),
+        }
+
+    m2m_rows = (
+        _CaptureFiles.objects.filter(capture_id__in=capture_ids, file__is_deleted=False)
+        .values("capture_id")
+        .annotate(**aggregates("file__"))
+        .order_by()
+    )
+    fk_rows = (
+        File.objects.filter(capture_id__in=capture_ids, is_deleted=False)
+        .filter(
+            ~Exists(
+                _CaptureFiles.objects.filter(
+                    file_id=OuterRef("pk"), capture_id=OuterRef("capture_id")
+                )
+            )
+        )
+        .values("capture_id")
+        .annotate(**aggregates(""))
+        .order_by()
+    )
+    stats: dict[str, dict[str, int]] = {}
+    for row in [*m2m_rows, *fk_rows]:
+        capture_stats = stats.setdefault(
+            str(row["capture_id"]),
+            dict.fromkeys(("total_count", "total_size", "data_count", "data_size"), 0),
+        )
+        for key, value in capture_stats.items():
+            capture_stats[key] = value + int(row[key] or 0)
+
+    for capture in captures:
+        for cache_name in ("_files_summary_cache", "_drf_data_files_stats_cache"):
+            if hasattr(capture, cache_name):
+                delattr(capture, cache_name)
+        capture_stats = stats.get(str(capture.pk), {})
+        capture._capture_files_stats_cache = {  # noqa: SLF001
+            "total_count": capture_stats.get("total_count", 0),
+            "total_size": capture_stats.get("total_size", 0),
+        }
+        if capture.capture_type == CaptureType.DigitalRF:
+            capture._drf_data_files_stats_cache = {  # noqa: SLF001
+                "total_count": capture_stats.get("data_count", 0),
+                "total_size": capture_stats.get("data_size", 0),
+            }
+
+
+def _set_multi_channel(captures: Sequence[Capture]) -> None:
+    """Cache whether DigitalRF captures are multi-channel on them, in one query."""
+    drf_captures = [
+        capture
+        for capture in captures
+        if capture.capture_type == CaptureType.DigitalRF
+        and capture.owner_id is not None
+    ]
+    if not drf_captures:
+        return
+    counts = {
+        (row["owner_id"], row["top_level_dir"]): row["count"]
+        for row in Capture.objects.filter(
+            capture_type=CaptureType.DigitalRF,
+            is_deleted=False,
+            owner_id__in={capture.owner_id for capture in drf_captures},
+            top_level_dir__in={capture.top_level_dir for capture in drf_captures},
+        )
+        .values("owner_id", "top_level_dir")
+        .annotate(count=Count("pk"))
+        .order_by()
+    }
+    for capture in drf_captures:
+        capture._is_multi_channel_cache = (  # noqa: SLF001
+            counts.get((capture.owner_id, capture.top_level_dir), 0) > 1
+        )
+
+
+def load_capture_bulk_data(
+    captures: Sequence[Capture], *, include_files: bool = True
+) -> CaptureBulkData:
+    """Load the rows related to captures serialized together.
+
+    Owners, shared users and post-processed data are prefetched on the captures,
+    and their file statistics and multi-channel status are cached on them; share
+    permissions, datasets and files are returned. The number of queries does not
+    depend on the number of captures.
+
+    Args:
+        captures: Captures to serialize, the same instances as serialized
+        include_files: Whether to load the files of the captures
+    Returns:
+        CaptureBulkData: Related rows of the captures, for the serializer context
+            (under CAPTURE_BULK_DATA_KEY)
+    """
+    bulk_data = CaptureBulkData(capture_uuids={str(capture.pk) for capture in captures})
+    if not captures:
+        if include_files:
+            bulk_data.files = {}
+        return bulk_data
+
+    prefetch_related_objects(
+        list(captures),
+        "owner",
+        "shared_with",
+        Prefetch(
+            "visualization_post_processed_data",
+            queryset=PostProcessedData.objects.order_by(*POST_PROCESSED_DATA_ORDERING),
+        ),
+    )
+    _set_files_summaries(captures)
+    _set_multi_channel(captures)
+
+    share_permissions = (
+        UserSharePermission.objects.filter(
+            item_uuid__in=bulk_data.capture_uuids,
+            item_type=ItemType.CAPTURE,
+            is_deleted=False,
+            is_enabled=True,
+        )
+        .select_related("shared_with")
+        .order_by("pk")
+    )
+    bulk_data.share_permissions = _group_by_capture(
+        (permission.item_uuid, permission) for permission in share_permissions
+    )
+    bulk_data.datasets = _load_datasets(captures)
+    if include_files:
+        bulk_data.files = _load_files(captures)
+    return bulk_data
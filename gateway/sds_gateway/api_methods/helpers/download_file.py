@@ -1,6 +1,10 @@
 import logging
+import re
 import tempfile
+from collections.abc import Iterator
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 from django.conf import settings
 from minio.error import MinioException
@@ -11,10 +15,90 @@ from sds_gateway.api_methods.utils.minio_client import get_minio_client
 logger = logging.getLogger(__name__)
 
 
+# chunks read from the object store when streaming a file to a client
+DOWNLOAD_STREAM_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+# single "bytes" range as in RFC 9110 §14.1.2: "bytes=start-end", "bytes=start-"
+#   or "bytes=-suffix_length"; multi-range requests are served in full instead
+_SINGLE_BYTE_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
 class FileDownloadError(Exception):
     """Custom exception for file download errors."""
 
 
+class RangeNotSatisfiableError(FileDownloadError):
+    """Raised when a requested byte range lies outside the file contents."""
+
+
+@dataclass(frozen=True)
+class ByteRange:
+    """Inclusive byte range of a file, as used in HTTP range requests."""
+
+    start: int
+    end: int
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start + 1
+
+    def content_range(self, total_size: int) -> str:
+        """Value of the Content-Range header for this range."""
+        return f"bytes {self.start}-{self.end}/{total_size}"
+
+
+def get_file_etag(target_file: File) -> str | None:
+    """Strong ETag of the file contents, derived from their BLAKE3 checksum.
+
+    File contents are immutable, so the checksum identifies a representation
+        and is safe to use for If-Range validation when resuming downloads.
+    """
+    if not target_file.sum_blake3:
+        return None
+    return f'"{target_file.sum_blake3}"'
+
+
+def parse_range_header(range_header: str | None, file_size: int) -> ByteRange | None:
+    """Parses the Range header of a download request.
+
+    Args:
+        range_header: The raw value of the Range header, if any.
+        file_size: Size of the file contents in bytes.
+
+    Returns:
+        ByteRange: The range to serve, clamped to the file size.
+        None: When the whole file should be served instead (no header,
+            malformed or multi-range header, or an empty file).
+
+    Raises:
+        RangeNotSatisfiableError: When the range starts past the end of the file.
+    """
+    if not range_header or file_size <= 0:
+        return None
+    match = _SINGLE_BYTE_RANGE_RE.match(range_header.strip())
+    if match is None:
+        return None
+    raw_start, raw_end = match.groups()
+    last_byte = file_size - 1
+    if not raw_start:
+        # suffix range: the last N bytes of the file
+        if not raw_end:
+            return None
+        suffix_length = int(raw_end)
+        if suffix_length == 0:
+            msg = f"Empty suffix range requested: '{range_header}'"
+            raise RangeNotSatisfiableError(msg)
+        return ByteRange(start=max(file_size - suffix_length, 0), end=last_byte)
+    start = int(raw_start)
+    end = int(raw_end) if raw_end else last_byte
+    if end < start:
+        return None
+    if start > last_byte:
+        msg = f"Range '{range_header}' starts past the file size of {file_size} B"
+        raise RangeNotSatisfiableError(msg)
+    return ByteRange(start=start, end=min(end, last_byte))
+
+
 def download_file(target_file: File) -> bytes:
     """
     Download a file from MinIO storage.
@@ -73,3 +157,53 @@ def download_file(target_file: File) -> bytes:
         raise FileDownloadError(error_msg)
 
     return file_content
+
+
+def stream_file(
+    target_file: File, byte_range: ByteRange | None = None
+) -> Iterator[bytes]:
+    """
+    Stream a file, or a byte range of it, from MinIO storage.
+
+    The object is requested before this returns, so storage errors are raised
+    here instead of after a response has started. Contents are then read in
+    chunks of DOWNLOAD_STREAM_CHUNK_SIZE as the returned iterator is consumed,
+    keeping memory usage flat regardless of the file size.
+
+    Args:
+        target_file: File model instance to download
+        byte_range: Optional inclusive range of bytes to retrieve
+
+    Returns:
+        Iterator[bytes]: The file content in chunks
+
+    Raises:
+        MinioException: If there's an error with MinIO operations
+    """
+    client = get_minio_client()
+    range_kwargs: dict[str, int] = {}
+    if byte_range is not None:
+        range_kwargs = {"offset": byte_range.start, "length": byte_range.length}
+    try:
+        response = client.get_object(
+            bucket_name=settings.AWS_STORAGE_BUCKET_NAME,
+            object_name=target_file.file.name,
+            **range_kwargs,
+        )
+    except MinioException:
+        logger.exception("MinIO error streaming file %s", target_file.file.name)
+        raise
+    return _iter_object_chunks(response, object_name=target_file.file.name)
+
+
+def _iter_object_chunks(response: Any, *, object_name: str) -> Iterator[bytes]:
+    """Yields chunks of an object response, releasing its connection when done."""
+    try:
+        yield from response.stream(DOWNLOAD_STREAM_CHUNK_SIZE)
+    except Exception:
+        # headers are already sent: the client sees a truncated body
+        logger.exception("Error while streaming file %s", object_name)
+        raise
+    finally:
+        response.close()
+        response.release_conn()
@@ -0,0 +1,286 @@
+"""Presigned URLs for direct file transfers between clients and object storage.
+
+Contents of presigned transfers never pass through gateway workers: the gateway
+only authorizes them and, for uploads, verifies the stored object before
+creating the File record that points to it.
+"""
+
+import logging
+import secrets
+from dataclasses import dataclass
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from typing import Any
+
+from blake3 import blake3 as Blake3  # noqa: N812
+from django.conf import settings
+from django.core import signing
+from minio.datatypes import PostPolicy
+from minio.error import MinioException
+
+from sds_gateway.api_methods.models import File
+from sds_gateway.api_methods.models import PresignedUpload
+from sds_gateway.api_methods.utils.minio_client import get_minio_client
+from sds_gateway.api_methods.utils.minio_client import get_presigning_client
+from sds_gateway.api_methods.utils.storage_errors import is_missing_object_error
+from sds_gateway.users.models import User
+
+logger = logging.getLogger(__name__)
+
+# chunks read from the object store when verifying an uploaded object
+_VERIFY_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+_UPLOAD_TOKEN_SALT = "sds_gateway.api_methods.presigned_upload"  # noqa: S105
+
+
+class PresignedTransferError(Exception):
+    """Raised when a presigned transfer can't be authorized or completed."""
+
+
+class PresignedTransferUnavailableError(PresignedTransferError):
+    """Raised when clients should fall back to transfers through the gateway."""
+
+
+@dataclass(frozen=True)
+class StagedUpload:
+    """An object uploaded through a presigned URL, pending verification."""
+
+    object_name: str
+    owner_id: str
+    sum_blake3: str
+    size: int
+    # the PresignedUpload record of uploads through presigned forms
+    upload_id: str | None = None
+
+
+def _url_expiry() -> timedelta:
+    return timedelta(seconds=settings.PRESIGNED_URL_EXPIRY_SECONDS)
+
+
+def presign_download(target_file: File) -> str:
+    """
+    Create a short-lived URL to download a file directly from the primary store.
+
+    Args:
+        target_file: File model instance to download
+
+    Returns:
+        str: The presigned GET URL
+
+    Raises:
+        PresignedTransferUnavailableError: When the object is not in the
+            primary store (e.g. it is only available through read fallback).
+    """
+    object_name = target_file.file.name
+    try:
+        get_minio_client().stat_object(
+            settings.PRIMARY_STORAGE_BUCKET_NAME, object_name
+        )
+    except MinioException as err:
+        if is_missing_object_error(err):
+            msg = f"File {target_file.uuid} is not available in the primary store"
+            raise PresignedTransferUnavailableError(msg) from err
+        raise
+    return get_presigning_client().presigned_get_object(
+        bucket_name=settings.PRIMARY_STORAGE_BUCKET_NAME,
+        object_name=object_name,
+        expires=_url_expiry(),
+    )
+
+
+def presign_upload(
+    *, user: User, sum_blake3: str, size: int
+) -> tuple[str, dict[str, str], str]:
+    """
+    Create a short-lived form to upload file contents directly to the primary store.
+
+    Each upload gets its own object name, so concurrent or malicious uploads
+    can't overwrite contents of existing files before they are verified. The
+    form is signed for the announced size: the store rejects other sizes. The
+    upload is recorded until it is completed, or discarded once it expires.
+
+    Args:
+        user: The user uploading the file
+        sum_blake3: BLAKE3 checksum the uploaded contents must match
+        size: Size in bytes the uploaded contents must match
+
+    Returns:
+        tuple[str, dict[str, str], str]: The URL to POST the form to, the form
+            fields to send before the file contents, and the signed upload
+            token that must be sent back to complete the upload.
+
+    Raises:
+        PresignedTransferUnavailableError: When uploads must go through the
+            gateway, e.g. while writing to both object stores.
+    """
+    if settings.OBJECT_STORE_WRITE_BOTH_ENABLED:
+        msg = "Presigned uploads are unavailable while writing to both stores"
+        raise PresignedTransferUnavailableError(msg)
+    object_name = f"files/{sum_blake3}_{secrets.token_hex(8)}"
+    now = datetime.now(UTC)
+    policy = PostPolicy(settings.PRIMARY_STORAGE_BUCKET_NAME, now + _url_expiry())
+    policy.add_equals_condition("key", object_name)
+    policy.add_content_length_range_condition(size, size)
+    form_fields = {
+        "key": object_name,
+        **get_presigning_client().presigned_post_policy(policy),
+    }
+    upload_url = (
+        f"{settings.PRESIGNED_S3_ENDPOINT_URL.rstrip('/')}/"
+        f"{settings.PRIMARY_STORAGE_BUCKET_NAME}"
+    )
+    presigned_upload = PresignedUpload.objects.create(
+        owner=user,
+        object_name=object_name,
+        sum_blake3=sum_blake3,
+        size=size,
+        # allow uploads started right before the form expired to complete
+        expires_at=now + 2 * _url_expiry(),
+    )
+    upload_token = signing.dumps(
+        {"upload_id": str(presigned_upload.uuid), "owner_id": str(user.pk)},
+        salt=_UPLOAD_TOKEN_SALT,
+    )
+    return upload_url, form_fields, upload_token
+
+
+def load_staged_upload(*, user: User, upload_token: str) -> StagedUpload:
+    """
+    Resolve an upload token issued by presign_upload() for the same user.
+
+    Raises:
+        PresignedTransferError: When the token is invalid or was issued to
+            another user, or the upload expired or was already completed.
+    """
+    try:
+        token_data: dict[str, Any] = signing.loads(
+            upload_token, salt=_UPLOAD_TOKEN_SALT
+        )
+    except signing.BadSignature as err:
+        msg = "Invalid upload token"
+        raise PresignedTransferError(msg) from err
+    if token_data.get("owner_id") != str(user.pk):
+        msg = "Upload token was issued to another user"
+        raise PresignedTransferError(msg)
+    presigned_upload = PresignedUpload.objects.filter(
+        uuid=token_data.get("upload_id"), owner=user, is_deleted=False
+    ).first()
+    if presigned_upload is None or presigned_upload.is_expired:
+        msg = "Upload has expired or was already completed"
+        raise PresignedTransferError(msg)
+    return StagedUpload(
+        object_name=presigned_upload.object_name,
+        owner_id=str(presigned_upload.owner_id),
+        sum_blake3=presigned_upload.sum_blake3,
+        size=presigned_upload.size,
+        upload_id=str(presigned_upload.uuid),
+    )
+
+
+def verify_staged_upload(staged_upload: StagedUpload) -> None:
+    """
+    Check the uploaded object matches the announced size and BLAKE3 checksum.
+
+    Objects that don't match are removed from the store.
+
+    Raises:
+        PresignedTransferError: When the object is missing or doesn't match.
+    """
+    client = get_minio_client()
+    response = None
+    checksum = Blake3()  # pylint: disable=not-callable
+    size = 0
+    try:
+        response = client.get_object(
+            bucket_name=settings.AWS_STORAGE_BUCKET_NAME,
+            object_name=staged_upload.object_name,
+        )
+        for chunk in response.stream(_VERIFY_CHUNK_SIZE):
+            checksum.update(chunk)
+            size += len(chunk)
+    except MinioException as err:
+        if is_missing_object_error(err):
+            msg = "Uploaded contents not found: upload them before completing"
+            raise PresignedTransferError(msg) from err
+        raise
+    finally:
+        if response is not None:
+            response.close()
+            response.release_conn()
+
+    if size == staged_upload.size and checksum.hexdigest() == staged_upload.sum_blake3:
+        return
+    logger.warning(
+        "Discarding presigned upload that doesn't match its checksum or size"
+    )
+    discard_staged_upload(staged_upload)
+    msg = "Uploaded contents don't match the expected checksum and size"
+    raise PresignedTransferError(msg)
+
+
+def discard_staged_upload(staged_upload: StagedUpload) -> None:
+    """Remove an uploaded object that won't be referenced by any file."""
+    get_minio_client().remove_object(
+        bucket_name=settings.AWS_STORAGE_BUCKET_NAME,
+        object_name=staged_upload.object_name,
+    )
+
+
+def lock_staged_upload(staged_upload: StagedUpload) -> None:
+    """
+    Lock the presigned upload of an object until the end of the transaction.
+
+    Call it in the transaction creating a file from the object, which then
+    closes the upload with finish_staged_upload(): concurrent completions with
+    the same token wait for the lock, then find the upload completed.
+
+    Raises:
+        PresignedTransferError: When the upload was completed in the meantime.
+    """
+    if staged_upload.upload_id is None:
+        return
+    presigned_upload = (
+        PresignedUpload.objects.select_for_update()
+        .filter(uuid=staged_upload.upload_id, is_deleted=False)
+        .first()
+    )
+    if presigned_upload is None:
+        msg = "Upload has expired or was already completed"
+        raise PresignedTransferError(msg)
+
+
+def finish_staged_upload(staged_upload: StagedUpload) -> None:
+    """Close the presigned upload of an object a file was created from."""
+    if staged_upload.upload_id is None:
+        return
+    PresignedUpload.objects.filter(uuid=staged_upload.upload_id).update(
+        is_deleted=True, deleted_at=datetime.now(UTC)
+    )
+
+
+def discard_expired_presigned_uploads() -> int:
+    """
+    Discard the objects of presigned uploads that expired before completion.
+
+    Returns:
+        int: Number of discarded uploads.
+    """
+    expired_uploads = PresignedUpload.objects.filter(
+        expires_at__lt=datetime.now(UTC),
+        is_deleted=False,
+    )
+    discarded_count = 0
+    for presigned_upload in expired_uploads.iterator():
+        # objects that a file references are kept
+        if not File.objects.filter(file=presigned_upload.object_name).exists():
+            try:
+                get_minio_client().remove_object(
+                    bucket_name=settings.AWS_STORAGE_BUCKET_NAME,
+                    object_name=presigned_upload.object_name,
+                )
+            except MinioException:
+                logger.exception("Failed to discard the object of a presigned upload")
+                continue
+        presigned_upload.soft_delete()
+        discarded_count += 1
+    return discarded_count
@@ -1,14 +1,30 @@
 """Helper functions for searching captures with metadata filtering."""
 
+import base64
+import datetime as dt
+import json
+from collections.abc import Generator
+from collections.abc import Iterable
+from collections.abc import Iterator
 from collections.abc import Mapping
+from contextlib import closing
+from contextlib import contextmanager
+from itertools import islice
 from typing import Any
+from typing import NamedTuple
 
+from django.db.models import Max
+from django.db.models import Q
 from django.db.models import QuerySet
+from django.db.models import Value
+from django.db.models.functions import Coalesce
 from loguru import logger as log
 from opensearchpy import exceptions as os_exceptions
 from rest_framework.request import Request
 from rich.pretty import pretty_repr
 
+from sds_gateway.api_methods.helpers.capture_bulk_data import CAPTURE_BULK_DATA_KEY
+from sds_gateway.api_methods.helpers.capture_bulk_data import load_capture_bulk_data
 from sds_gateway.api_methods.models import Capture
 from sds_gateway.api_methods.models import CaptureType
 from sds_gateway.api_methods.serializers.capture_serializers import (
@@ -36,6 +52,13 @@ UNKNOWN_CAPTURE_TYPE = "Unknown capture type"
 
 # maximum size (doc count) of OpenSearch searches
 MAX_OS_SIZE = 10_000
+# number of hits fetched per OpenSearch request when paging through a search
+OS_SEARCH_BATCH_SIZE = 1_000
+# how long OpenSearch keeps the point in time of a search between two requests
+OS_PIT_KEEP_ALIVE = "1m"
+
+# owner of a group of captures, as compared in keyset pagination
+_GROUP_OWNER = Coalesce("owner_id", Value(0))
 
 
 def handle_nested_query(
@@ -209,51 +232,66 @@ def get_capture_queryset(
     return capture_queryset.order_by("-updated_at")
 
 
+class CaptureSearch(NamedTuple):
+    """Captures a user may list, and the OpenSearch query they must match."""
+
+    captures: QuerySet[Capture]
+    index_name: str
+    # None when no metadata filters are given: all captures are listed
+    os_query: dict[str, Any] | None
+
+
 def search_captures(
     request_user: User,
     capture_type: CaptureType | None = None,
     metadata_filters: list[dict[str, Any]] | None = None,
-) -> QuerySet[Capture]:
+) -> CaptureSearch:
     """Search for captures with optional metadata filtering.
 
+    Matches are not fetched here: list them with `get_capture_groups_page`
+    when there is no OpenSearch query, or `get_searched_capture_groups_page`.
+
     Args:
-        owner:              user who owns the captures
+        request_user:       user who lists the captures
         capture_type:       type of capture to filter by
         metadata_filters:   dict of metadata field names and their filter values
     Raises:
-        ValueError:         when the index was not found
+        ValueError:         when the capture type is unknown
     Returns:
-        QuerySet of Capture objects matching the criteria
+        The captures accessible to the user and the query of the search
     """
 
     capture_queryset: QuerySet[Capture] = get_capture_queryset(
         capture_type=capture_type,
         request_user=request_user,
     )
+    index_name: str = (
+        "captures-*" if capture_type is None else infer_index_name(capture_type)
+    )
     metadata_queries: list[dict[str, Any]] = _build_os_metadata_query(
         capture_type=capture_type,
         metadata_filters=metadata_filters,
     )
     if not metadata_queries:
         log.debug("No metadata queries provided. Returning all captures.")
-        return capture_queryset
+        return CaptureSearch(capture_queryset, index_name, os_query=None)
 
     os_query = _build_os_query_for_captures(
         capture_type=capture_type,
         metadata_queries=metadata_queries,
     )
+    return CaptureSearch(capture_queryset, index_name, os_query=os_query)
 
-    client = get_opensearch_client()
-    index_name: str = (
-        "captures-*" if capture_type is None else infer_index_name(capture_type)
-    )
 
+@contextmanager
+def _opensearch_search_errors(index_name: str) -> Iterator[None]:
+    """Re-raises errors of OpenSearch searches as expected by the views.
+
+    Raises:
+        ValueError: when the index was not found or the query is invalid
+    """
     try:
-        response = client.search(
-            index=index_name,
-            body=os_query,
-            size=MAX_OS_SIZE,  # pyright: ignore[reportCallIssue]
-        )
+        yield
     except os_exceptions.NotFoundError as err:
         msg = f"Index '{index_name}' not found"
         log.exception(msg)
@@ -285,33 +323,218 @@ def search_captures(
         log.exception(msg)
         raise
 
-    # Extract capture UUIDs from OpenSearch response
-    capture_uuids: list[str] = [hit["_id"] for hit in response["hits"]["hits"]]
 
-    if not capture_uuids:
-        log.debug("No captures found in OpenSearch.")
-        return capture_queryset.none()
+def iter_search_hit_batches(
+    index_name: str,
+    os_query: dict[str, Any],
+    *,
+    after: str | None = None,
+) -> Generator[list[str], None, None]:
+    """IDs of the documents matching a query, in batches sorted by ID.
 
-    # Check if we're approaching the maximum size limit
-    num_hits = len(capture_uuids)
-    if num_hits > 0.9 * MAX_OS_SIZE:
-        log.warning(
-            f"OpenSearch returned {num_hits:,} hits, which is close to the "
-            f"maximum size of {MAX_OS_SIZE:,}. Consider refactoring.",
-        )
-    log.debug(f"Found {len(capture_uuids)} matching captures.")
+    Hits are paged with `search_after` in a point in time, so searches are not
+    truncated at `MAX_OS_SIZE` and only a batch of IDs is held at once.
 
-    # Filter the queryset to only include captures found in OpenSearch
-    filtered_queryset = capture_queryset.filter(uuid__in=capture_uuids).order_by(
-        "-updated_at"
-    )
+    Args:
+        index_name: Index (or pattern) to search
+        os_query:   OpenSearch query, as built by `_build_os_query_for_captures`
+        after:      ID the hits start after, e.g. the last one of a previous page
+    Raises:
+        ValueError: when the index was not found or the query is invalid
+    """
+    client = get_opensearch_client()
+    with _opensearch_search_errors(index_name):
+        pit_id: str = client.create_point_in_time(
+            index=index_name,
+            keep_alive=OS_PIT_KEEP_ALIVE,  # pyright: ignore[reportCallIssue]
+        )["pit_id"]
+    search_after = [after] if after is not None else None
+    try:
+        while True:
+            body: dict[str, Any] = {
+                **os_query,
+                "pit": {"id": pit_id, "keep_alive": OS_PIT_KEEP_ALIVE},
+                "sort": [{"_id": "asc"}],
+                "size": OS_SEARCH_BATCH_SIZE,
+                "_source": False,
+            }
+            if search_after is not None:
+                body["search_after"] = search_after
+            with _opensearch_search_errors(index_name):
+                response = client.search(body=body)
+            # the id of a point in time may change between searches
+            pit_id = response.get("pit_id", pit_id)
+            hits = response["hits"]["hits"]
+            if hits:
+                yield [hit["_id"] for hit in hits]
+            if len(hits) < OS_SEARCH_BATCH_SIZE:
+                return
+            search_after = hits[-1]["sort"]
+    finally:
+        # points in time expire on their own: do not fail the listing over it
+        try:
+            client.delete_point_in_time(body={"pit_id": [pit_id]})
+        except os_exceptions.OpenSearchException as err:
+            log.warning(f"Could not delete OpenSearch point in time: {err}")
+
+
+def _matching_ids(
+    index_name: str,
+    os_query: dict[str, Any],
+    ids: Iterable[str],
+) -> set[str]:
+    """IDs, among the given ones, of the documents matching a query."""
+    client = get_opensearch_client()
+    ids = sorted(set(ids))
+    matching: set[str] = set()
+    for start in range(0, len(ids), OS_SEARCH_BATCH_SIZE):
+        chunk = ids[start : start + OS_SEARCH_BATCH_SIZE]
+        body = {
+            "query": {
+                "bool": {
+                    "must": [os_query["query"]],
+                    "filter": [{"ids": {"values": chunk}}],
+                },
+            },
+            "size": len(chunk),
+            "_source": False,
+        }
+        with _opensearch_search_errors(index_name):
+            response = client.search(index=index_name, body=body)
+        matching.update(hit["_id"] for hit in response["hits"]["hits"])
+    return matching
 
-    log.debug(
-        f"Found {len(capture_uuids)} captures in OpenSearch, "
-        f"filtered to {filtered_queryset.count()} captures in database.",
+
+def _group_members(
+    captures: QuerySet[Capture],
+    group_keys: Iterable[tuple[int, str]],
+) -> QuerySet[Capture]:
+    """Captures of the groups with the given owners and top_level_dirs."""
+    in_groups = Q()
+    for owner_id, top_level_dir in group_keys:
+        in_groups |= Q(group_owner=owner_id, top_level_dir=top_level_dir)
+    return captures.annotate(group_owner=_GROUP_OWNER).filter(in_groups)
+
+
+def iter_searched_capture_groups(
+    search: CaptureSearch,
+    *,
+    after: str | None = None,
+) -> Generator[tuple[str, int, str], None, None]:
+    """Groups of captures with hits of a search, in the order of its hits.
+
+    A group (see `CaptureGroupKey`) is yielded at its first matching capture
+    after `after` in the hits, sorted by UUID, and skipped at its other ones.
+    Groups with matching captures before `after` were listed at one of them:
+    `get_searched_capture_groups_page` leaves them out of its pages.
+
+    Args:
+        search:     Search with an OpenSearch query
+        after:      UUID the groups start after, e.g. from a previous page
+    Yields:
+        The UUID of the first matching capture of each group after `after`,
+        with the owner id (0 if none) and top_level_dir of the group.
+    """
+    assert search.os_query is not None, "Search without an OpenSearch query"
+    yielded_groups: set[tuple[int, str]] = set()
+    for batch in iter_search_hit_batches(
+        search.index_name, search.os_query, after=after
+    ):
+        # merged with the captures of the user, one batch at a time
+        accessible: dict[str, tuple[int, str]] = {
+            str(row["uuid"]): (row["group_owner"], row["top_level_dir"])
+            for row in search.captures.annotate(group_owner=_GROUP_OWNER)
+            .filter(uuid__in=batch)
+            .values("uuid", "group_owner", "top_level_dir")
+        }
+        for uuid in batch:
+            group = accessible.get(uuid)
+            if group is None or group in yielded_groups:
+                continue
+            yielded_groups.add(group)
+            yield uuid, *group
+
+
+def count_searched_capture_groups(search: CaptureSearch) -> int:
+    """Number of groups of captures matching a search.
+
+    Groups are counted in the database from the hits of the search, one batch
+    at a time (see `iter_searched_capture_groups`), so counts are exact and
+    only a batch of hits and the keys of the groups are held at once.
+    """
+    # closed once counted, to delete the point in time of the search
+    with closing(iter_searched_capture_groups(search)) as groups:
+        return sum(1 for _ in groups)
+
+
+def _matching_group_captures(
+    search: CaptureSearch,
+    group_keys: Iterable[tuple[int, str]],
+) -> dict[tuple[int, str], list[Capture]]:
+    """Captures of the given groups that match a search, by group.
+
+    Captures of each group are ordered by most recent update.
+    """
+    assert search.os_query is not None, "Search without an OpenSearch query"
+    members = list(_group_members(search.captures, group_keys))
+    matching = _matching_ids(
+        search.index_name, search.os_query, (str(c.uuid) for c in members)
     )
+    captures_by_group: dict[tuple[int, str], list[Capture]] = {}
+    for capture in members:
+        if str(capture.uuid) in matching:
+            captures_by_group.setdefault(
+                (capture.group_owner, capture.top_level_dir), []
+            ).append(capture)
+    return captures_by_group
+
+
+def get_searched_capture_groups_page(
+    search: CaptureSearch,
+    page_size: int,
+    *,
+    after: str | None = None,
+    offset: int = 0,
+) -> tuple[list[tuple[str, list[Capture]]], bool]:
+    """Page of groups of captures matching a search, in the order of its hits.
+
+    Only a batch of hits and the captures of the groups in the page are held at
+    once, so the cost of a page does not depend on the number of matches
+    before it is reached (see `iter_searched_capture_groups`). The matching
+    captures of the groups of a page are fetched in one query, which also
+    leaves out groups listed before `after`; another one is only made for the
+    groups replacing them.
 
-    return filtered_queryset
+    Args:
+        search:     Search with an OpenSearch query
+        page_size:  Maximum number of groups in the page
+        after:      UUID the page starts after (cursor pagination)
+        offset:     Number of groups skipped, when `after` is not given
+    Returns:
+        The groups of the page, each with the UUID it is listed at and its
+        matching captures ordered by most recent update; and whether more
+        groups follow the page.
+    """
+    assert search.os_query is not None, "Search without an OpenSearch query"
+    page: list[tuple[str, list[Capture]]] = []
+    # closed once the page is taken, to delete the point in time of the search
+    with closing(iter_searched_capture_groups(search, after=after)) as groups:
+        # no group is listed before the first one: skipped groups are not resolved
+        page_groups = islice(groups, offset, None)
+        while len(page) <= page_size:
+            group_rows = list(islice(page_groups, page_size + 1 - len(page)))
+            if not group_rows:
+                break
+            captures_by_group = _matching_group_captures(
+                search, [(owner_id, tld) for _, owner_id, tld in group_rows]
+            )
+            for uuid, owner_id, top_level_dir in group_rows:
+                captures = captures_by_group.get((owner_id, top_level_dir))
+                # groups with a matching capture before their hit were listed at it
+                if not captures or any(str(c.uuid) < uuid for c in captures):
+                    continue
+                page.append((uuid, captures))
+    return page[:page_size], len(page) > page_size
 
 
 def _build_os_query_for_captures(
@@ -344,18 +567,167 @@ def _build_os_query_for_captures(
     return query
 
 
-# TODO: add pagination before retrieval rather than after
-# Need to paginate/limit OpenSearch results list before grouping
-# and then paginate/limit the grouped captures
-def get_composite_captures(
+class CaptureGroupKey(NamedTuple):
+    """Key of a group of captures in listings, in the order groups are listed.
+
+    Groups are the captures of an owner under a top_level_dir (composite
+    captures), listed by their most recent update first.
+    """
+
+    last_updated_at: dt.datetime
+    owner_id: int  # 0 for captures without an owner
+    top_level_dir: str
+
+    def to_cursor(self, page_number: int) -> str:
+        """Opaque cursor of the page following this group, numbered page_number."""
+        payload = [
+            self.last_updated_at.isoformat(),
+            self.owner_id,
+            self.top_level_dir,
+            page_number,
+        ]
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+    @classmethod
+    def from_cursor(cls, cursor: str) -> tuple["CaptureGroupKey", int]:
+        """Group key and page number encoded in a cursor by `to_cursor`.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        try:
+            last_updated_at, owner_id, top_level_dir, page_number = json.loads(
+                base64.urlsafe_b64decode(cursor.encode())
+            )
+            key = cls(
+                dt.datetime.fromisoformat(last_updated_at),
+                int(owner_id),
+                str(top_level_dir),
+            )
+            return key, int(page_number)
+        except (ValueError, TypeError) as err:
+            msg = "Invalid cursor"
+            raise ValueError(msg) from err
+
+
+class CaptureSearchCursor(NamedTuple):
+    """Position of a page of groups of captures matching a search."""
+
+    after: str  # UUID the groups of the page start after
+    page_number: int
+    count: int  # number of groups matching the search, counted on the first page
+
+    def to_cursor(self) -> str:
+        """Opaque cursor of the page."""
+        payload = [self.after, self.page_number, self.count]
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+    @classmethod
+    def from_cursor(cls, cursor: str) -> "CaptureSearchCursor":
+        """Position encoded in a cursor by `to_cursor`.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        try:
+            after, page_number, count = json.loads(
+                base64.urlsafe_b64decode(cursor.encode())
+            )
+            return cls(str(after), int(page_number), int(count))
+        except (ValueError, TypeError) as err:
+            msg = "Invalid cursor"
+            raise ValueError(msg) from err
+
+
+def _capture_groups(captures: QuerySet[Capture]) -> QuerySet[Capture, dict[str, Any]]:
+    """Group keys of captures, in listing order (see `CaptureGroupKey`)."""
+    return (
+        Capture.objects.filter(pk__in=captures.order_by().values("pk"))
+        .annotate(group_owner=_GROUP_OWNER)
+        .values("group_owner", "top_level_dir")
+        .annotate(last_updated_at=Max("updated_at"))
+        .order_by("-last_updated_at", "group_owner", "top_level_dir")
+    )
+
+
+def count_capture_groups(captures: QuerySet[Capture]) -> int:
+    """Number of groups (composite or single captures) the captures list as."""
+    return _capture_groups(captures).count()
+
+
+def get_capture_groups_page(
     captures: QuerySet[Capture],
+    page_size: int,
+    *,
+    after: CaptureGroupKey | None = None,
+    offset: int = 0,
+) -> tuple[list[tuple[CaptureGroupKey, list[Capture]]], bool]:
+    """Page of groups of captures, paginated in the database.
+
+    Only the captures of the groups in the page are loaded, so the cost of a
+    page does not depend on the number of captures listed.
+
+    Args:
+        captures:   QuerySet of the captures to list
+        page_size:  Maximum number of groups in the page
+        after:      Key of the group preceding the page (keyset pagination)
+        offset:     Number of groups skipped, when `after` is not given
+    Returns:
+        The groups of the page with their keys, each with its captures ordered
+        by most recent update; and whether more groups follow the page.
+    """
+    groups = _capture_groups(captures)
+    if after is None:
+        group_rows = list(groups[offset : offset + page_size + 1])
+    else:
+        group_rows = list(
+            groups.filter(
+                Q(last_updated_at__lt=after.last_updated_at)
+                | Q(
+                    last_updated_at=after.last_updated_at,
+                    group_owner__gt=after.owner_id,
+                )
+                | Q(
+                    last_updated_at=after.last_updated_at,
+                    group_owner=after.owner_id,
+                    top_level_dir__gt=after.top_level_dir,
+                )
+            )[: page_size + 1]
+        )
+    has_more = len(group_rows) > page_size
+    keys = [
+        CaptureGroupKey(
+            row["last_updated_at"], row["group_owner"], row["top_level_dir"]
+        )
+        for row in group_rows[:page_size]
+    ]
+    if not keys:
+        return [], has_more
+
+    in_page = Q()
+    for key in keys:
+        in_page |= Q(group_owner=key.owner_id, top_level_dir=key.top_level_dir)
+    captures_by_group: dict[tuple[int, str], list[Capture]] = {}
+    for capture in captures.annotate(group_owner=_GROUP_OWNER).filter(in_page):
+        captures_by_group.setdefault(
+            (capture.group_owner, capture.top_level_dir), []
+        ).append(capture)
+    return [
+        (key, captures_by_group[key.owner_id, key.top_level_dir])
+        for key in keys
+        if (key.owner_id, key.top_level_dir) in captures_by_group
+    ], has_more
+
+
+def serialize_capture_groups(
+    grouped_captures: Iterable[list[Capture]],
     request: Request | None = None,
     bulk_metadata: dict[str, dict[str, Any]] | None = None,
 ) -> list[dict[str, Any]]:
-    """Get captures as composite objects, grouping multi-channel captures.
+    """Serialize groups of captures, as composites for multi-channel groups.
 
     Args:
-        captures: QuerySet of Capture objects
+        grouped_captures: Lists of captures sharing a top_level_dir
         request: Optional Django REST framework request for serializer context
         bulk_metadata: Optional pre-loaded OpenSearch metadata mapping
                        ``uuid_str → metadata_dict``. When provided, the
@@ -365,14 +737,18 @@ def get_composite_captures(
     Returns:
         list: List of composite capture data
     """
-    grouped_captures = group_captures_by_top_level_dir(captures)
+    grouped_captures = list(grouped_captures)
     composite_captures = []
 
     context: dict[str, Any] = {"request": request} if request else {}
     if bulk_metadata is not None:
         context["bulk_metadata"] = bulk_metadata
+    # related rows of single captures, loaded for all of them at once
+    context[CAPTURE_BULK_DATA_KEY] = load_capture_bulk_data(
+        [capture_list[0] for capture_list in grouped_captures if len(capture_list) == 1]
+    )
 
-    for capture_list in grouped_captures.values():
+    for capture_list in grouped_captures:
         if len(capture_list) > 1:
             # Multiple captures with same top_level_dir - create composite
             composite_data = build_composite_capture_data(capture_list)
@@ -384,3 +760,27 @@ def get_composite_captures(
             composite_captures.append(capture_data)
 
     return composite_captures
+
+
+def get_composite_captures(
+    captures: QuerySet[Capture],
+    request: Request | None = None,
+    bulk_metadata: dict[str, dict[str, Any]] | None = None,
+) -> list[dict[str, Any]]:
+    """Get captures as composite objects, grouping multi-channel captures.
+
+    Serializes all captures: use `get_capture_groups_page` to list a page of them.
+
+    Args:
+        captures: QuerySet of Capture objects
+        request: Optional Django REST framework request for serializer context
+        bulk_metadata: Optional pre-loaded OpenSearch metadata mapping, see
+                       `serialize_capture_groups`
+    Returns:
+        list: List of composite capture data
+    """
+    return serialize_capture_groups(
+        group_captures_by_top_level_dir(captures).values(),
+        request=request,
+        bulk_metadata=bulk_metadata,
+    )
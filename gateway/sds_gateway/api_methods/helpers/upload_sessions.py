@@ -0,0 +1,325 @@
+"""Chunked upload sessions for the contents of large files.
+
+Contents are uploaded in fixed-size parts that are written to an S3 multipart
+upload as they arrive, so a failed transfer only repeats the parts that didn't
+make it. Each part is hashed while it is received; the complete object is
+verified against the announced BLAKE3 checksum when the session is completed.
+"""
+
+import logging
+import secrets
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from io import BytesIO
+from typing import IO
+from typing import Any
+
+from blake3 import blake3 as Blake3  # noqa: N812
+from django.conf import settings
+from django.db import transaction
+from minio.datatypes import Part
+from minio.error import MinioException
+
+from sds_gateway.api_methods.helpers.presigned_transfers import PresignedTransferError
+from sds_gateway.api_methods.helpers.presigned_transfers import StagedUpload
+from sds_gateway.api_methods.helpers.presigned_transfers import discard_staged_upload
+from sds_gateway.api_methods.helpers.presigned_transfers import verify_staged_upload
+from sds_gateway.api_methods.models import File
+from sds_gateway.api_methods.models import FileUploadSession
+from sds_gateway.api_methods.models import UploadSessionStatus
+from sds_gateway.api_methods.utils.minio_client import MultipartUploadUnsupportedError
+from sds_gateway.api_methods.utils.minio_client import get_minio_client
+from sds_gateway.users.models import User
+
+logger = logging.getLogger(__name__)
+
+# chunks read from request bodies while receiving a part
+_RECEIVE_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+# statuses of sessions whose parts were assembled into a single object
+_ASSEMBLED_STATUSES = (
+    UploadSessionStatus.Assembled.value,
+    UploadSessionStatus.Verifying.value,
+    UploadSessionStatus.Completed.value,
+)
+
+
+class UploadSessionError(Exception):
+    """Raised when an upload session can't accept a part or be completed."""
+
+
+class UploadSessionUnavailableError(UploadSessionError):
+    """Raised when clients should fall back to uploads of whole files."""
+
+
+def _ensure_not_expired(session: FileUploadSession) -> None:
+    if session.is_expired:
+        msg = "Upload session has expired: start a new one"
+        raise UploadSessionError(msg)
+
+
+def _ensure_active(session: FileUploadSession) -> None:
+    if session.status != UploadSessionStatus.Active.value:
+        msg = f"Upload session is {session.status}"
+        raise UploadSessionError(msg)
+    _ensure_not_expired(session)
+
+
+def create_upload_session(
+    *, user: User, sum_blake3: str, size: int
+) -> FileUploadSession:
+    """
+    Start a chunked upload of file contents to the primary store.
+
+    Args:
+        user: The user uploading the file
+        sum_blake3: BLAKE3 checksum the uploaded contents must match
+        size: Size in bytes the uploaded contents must match
+
+    Returns:
+        FileUploadSession: The new session, with the part size to use.
+
+    Raises:
+        UploadSessionUnavailableError: When uploads must go through the
+            regular file upload, e.g. while writing to both object stores.
+    """
+    if not settings.UPLOAD_SESSIONS_ENABLED:
+        msg = "Upload sessions are not enabled"
+        raise UploadSessionUnavailableError(msg)
+    if settings.OBJECT_STORE_WRITE_BOTH_ENABLED:
+        msg = "Upload sessions are unavailable while writing to both stores"
+        raise UploadSessionUnavailableError(msg)
+    object_name = f"files/{sum_blake3}_{secrets.token_hex(8)}"
+    try:
+        upload_id = get_minio_client().create_multipart_upload(object_name)
+    except MultipartUploadUnsupportedError as err:
+        raise UploadSessionUnavailableError(str(err)) from err
+    return FileUploadSession.objects.create(
+        owner=user,
+        object_name=object_name,
+        multipart_upload_id=upload_id,
+        sum_blake3=sum_blake3,
+        size=size,
+        part_size=settings.UPLOAD_SESSION_PART_SIZE,
+        expires_at=datetime.now(UTC)
+        + timedelta(seconds=settings.UPLOAD_SESSION_EXPIRY_SECONDS),
+    )
+
+
+def receive_part(
+    *,
+    session: FileUploadSession,
+    part_number: int,
+    stream: IO[bytes] | None,
+    part_sum_blake3: str | None = None,
+) -> dict[str, Any]:
+    """
+    Read a part from a request body and write it to the multipart upload.
+
+    Parts may be uploaded in any order, and uploading a part again replaces it.
+
+    Args:
+        session: The upload session the part belongs to
+        part_number: Number of the part, starting at 1
+        stream: Request body with the part contents, None when empty
+        part_sum_blake3: BLAKE3 checksum of the part, when sent by the client
+
+    Returns:
+        dict: The recorded part: its "etag", "size", and "sum_blake3".
+
+    Raises:
+        UploadSessionError: When the session is not active, the part
+            doesn't have the expected size or checksum, or it can't be stored.
+    """
+    _ensure_active(session)
+    if not 1 <= part_number <= session.num_parts:
+        msg = f"Part number must be between 1 and {session.num_parts}"
+        raise UploadSessionError(msg)
+
+    expected_size = session.expected_part_size(part_number)
+    stream = stream or BytesIO()
+    data = bytearray()
+    checksum = Blake3()  # pylint: disable=not-callable
+    # read one byte past the expected size to detect oversized parts
+    while len(data) <= expected_size:
+        chunk = stream.read(min(_RECEIVE_CHUNK_SIZE, expected_size + 1 - len(data)))
+        if not chunk:
+            break
+        checksum.update(chunk)
+        data.extend(chunk)
+    if len(data) != expected_size:
+        msg = f"Part {part_number} must have {expected_size} bytes"
+        raise UploadSessionError(msg)
+    part_checksum = checksum.hexdigest()
+    if part_sum_blake3 and part_sum_blake3.lower() != part_checksum:
+        msg = f"Part {part_number} doesn't match its checksum"
+        raise UploadSessionError(msg)
+
+    try:
+        # the buffer is sent as is: copying it would double the memory of a part
+        etag = get_minio_client().upload_part(
+            object_name=session.object_name,
+            upload_id=session.multipart_upload_id,
+            part_number=part_number,
+            data=data,
+        )
+    except MinioException as err:
+        logger.exception("Failed to store a part of an upload session")
+        msg = f"Part {part_number} could not be stored: upload it again"
+        raise UploadSessionError(msg) from err
+    part = {"etag": etag, "size": len(data), "sum_blake3": part_checksum}
+    # parts of a session are uploaded concurrently: lock the row to record them
+    with transaction.atomic():
+        locked_session = FileUploadSession.objects.select_for_update().get(
+            pk=session.pk
+        )
+        _ensure_active(locked_session)
+        locked_session.parts[str(part_number)] = part
+        locked_session.save(update_fields=["parts", "updated_at"])
+    session.parts = locked_session.parts
+    return part
+
+
+def complete_upload_session(session: FileUploadSession) -> StagedUpload:
+    """
+    Assemble the uploaded parts into a single object and verify it.
+
+    The session row is only locked to assemble the parts and to record the
+    outcome: the assembled object is verified in between, while the session
+    is "verifying", so other requests on it are not blocked meanwhile.
+    Sessions whose assembled object doesn't match are aborted. When the
+    object can't be read back, the session is left "assembled": completing it
+    again verifies the object without assembling the parts again.
+
+    Completed sessions keep their verified object until a file is created from
+    it (see `finish_upload_session`): completing them again returns the same
+    object, so a file whose metadata was rejected is retried without uploading
+    its parts again.
+
+    Returns:
+        StagedUpload: The verified object, ready to be referenced by a file.
+
+    Raises:
+        UploadSessionError: When parts are missing, the session is already
+            being completed, the object store fails, or the assembled object
+            doesn't match the announced checksum and size.
+    """
+    staged_upload = _session_staged_upload(session)
+    # the status moves to "verifying" under the lock: one completion at a time
+    with transaction.atomic():
+        locked_session = FileUploadSession.objects.select_for_update().get(
+            pk=session.pk
+        )
+        if locked_session.status == UploadSessionStatus.Completed.value:
+            _ensure_not_expired(locked_session)
+            session.status = locked_session.status
+            return staged_upload
+        if locked_session.status == UploadSessionStatus.Assembled.value:
+            _ensure_not_expired(locked_session)
+        else:
+            _ensure_active(locked_session)
+            _assemble_parts(locked_session)
+        locked_session.status = UploadSessionStatus.Verifying.value
+        locked_session.save(update_fields=["status", "updated_at"])
+    session.parts = locked_session.parts
+    session.status = locked_session.status
+
+    verification_error: PresignedTransferError | None = None
+    storage_error: MinioException | OSError | None = None
+    try:
+        # blake3 hash states can't be stored between requests, so the
+        #   checksum of the whole object is only known once assembled
+        verify_staged_upload(staged_upload)
+    except PresignedTransferError as err:
+        verification_error = err
+    except (MinioException, OSError) as err:
+        logger.exception("Failed to read back the assembled object of a session")
+        storage_error = err
+
+    with transaction.atomic():
+        locked_session = FileUploadSession.objects.select_for_update().get(
+            pk=session.pk
+        )
+        if locked_session.status != UploadSessionStatus.Verifying.value:
+            # aborted while verifying: its object was discarded
+            msg = f"Upload session is {locked_session.status}"
+            raise UploadSessionError(msg)
+        if verification_error is not None:
+            locked_session.status = UploadSessionStatus.Aborted.value
+            locked_session.soft_delete()
+        elif storage_error is not None:
+            locked_session.status = UploadSessionStatus.Assembled.value
+            locked_session.save(update_fields=["status", "updated_at"])
+        else:
+            locked_session.status = UploadSessionStatus.Completed.value
+            locked_session.save(update_fields=["status", "updated_at"])
+    session.status = locked_session.status
+    if verification_error is not None:
+        raise UploadSessionError(str(verification_error)) from verification_error
+    if storage_error is not None:
+        msg = "Uploaded contents could not be verified: complete the session again"
+        raise UploadSessionError(msg) from storage_error
+    return staged_upload
+
+
+def _assemble_parts(locked_session: FileUploadSession) -> None:
+    """Complete the multipart upload of a session, once all parts are uploaded."""
+    if missing_parts := locked_session.missing_parts:
+        msg = f"Upload the missing parts before completing: {missing_parts}"
+        raise UploadSessionError(msg)
+    try:
+        get_minio_client().complete_multipart_upload(
+            object_name=locked_session.object_name,
+            upload_id=locked_session.multipart_upload_id,
+            parts=[
+                Part(part_number, locked_session.parts[str(part_number)]["etag"])
+                for part_number in range(1, locked_session.num_parts + 1)
+            ],
+        )
+    except MinioException as err:
+        logger.exception("Failed to assemble the parts of an upload session")
+        msg = "Uploaded parts could not be assembled: complete the session again"
+        raise UploadSessionError(msg) from err
+
+
+def finish_upload_session(session: FileUploadSession) -> None:
+    """Close a completed session once a file was created from its object."""
+    session.soft_delete()
+
+
+def _session_staged_upload(session: FileUploadSession) -> StagedUpload:
+    return StagedUpload(
+        object_name=session.object_name,
+        owner_id=str(session.owner_id),
+        sum_blake3=session.sum_blake3,
+        size=session.size,
+    )
+
+
+def abort_upload_session(session: FileUploadSession) -> None:
+    """Abort an upload session, discarding the parts uploaded so far."""
+    with transaction.atomic():
+        locked_session = FileUploadSession.objects.select_for_update().get(
+            pk=session.pk
+        )
+        if locked_session.status == UploadSessionStatus.Active.value:
+            try:
+                get_minio_client().abort_multipart_upload(
+                    object_name=locked_session.object_name,
+                    upload_id=locked_session.multipart_upload_id,
+                )
+            except MinioException:
+                # the object store also expires incomplete multipart uploads
+                logger.exception("Failed to abort the multipart upload of a session")
+            locked_session.status = UploadSessionStatus.Aborted.value
+        elif locked_session.status in _ASSEMBLED_STATUSES and not (
+            File.objects.filter(file=locked_session.object_name).exists()
+        ):
+            # the parts were assembled, but no file references the object yet
+            try:
+                discard_staged_upload(_session_staged_upload(locked_session))
+            except MinioException:
+                logger.exception("Failed to discard the object of a session")
+            locked_session.status = UploadSessionStatus.Aborted.value
+        locked_session.soft_delete()
+    session.status = locked_session.status
@@ -0,0 +1,47 @@
+"""Management command to check the per-user access index against its sources."""
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from sds_gateway.api_methods.models import ItemType
+from sds_gateway.api_methods.utils.access_index import check_access_index
+from sds_gateway.api_methods.utils.access_index import refresh_capture_access
+from sds_gateway.api_methods.utils.access_index import refresh_file_access
+
+# number of drifted rows listed
+_MAX_LISTED_ROWS = 20
+
+
+class Command(BaseCommand):
+    """Report access rows that are missing from or extra in the access index."""
+
+    help = "Check the per-user access index, optionally refreshing drifted items"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Recompute the access rows of the items that drifted",
+        )
+
+    def handle(self, *args, **options):
+        """Handle the command."""
+        drift = check_access_index()
+        if drift.is_consistent:
+            self.stdout.write(self.style.SUCCESS("Access index is consistent"))
+            return
+
+        self.stdout.write(
+            f"{len(drift.missing)} missing and {len(drift.extra)} extra access rows"
+        )
+        for label, rows in (("missing", drift.missing), ("extra", drift.extra)):
+            for row in rows[:_MAX_LISTED_ROWS]:
+                self.stdout.write(f"{label}: {row}")
+
+        if not options["fix"]:
+            msg = "Access index drifted from its sources, rerun with --fix"
+            raise CommandError(msg)
+        refresh_capture_access(drift.item_uuids(ItemType.CAPTURE), include_files=False)
+        refresh_file_access(drift.item_uuids(ItemType.FILE))
+        self.stdout.write(self.style.SUCCESS("Refreshed the drifted items"))
@@ -13,8 +13,8 @@ class Command(BaseCommand):
     """Prepare the gateway before the ASGI server starts."""
 
     help = (
-        "Prepare the gateway for serving: migrate, init search indices, "
-        "service tokens, and visualization pipelines."
+        "Prepare the gateway for serving: migrate, build the access index, "
+        "init search indices, service tokens, and visualization pipelines."
     )
 
     def add_arguments(self, parser):
@@ -40,6 +40,11 @@ class Command(BaseCommand):
         pipeline_strategy = options["pipeline_strategy"]
         steps: list[tuple[str, str, dict[str, object]]] = [
             ("Applying database migrations...", "migrate", {"no_input": True}),
+            (
+                "Building the access index...",
+                "rebuild_access_index",
+                {"if_drifted": True},
+            ),
             ("Initializing OpenSearch indices...", "init_indices", {}),
             ("Initializing SVI server token...", "init_svi_token", {}),
         ]
@@ -0,0 +1,31 @@
+"""Management command to rebuild the per-user access index."""
+
+from django.core.management.base import BaseCommand
+
+from sds_gateway.api_methods.utils.access_index import is_access_index_consistent
+from sds_gateway.api_methods.utils.access_index import rebuild_access_index
+
+
+class Command(BaseCommand):
+    """Recompute the access rows of every capture and file from their sources."""
+
+    help = "Rebuild the per-user access index of captures and files"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--if-drifted",
+            action="store_true",
+            help=(
+                "Only rebuild when the index doesn't match its sources, e.g. "
+                "after migrating existing assets"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        """Handle the command."""
+        if options["if_drifted"] and is_access_index_consistent():
+            self.stdout.write("Access index is consistent, skipping")
+            return
+        written = rebuild_access_index()
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} access rows"))
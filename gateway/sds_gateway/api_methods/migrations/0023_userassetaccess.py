@@ -0,0 +1,72 @@
+# Generated by Django 4.2.26
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("api_methods", "0022_fileuploadsession"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserAssetAccess",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "item_type",
+                    models.CharField(
+                        choices=[("capture", "Capture"), ("file", "File")],
+                        max_length=20,
+                    ),
+                ),
+                ("item_uuid", models.UUIDField()),
+                (
+                    "permission_level",
+                    models.CharField(
+                        choices=[
+                            ("owner", "Owner"),
+                            ("co-owner", "Co-Owner"),
+                            ("contributor", "Contributor"),
+                            ("viewer", "Viewer"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="asset_access",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["item_type", "item_uuid"],
+                        name="api_methods_item_ty_b90e6f_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="userassetaccess",
+            constraint=models.UniqueConstraint(
+                fields=("user", "item_type", "item_uuid"),
+                name="unique_user_asset_access",
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api_methods", "0023_userassetaccess"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="fileuploadsession",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("active", "Active"),
+                    ("verifying", "Verifying"),
+                    ("completed", "Completed"),
+                    ("aborted", "Aborted"),
+                ],
+                default="active",
+                max_length=20,
+            ),
+        ),
+    ]
@@ -132,6 +132,16 @@ class ZipFileStatus(StrEnum):
     Failed = "failed"
 
 
+class UploadSessionStatus(StrEnum):
+    """The status of a chunked file upload session."""
+
+    Active = "active"
+    Assembled = "assembled"
+    Verifying = "verifying"
+    Completed = "completed"
+    Aborted = "aborted"
+
+
 class DatasetStatus(StrEnum):
     """The status of a dataset."""
 
@@ -438,6 +448,9 @@ class Capture(BaseModel):
     @property
     def is_multi_channel(self) -> bool:
         """Check if this capture is a multi-channel capture."""
+        # cached when captures are loaded in bulk (see `load_capture_bulk_data`)
+        if hasattr(self, "_is_multi_channel_cache"):
+            return self._is_multi_channel_cache
         match self.capture_type:
             case CaptureType.DigitalRF:
                 captures_in_top_level_dir = Capture.objects.filter(
@@ -1280,6 +1293,91 @@ class TemporaryZipFile(BaseModel):
         return False
 
 
+class FileUploadSession(BaseModel):
+    """
+    Model to track chunked uploads of the contents of large files.
+
+    Parts are written to an S3 multipart upload as they arrive, so interrupted
+    uploads can resume from the parts already stored. Completing the session
+    assembles the parts into a single object that a new File points to.
+    """
+
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="file_upload_sessions",
+        on_delete=models.PROTECT,
+    )
+    object_name = models.CharField(max_length=255)
+    multipart_upload_id = models.CharField(max_length=1024)
+    sum_blake3 = models.CharField(max_length=64)
+    size = models.BigIntegerField()
+    part_size = models.BigIntegerField()
+    # part number (as a string) -> {"etag": str, "size": int, "sum_blake3": str}
+    parts = models.JSONField(default=dict, blank=True)
+    status = models.CharField(
+        max_length=20,
+        choices=[(st.value, st.value.title()) for st in UploadSessionStatus],
+        default=UploadSessionStatus.Active.value,
+    )
+    expires_at = models.DateTimeField()
+
+    def __str__(self) -> str:
+        return f"Upload session {self.uuid} ({self.status})"
+
+    @property
+    def is_expired(self) -> bool:
+        """Check if the session has expired and should be aborted."""
+        return datetime.datetime.now(datetime.UTC) > self.expires_at
+
+    @property
+    def num_parts(self) -> int:
+        """Number of parts the contents are split into; empty files have one."""
+        return max(1, -(-self.size // self.part_size))
+
+    def expected_part_size(self, part_number: int) -> int:
+        """Size in bytes of a part: only the last one may be smaller."""
+        if part_number < self.num_parts:
+            return self.part_size
+        return self.size - (self.num_parts - 1) * self.part_size
+
+    @property
+    def missing_parts(self) -> list[int]:
+        """Part numbers not uploaded yet, in ascending order."""
+        return [
+            part_number
+            for part_number in range(1, self.num_parts + 1)
+            if str(part_number) not in self.parts
+        ]
+
+
+class PresignedUpload(BaseModel):
+    """
+    Model to track file contents uploaded through presigned URLs.
+
+    Contents are written to their own object before any file references them.
+    Uploads that are not completed before they expire are discarded, together
+    with their object.
+    """
+
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="presigned_uploads",
+        on_delete=models.PROTECT,
+    )
+    object_name = models.CharField(max_length=255)
+    sum_blake3 = models.CharField(max_length=64)
+    size = models.BigIntegerField()
+    expires_at = models.DateTimeField()
+
+    def __str__(self) -> str:
+        return f"Presigned upload {self.uuid} ({self.object_name})"
+
+    @property
+    def is_expired(self) -> bool:
+        """Check if the upload can no longer be completed."""
+        return datetime.datetime.now(datetime.UTC) > self.expires_at
+
+
 class UserSharePermission(BaseModel):
     """
     Model to handle user share permissions for different item types.
@@ -1657,6 +1755,56 @@ class ShareGroup(BaseModel):
         return f"ShareGroup: {self.name} (Owner: {self.owner.email})"
 
 
+class UserAssetAccess(models.Model):
+    """
+    Denormalized index of the captures and files each user can access.
+
+    One row per user and non-deleted item they can access, derived from
+    ownership, share permissions and capture and dataset membership; see
+    `sds_gateway.api_methods.utils.access_index` for how rows are computed and
+    kept up to date. Access inherited from a capture or dataset is recorded
+    with the viewer level.
+    """
+
+    ITEM_TYPE_CHOICES = [
+        (ItemType.CAPTURE, "Capture"),
+        (ItemType.FILE, "File"),
+    ]
+
+    PERMISSION_CHOICES = [
+        (PermissionLevel.OWNER, "Owner"),
+        (PermissionLevel.CO_OWNER, "Co-Owner"),
+        (PermissionLevel.CONTRIBUTOR, "Contributor"),
+        (PermissionLevel.VIEWER, "Viewer"),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="asset_access",
+    )
+    item_type = models.CharField(max_length=20, choices=ITEM_TYPE_CHOICES)
+    item_uuid = models.UUIDField()
+    permission_level = models.CharField(max_length=20, choices=PERMISSION_CHOICES)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "item_type", "item_uuid"],
+                name="unique_user_asset_access",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["item_type", "item_uuid"]),
+        ]
+
+    def __str__(self) -> str:
+        return (
+            f"User {self.user_id} {self.permission_level} of "
+            f"{self.item_type} {self.item_uuid}"
+        )
+
+
 def _extract_drf_capture_props(
     capture_props: dict[str, Any],
     center_frequency: float | None = None,
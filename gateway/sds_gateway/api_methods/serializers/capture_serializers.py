@@ -1,5 +1,6 @@
 """Capture serializers for the SDS Gateway API methods."""
 
+from collections.abc import Iterable
 from datetime import UTC
 from datetime import datetime
 from typing import Any
@@ -11,6 +12,12 @@ from loguru import logger as log
 from rest_framework import serializers
 from rest_framework.utils.serializer_helpers import ReturnList
 
+from sds_gateway.api_methods.helpers.capture_bulk_data import CAPTURE_BULK_DATA_KEY
+from sds_gateway.api_methods.helpers.capture_bulk_data import (
+    POST_PROCESSED_DATA_ORDERING,
+)
+from sds_gateway.api_methods.helpers.capture_bulk_data import CaptureBulkData
+from sds_gateway.api_methods.helpers.capture_bulk_data import load_capture_bulk_data
 from sds_gateway.api_methods.helpers.index_handling import retrieve_indexed_metadata
 from sds_gateway.api_methods.models import Capture
 from sds_gateway.api_methods.models import CaptureType
@@ -135,25 +142,70 @@ class CaptureGetSerializer(serializers.ModelSerializer[Capture]):
     capture_type_display = serializers.SerializerMethodField()
     post_processed_data = serializers.SerializerMethodField()
 
+    def _bulk_data(self, capture: Capture) -> CaptureBulkData | None:
+        """Rows related to the capture, when loaded with those serialized with it.
+
+        Given in the context (under CAPTURE_BULK_DATA_KEY), or loaded once for all
+        instances of a many=True serialization; None to query them per capture.
+        """
+        context = self.context or {}
+        bulk_data = cast("CaptureBulkData | None", context.get(CAPTURE_BULK_DATA_KEY))
+        if bulk_data is None:
+            parent = self.parent
+            if not isinstance(parent, serializers.ListSerializer) or not isinstance(
+                parent.instance, Iterable
+            ):
+                return None
+            if not hasattr(parent, "capture_bulk_data"):
+                parent.capture_bulk_data = load_capture_bulk_data(
+                    list(parent.instance),
+                    include_files=not context.get("exclude_files", False),
+                )
+            bulk_data = cast("CaptureBulkData", parent.capture_bulk_data)
+        return bulk_data if bulk_data.covers(capture) else None
+
+    def _share_permissions(self, capture: Capture) -> list[UserSharePermission]:
+        """Enabled share permissions of the capture."""
+        bulk_data = self._bulk_data(capture)
+        if bulk_data is not None:
+            return bulk_data.share_permissions.get(str(capture.uuid), [])
+        return list(
+            UserSharePermission.objects.filter(
+                item_uuid=capture.uuid,
+                item_type=ItemType.CAPTURE,
+                is_deleted=False,
+                is_enabled=True,
+            )
+        )
+
     def get_datasets(self, capture: Capture) -> list[dict[str, Any]]:
         """Datasets linked to this capture (summary rows only; avoids nested graphs)."""
-        qs = get_capture_datasets(capture, include_deleted=False)
-        return DatasetSummarySerializer(qs, many=True, context=self.context or {}).data
+        bulk_data = self._bulk_data(capture)
+        datasets = (
+            bulk_data.datasets.get(str(capture.uuid), [])
+            if bulk_data is not None
+            else get_capture_datasets(capture, include_deleted=False)
+        )
+        return DatasetSummarySerializer(
+            datasets, many=True, context=self.context or {}
+        ).data
 
     def get_share_permissions(self, capture: Capture) -> list[UserSharePermission]:
         """Get the share permissions for the capture."""
-        user_share_permissions = UserSharePermission.objects.filter(
-            item_uuid=capture.uuid,
-            item_type=ItemType.CAPTURE,
-            is_deleted=False,
-            is_enabled=True,
-        )
-        return UserSharePermissionSerializer(user_share_permissions, many=True).data
+        return UserSharePermissionSerializer(
+            self._share_permissions(capture), many=True
+        ).data
 
     def get_is_shared_with_me(self, capture: Capture) -> bool:
         """Get whether the capture is shared with the current user."""
         request = (self.context or {}).get("request")
         if request and hasattr(request, "user"):
+            if self._bulk_data(capture) is not None:
+                return any(
+                    permission.shared_with_id == request.user.pk
+                    and permission.owner_id != request.user.pk
+                    for permission in self._share_permissions(capture)
+                )
             return (
                 UserSharePermission.objects.filter(
                     shared_with=request.user,
@@ -173,6 +225,8 @@ class CaptureGetSerializer(serializers.ModelSerializer[Capture]):
         Returns:
             True if the capture has enabled share permissions, False otherwise.
         """
+        if self._bulk_data(capture) is not None:
+            return bool(self._share_permissions(capture))
         return check_if_shared(capture.uuid, ItemType.CAPTURE)
 
     def get_permission_level(self, capture: Capture) -> PermissionLevel | None:
@@ -182,10 +236,20 @@ class CaptureGetSerializer(serializers.ModelSerializer[Capture]):
             return None
 
         # Check if user is the owner
-        if capture.owner == request.user:
+        if capture.owner_id is not None and capture.owner_id == request.user.pk:
             return PermissionLevel.OWNER
 
         # Check for shared permissions
+        if self._bulk_data(capture) is not None:
+            permission = next(
+                (
+                    permission
+                    for permission in self._share_permissions(capture)
+                    if permission.shared_with_id == request.user.pk
+                ),
+                None,
+            )
+            return permission.permission_level if permission else None
         permission = UserSharePermission.objects.filter(
             shared_with=request.user,
             item_type=ItemType.CAPTURE,
@@ -206,7 +270,12 @@ class CaptureGetSerializer(serializers.ModelSerializer[Capture]):
         if exclude_files:
             return []
 
-        non_deleted_files = get_capture_files(capture, include_deleted=False)
+        bulk_data = self._bulk_data(capture)
+        non_deleted_files = (
+            bulk_data.files.get(str(capture.uuid), [])
+            if bulk_data is not None and bulk_data.files is not None
+            else get_capture_files(capture, include_deleted=False)
+        )
         return FileSummarySerializer(
             non_deleted_files, many=True, context=self.context or {}
         ).data
@@ -334,9 +403,12 @@ class CaptureGetSerializer(serializers.ModelSerializer[Capture]):
     @extend_schema_field(DEPRECATEDPostProcessedDataSerializer(many=True))
     def get_post_processed_data(self, obj: Capture) -> Any:
         """Get all post-processed data for this capture."""
-        processed_data = obj.visualization_post_processed_data.all().order_by(
-            "processing_type", "-created_at"
-        )
+        processed_data = obj.visualization_post_processed_data.all()
+        # prefetched in order by load_capture_bulk_data
+        if "visualization_post_processed_data" not in getattr(
+            obj, "_prefetched_objects_cache", {}
+        ):
+            processed_data = processed_data.order_by(*POST_PROCESSED_DATA_ORDERING)
         return DEPRECATEDPostProcessedDataSerializer(processed_data, many=True).data
 
     class Meta:
@@ -3,11 +3,13 @@
 import uuid
 from typing import Any
 
+from django.db.models.fields.files import FieldFile
 from django.http import QueryDict
 from loguru import logger as log
 from rest_framework import serializers
 
 from sds_gateway.api_methods.models import File
+from sds_gateway.api_methods.models import FileUploadSession
 from sds_gateway.api_methods.serializers.summary_serializers import (
     DatasetSummarySerializer,
 )
@@ -113,7 +115,10 @@ class FilePostSerializer(serializers.ModelSerializer[File]):
         if "media_type" not in validated_data:
             validated_data["media_type"] = ""
 
-        b3_checksum = File().calculate_checksum(validated_data["file"])
+        # contents uploaded through a presigned URL are verified before this
+        b3_checksum = self.context.get(
+            "verified_sum_blake3"
+        ) or File().calculate_checksum(validated_data["file"])
 
         user_file_queryset = File.objects.filter(
             owner=validated_data["owner"],
@@ -146,6 +151,9 @@ class FilePostSerializer(serializers.ModelSerializer[File]):
         if existing_file_instance:  # sibling file exists
             validated_data["file"] = existing_file_instance.file
             validated_data["size"] = existing_file_instance.size
+        elif isinstance(validated_data["file"], FieldFile):
+            # original file contents, already in object storage
+            validated_data["size"] = validated_data["file"].size
         else:  # original file contents
             file_size = validated_data["file"].size
             target_name = validated_data["file"].name
@@ -226,18 +234,11 @@ class FilePostSerializer(serializers.ModelSerializer[File]):
             # attrs always differ when the file doesn't exist
             user_mutable_attributes_differ = True
         else:
-            # check mutable attributes between existing file and request data
-            user_mutable_attributes_differ = False
             # we can narrow down the asset to an exact match
             asset = identical_file
-            # these attrs were already checked in query
-            skipped_attrs: list[str] = ["name", "directory"]
-            for attr in self.Meta.user_mutable_fields:
-                if attr in skipped_attrs or attr not in request_data:
-                    continue
-                if getattr(identical_file, attr) != request_data[attr]:
-                    user_mutable_attributes_differ = True
-                    break
+            user_mutable_attributes_differ = self._user_mutable_attributes_differ(
+                existing_file=identical_file, request_data=request_data
+            )
 
         return {
             "file_exists_in_tree": identical_file is not None,
@@ -246,6 +247,82 @@ class FilePostSerializer(serializers.ModelSerializer[File]):
             "asset_id": asset.uuid if asset else None,
         }
 
+    def check_files_contents_exist(
+        self,
+        *,
+        entries: list[dict[str, Any]],
+        user: User,
+    ) -> list[dict[str, bool | uuid.UUID | None]]:
+        """Batch version of `check_file_contents_exist()`, using a single query.
+
+        Args:
+            entries:    Dicts with the `sum_blake3`, `name`, and `directory` of each
+                            file, and optionally their other user-mutable attributes.
+                            Directories must already be sanitized with
+                            `sanitize_path_rel_to_user()`.
+            user:       The requesting user.
+        Returns:
+            One dictionary of flags per entry, in the same order and with the same
+                keys as the ones returned by `check_file_contents_exist()`.
+        """
+        checksums = {entry["sum_blake3"] for entry in entries}
+        candidates = File.objects.filter(
+            owner=user,
+            is_deleted=False,
+            sum_blake3__in=checksums,
+        ).only("uuid", "sum_blake3", *self.Meta.user_mutable_fields)
+        if not candidates.ordered:
+            # same order used by .first() in the single-file check
+            candidates = candidates.order_by("pk")
+
+        first_by_checksum: dict[str, File] = {}
+        first_by_location: dict[tuple[str, str, str], File] = {}
+        for candidate in candidates.iterator():
+            first_by_checksum.setdefault(candidate.sum_blake3, candidate)
+            first_by_location.setdefault(
+                (candidate.sum_blake3, candidate.directory, candidate.name),
+                candidate,
+            )
+
+        results: list[dict[str, bool | uuid.UUID | None]] = []
+        for entry in entries:
+            blake3_sum = entry["sum_blake3"]
+            identical_file = first_by_location.get(
+                (blake3_sum, str(entry["directory"]), entry["name"])
+            )
+            asset = identical_file or first_by_checksum.get(blake3_sum)
+            user_mutable_attributes_differ = (
+                identical_file is None
+                or self._user_mutable_attributes_differ(
+                    existing_file=identical_file, request_data=entry
+                )
+            )
+            results.append(
+                {
+                    "file_exists_in_tree": identical_file is not None,
+                    "file_contents_exist_for_user": blake3_sum in first_by_checksum,
+                    "user_mutable_attributes_differ": user_mutable_attributes_differ,
+                    "asset_id": asset.uuid if asset else None,
+                }
+            )
+        return results
+
+    def _user_mutable_attributes_differ(
+        self,
+        *,
+        existing_file: File,
+        request_data: QueryDict | dict[str, Any],
+    ) -> bool:
+        """Whether the request data changes user-mutable attributes of a file."""
+        # these attrs are matched when looking up the existing file
+        skipped_attrs: list[str] = ["name", "directory"]
+        for attr in self.Meta.user_mutable_fields:
+            if attr in skipped_attrs or attr not in request_data:
+                continue
+            if getattr(existing_file, attr) != request_data[attr]:
+                return True
+        return False
+
 
 class FileCheckResponseSerializer(serializers.Serializer[File]):
     """Serializer for the response of the file check endpoint."""
@@ -253,3 +330,72 @@ class FileCheckResponseSerializer(serializers.Serializer[File]):
     file_contents_exist_for_user = serializers.BooleanField()
     file_exists_in_tree = serializers.BooleanField()
     user_mutable_attributes_differ = serializers.BooleanField()
+
+
+class FileContentsCheckEntrySerializer(serializers.Serializer[File]):
+    """Serializer for a single file in a batch file contents check request."""
+
+    directory = serializers.CharField()
+    name = serializers.CharField(max_length=255)
+    sum_blake3 = serializers.CharField(max_length=64)
+    media_type = serializers.CharField(required=False)
+    permissions = serializers.CharField(required=False)
+
+
+class FileContentsCheckBatchSerializer(serializers.Serializer[File]):
+    """Serializer for batch file contents check requests."""
+
+    MAX_FILES = 1000
+
+    files = serializers.ListField(
+        child=FileContentsCheckEntrySerializer(),
+        allow_empty=False,
+        max_length=MAX_FILES,
+    )
+
+
+class FileContentsCheckBatchResponseSerializer(serializers.Serializer[File]):
+    """Serializer for responses of the batch file contents check endpoint."""
+
+    results = FileCheckResponseSerializer(many=True)
+
+
+class PresignedUploadRequestSerializer(serializers.Serializer[File]):
+    """Serializer for requests of presigned upload URLs."""
+
+    sum_blake3 = serializers.RegexField(regex=r"^[0-9a-f]{64}$")
+    size = serializers.IntegerField(min_value=0)
+
+
+class PresignedUrlResponseSerializer(serializers.Serializer[File]):
+    """Serializer for responses with a presigned transfer URL."""
+
+    url = serializers.URLField()
+    # form fields of presigned uploads, sent before the file contents
+    fields = serializers.DictField(child=serializers.CharField(), required=False)
+    expires_in = serializers.IntegerField()
+    upload_token = serializers.CharField(required=False)
+
+
+class UploadSessionSerializer(serializers.ModelSerializer[FileUploadSession]):
+    """Serializer for the state of chunked upload sessions."""
+
+    num_parts = serializers.IntegerField(read_only=True)
+    missing_parts = serializers.ListField(
+        child=serializers.IntegerField(), read_only=True
+    )
+
+    class Meta:
+        model = FileUploadSession
+        fields = [
+            "uuid",
+            "sum_blake3",
+            "size",
+            "part_size",
+            "num_parts",
+            "parts",
+            "missing_parts",
+            "status",
+            "expires_at",
+        ]
+        read_only_fields = fields
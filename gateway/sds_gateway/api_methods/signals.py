@@ -0,0 +1,233 @@
+"""Keep the per-user access index up to date as its sources change.
+
+See `sds_gateway.api_methods.utils.access_index` for how rows are derived.
+Instances remember the fields that grant access when loaded, so saves that do
+not change them skip the refresh.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from django.db.models.signals import m2m_changed
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_init
+from django.db.models.signals import post_save
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from sds_gateway.api_methods.models import Capture
+from sds_gateway.api_methods.models import Dataset
+from sds_gateway.api_methods.models import File
+from sds_gateway.api_methods.models import UserSharePermission
+from sds_gateway.api_methods.utils.access_index import refresh_capture_access
+from sds_gateway.api_methods.utils.access_index import refresh_dataset_access
+from sds_gateway.api_methods.utils.access_index import refresh_file_access
+from sds_gateway.api_methods.utils.access_index import refresh_item_access
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+# attributes of each model that grant access to captures and files
+_ACCESS_FIELDS: dict[type[Model], tuple[str, ...]] = {
+    Capture: ("owner_id", "dataset_id", "is_deleted"),
+    Dataset: ("owner_id", "is_deleted"),
+    File: ("owner_id", "capture_id", "dataset_id", "is_deleted"),
+    UserSharePermission: (
+        "shared_with_id",
+        "item_type",
+        "item_uuid",
+        "permission_level",
+        "is_enabled",
+        "is_deleted",
+    ),
+}
+
+# stands for fields deferred when the instance was loaded
+_UNKNOWN = object()
+
+
+def _access_state(instance: Model) -> tuple[Any, ...]:
+    # reads __dict__ to not load deferred fields
+    return tuple(
+        instance.__dict__.get(attname, _UNKNOWN)
+        for attname in _ACCESS_FIELDS[type(instance)]
+    )
+
+
+def _access_changed(instance: Model, *, created: bool) -> bool:
+    """Whether a saved instance changed how access is granted, since loaded."""
+    state = _access_state(instance)
+    previous = getattr(instance, "_access_index_state", None)
+    instance._access_index_state = state  # noqa: SLF001
+    return created or previous != state
+
+
+@receiver(post_init, sender=Capture)
+@receiver(post_init, sender=Dataset)
+@receiver(post_init, sender=File)
+@receiver(post_init, sender=UserSharePermission)
+def remember_access_state(sender: type[Model], instance: Model, **kwargs) -> None:
+    instance._access_index_state = _access_state(instance)  # noqa: SLF001
+
+
+@receiver(post_save, sender=UserSharePermission)
+def share_permission_saved(
+    sender: type[UserSharePermission],
+    instance: UserSharePermission,
+    created: bool,  # noqa: FBT001
+    **kwargs,
+) -> None:
+    previous = getattr(instance, "_access_index_state", None)
+    if not _access_changed(instance, created=created):
+        return
+    refresh_item_access(instance.item_type, [instance.item_uuid])
+    # an edited permission may have pointed to another item
+    if created or previous is None:
+        return
+    previous_type, previous_uuid = previous[1:3]
+    if _UNKNOWN not in (previous_type, previous_uuid) and (
+        previous_type,
+        previous_uuid,
+    ) != (instance.item_type, instance.item_uuid):
+        refresh_item_access(previous_type, [previous_uuid])
+
+
+@receiver(post_delete, sender=UserSharePermission)
+def share_permission_deleted(
+    sender: type[UserSharePermission], instance: UserSharePermission, **kwargs
+) -> None:
+    refresh_item_access(instance.item_type, [instance.item_uuid])
+
+
+@receiver(post_save, sender=Capture)
+def capture_saved(
+    sender: type[Capture],
+    instance: Capture,
+    created: bool,  # noqa: FBT001
+    **kwargs,
+) -> None:
+    if _access_changed(instance, created=created):
+        refresh_capture_access([instance.uuid])
+
+
+@receiver(post_save, sender=File)
+def file_saved(
+    sender: type[File],
+    instance: File,
+    created: bool,  # noqa: FBT001
+    **kwargs,
+) -> None:
+    if _access_changed(instance, created=created):
+        refresh_file_access([instance.uuid])
+
+
+@receiver(post_save, sender=Dataset)
+def dataset_saved(
+    sender: type[Dataset],
+    instance: Dataset,
+    created: bool,  # noqa: FBT001
+    **kwargs,
+) -> None:
+    # new datasets have no captures or files yet
+    if _access_changed(instance, created=created) and not created:
+        refresh_dataset_access([instance.uuid])
+
+
+@receiver(pre_delete, sender=Capture)
+def remember_capture_files(sender: type[Capture], instance: Capture, **kwargs) -> None:
+    # links to the capture are removed before post_delete
+    instance._access_index_files = [  # noqa: SLF001
+        *instance.files.values_list("uuid", flat=True),
+        *instance.files_deprecated.values_list("uuid", flat=True),
+    ]
+
+
+@receiver(post_delete, sender=Capture)
+def capture_deleted(sender: type[Capture], instance: Capture, **kwargs) -> None:
+    refresh_capture_access([instance.uuid], include_files=False)
+    refresh_file_access(getattr(instance, "_access_index_files", []))
+
+
+@receiver(post_delete, sender=File)
+def file_deleted(sender: type[File], instance: File, **kwargs) -> None:
+    refresh_file_access([instance.uuid])
+
+
+@receiver(pre_delete, sender=Dataset)
+def remember_dataset_assets(sender: type[Dataset], instance: Dataset, **kwargs) -> None:
+    # links to the dataset are removed before post_delete
+    instance._access_index_captures = [  # noqa: SLF001
+        *instance.captures.values_list("uuid", flat=True),
+        *instance.captures_deprecated.values_list("uuid", flat=True),
+    ]
+    instance._access_index_files = [  # noqa: SLF001
+        *instance.files.values_list("uuid", flat=True),
+        *instance.files_deprecated.values_list("uuid", flat=True),
+    ]
+
+
+@receiver(post_delete, sender=Dataset)
+def dataset_deleted(sender: type[Dataset], instance: Dataset, **kwargs) -> None:
+    refresh_capture_access(getattr(instance, "_access_index_captures", []))
+    refresh_file_access(getattr(instance, "_access_index_files", []))
+
+
+def _m2m_changed_items(
+    instance: Model,
+    action: str,
+    *,
+    reverse: bool,
+    pk_set: set[Any] | None,
+    reverse_accessor: str,
+) -> list[Any] | None:
+    """Items on the forward side of an M2M change, None before the change.
+
+    The items of a reverse clear are remembered on the instance beforehand.
+    """
+    if not reverse:
+        return None if action.startswith("pre_") else [instance.pk]
+    if action == "pre_clear":
+        instance._access_index_cleared = list(  # noqa: SLF001
+            getattr(instance, reverse_accessor).values_list("pk", flat=True)
+        )
+        return None
+    if action == "post_clear":
+        return getattr(instance, "_access_index_cleared", [])
+    if action in ("post_add", "post_remove"):
+        return list(pk_set or ())
+    return None
+
+
+@receiver(m2m_changed, sender=Capture.datasets.through)
+def capture_datasets_changed(
+    sender: type[Model],
+    instance: Capture | Dataset,
+    action: str,
+    reverse: bool,  # noqa: FBT001
+    pk_set: set[Any] | None,
+    **kwargs,
+) -> None:
+    capture_uuids = _m2m_changed_items(
+        instance, action, reverse=reverse, pk_set=pk_set, reverse_accessor="captures"
+    )
+    if capture_uuids:
+        refresh_capture_access(capture_uuids)
+
+
+@receiver(m2m_changed, sender=File.captures.through)
+@receiver(m2m_changed, sender=File.datasets.through)
+def file_links_changed(
+    sender: type[Model],
+    instance: File | Capture | Dataset,
+    action: str,
+    reverse: bool,  # noqa: FBT001
+    pk_set: set[Any] | None,
+    **kwargs,
+) -> None:
+    file_uuids = _m2m_changed_items(
+        instance, action, reverse=reverse, pk_set=pk_set, reverse_accessor="files"
+    )
+    if file_uuids:
+        refresh_file_access(file_uuids)
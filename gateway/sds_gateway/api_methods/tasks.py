@@ -19,10 +19,15 @@ from django.template.loader import render_to_string
 from loguru import logger as log
 from redis import Redis
 
+from sds_gateway.api_methods.helpers.presigned_transfers import (
+    discard_expired_presigned_uploads,
+)
+from sds_gateway.api_methods.helpers.upload_sessions import abort_upload_session
 from sds_gateway.api_methods.models import Capture
 from sds_gateway.api_methods.models import CaptureType
 from sds_gateway.api_methods.models import Dataset
 from sds_gateway.api_methods.models import File
+from sds_gateway.api_methods.models import FileUploadSession
 from sds_gateway.api_methods.models import ItemType
 from sds_gateway.api_methods.models import TemporaryZipFile
 from sds_gateway.api_methods.models import ZipFileStatus
@@ -424,6 +429,49 @@ def cleanup_expired_temp_zips() -> dict[str, str | int]:
         }
 
 
+@shared_task
+def cleanup_expired_upload_sessions() -> dict[str, str | int]:
+    """
+    Celery task to abort chunked upload sessions that expired before a file was
+    created from them, discarding their parts or assembled contents.
+
+    Returns:
+        dict: Task result with cleanup statistics
+    """
+    expired_sessions = FileUploadSession.objects.filter(
+        expires_at__lt=datetime.datetime.now(datetime.UTC),
+        is_deleted=False,
+    )
+    aborted_count = 0
+    for session in expired_sessions.iterator():
+        abort_upload_session(session)
+        aborted_count += 1
+    log.info(f"Aborted {aborted_count} expired upload sessions")
+    return {
+        "status": "success",
+        "message": f"Aborted {aborted_count} expired upload sessions",
+        "aborted_count": aborted_count,
+    }
+
+
+@shared_task
+def cleanup_expired_presigned_uploads() -> dict[str, str | int]:
+    """
+    Celery task to discard contents uploaded through presigned forms that
+    expired before a file was created from them.
+
+    Returns:
+        dict: Task result with cleanup statistics
+    """
+    discarded_count = discard_expired_presigned_uploads()
+    log.info(f"Discarded {discarded_count} expired presigned uploads")
+    return {
+        "status": "success",
+        "message": f"Discarded {discarded_count} expired presigned uploads",
+        "discarded_count": discarded_count,
+    }
+
+
 @shared_task
 def cleanup_orphaned_zip_files() -> dict[str, str | int]:
     """
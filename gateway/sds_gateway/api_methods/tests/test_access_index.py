@@ -0,0 +1,178 @@
+"""Tests for the per-user access index of captures and files."""
+
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from sds_gateway.api_methods.models import Capture
+from sds_gateway.api_methods.models import CaptureType
+from sds_gateway.api_methods.models import Dataset
+from sds_gateway.api_methods.models import File
+from sds_gateway.api_methods.models import ItemType
+from sds_gateway.api_methods.models import PermissionLevel
+from sds_gateway.api_methods.models import UserAssetAccess
+from sds_gateway.api_methods.models import UserSharePermission
+from sds_gateway.api_methods.utils.access_index import check_access_index
+from sds_gateway.api_methods.utils.access_index import rebuild_access_index
+from sds_gateway.api_methods.utils.asset_access_control import (
+    disconnect_files_from_capture,
+)
+from sds_gateway.api_methods.utils.asset_access_control import (
+    get_accessible_captures_queryset,
+)
+from sds_gateway.api_methods.utils.asset_access_control import (
+    get_accessible_files_queryset,
+)
+
+User = get_user_model()
+
+
+class AccessIndexTestCase(TestCase):
+    """Incremental maintenance, rebuild and checks of the access index."""
+
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            email="index-owner@example.com",
+            password="testpass123",  # noqa: S106
+            name="Index Owner",
+        )
+        self.viewer = User.objects.create_user(
+            email="index-viewer@example.com",
+            password="testpass123",  # noqa: S106
+            name="Index Viewer",
+        )
+        self.dataset = Dataset.objects.create(name="Index Dataset", owner=self.owner)
+        self.capture = Capture.objects.create(
+            name="Index Capture",
+            owner=self.owner,
+            capture_type=CaptureType.RadioHound,
+            index_name="captures-rh",
+            top_level_dir="index-dir",
+        )
+        self.file = File.objects.create(
+            name="index_file.h5", owner=self.owner, size=1000
+        )
+        self.file.captures.add(self.capture)
+
+    def _level(self, user, item_type: ItemType, item) -> str | None:
+        row = UserAssetAccess.objects.filter(
+            user=user, item_type=item_type, item_uuid=item.uuid
+        ).first()
+        return row.permission_level if row else None
+
+    def test_capture_share_grants_access_to_capture_and_files(self):
+        """Sharing a capture indexes it and its files for the shared user."""
+        permission = UserSharePermission.objects.create(
+            owner=self.owner,
+            shared_with=self.viewer,
+            item_type=ItemType.CAPTURE,
+            item_uuid=self.capture.uuid,
+            permission_level=PermissionLevel.CONTRIBUTOR,
+        )
+
+        assert self._level(self.owner, ItemType.FILE, self.file) == (
+            PermissionLevel.OWNER
+        )
+        assert self._level(self.viewer, ItemType.CAPTURE, self.capture) == (
+            PermissionLevel.CONTRIBUTOR
+        )
+        assert self._level(self.viewer, ItemType.FILE, self.file) == (
+            PermissionLevel.VIEWER
+        )
+        assert list(get_accessible_files_queryset(self.viewer)) == [self.file]
+
+        permission.is_enabled = False
+        permission.save()
+
+        assert not get_accessible_captures_queryset(self.viewer).exists()
+        assert not get_accessible_files_queryset(self.viewer).exists()
+
+    def test_dataset_membership_and_soft_delete(self):
+        """Captures added to a shared dataset are indexed until it is deleted."""
+        UserSharePermission.objects.create(
+            owner=self.owner,
+            shared_with=self.viewer,
+            item_type=ItemType.DATASET,
+            item_uuid=self.dataset.uuid,
+        )
+        assert not get_accessible_captures_queryset(self.viewer).exists()
+
+        self.dataset.captures.add(self.capture)
+
+        assert list(get_accessible_captures_queryset(self.viewer)) == [self.capture]
+        assert list(get_accessible_files_queryset(self.viewer)) == [self.file]
+
+        self.dataset.is_deleted = True
+        self.dataset.save()
+
+        assert not get_accessible_captures_queryset(self.viewer).exists()
+        assert not get_accessible_files_queryset(self.viewer).exists()
+
+    def test_bulk_disconnect_refreshes_files(self):
+        """Files disconnected from a capture with bulk updates lose its access."""
+        UserSharePermission.objects.create(
+            owner=self.owner,
+            shared_with=self.viewer,
+            item_type=ItemType.CAPTURE,
+            item_uuid=self.capture.uuid,
+        )
+        fk_file = File.objects.create(
+            name="fk_file.h5", owner=self.owner, size=10, capture=self.capture
+        )
+        assert get_accessible_files_queryset(self.viewer).count() == 2  # noqa: PLR2004
+
+        disconnect_files_from_capture(self.capture)
+
+        assert not get_accessible_files_queryset(self.viewer).exists()
+        assert set(get_accessible_files_queryset(self.owner)) == {self.file, fk_file}
+        assert check_access_index().is_consistent
+
+    def test_check_and_rebuild(self):
+        """Drifted rows are reported, and fixed by a rebuild or --fix."""
+        UserSharePermission.objects.create(
+            owner=self.owner,
+            shared_with=self.viewer,
+            item_type=ItemType.CAPTURE,
+            item_uuid=self.capture.uuid,
+        )
+        indexed_rows = UserAssetAccess.objects.count()
+        assert check_access_index().is_consistent
+
+        UserAssetAccess.objects.filter(user=self.viewer).delete()
+        UserAssetAccess.objects.filter(user=self.owner).update(
+            permission_level=PermissionLevel.VIEWER
+        )
+        drift = check_access_index()
+        assert len(drift.missing) == indexed_rows
+        assert drift.item_uuids(ItemType.FILE) == {str(self.file.uuid)}
+        with pytest.raises(CommandError):
+            call_command("check_access_index")
+
+        call_command("check_access_index", fix=True)
+        assert check_access_index().is_consistent
+
+        UserAssetAccess.objects.all().delete()
+        assert rebuild_access_index() == indexed_rows
+        assert check_access_index().is_consistent
+
+    def test_rebuild_if_drifted_fills_partial_index(self):
+        """Existing assets are indexed even when signals already wrote rows."""
+        indexed_rows = UserAssetAccess.objects.count()
+        # e.g. migrated without rows, then a single upload indexed its file
+        UserAssetAccess.objects.exclude(item_uuid=self.file.uuid).delete()
+        assert UserAssetAccess.objects.exists()
+
+        call_command("rebuild_access_index", if_drifted=True)
+        assert UserAssetAccess.objects.count() == indexed_rows
+        assert self.capture in get_accessible_captures_queryset(self.owner)
+
+        with patch(
+            "sds_gateway.api_methods.management.commands.rebuild_access_index"
+            ".rebuild_access_index"
+        ) as mock_rebuild:
+            call_command("rebuild_access_index", if_drifted=True)
+        mock_rebuild.assert_not_called()
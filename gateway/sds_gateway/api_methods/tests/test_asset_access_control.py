@@ -10,6 +10,8 @@ from sds_gateway.api_methods.models import File
 from sds_gateway.api_methods.models import ItemType
 from sds_gateway.api_methods.models import PermissionLevel
 from sds_gateway.api_methods.models import UserSharePermission
+from sds_gateway.api_methods.utils import access_index
+from sds_gateway.api_methods.utils.asset_access_control import get_access_levels
 from sds_gateway.api_methods.utils.asset_access_control import (
     get_accessible_captures_queryset,
 )
@@ -447,3 +449,49 @@ class AssetAccessControlTestCase(TestCase):
         # Viewer should have access (capture is in shared dataset)
         assert user_has_access_to_file(self.viewer, file)
         assert file in get_accessible_files_queryset(self.viewer)
+
+    # Batch permission checks
+    def test_get_access_levels_checks_many_files_in_one_query(self):
+        """Test that batch checks return the accessible subset with levels."""
+        files = [
+            File.objects.create(name=f"batch_{i}.h5", owner=self.owner, size=10)
+            for i in range(4)
+        ]
+        for file in files[:3]:
+            file.captures.add(self.capture)
+        file_uuids = [file.uuid for file in files]
+
+        with self.assertNumQueries(1):
+            levels = get_access_levels(self.viewer, ItemType.FILE, file_uuids)
+
+        assert levels == {str(file.uuid): PermissionLevel.VIEWER for file in files[:3]}
+        assert get_access_levels(self.owner, ItemType.FILE, file_uuids) == {
+            str(file.uuid): PermissionLevel.OWNER for file in files
+        }
+        assert get_access_levels(self.owner, ItemType.DATASET, [self.dataset.uuid]) == {
+            str(self.dataset.uuid): PermissionLevel.OWNER
+        }
+        assert get_access_levels(
+            self.viewer, ItemType.DATASET, [self.dataset.uuid]
+        ) == {str(self.dataset.uuid): PermissionLevel.VIEWER}
+
+    def test_access_checks_are_remembered_during_requests(self):
+        """Test that repeated checks in a request make no queries until changes."""
+        file = File.objects.create(name="memo.h5", owner=self.owner, size=10)
+        file.captures.add(self.capture)
+        # the request signals would also close the connection of the test
+        #   transaction (close_old_connections), so only the memo receivers run
+        access_index._start_access_memo(sender=self.__class__)  # noqa: SLF001
+        self.addCleanup(
+            access_index._end_access_memo,  # noqa: SLF001
+            sender=self.__class__,
+        )
+
+        assert user_has_access_to_file(self.viewer, file)
+        with self.assertNumQueries(0):
+            assert user_has_access_to_file(self.viewer, file)
+            assert not get_access_levels(self.other_user, ItemType.FILE, [])
+
+        file.captures.remove(self.capture)
+
+        assert not user_has_access_to_file(self.viewer, file)
@@ -0,0 +1,130 @@
+"""Tests for serializing many captures with their related rows loaded in bulk."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+
+from sds_gateway.api_methods.models import Capture
+from sds_gateway.api_methods.models import CaptureType
+from sds_gateway.api_methods.models import Dataset
+from sds_gateway.api_methods.models import File
+from sds_gateway.api_methods.models import ItemType
+from sds_gateway.api_methods.models import UserSharePermission
+from sds_gateway.api_methods.serializers.capture_serializers import CaptureGetSerializer
+
+User = get_user_model()
+
+_COMPARED_FIELDS = (
+    "owner",
+    "shared_with",
+    "share_permissions",
+    "is_shared",
+    "is_shared_with_me",
+    "permission_level",
+    "datasets",
+    "total_file_count",
+    "total_file_size",
+    "data_files_info",
+    "post_processed_data",
+)
+
+
+class CaptureBulkSerializationTests(TestCase):
+    """Query counts and payloads of CaptureGetSerializer with many=True."""
+
+    def setUp(self) -> None:
+        self.owner = User.objects.create(
+            email="bulk-owner@example.com",
+            password="testpassword",  # noqa: S106
+            is_approved=True,
+        )
+        self.viewer = User.objects.create(
+            email="bulk-viewer@example.com",
+            password="testpassword",  # noqa: S106
+            is_approved=True,
+        )
+        dataset = Dataset.objects.create(name="bulk-dataset", owner=self.owner)
+        for i in range(6):
+            capture = Capture.objects.create(
+                capture_type=CaptureType.DigitalRF,
+                channel=f"ch{i}",
+                index_name="captures-test-drf",
+                owner=self.owner,
+                top_level_dir=f"/bulk-dir-{i}",
+                dataset=dataset if i % 2 else None,
+            )
+            capture.datasets.add(dataset)
+            for name in (f"rf@1700000{i}00.000.h5", "drf_properties.h5"):
+                File.objects.create(
+                    name=name,
+                    directory=f"/files/bulk-owner@example.com/bulk-dir-{i}/",
+                    media_type="application/x-hdf5",
+                    size=100 + i,
+                    owner=self.owner,
+                ).captures.add(capture)
+            File.objects.create(
+                name="metadata.h5",
+                directory=f"/files/bulk-owner@example.com/bulk-dir-{i}/",
+                media_type="application/x-hdf5",
+                size=10,
+                owner=self.owner,
+                capture=capture,
+            )
+            UserSharePermission.objects.create(
+                owner=self.owner,
+                shared_with=self.viewer,
+                item_type=ItemType.CAPTURE,
+                item_uuid=capture.uuid,
+            )
+
+        request = APIRequestFactory().get("/")
+        request.user = self.viewer
+        self.context = {"request": request}
+        for patcher in (
+            patch(
+                "sds_gateway.api_methods.serializers.capture_serializers"
+                ".retrieve_indexed_metadata",
+                return_value={},
+            ),
+            patch.object(Capture, "get_opensearch_metadata", return_value={}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _serialize_page(self, page_size: int) -> tuple[list[dict[str, Any]], int]:
+        captures = Capture.objects.order_by("channel")[:page_size]
+        with CaptureQueriesContext(connection) as queries:
+            data = CaptureGetSerializer(captures, many=True, context=self.context).data
+        return data, len(queries)
+
+    def test_query_count_does_not_depend_on_page_size(self) -> None:
+        """A page of captures is serialized in a fixed number of queries."""
+        small_page, small_page_queries = self._serialize_page(2)
+        large_page, large_page_queries = self._serialize_page(6)
+
+        assert len(small_page) == 2  # noqa: PLR2004
+        assert len(large_page) == 6  # noqa: PLR2004
+        assert large_page_queries == small_page_queries
+
+    def test_bulk_payload_matches_per_capture_serialization(self) -> None:
+        """Related rows loaded in bulk serialize as when queried per capture."""
+        page, _ = self._serialize_page(6)
+
+        for row in page:
+            capture = Capture.objects.get(uuid=row["uuid"])
+            expected = CaptureGetSerializer(capture, context=self.context).data
+            for field_name in _COMPARED_FIELDS:
+                assert row[field_name] == expected[field_name], field_name
+            assert sorted(f["uuid"] for f in row["files"]) == sorted(
+                f["uuid"] for f in expected["files"]
+            )
+            assert row["total_file_count"] == 3  # noqa: PLR2004
+            assert row["data_files_info"]["count"] == 1
+            assert row["is_shared_with_me"] is True
@@ -2,8 +2,10 @@
 
 # pyright: reportPrivateUsage=false
 
+import base64
 import contextlib
 import datetime
+import io
 import json
 import logging
 import uuid
@@ -14,10 +16,12 @@ from typing import cast
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
+from minio.error import MinioException
 from opensearchpy import exceptions as os_exceptions
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -52,6 +56,13 @@ from sds_gateway.users.models import UserAPIKey
 from sds_gateway.visualizations.models import PostProcessedData
 from sds_gateway.visualizations.models import ProcessingStatus
 from sds_gateway.visualizations.models import ProcessingType
+from sds_gateway.visualizations.processing.waterfall_binary import WaterfallMatrixFile
+from sds_gateway.visualizations.processing.waterfall_binary import (
+    encode_waterfall_slices,
+)
+from sds_gateway.visualizations.processing.waterfall_pyramid import (
+    build_waterfall_pyramid,
+)
 
 # Test constants
 TEST_USER_PASSWORD = "testpass123"  # noqa: S105
@@ -2113,6 +2124,79 @@ class CaptureTestCases(APITestCase):
         assert data["end_index"] == 5  # noqa: PLR2004  # Clamped to total_slices
         assert len(data["slices"]) == 3  # noqa: PLR2004  # Only slices 2, 3, 4
 
+    def test_waterfall_slices_stored_matrix(self) -> None:
+        """Slices of waterfalls stored in the binary format are read by range."""
+        capture = Capture.objects.create(
+            capture_type=CaptureType.DigitalRF,
+            channel="test-channel",
+            index_name=f"{self.test_index_prefix}-test",
+            owner=self.user,
+            top_level_dir="test-dir",
+        )
+
+        # 10 slices of 4 bins, with slices 3 and 4 missing due to a data gap
+        spectra = np.arange(8 * 4, dtype=np.float32).reshape(8, 4)
+        payload = encode_waterfall_slices(
+            spectra,
+            [(0, 3), (5, 5)],
+            header={
+                "total_slices": 10,
+                "slice_params": {
+                    "channel": "test-channel",
+                    "start_sample": 0,
+                    "end_sample": 10 * 1024,
+                    "fft_size": 4,
+                    "center_freq": 2_000_000_000.0,
+                    "sample_rate_numerator": 2_000_000,
+                    "sample_rate_denominator": 1,
+                    "samples_per_slice": 1024,
+                },
+            },
+        )
+        processed_data = PostProcessedData.objects.create(
+            capture=capture,
+            processing_type=ProcessingType.Waterfall.value,
+            processing_status=ProcessingStatus.Completed.value,
+            metadata={"total_slices": 10},
+        )
+        processed_data.data_file.save(
+            "waterfall_test.sdsw",
+            SimpleUploadedFile("waterfall_test.sdsw", payload),
+        )
+        processed_data.save()
+
+        reads: list[tuple[int, int]] = []
+
+        def read_stored_range(object_name: str, offset: int, length: int) -> bytes:
+            reads.append((offset, length))
+            return payload[offset : offset + length]
+
+        url = reverse(
+            "api:captures-waterfall-slices",
+            kwargs={"pk": capture.uuid},
+        )
+        with patch(
+            "sds_gateway.api_methods.views.capture_endpoints.read_stored_range",
+            side_effect=read_stored_range,
+        ):
+            response = self.client.get(url, {"start_index": 2, "end_index": 7})
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["total_slices"] == 10  # noqa: PLR2004
+        assert [
+            slice_data["custom_fields"]["slice_index"] for slice_data in data["slices"]
+        ] == [2, 5, 6]
+        assert (
+            np.frombuffer(
+                base64.b64decode(data["slices"][1]["data"]), dtype=np.float32
+            ).tolist()
+            == spectra[3].tolist()
+        )
+        # the header, then the rows of the range only
+        assert len(reads) == 2  # noqa: PLR2004
+        assert reads[1][1] == 3 * 4 * 4
+
     def test_waterfall_slices_custom_processing_type(self) -> None:
         """Test waterfall_slices with custom processing_type."""
         capture = Capture.objects.create(
@@ -2320,7 +2404,7 @@ class CaptureTestCases(APITestCase):
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
     @patch(
-        "sds_gateway.api_methods.views.capture_endpoints.reconstruct_drf_files",
+        "sds_gateway.api_methods.views.capture_endpoints.reconstruct_drf_range",
     )
     @patch(
         "sds_gateway.api_methods.views.capture_endpoints.compute_slices_on_demand",
@@ -2328,7 +2412,7 @@ class CaptureTestCases(APITestCase):
     def test_waterfall_slices_stream_success(
         self,
         mock_compute_slices_on_demand: object,
-        mock_reconstruct_drf_files: object,
+        mock_reconstruct_drf_range: object,
     ) -> None:
         """Test successful waterfall_slices_stream with mocked compute."""
         capture = Capture.objects.create(
@@ -2349,7 +2433,7 @@ class CaptureTestCases(APITestCase):
             capture=capture,
         )
 
-        mock_reconstruct_drf_files.return_value = Path("/mock/drf/path")
+        mock_reconstruct_drf_range.return_value = Path("/mock/drf/path")
         mock_compute_slices_on_demand.return_value = {
             "slices": [
                 {
@@ -2377,10 +2461,172 @@ class CaptureTestCases(APITestCase):
         assert data["total_slices"] == 10  # noqa: PLR2004
         assert data["start_index"] == 0
         assert data["end_index"] == 5  # noqa: PLR2004
-        mock_reconstruct_drf_files.assert_called_once()
+        mock_reconstruct_drf_range.assert_called_once()
         mock_compute_slices_on_demand.assert_called_once()
         assert stream_file.capture_id == capture.pk
 
+    def test_waterfall_metadata_stream_stored_power_stats(self) -> None:
+        """Power bounds are answered from the stored statistics of the waterfall."""
+        capture = Capture.objects.create(
+            capture_type=CaptureType.DigitalRF,
+            channel="test-channel",
+            index_name=f"{self.test_index_prefix}-test-stream-power",
+            owner=self.user,
+            top_level_dir="test-dir",
+        )
+        power_stats = {
+            "count": 4096,
+            "min": -120.0,
+            "max": -20.0,
+            "mean": -80.0,
+            "percentiles": {"50": -81.5},
+            "histogram": {"start_db": -120.0, "bin_db": 0.25, "counts": [4096]},
+        }
+        PostProcessedData.objects.create(
+            capture=capture,
+            processing_type=ProcessingType.Waterfall.value,
+            processing_status=ProcessingStatus.Completed.value,
+            metadata={
+                "total_slices": 4,
+                "power_bounds": {"min": -125.0, "max": -15.0},
+                "power_stats": power_stats,
+            },
+        )
+        url = reverse(
+            "api:captures-waterfall-metadata-stream",
+            kwargs={"pk": capture.uuid},
+        )
+        indexed_metadata = {
+            str(capture.uuid): {
+                "samples_per_second": 1_000_000,
+                "start_bound": 0,
+                "end_bound": 1,
+                "center_frequencies": [2_000_000_000.0],
+            }
+        }
+
+        with patch(
+            "sds_gateway.api_methods.views.capture_endpoints.retrieve_indexed_metadata",
+            return_value=indexed_metadata,
+        ):
+            response = self.client.get(url, {"include_power_bounds": "true"})
+            default_response = self.client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        metadata = response.json()["metadata"]
+        assert metadata["power_bounds"] == {"min": -125.0, "max": -15.0}
+        assert metadata["power_stats"] == power_stats
+        assert "power_stats" not in default_response.json()["metadata"]
+
+    def test_waterfall_slices_stream_pyramid_level(self) -> None:
+        """Slices of pyramid levels are read from the stored pyramid."""
+        capture = Capture.objects.create(
+            capture_type=CaptureType.DigitalRF,
+            channel="test-channel",
+            index_name=f"{self.test_index_prefix}-test-stream-pyramid",
+            owner=self.user,
+            top_level_dir="test-dir",
+        )
+        # 2048 slices of 4 bins: one level of 512 rows
+        spectra = np.arange(2048 * 4, dtype=np.float32).reshape(2048, 4)
+        payload = encode_waterfall_slices(
+            spectra,
+            [(0, 2048)],
+            header={
+                "total_slices": 2048,
+                "slice_params": {
+                    "channel": "test-channel",
+                    "start_sample": 0,
+                    "end_sample": 2048 * 1024,
+                    "fft_size": 4,
+                    "center_freq": 2_000_000_000.0,
+                    "sample_rate_numerator": 2_000_000,
+                    "sample_rate_denominator": 1,
+                    "samples_per_slice": 1024,
+                },
+            },
+        )
+        stored_pyramid = io.BytesIO()
+        pyramid = build_waterfall_pyramid(
+            WaterfallMatrixFile(
+                lambda offset, length: payload[offset : offset + length]
+            ),
+            stored_pyramid,
+        )
+        PostProcessedData.objects.create(
+            capture=capture,
+            processing_type=ProcessingType.Waterfall.value,
+            processing_status=ProcessingStatus.Completed.value,
+            metadata={
+                "total_slices": 2048,
+                "pyramid": {**pyramid, "object_name": "waterfall_pyramid.sdsw"},
+            },
+        )
+
+        def read_stored_range(object_name: str, offset: int, length: int) -> bytes:
+            assert object_name == "waterfall_pyramid.sdsw"
+            return stored_pyramid.getvalue()[offset : offset + length]
+
+        url = reverse(
+            "api:captures-waterfall-slices-stream",
+            kwargs={"pk": capture.uuid},
+        )
+        with patch(
+            "sds_gateway.api_methods.views.capture_endpoints.read_stored_range",
+            side_effect=read_stored_range,
+        ):
+            response = self.client.get(
+                url, {"start_index": 10, "end_index": 12, "level": 1}
+            )
+            missing_level_response = self.client.get(
+                url, {"start_index": 0, "end_index": 5, "level": 2}
+            )
+        failing_level = MagicMock(total_slices=512)
+        failing_level.read_slices.side_effect = MinioException("unavailable")
+        with patch(
+            "sds_gateway.api_methods.views.capture_endpoints.open_pyramid_level",
+            return_value=failing_level,
+        ):
+            failed_read_response = self.client.get(
+                url, {"start_index": 10, "end_index": 12, "level": 1}
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["total_slices"] == 512  # noqa: PLR2004
+        assert data["metadata"]["slices_per_row"] == 4  # noqa: PLR2004
+        assert "pyramid" not in data["metadata"]
+        assert [
+            slice_data["custom_fields"]["slice_index"] for slice_data in data["slices"]
+        ] == [10, 11]
+        # maximum of slices 40 to 43
+        assert (
+            np.frombuffer(
+                base64.b64decode(data["slices"][0]["data"]), dtype=np.float32
+            ).tolist()
+            == spectra[43].tolist()
+        )
+        assert missing_level_response.status_code == status.HTTP_400_BAD_REQUEST
+        assert failed_read_response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+    def test_waterfall_slices_stream_pyramid_not_built(self) -> None:
+        """Pyramid levels of waterfalls without a pyramid are not found."""
+        capture = Capture.objects.create(
+            capture_type=CaptureType.DigitalRF,
+            channel="test-channel",
+            index_name=f"{self.test_index_prefix}-test-stream-no-pyramid",
+            owner=self.user,
+            top_level_dir="test-dir",
+        )
+        url = reverse(
+            "api:captures-waterfall-slices-stream",
+            kwargs={"pk": capture.uuid},
+        )
+
+        response = self.client.get(url, {"start_index": 0, "end_index": 5, "level": 1})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
 
 class StorageUnavailableErrorTestCases(APITestCase):
     """Test storage-unavailable handling in capture create/update endpoints."""
@@ -2719,7 +2965,7 @@ class CaptureBulkMetadataLoadingTests(APITestCase):
         mock_bulk_load,
         mock_set_cache,
     ) -> None:
-        """bulk_load_frequency_metadata receives the full queryset (not just page)."""
+        """bulk_load_frequency_metadata receives all the captures of the page."""
         for i in range(3):
             Capture.objects.create(
                 capture_type=CaptureType.DigitalRF,
@@ -2734,10 +2980,75 @@ class CaptureBulkMetadataLoadingTests(APITestCase):
         # Verify bulk_load was called with a QuerySet-like object
         call_args = mock_bulk_load.call_args
         captured_captures = call_args[0][0]  # first positional arg
-        # Should be the full queryset (not paginated)
+        # All captures fit in the first page
         min_count = 3
         assert len(captured_captures) >= min_count
 
+    @patch(
+        "sds_gateway.api_methods.serializers.capture_serializers.retrieve_indexed_metadata",
+        return_value={},
+    )
+    @patch(
+        "sds_gateway.api_methods.views.capture_endpoints.Capture.bulk_load_frequency_metadata",
+        new_callable=lambda: MagicMock(return_value={}),
+    )
+    def test_list_paginates_capture_groups(
+        self,
+        mock_bulk_load,
+        mock_retrieve,
+    ) -> None:
+        """Pages of groups are followed with cursors, loading only their captures."""
+        for i in range(4):
+            Capture.objects.create(
+                capture_type=CaptureType.DigitalRF,
+                channel=f"ch{i}",
+                index_name="captures-test-bulk",
+                owner=self.user,
+                top_level_dir=_normalize_top_level_dir(f"bulk-page-dir-{i}"),
+            )
+        # a second channel in the first directory: listed as one composite
+        Capture.objects.create(
+            capture_type=CaptureType.DigitalRF,
+            channel="ch-extra",
+            index_name="captures-test-bulk",
+            owner=self.user,
+            top_level_dir=_normalize_top_level_dir("bulk-page-dir-0"),
+        )
+
+        pages = []
+        url = f"{self.list_url}?page_size=2"
+        while url:
+            response = self.client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            pages.append(response.json())
+            url = pages[-1]["next"]
+
+        assert [len(page["results"]) for page in pages] == [2, 2]
+        assert all(page["count"] == 4 for page in pages)  # noqa: PLR2004
+        assert pages[0]["previous"] is None
+        assert "page=1" in pages[1]["previous"]
+        top_level_dirs = [
+            result["top_level_dir"] for page in pages for result in page["results"]
+        ]
+        assert sorted(top_level_dirs) == sorted(
+            _normalize_top_level_dir(f"bulk-page-dir-{i}") for i in range(4)
+        )
+        # each page bulk-loads the metadata of its own captures only
+        assert sorted(len(call[0][0]) for call in mock_bulk_load.call_args_list) == [
+            2,
+            3,
+        ]
+
+        response = self.client.get(self.list_url, {"page_size": 2, "page": 2})
+        assert [
+            result["top_level_dir"] for result in response.json()["results"]
+        ] == top_level_dirs[2:]
+
+    def test_list_invalid_cursor_400(self) -> None:
+        """An invalid cursor is rejected."""
+        response = self.client.get(self.list_url, {"cursor": "not-a-cursor"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     @patch(
         "sds_gateway.api_methods.models.get_opensearch_client",
     )
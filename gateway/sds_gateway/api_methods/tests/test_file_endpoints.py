@@ -1,30 +1,54 @@
 """Test cases for the endpoints that handle file operations."""
 
+import base64
+import json
 import time
 import uuid
 from collections.abc import Mapping
 from datetime import UTC
 from datetime import datetime
+from datetime import timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import cast
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
+import pytest
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractBaseUser
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
 from django.urls import reverse
+from minio import Minio
+from minio.error import MinioException
 from rest_framework import status
 from rest_framework.test import APIClient
 from rest_framework.test import APITestCase
 
+from sds_gateway.api_methods.helpers.download_file import DOWNLOAD_STREAM_CHUNK_SIZE
+from sds_gateway.api_methods.helpers.download_file import ByteRange
+from sds_gateway.api_methods.helpers.download_file import RangeNotSatisfiableError
+from sds_gateway.api_methods.helpers.download_file import parse_range_header
+from sds_gateway.api_methods.helpers.download_file import stream_file
+from sds_gateway.api_methods.helpers.presigned_transfers import PresignedTransferError
+from sds_gateway.api_methods.helpers.presigned_transfers import StagedUpload
+from sds_gateway.api_methods.helpers.presigned_transfers import load_staged_upload
+from sds_gateway.api_methods.helpers.presigned_transfers import presign_upload
 from sds_gateway.api_methods.models import Capture
 from sds_gateway.api_methods.models import CaptureType
 from sds_gateway.api_methods.models import DatasetStatus
 from sds_gateway.api_methods.models import File
+from sds_gateway.api_methods.models import FileUploadSession
 from sds_gateway.api_methods.models import ItemType
+from sds_gateway.api_methods.models import PresignedUpload
+from sds_gateway.api_methods.models import UploadSessionStatus
 from sds_gateway.api_methods.serializers.file_serializers import FilePostSerializer
+from sds_gateway.api_methods.tasks import cleanup_expired_presigned_uploads
 from sds_gateway.api_methods.tests.factories import DatasetFactory
 from sds_gateway.api_methods.tests.factories import MockMinIOContext
 from sds_gateway.api_methods.tests.factories import UserSharePermissionFactory
@@ -370,6 +394,69 @@ class FileTestCases(APITestCase):
         assert "file_exists_in_tree" in response.data
         assert "user_mutable_attributes_differ" in response.data
 
+    def test_file_contents_check_batch(self) -> None:
+        """Batch checks match the single-file check for each entry."""
+        checksum = self.file.sum_blake3
+        entries = [
+            {
+                "directory": self.file.directory,
+                "name": self.file.name,
+                "sum_blake3": checksum,
+                "media_type": self.file.media_type,
+            },
+            {
+                "directory": self.file.directory,
+                "name": "renamed.txt",
+                "sum_blake3": checksum,
+            },
+            {
+                "directory": self.file.directory,
+                "name": self.file.name,
+                "sum_blake3": "0" * 64,
+            },
+        ]
+        response = self.client.post(
+            reverse("api:check_contents_exist_batch"),
+            data={"files": entries},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data["results"]
+        assert len(results) == len(entries)
+
+        exact_match, sibling, missing = results
+        assert exact_match["file_exists_in_tree"] is True
+        assert exact_match["user_mutable_attributes_differ"] is False
+        assert exact_match["asset_id"] == self.file.uuid
+        assert sibling["file_exists_in_tree"] is False
+        assert sibling["file_contents_exist_for_user"] is True
+        assert sibling["asset_id"] == self.file.uuid
+        assert missing["file_contents_exist_for_user"] is False
+        assert missing["asset_id"] is None
+
+        for entry, result in zip(entries, results, strict=True):
+            single_response = self.client.post(
+                self.contents_check_url, data=entry, format="multipart"
+            )
+            assert single_response.data == result
+
+    def test_file_contents_check_batch_rejects_paths_outside_user_root(self) -> None:
+        """Batch checks can't look up files outside the user's directory."""
+        response = self.client.post(
+            reverse("api:check_contents_exist_batch"),
+            data={
+                "files": [
+                    {
+                        "directory": "../../other@example.com",
+                        "name": self.file.name,
+                        "sum_blake3": self.file.sum_blake3,
+                    },
+                ],
+            },
+            format="json",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_download_file_uses_helper_function(self):
         """Test that the download endpoint uses the helper function."""
         # Create a test file with MinIO mocking
@@ -386,7 +473,8 @@ class FileTestCases(APITestCase):
 
         # Verify response
         assert response.status_code == status.HTTP_200_OK
-        assert response.content == b"test file content"
+        assert b"".join(response.streaming_content) == b"test file content"
+        assert response["Content-Length"] == str(test_file.size)
         # Default media type from factory
         assert response["Content-Type"] == "application/x-hdf5"
         assert (
@@ -405,9 +493,9 @@ class FileTestCases(APITestCase):
         # Update the download URL to use the new test file
         download_url = reverse("api:files-download", args=[test_file.uuid])
 
-        # Mock the download_file function to raise an exception
+        # Mock the stream_file function to raise an exception
         with patch(
-            "sds_gateway.api_methods.views.file_endpoints.download_file"
+            "sds_gateway.api_methods.views.file_endpoints.stream_file"
         ) as mock_download:
             mock_download.side_effect = OSError("Download failed")
 
@@ -418,6 +506,91 @@ class FileTestCases(APITestCase):
             assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
             assert "Failed to download file" in response.data["detail"]
 
+    def test_download_file_range_returns_partial_content(self):
+        """A Range request is answered with 206 and only the requested bytes."""
+        test_file = create_db_file(owner=self.user, content=b"0123456789")
+        download_url = reverse("api:files-download", args=[test_file.uuid])
+
+        with patch(
+            "sds_gateway.api_methods.views.file_endpoints.stream_file",
+            return_value=iter([b"4567", b"89"]),
+        ) as mock_stream_file:
+            response = self.client.get(download_url, HTTP_RANGE="bytes=4-")
+
+        assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+        assert b"".join(response.streaming_content) == b"456789"
+        assert response["Content-Range"] == f"bytes 4-9/{test_file.size}"
+        assert response["Content-Length"] == "6"
+        assert response["Accept-Ranges"] == "bytes"
+        assert response["ETag"] == f'"{test_file.sum_blake3}"'
+        byte_range = mock_stream_file.call_args.kwargs["byte_range"]
+        assert (byte_range.start, byte_range.end) == (4, 9)
+
+    def test_download_file_range_stale_if_range_sends_full_file(self):
+        """A Range request with a stale If-Range validator gets the full file."""
+        test_file = create_db_file(owner=self.user, content=b"0123456789")
+        download_url = reverse("api:files-download", args=[test_file.uuid])
+
+        with patch(
+            "sds_gateway.api_methods.views.file_endpoints.stream_file",
+            return_value=iter([b"0123456789"]),
+        ) as mock_stream_file:
+            response = self.client.get(
+                download_url,
+                HTTP_RANGE="bytes=4-",
+                HTTP_IF_RANGE='"not-the-current-checksum"',
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert b"".join(response.streaming_content) == b"0123456789"
+        assert mock_stream_file.call_args.kwargs["byte_range"] is None
+
+    def test_download_file_range_not_satisfiable(self):
+        """A Range starting past the end of the file is rejected with 416."""
+        test_file = create_db_file(owner=self.user, content=b"0123456789")
+        download_url = reverse("api:files-download", args=[test_file.uuid])
+
+        response = self.client.get(download_url, HTTP_RANGE="bytes=100-")
+
+        assert response.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        assert response["Content-Range"] == f"bytes */{test_file.size}"
+
+    def test_stream_file_reads_object_in_chunks(self):
+        """stream_file requests the object range lazily and releases it when done."""
+        test_file = create_db_file(owner=self.user, content=b"0123456789")
+
+        with (
+            MockMinIOContext(b"456789") as mock_client,
+            patch(
+                "sds_gateway.api_methods.helpers.download_file.get_minio_client",
+                return_value=mock_client,
+            ),
+        ):
+            file_chunks = stream_file(test_file, byte_range=ByteRange(4, 9))
+            mock_response = mock_client.get_object.return_value
+            mock_response.stream.assert_not_called()
+            assert b"".join(file_chunks) == b"456789"
+
+        get_object_kwargs = mock_client.get_object.call_args.kwargs
+        assert get_object_kwargs["offset"] == 4  # noqa: PLR2004
+        assert get_object_kwargs["length"] == 6  # noqa: PLR2004
+        mock_response.stream.assert_called_once_with(DOWNLOAD_STREAM_CHUNK_SIZE)
+        mock_response.close.assert_called_once()
+        mock_response.release_conn.assert_called_once()
+
+    def test_parse_range_header(self):
+        """Single byte ranges are parsed and clamped; others serve the full file."""
+        file_size = 10
+        assert parse_range_header(None, file_size) is None
+        assert parse_range_header("bytes=0-1,4-5", file_size) is None
+        assert parse_range_header("items=0-4", file_size) is None
+        assert parse_range_header("bytes=2-4", file_size) == ByteRange(2, 4)
+        assert parse_range_header("bytes=2-", file_size) == ByteRange(2, 9)
+        assert parse_range_header("bytes=2-100", file_size) == ByteRange(2, 9)
+        assert parse_range_header("bytes=-3", file_size) == ByteRange(7, 9)
+        with pytest.raises(RangeNotSatisfiableError):
+            parse_range_header("bytes=10-", file_size)
+
     def test_download_file_not_found(self):
         """Test that the download endpoint returns 404 for non-existent files."""
         # Make request with non-existent file UUID
@@ -446,6 +619,625 @@ class FileTestCases(APITestCase):
         # Verify 403 response
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
+    def test_download_url_disabled_by_default(self) -> None:
+        """Presigned download URLs are refused unless enabled in settings."""
+        url = reverse("api:files-download-url", args=[self.file.uuid])
+        response = self.client.get(url)
+        assert response.status_code == status.HTTP_409_CONFLICT
+
+    @override_settings(PRESIGNED_TRANSFERS_ENABLED=True)
+    def test_download_url_returns_presigned_url(self) -> None:
+        """Users with access get a presigned URL for the file contents."""
+        url = reverse("api:files-download-url", args=[self.file.uuid])
+        with patch(
+            "sds_gateway.api_methods.views.file_endpoints.presign_download",
+            return_value="http://storage.example/files/object?X-Amz-Signature=abc",
+        ) as mock_presign:
+            response = self.client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["url"].startswith("http://storage.example/")
+        assert response.data["expires_in"] > 0
+        mock_presign.assert_called_once_with(self.file)
+
+    @override_settings(PRESIGNED_TRANSFERS_ENABLED=True)
+    def test_download_url_no_access_403(self) -> None:
+        """Presigned URLs are only handed out to users with access to the file."""
+        other_user = User.objects.create(
+            email="other-presigned@example.com",
+            password="testpassword",  # noqa: S106
+            is_approved=True,
+        )
+        other_file = create_db_file(owner=other_user)
+        url = reverse("api:files-download-url", args=[other_file.uuid])
+        response = self.client.get(url)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    @override_settings(PRESIGNED_TRANSFERS_ENABLED=True)
+    def test_upload_url_validates_request(self) -> None:
+        """Upload URLs require a BLAKE3 checksum and a size."""
+        url = reverse("api:files-upload-url")
+        response = self.client.post(
+            url, data={"sum_blake3": "not-a-checksum", "size": 10}, format="json"
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "sum_blake3" in response.data
+
+    @override_settings(PRESIGNED_TRANSFERS_ENABLED=True)
+    def test_upload_complete_creates_file_from_staged_object(self) -> None:
+        """Verified contents uploaded through a presigned URL become a new file."""
+        contents = b"contents uploaded straight to object storage"
+        sum_blake3 = File().calculate_checksum(SimpleUploadedFile("x", contents))
+        object_name = default_storage.save(
+            f"files/{sum_blake3}_presigned", ContentFile(contents)
+        )
+        staged_upload = StagedUpload(
+            object_name=object_name,
+            owner_id=str(self.user.pk),
+            sum_blake3=sum_blake3,
+            size=len(contents),
+        )
+
+        with patch(
+            "sds_gateway.api_methods.views.file_endpoints.load_staged_upload",
+            return_value=staged_upload,
+        ):
+            response = self.client.post(
+                reverse("api:files-upload-complete"),
+                data={
+                    "upload_token": "signed-token",
+                    "directory": self.sds_path,
+                    "media_type": "text/plain",
+                    "name": "presigned.txt",
+                },
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_201_CREATED, response.data
+        assert response.data["sum_blake3"] == sum_blake3
+        assert response.data["size"] == len(contents)
+        created_file = File.objects.get(uuid=response.data["uuid"])
+        assert created_file.file.name == object_name
+        assert created_file.name == "presigned.txt"
+        assert created_file.owner == self.user
+
+    @override_settings(PRESIGNED_TRANSFERS_ENABLED=True)
+    def test_upload_complete_rejects_mismatched_contents(self) -> None:
+        """Staged contents that don't match the announced checksum are rejected."""
+        with (
+            patch(
+                "sds_gateway.api_methods.views.file_endpoints.load_staged_upload",
+            ),
+            patch(
+                "sds_gateway.api_methods.views.file_endpoints.verify_staged_upload",
+                side_effect=PresignedTransferError("contents don't match"),
+            ),
+        ):
+            response = self.client.post(
+                reverse("api:files-upload-complete"),
+                data={
+                    "upload_token": "signed-token",
+                    "directory": self.sds_path,
+                    "media_type": "text/plain",
+                    "name": "presigned.txt",
+                },
+                format="json",
+            )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not File.objects.filter(name="presigned.txt").exists()
+
+    def test_upload_complete_rejects_tokens_of_other_users(self) -> None:
+        """Upload tokens are bound to the user they were issued to."""
+        other_user = User.objects.create(
+            email="other-token@example.com",
+            password="testpassword",  # noqa: S106
+            is_approved=True,
+        )
+        with (
+            override_settings(PRESIGNED_TRANSFERS_ENABLED=True),
+            patch(
+                "sds_gateway.api_methods.helpers.presigned_transfers.get_presigning_client"
+            ) as mock_get_client,
+        ):
+            mock_get_client.return_value.presigned_post_policy.return_value = {}
+            _url, _fields, upload_token = presign_upload(
+                user=other_user, sum_blake3="0" * 64, size=1
+            )
+        with pytest.raises(PresignedTransferError, match="another user"):
+            load_staged_upload(user=self.user, upload_token=upload_token)
+
+    @override_settings(
+        PRESIGNED_TRANSFERS_ENABLED=True,
+        PRESIGNED_S3_ENDPOINT_URL="http://storage.example",
+    )
+    def test_upload_url_signs_announced_size(self) -> None:
+        """Presigned upload forms only accept contents of the announced size."""
+        presigning_client = Minio(
+            "storage.example",
+            access_key="access",
+            secret_key="secret",  # noqa: S106
+            secure=False,
+            region="us-east-1",
+        )
+        with patch(
+            "sds_gateway.api_methods.helpers.presigned_transfers.get_presigning_client",
+            return_value=presigning_client,
+        ):
+            response = self.client.post(
+                reverse("api:files-upload-url"),
+                data={"sum_blake3": "0" * 64, "size": 1234},
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_200_OK, response.data
+        fields = response.data["fields"]
+        assert response.data["url"].startswith("http://storage.example/")
+        assert fields["key"].startswith(f"files/{'0' * 64}_")
+        policy = json.loads(base64.b64decode(fields["policy"]))
+        assert ["content-length-range", 1234, 1234] in policy["conditions"]
+        presigned_upload = PresignedUpload.objects.get(object_name=fields["key"])
+        assert presigned_upload.size == 1234  # noqa: PLR2004
+        assert presigned_upload.expires_at > datetime.now(UTC)
+
+    def test_upload_complete_tokens_are_used_once(self) -> None:
+        """Completed presigned uploads can't be completed again."""
+        contents = b"completed once"
+        sum_blake3 = File().calculate_checksum(SimpleUploadedFile("x", contents))
+        with (
+            override_settings(PRESIGNED_TRANSFERS_ENABLED=True),
+            patch(
+                "sds_gateway.api_methods.helpers.presigned_transfers.get_presigning_client"
+            ) as mock_get_client,
+        ):
+            mock_get_client.return_value.presigned_post_policy.return_value = {}
+            _url, fields, upload_token = presign_upload(
+                user=self.user, sum_blake3=sum_blake3, size=len(contents)
+            )
+        default_storage.save(fields["key"], ContentFile(contents))
+        data = {
+            "upload_token": upload_token,
+            "directory": self.sds_path,
+            "media_type": "text/plain",
+            "name": "once.txt",
+        }
+        with patch("sds_gateway.api_methods.views.file_endpoints.verify_staged_upload"):
+            response = self.client.post(
+                reverse("api:files-upload-complete"), data=data, format="json"
+            )
+            assert response.status_code == status.HTTP_201_CREATED, response.data
+            response = self.client.post(
+                reverse("api:files-upload-complete"), data=data, format="json"
+            )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "already completed" in response.data["detail"]
+
+    def test_upload_complete_racing_completion_is_rejected(self) -> None:
+        """Completions that lose the race for the upload don't create a file."""
+        contents = b"completed concurrently"
+        sum_blake3 = File().calculate_checksum(SimpleUploadedFile("x", contents))
+        presigned_upload = PresignedUpload.objects.create(
+            owner=self.user,
+            object_name=default_storage.save(
+                f"files/{sum_blake3}_racing", ContentFile(contents)
+            ),
+            sum_blake3=sum_blake3,
+            size=len(contents),
+            expires_at=datetime.now(UTC) + timedelta(minutes=5),
+        )
+        # loaded before the other completion closed the upload
+        staged_upload = StagedUpload(
+            object_name=presigned_upload.object_name,
+            owner_id=str(self.user.pk),
+            sum_blake3=sum_blake3,
+            size=len(contents),
+            upload_id=str(presigned_upload.uuid),
+        )
+        presigned_upload.soft_delete()
+
+        with (
+            override_settings(PRESIGNED_TRANSFERS_ENABLED=True),
+            patch(
+                "sds_gateway.api_methods.views.file_endpoints.load_staged_upload",
+                return_value=staged_upload,
+            ),
+            patch("sds_gateway.api_methods.views.file_endpoints.verify_staged_upload"),
+        ):
+            response = self.client.post(
+                reverse("api:files-upload-complete"),
+                data={
+                    "upload_token": "signed-token",
+                    "directory": self.sds_path,
+                    "media_type": "text/plain",
+                    "name": "racing.txt",
+                },
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "already completed" in response.data["detail"]
+        assert not File.objects.filter(name="racing.txt").exists()
+
+    def test_expired_presigned_uploads_are_discarded(self) -> None:
+        """Objects of presigned uploads that were never completed are removed."""
+        expired_at = datetime.now(UTC) - timedelta(minutes=1)
+        abandoned_upload = PresignedUpload.objects.create(
+            owner=self.user,
+            object_name="files/abandoned",
+            sum_blake3="0" * 64,
+            size=10,
+            expires_at=expired_at,
+        )
+        referenced_upload = PresignedUpload.objects.create(
+            owner=self.user,
+            object_name=self.file.file.name,
+            sum_blake3=self.file.sum_blake3,
+            size=self.file.size,
+            expires_at=expired_at,
+        )
+        pending_upload = PresignedUpload.objects.create(
+            owner=self.user,
+            object_name="files/pending",
+            sum_blake3="0" * 64,
+            size=10,
+            expires_at=datetime.now(UTC) + timedelta(minutes=1),
+        )
+        with patch(
+            "sds_gateway.api_methods.helpers.presigned_transfers.get_minio_client"
+        ) as mock_get_client:
+            result = cleanup_expired_presigned_uploads()
+
+        assert result["discarded_count"] == 2  # noqa: PLR2004
+        mock_get_client.return_value.remove_object.assert_called_once_with(
+            bucket_name=settings.AWS_STORAGE_BUCKET_NAME,
+            object_name="files/abandoned",
+        )
+        for presigned_upload in (abandoned_upload, referenced_upload):
+            presigned_upload.refresh_from_db()
+            assert presigned_upload.is_deleted
+        pending_upload.refresh_from_db()
+        assert not pending_upload.is_deleted
+
+    @override_settings(UPLOAD_SESSION_PART_SIZE=8)
+    def test_upload_session_creates_file_from_parts(self) -> None:
+        """Parts uploaded in any order are assembled into a new file."""
+        contents = b"twenty bytes of data"
+        sum_blake3 = File().calculate_checksum(SimpleUploadedFile("x", contents))
+        mock_client = MagicMock()
+        mock_client.create_multipart_upload.return_value = "multipart-id"
+        mock_client.upload_part.side_effect = lambda **kwargs: (
+            f"etag-{kwargs['part_number']}"
+        )
+
+        with (
+            patch(
+                "sds_gateway.api_methods.helpers.upload_sessions.get_minio_client",
+                return_value=mock_client,
+            ),
+            patch(
+                "sds_gateway.api_methods.helpers.upload_sessions.verify_staged_upload",
+            ) as mock_verify,
+        ):
+            response = self.client.post(
+                reverse("api:files-upload-sessions"),
+                data={"sum_blake3": sum_blake3, "size": len(contents)},
+                format="json",
+            )
+            assert response.status_code == status.HTTP_201_CREATED, response.data
+            assert response.data["num_parts"] == 3  # noqa: PLR2004
+            assert response.data["missing_parts"] == [1, 2, 3]
+            session_id = response.data["uuid"]
+
+            def part_url(part_number: int) -> str:
+                return reverse(
+                    "api:files-upload-session-part",
+                    kwargs={"session_id": session_id, "part_number": part_number},
+                )
+
+            # every part but the last must have exactly the part size
+            response = self.client.put(
+                part_url(1), data=contents[:5], content_type="application/octet-stream"
+            )
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            # parts are checked against their checksum when the client sends it
+            response = self.client.put(
+                part_url(1),
+                data=contents[:8],
+                content_type="application/octet-stream",
+                HTTP_X_PART_BLAKE3="0" * 64,
+            )
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+            for part_number in (3, 1, 2):
+                start = (part_number - 1) * 8
+                response = self.client.put(
+                    part_url(part_number),
+                    data=contents[start : start + 8],
+                    content_type="application/octet-stream",
+                )
+                assert response.status_code == status.HTTP_200_OK, response.data
+
+            response = self.client.get(
+                reverse("api:files-upload-session", kwargs={"session_id": session_id})
+            )
+            assert response.data["missing_parts"] == []
+            assert response.data["parts"]["3"]["size"] == 4  # noqa: PLR2004
+
+            session = FileUploadSession.objects.get(uuid=session_id)
+            default_storage.save(session.object_name, ContentFile(contents))
+            response = self.client.post(
+                reverse(
+                    "api:files-upload-session-complete",
+                    kwargs={"session_id": session_id},
+                ),
+                data={
+                    "directory": self.sds_path,
+                    "media_type": "text/plain",
+                    "name": "chunked.txt",
+                },
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_201_CREATED, response.data
+        assert response.data["sum_blake3"] == sum_blake3
+        created_file = File.objects.get(uuid=response.data["uuid"])
+        assert created_file.file.name == session.object_name
+        mock_verify.assert_called_once()
+        completed_parts = mock_client.complete_multipart_upload.call_args.kwargs[
+            "parts"
+        ]
+        assert [part.etag for part in completed_parts] == [
+            "etag-1",
+            "etag-2",
+            "etag-3",
+        ]
+        session.refresh_from_db()
+        assert session.status == UploadSessionStatus.Completed.value
+        assert session.is_deleted
+
+    def test_upload_session_complete_retried_after_rejected_metadata(self) -> None:
+        """Completed sessions keep their contents until a file is created."""
+        contents = b"retry me"
+        session = FileUploadSession.objects.create(
+            owner=self.user,
+            object_name="files/retried",
+            multipart_upload_id="multipart-id",
+            sum_blake3=File().calculate_checksum(SimpleUploadedFile("x", contents)),
+            size=len(contents),
+            part_size=8,
+            parts={"1": {"etag": "etag-1", "size": 8, "sum_blake3": "0" * 64}},
+            expires_at=datetime.now(UTC) + timedelta(days=1),
+        )
+        default_storage.save(session.object_name, ContentFile(contents))
+        url = reverse(
+            "api:files-upload-session-complete", kwargs={"session_id": session.uuid}
+        )
+        with (
+            patch(
+                "sds_gateway.api_methods.helpers.upload_sessions.get_minio_client"
+            ) as mock_get_client,
+            patch(
+                "sds_gateway.api_methods.helpers.upload_sessions.verify_staged_upload",
+            ) as mock_verify,
+            patch(
+                "sds_gateway.api_methods.views.file_endpoints.discard_staged_upload",
+            ) as mock_discard,
+        ):
+            # media_type is required
+            response = self.client.post(
+                url, {"directory": self.sds_path, "name": "retried.txt"}, format="json"
+            )
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            session.refresh_from_db()
+            assert session.status == UploadSessionStatus.Completed.value
+            assert not session.is_deleted
+
+            response = self.client.post(
+                url,
+                {
+                    "directory": self.sds_path,
+                    "media_type": "text/plain",
+                    "name": "retried.txt",
+                },
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_201_CREATED, response.data
+        created_file = File.objects.get(uuid=response.data["uuid"])
+        assert created_file.file.name == session.object_name
+        # the parts were assembled and verified once
+        mock_get_client.return_value.complete_multipart_upload.assert_called_once()
+        mock_verify.assert_called_once()
+        mock_discard.assert_not_called()
+        session.refresh_from_db()
+        assert session.is_deleted
+
+    def test_upload_session_complete_requires_all_parts(self) -> None:
+        """Sessions can't be completed before all parts are uploaded."""
+        session = FileUploadSession.objects.create(
+            owner=self.user,
+            object_name="files/incomplete",
+            multipart_upload_id="multipart-id",
+            sum_blake3="0" * 64,
+            size=10,
+            part_size=8,
+            parts={"1": {"etag": "etag-1", "size": 8, "sum_blake3": "0" * 64}},
+            expires_at=datetime.now(UTC) + timedelta(days=1),
+        )
+        response = self.client.post(
+            reverse(
+                "api:files-upload-session-complete",
+                kwargs={"session_id": session.uuid},
+            ),
+            data={"directory": self.sds_path, "name": "incomplete.txt"},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "[2]" in response.data["detail"]
+        assert not File.objects.filter(name="incomplete.txt").exists()
+
+    def test_upload_session_aborted_when_contents_mismatch(self) -> None:
+        """Sessions assembling contents that don't match their checksum abort."""
+        session = FileUploadSession.objects.create(
+            owner=self.user,
+            object_name="files/mismatched",
+            multipart_upload_id="multipart-id",
+            sum_blake3="0" * 64,
+            size=8,
+            part_size=8,
+            parts={"1": {"etag": "etag-1", "size": 8, "sum_blake3": "1" * 64}},
+            expires_at=datetime.now(UTC) + timedelta(days=1),
+        )
+        with (
+            patch("sds_gateway.api_methods.helpers.upload_sessions.get_minio_client"),
+            patch(
+                "sds_gateway.api_methods.helpers.upload_sessions.verify_staged_upload",
+                side_effect=PresignedTransferError("contents don't match"),
+            ),
+        ):
+            response = self.client.post(
+                reverse(
+                    "api:files-upload-session-complete",
+                    kwargs={"session_id": session.uuid},
+                ),
+                data={"directory": self.sds_path, "name": "mismatched.txt"},
+                format="json",
+            )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        session.refresh_from_db()
+        assert session.status == UploadSessionStatus.Aborted.value
+        assert session.is_deleted
+        assert not File.objects.filter(name="mismatched.txt").exists()
+
+    def test_upload_session_retried_after_storage_errors(self) -> None:
+        """Storage errors while completing a session leave it retryable."""
+        session = FileUploadSession.objects.create(
+            owner=self.user,
+            object_name="files/storage-errors",
+            multipart_upload_id="multipart-id",
+            sum_blake3="0" * 64,
+            size=8,
+            part_size=8,
+            parts={"1": {"etag": "etag-1", "size": 8, "sum_blake3": "0" * 64}},
+            expires_at=datetime.now(UTC) + timedelta(days=1),
+        )
+        url = reverse(
+            "api:files-upload-session-complete", kwargs={"session_id": session.uuid}
+        )
+        data = {"directory": self.sds_path, "name": "storage-errors.txt"}
+        with (
+            patch(
+                "sds_gateway.api_methods.helpers.upload_sessions.get_minio_client"
+            ) as mock_get_client,
+            patch(
+                "sds_gateway.api_methods.helpers.upload_sessions.verify_staged_upload",
+                side_effect=OSError("connection reset"),
+            ) as mock_verify,
+        ):
+            mock_client = mock_get_client.return_value
+            mock_client.complete_multipart_upload.side_effect = MinioException(
+                "service unavailable"
+            )
+            response = self.client.post(url, data, format="json")
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            session.refresh_from_db()
+            assert session.status == UploadSessionStatus.Active.value
+            mock_verify.assert_not_called()
+
+            # the parts are assembled, but reading the object back fails
+            mock_client.complete_multipart_upload.side_effect = None
+            response = self.client.post(url, data, format="json")
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            session.refresh_from_db()
+            assert session.status == UploadSessionStatus.Assembled.value
+            assert not session.is_deleted
+
+            # completing again only verifies the assembled object
+            mock_verify.side_effect = PresignedTransferError("contents don't match")
+            response = self.client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert mock_client.complete_multipart_upload.call_count == 2  # noqa: PLR2004
+        assert mock_verify.call_count == 2  # noqa: PLR2004
+        session.refresh_from_db()
+        assert session.status == UploadSessionStatus.Aborted.value
+
+    def test_upload_session_verified_once_outside_lock(self) -> None:
+        """Contents are verified after the session moves to "verifying"."""
+        session = FileUploadSession.objects.create(
+            owner=self.user,
+            object_name="files/verifying",
+            multipart_upload_id="multipart-id",
+            sum_blake3="0" * 64,
+            size=8,
+            part_size=8,
+            parts={"1": {"etag": "etag-1", "size": 8, "sum_blake3": "0" * 64}},
+            expires_at=datetime.now(UTC) + timedelta(days=1),
+        )
+        url = reverse(
+            "api:files-upload-session-complete", kwargs={"session_id": session.uuid}
+        )
+        data = {"directory": self.sds_path, "name": "verifying.txt"}
+        concurrent_responses = []
+
+        def complete_concurrently(_staged_upload: object) -> None:
+            session.refresh_from_db()
+            assert session.status == UploadSessionStatus.Verifying.value
+            concurrent_responses.append(self.client.post(url, data, format="json"))
+            msg = "contents don't match"
+            raise PresignedTransferError(msg)
+
+        with (
+            patch("sds_gateway.api_methods.helpers.upload_sessions.get_minio_client"),
+            patch(
+                "sds_gateway.api_methods.helpers.upload_sessions.verify_staged_upload",
+                side_effect=complete_concurrently,
+            ),
+        ):
+            response = self.client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert concurrent_responses[0].status_code == status.HTTP_400_BAD_REQUEST
+        assert "verifying" in concurrent_responses[0].data["detail"]
+        session.refresh_from_db()
+        assert session.status == UploadSessionStatus.Aborted.value
+
+    @override_settings(OBJECT_STORE_WRITE_BOTH_ENABLED=True)
+    def test_upload_sessions_unavailable_while_writing_both_stores(self) -> None:
+        """Clients fall back to regular uploads while writing to both stores."""
+        response = self.client.post(
+            reverse("api:files-upload-sessions"),
+            data={"sum_blake3": "0" * 64, "size": 10},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_409_CONFLICT
+
+    def test_upload_session_abort_discards_parts(self) -> None:
+        """Aborting a session aborts its multipart upload."""
+        session = FileUploadSession.objects.create(
+            owner=self.user,
+            object_name="files/aborted",
+            multipart_upload_id="multipart-id",
+            sum_blake3="0" * 64,
+            size=10,
+            part_size=8,
+            expires_at=datetime.now(UTC) + timedelta(days=1),
+        )
+        url = reverse("api:files-upload-session", kwargs={"session_id": session.uuid})
+        with patch(
+            "sds_gateway.api_methods.helpers.upload_sessions.get_minio_client"
+        ) as mock_get_client:
+            response = self.client.delete(url)
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        mock_get_client.return_value.abort_multipart_upload.assert_called_once_with(
+            object_name="files/aborted", upload_id="multipart-id"
+        )
+        session.refresh_from_db()
+        assert session.status == UploadSessionStatus.Aborted.value
+        assert session.is_deleted
+        assert self.client.get(url).status_code == status.HTTP_404_NOT_FOUND
+
     def test_list_files_with_temporal_params(self) -> None:
         """Temporal params keep non-RF files; RF listings respect time bounds."""
         base_sec = 1_000_000
@@ -0,0 +1,185 @@
+"""Tests for listing captures matching metadata searches, paged in OpenSearch."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework.test import APITestCase
+
+from sds_gateway.api_methods.models import Capture
+from sds_gateway.api_methods.models import CaptureType
+from sds_gateway.users.models import UserAPIKey
+
+User = get_user_model()
+
+_METADATA_FILTERS = json.dumps(
+    [
+        {
+            "field_path": "search_props.center_frequency",
+            "query_type": "range",
+            "filter_value": {"gte": 1_000_000_000},
+        },
+    ]
+)
+
+
+class _PagedOpenSearchClient:
+    """OpenSearch client matching a fixed set of documents.
+
+    Implements what listings use: points in time, searches paged with
+    `search_after` over them, and searches filtered by IDs.
+    """
+
+    def __init__(self, matching_docs: dict[str, str]) -> None:
+        # top_level_dir of each matching document, by ID
+        self.matching_docs = matching_docs
+        self.matching_ids = sorted(matching_docs)
+        self.open_pits: set[str] = set()
+        self.id_searches = 0
+        self.points_in_time = 0
+
+    def create_point_in_time(self, index: str, **kwargs: Any) -> dict[str, str]:
+        self.points_in_time += 1
+        pit_id = f"pit-{self.points_in_time}-{index}"
+        self.open_pits.add(pit_id)
+        return {"pit_id": pit_id}
+
+    def delete_point_in_time(self, body: dict[str, list[str]]) -> None:
+        self.open_pits.difference_update(body["pit_id"])
+
+    def search(self, body: dict[str, Any], index: str | None = None) -> dict:
+        if "pit" in body:
+            assert body["pit"]["id"] in self.open_pits
+            after = body.get("search_after", [""])[0]
+            ids = [_id for _id in self.matching_ids if _id > after][: body["size"]]
+            hits = [{"_id": _id, "sort": [_id]} for _id in ids]
+            return {"pit_id": body["pit"]["id"], "hits": {"hits": hits}}
+        self.id_searches += 1
+        filtered_ids = set(body["query"]["bool"]["filter"][0]["ids"]["values"])
+        hits = [{"_id": _id} for _id in self.matching_ids if _id in filtered_ids]
+        return {"hits": {"hits": hits}}
+
+
+class SearchedCaptureListingTests(APITestCase):
+    """Capture listings with metadata filters, paged with cursors."""
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create(
+            email="search-owner@example.com",
+            password="testpassword",  # noqa: S106
+            is_approved=True,
+        )
+        _api_key, key = UserAPIKey.objects.create_key(
+            name="test-key",
+            user=self.user,
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Api-Key: {key}")
+        self.list_url = reverse("api:captures-list")
+
+        self.captures = [
+            Capture.objects.create(
+                capture_type=CaptureType.DigitalRF,
+                channel="ch0",
+                index_name="captures-drf",
+                owner=self.user,
+                top_level_dir=f"/search-dir-{i}",
+            )
+            for i in range(7)
+        ]
+        # second channel of a composite capture
+        self.captures.append(
+            Capture.objects.create(
+                capture_type=CaptureType.DigitalRF,
+                channel="ch1",
+                index_name="captures-drf",
+                owner=self.user,
+                top_level_dir="/search-dir-0",
+            )
+        )
+        self.not_matching = self.captures[3]
+        self.opensearch = _PagedOpenSearchClient(
+            {
+                str(c.uuid): c.top_level_dir
+                for c in self.captures
+                if c != self.not_matching
+            }
+        )
+
+        for patcher in (
+            patch(
+                "sds_gateway.api_methods.helpers.search_captures.get_opensearch_client",
+                return_value=self.opensearch,
+            ),
+            patch(
+                "sds_gateway.api_methods.helpers.search_captures.OS_SEARCH_BATCH_SIZE",
+                2,
+            ),
+            patch(
+                "sds_gateway.api_methods.serializers.capture_serializers"
+                ".retrieve_indexed_metadata",
+                return_value={},
+            ),
+            patch.object(Capture, "bulk_load_frequency_metadata", return_value={}),
+            patch.object(Capture, "get_opensearch_metadata", return_value={}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _listed_capture_uuids(self, result: dict[str, Any]) -> list[str]:
+        if result.get("is_multi_channel"):
+            return [str(channel["uuid"]) for channel in result["channels"]]
+        return [str(result["uuid"])]
+
+    def test_cursor_pages_list_each_group_once(self) -> None:
+        """Following cursors lists every matching group once, past batches."""
+        url = f"{self.list_url}?metadata_filters={_METADATA_FILTERS}&page_size=2"
+        listed: list[str] = []
+        counts: set[int] = set()
+        pages = 0
+        while url:
+            response = self.client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+            assert len(data["results"]) <= 2  # noqa: PLR2004
+            for result in data["results"]:
+                listed.extend(self._listed_capture_uuids(result))
+            counts.add(data["count"])
+            url = data["next"]
+            pages += 1
+
+        expected = {str(c.uuid) for c in self.captures if c != self.not_matching}
+        assert sorted(listed) == sorted(expected)
+        # 7 matching captures, 2 of them in a composite capture
+        assert counts == {6}
+        assert pages == 3  # noqa: PLR2004
+        # hits paged once to count the groups, for the first page, and once
+        # for each page
+        assert self.opensearch.points_in_time == pages + 1
+        # one search for the captures of each page, and one more for the group
+        # of the composite capture if it is found again after its page
+        assert self.opensearch.id_searches <= pages + 1
+        assert not self.opensearch.open_pits
+
+    def test_page_numbers_and_invalid_cursor(self) -> None:
+        """Numbered pages match cursor pages, and bad cursors are rejected."""
+        url = f"{self.list_url}?metadata_filters={_METADATA_FILTERS}&page_size=4"
+        first_page = self.client.get(url).json()
+        second_page = self.client.get(f"{url}&page=2").json()
+        assert second_page["count"] == first_page["count"]
+        assert (
+            second_page["results"]
+            == self.client.get(first_page["next"]).json()["results"]
+        )
+        assert second_page["next"] is None
+        assert first_page["count"] == 6  # noqa: PLR2004
+
+        response = self.client.get(f"{url}&cursor=not-a-cursor")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not self.opensearch.open_pits
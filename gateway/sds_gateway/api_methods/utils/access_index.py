@@ -0,0 +1,450 @@
+"""Per-user index of the captures and files each user can access.
+
+`get_accessible_captures_queryset` and `get_accessible_files_queryset` read
+`UserAssetAccess` rows instead of joining share permissions, captures and
+datasets over every M2M and FK path on each request. Rows are derived from:
+
+- captures: their owner, their enabled share permissions, and the owners and
+    shared users of their non-deleted datasets (M2M or FK);
+- files: their owner, the users with access to their non-deleted captures
+    (M2M or FK), and the owners and shared users of their non-deleted datasets.
+
+The signal handlers in `sds_gateway.api_methods.signals` refresh the rows of
+the items affected by each change. Bulk updates bypass signals: code updating
+access sources with `QuerySet.update()` or through-model deletes refreshes the
+affected items itself (see `asset_access_control`). `rebuild_access_index`
+recomputes every row and `check_access_index` reports rows that drifted.
+
+Permission checks made during a request are remembered until it finishes (see
+`get_access_memo`); refreshing any rows forgets them.
+"""
+
+import threading
+from collections.abc import Iterable
+from collections.abc import Iterator
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+from django.core.signals import request_finished
+from django.core.signals import request_started
+from django.db import transaction
+from django.db.models import Exists
+from django.db.models import OuterRef
+from django.db.models import QuerySet
+from loguru import logger as log
+
+from sds_gateway.api_methods.models import Capture
+from sds_gateway.api_methods.models import Dataset
+from sds_gateway.api_methods.models import File
+from sds_gateway.api_methods.models import ItemType
+from sds_gateway.api_methods.models import PermissionLevel
+from sds_gateway.api_methods.models import UserAssetAccess
+from sds_gateway.api_methods.models import UserSharePermission
+
+# number of items whose rows are computed and written together
+_CHUNK_SIZE = 1000
+
+# higher ranks win when a user has access to an item in several ways
+_LEVEL_RANK: dict[str, int] = {
+    PermissionLevel.VIEWER: 0,
+    PermissionLevel.CONTRIBUTOR: 1,
+    PermissionLevel.CO_OWNER: 2,
+    PermissionLevel.OWNER: 3,
+}
+
+_CaptureDatasets = Capture.datasets.through
+_FileCaptures = File.captures.through
+_FileDatasets = File.datasets.through
+
+# expected permission levels, by (user ID, item UUID)
+AccessRows = dict[tuple[int, str], str]
+
+# permission levels checked during the current request, by user ID and item type
+_access_memo = threading.local()
+
+
+def _start_access_memo(sender, **kwargs) -> None:
+    _access_memo.levels = {}
+
+
+def _end_access_memo(sender, **kwargs) -> None:
+    if hasattr(_access_memo, "levels"):
+        del _access_memo.levels
+
+
+request_started.connect(_start_access_memo, weak=False)
+request_finished.connect(_end_access_memo, weak=False)
+
+
+def get_access_memo(user_id: int, item_type: ItemType) -> dict[str, str | None]:
+    """Permission levels of a user checked during the current request.
+
+    Levels are by item UUID, None when the user has no access. Outside of
+    requests (e.g. in Celery tasks) nothing is remembered: an empty dict is
+    returned for each call.
+    """
+    levels = getattr(_access_memo, "levels", None)
+    if levels is None:
+        return {}
+    return levels.setdefault((user_id, item_type), {})
+
+
+def clear_access_memo() -> None:
+    """Forget the permission levels checked during the current request."""
+    levels = getattr(_access_memo, "levels", None)
+    if levels is not None:
+        levels.clear()
+
+
+@dataclass
+class AccessIndexDrift:
+    """Differences between the access index and its sources."""
+
+    # rows that should be indexed, unsaved
+    missing: list[UserAssetAccess] = field(default_factory=list)
+    # indexed rows that should not be, or with another permission level
+    extra: list[UserAssetAccess] = field(default_factory=list)
+
+    @property
+    def is_consistent(self) -> bool:
+        return not self.missing and not self.extra
+
+    def item_uuids(self, item_type: ItemType) -> set[str]:
+        """UUIDs of the items of a type whose rows drifted."""
+        return {
+            str(row.item_uuid)
+            for row in [*self.missing, *self.extra]
+            if row.item_type == item_type
+        }
+
+
+def _chunks(values: Iterable[Any]) -> Iterator[list[Any]]:
+    chunk: list[Any] = []
+    for value in values:
+        chunk.append(value)
+        if len(chunk) >= _CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _grant(rows: AccessRows, user_id: int | None, item_uuid: Any, level: str) -> None:
+    if user_id is None:
+        return
+    key = (user_id, str(item_uuid))
+    current = rows.get(key)
+    if current is None or _LEVEL_RANK[level] > _LEVEL_RANK[current]:
+        rows[key] = level
+
+
+def _dataset_users(dataset_uuids: Iterable[Any]) -> dict[str, set[int]]:
+    """Owners and shared users of non-deleted datasets, by dataset UUID."""
+    users: dict[str, set[int]] = {}
+    for dataset_uuid, owner_id in Dataset.objects.filter(
+        uuid__in=set(dataset_uuids), is_deleted=False
+    ).values_list("uuid", "owner_id"):
+        users[str(dataset_uuid)] = {owner_id} if owner_id is not None else set()
+    if not users:
+        return users
+    for dataset_uuid, user_id in UserSharePermission.objects.filter(
+        item_type=ItemType.DATASET,
+        item_uuid__in=users.keys(),
+        shared_with__isnull=False,
+        is_deleted=False,
+        is_enabled=True,
+    ).values_list("item_uuid", "shared_with_id"):
+        users[str(dataset_uuid)].add(user_id)
+    return users
+
+
+def _capture_access_rows(capture_uuids: Iterable[Any]) -> AccessRows:
+    """Expected access rows of captures, computed from their sources."""
+    rows: AccessRows = {}
+    captures = list(
+        Capture.objects.filter(uuid__in=set(capture_uuids), is_deleted=False)
+        .values_list("uuid", "owner_id", "dataset_id")
+        .order_by()
+    )
+    if not captures:
+        return rows
+    live_uuids = [capture_uuid for capture_uuid, _, _ in captures]
+
+    for capture_uuid, owner_id, _ in captures:
+        _grant(rows, owner_id, capture_uuid, PermissionLevel.OWNER)
+    for capture_uuid, user_id, level in UserSharePermission.objects.filter(
+        item_type=ItemType.CAPTURE,
+        item_uuid__in=live_uuids,
+        shared_with__isnull=False,
+        is_deleted=False,
+        is_enabled=True,
+    ).values_list("item_uuid", "shared_with_id", "permission_level"):
+        _grant(rows, user_id, capture_uuid, level)
+
+    # TODO: remove the FK links after migration (expand -> contract)
+    dataset_links = [
+        *_CaptureDatasets.objects.filter(capture_id__in=live_uuids).values_list(
+            "capture_id", "dataset_id"
+        ),
+        *(
+            (capture_uuid, dataset_uuid)
+            for capture_uuid, _, dataset_uuid in captures
+            if dataset_uuid is not None
+        ),
+    ]
+    dataset_users = _dataset_users(dataset_uuid for _, dataset_uuid in dataset_links)
+    for capture_uuid, dataset_uuid in dataset_links:
+        for user_id in dataset_users.get(str(dataset_uuid), ()):
+            _grant(rows, user_id, capture_uuid, PermissionLevel.VIEWER)
+    return rows
+
+
+def _file_access_rows(file_uuids: Iterable[Any]) -> AccessRows:
+    """Expected access rows of files, computed from their sources."""
+    rows: AccessRows = {}
+    files = list(
+        File.objects.filter(uuid__in=set(file_uuids), is_deleted=False)
+        .values_list("uuid", "owner_id", "capture_id", "dataset_id")
+        .order_by()
+    )
+    if not files:
+        return rows
+    live_uuids = [file_uuid for file_uuid, _, _, _ in files]
+
+    for file_uuid, owner_id, _, _ in files:
+        _grant(rows, owner_id, file_uuid, PermissionLevel.OWNER)
+
+    # TODO: remove the FK links after migration (expand -> contract)
+    capture_links = [
+        *_FileCaptures.objects.filter(file_id__in=live_uuids).values_list(
+            "file_id", "capture_id"
+        ),
+        *(
+            (file_uuid, capture_uuid)
+            for file_uuid, _, capture_uuid, _ in files
+            if capture_uuid is not None
+        ),
+    ]
+    capture_users: dict[str, set[int]] = {}
+    for user_id, capture_uuid in _capture_access_rows(
+        capture_uuid for _, capture_uuid in capture_links
+    ):
+        capture_users.setdefault(capture_uuid, set()).add(user_id)
+    for file_uuid, capture_uuid in capture_links:
+        for user_id in capture_users.get(str(capture_uuid), ()):
+            _grant(rows, user_id, file_uuid, PermissionLevel.VIEWER)
+
+    dataset_links = [
+        *_FileDatasets.objects.filter(file_id__in=live_uuids).values_list(
+            "file_id", "dataset_id"
+        ),
+        *(
+            (file_uuid, dataset_uuid)
+            for file_uuid, _, _, dataset_uuid in files
+            if dataset_uuid is not None
+        ),
+    ]
+    dataset_users = _dataset_users(dataset_uuid for _, dataset_uuid in dataset_links)
+    for file_uuid, dataset_uuid in dataset_links:
+        for user_id in dataset_users.get(str(dataset_uuid), ()):
+            _grant(rows, user_id, file_uuid, PermissionLevel.VIEWER)
+    return rows
+
+
+_ACCESS_ROWS = {
+    ItemType.CAPTURE: _capture_access_rows,
+    ItemType.FILE: _file_access_rows,
+}
+
+
+def _drift(item_type: ItemType, item_uuids: list[Any]) -> AccessIndexDrift:
+    """Differences between the indexed and expected rows of items."""
+    expected = _ACCESS_ROWS[item_type](item_uuids)
+    drift = AccessIndexDrift()
+    indexed: set[tuple[int, str]] = set()
+    for row in UserAssetAccess.objects.filter(
+        item_type=item_type, item_uuid__in=item_uuids
+    ):
+        key = (row.user_id, str(row.item_uuid))
+        if expected.get(key) == row.permission_level:
+            indexed.add(key)
+        else:
+            drift.extra.append(row)
+    drift.missing = [
+        UserAssetAccess(
+            user_id=user_id,
+            item_type=item_type,
+            item_uuid=item_uuid,
+            permission_level=level,
+        )
+        for (user_id, item_uuid), level in expected.items()
+        if (user_id, item_uuid) not in indexed
+    ]
+    return drift
+
+
+def _refresh(item_type: ItemType, item_uuids: Iterable[Any]) -> None:
+    clear_access_memo()
+    for chunk in _chunks({str(item_uuid) for item_uuid in item_uuids}):
+        with transaction.atomic():
+            drift = _drift(item_type, chunk)
+            if drift.extra:
+                UserAssetAccess.objects.filter(
+                    pk__in=[row.pk for row in drift.extra]
+                ).delete()
+            if drift.missing:
+                UserAssetAccess.objects.bulk_create(
+                    drift.missing, ignore_conflicts=True
+                )
+
+
+def _capture_file_uuids(capture_uuids: Iterable[Any]) -> set[Any]:
+    capture_uuids = set(capture_uuids)
+    return {
+        *_FileCaptures.objects.filter(capture_id__in=capture_uuids).values_list(
+            "file_id", flat=True
+        ),
+        *File.objects.filter(capture_id__in=capture_uuids).values_list(
+            "uuid", flat=True
+        ),
+    }
+
+
+def refresh_file_access(file_uuids: Iterable[Any]) -> None:
+    """Recompute the indexed access rows of files."""
+    _refresh(ItemType.FILE, file_uuids)
+
+
+def refresh_capture_access(
+    capture_uuids: Iterable[Any], *, include_files: bool = True
+) -> None:
+    """Recompute the indexed access rows of captures.
+
+    Args:
+        capture_uuids: UUIDs of the captures whose access sources changed
+        include_files: Whether to also refresh the files of the captures, which
+            inherit their access
+    """
+    capture_uuids = {str(capture_uuid) for capture_uuid in capture_uuids}
+    _refresh(ItemType.CAPTURE, capture_uuids)
+    if include_files:
+        refresh_file_access(_capture_file_uuids(capture_uuids))
+
+
+def refresh_dataset_access(dataset_uuids: Iterable[Any]) -> None:
+    """Recompute the indexed access rows of the captures and files of datasets."""
+    dataset_uuids = set(dataset_uuids)
+    capture_uuids = {
+        *_CaptureDatasets.objects.filter(dataset_id__in=dataset_uuids).values_list(
+            "capture_id", flat=True
+        ),
+        *Capture.objects.filter(dataset_id__in=dataset_uuids).values_list(
+            "uuid", flat=True
+        ),
+    }
+    file_uuids = {
+        *_capture_file_uuids(capture_uuids),
+        *_FileDatasets.objects.filter(dataset_id__in=dataset_uuids).values_list(
+            "file_id", flat=True
+        ),
+        *File.objects.filter(dataset_id__in=dataset_uuids).values_list(
+            "uuid", flat=True
+        ),
+    }
+    refresh_capture_access(capture_uuids, include_files=False)
+    refresh_file_access(file_uuids)
+
+
+def refresh_item_access(item_type: ItemType | str, item_uuids: Iterable[Any]) -> None:
+    """Recompute the indexed access rows affected by a change to items.
+
+    Raises:
+        ValueError: When the item type is not indexed nor grants access
+    """
+    if item_type == ItemType.FILE:
+        refresh_file_access(item_uuids)
+    elif item_type == ItemType.CAPTURE:
+        refresh_capture_access(item_uuids)
+    elif item_type == ItemType.DATASET:
+        refresh_dataset_access(item_uuids)
+    else:
+        err_msg = f"Invalid item type: {item_type}"
+        raise ValueError(err_msg)
+
+
+def accessible_item_uuids(user, item_type: ItemType) -> QuerySet[UserAssetAccess]:
+    """Subquery of the UUIDs of the items of a type that a user can access."""
+    return UserAssetAccess.objects.filter(user=user, item_type=item_type).values(
+        "item_uuid"
+    )
+
+
+def _all_item_uuids(item_type: ItemType, *, include_deleted: bool) -> Iterator[Any]:
+    model = Capture if item_type == ItemType.CAPTURE else File
+    queryset = model.objects.all()
+    if not include_deleted:
+        queryset = queryset.filter(is_deleted=False)
+    return queryset.values_list("uuid", flat=True).iterator(chunk_size=_CHUNK_SIZE)
+
+
+def rebuild_access_index() -> int:
+    """Recompute every row of the access index from its sources.
+
+    Readers see the previous rows until the rebuild is committed.
+
+    Returns:
+        int: Number of rows written
+    """
+    written = 0
+    with transaction.atomic():
+        UserAssetAccess.objects.all().delete()
+        for item_type, access_rows in _ACCESS_ROWS.items():
+            for chunk in _chunks(_all_item_uuids(item_type, include_deleted=False)):
+                rows = [
+                    UserAssetAccess(
+                        user_id=user_id,
+                        item_type=item_type,
+                        item_uuid=item_uuid,
+                        permission_level=level,
+                    )
+                    for (user_id, item_uuid), level in access_rows(chunk).items()
+                ]
+                UserAssetAccess.objects.bulk_create(rows, batch_size=_CHUNK_SIZE)
+                written += len(rows)
+    clear_access_memo()
+    log.info(f"Rebuilt the access index with {written} rows")
+    return written
+
+
+def _iter_drift() -> Iterator[AccessIndexDrift]:
+    """Drift of each chunk of items, then of the rows of items that don't exist."""
+    for item_type, model in ((ItemType.CAPTURE, Capture), (ItemType.FILE, File)):
+        for chunk in _chunks(_all_item_uuids(item_type, include_deleted=True)):
+            yield _drift(item_type, [str(item_uuid) for item_uuid in chunk])
+        yield AccessIndexDrift(
+            extra=list(
+                UserAssetAccess.objects.filter(item_type=item_type).exclude(
+                    Exists(model.objects.filter(uuid=OuterRef("item_uuid")))
+                )
+            )
+        )
+
+
+def check_access_index() -> AccessIndexDrift:
+    """Compare every row of the access index to its sources.
+
+    Returns:
+        AccessIndexDrift: Missing rows, and extra rows including those of items
+            that no longer exist
+    """
+    drift = AccessIndexDrift()
+    for chunk_drift in _iter_drift():
+        drift.missing.extend(chunk_drift.missing)
+        drift.extra.extend(chunk_drift.extra)
+    return drift
+
+
+def is_access_index_consistent() -> bool:
+    """Whether the access index matches its sources, stopping at the first drift."""
+    return all(chunk_drift.is_consistent for chunk_drift in _iter_drift())
@@ -1,107 +1,116 @@
 """Capture access utility functions for the SDS Gateway API."""
 
 import logging
+from collections.abc import Iterable
 
-from django.db.models import Q
 from pydantic import UUID4
 
 from sds_gateway.api_methods.models import Capture
 from sds_gateway.api_methods.models import Dataset
 from sds_gateway.api_methods.models import File
 from sds_gateway.api_methods.models import ItemType
+from sds_gateway.api_methods.models import PermissionLevel
+from sds_gateway.api_methods.models import UserAssetAccess
 from sds_gateway.api_methods.models import UserSharePermission
-from sds_gateway.api_methods.models import user_has_access_to_item
+from sds_gateway.api_methods.utils import access_index
 from sds_gateway.api_methods.utils import relationship_utils
 
 logger = logging.getLogger(__name__)
 
 
-def user_has_access_to_capture(user, capture: Capture) -> bool:
-    """
-    Check if a user has access to a capture.
-    ...
-    """
-    # Check M2M datasets access
-    shared_datasets = UserSharePermission.objects.filter(
-        shared_with=user,
+# higher ranks win when a user has several share permissions on an item
+_SHARE_LEVEL_RANK: dict[str, int] = {
+    PermissionLevel.VIEWER: 0,
+    PermissionLevel.CONTRIBUTOR: 1,
+    PermissionLevel.CO_OWNER: 2,
+}
+
+
+def _query_dataset_access_levels(user, dataset_uuids: set[str]) -> dict[str, str]:
+    """Permission levels of a user on datasets, from ownership and shares."""
+    levels: dict[str, str] = {
+        str(dataset_uuid): PermissionLevel.OWNER
+        for dataset_uuid in Dataset.objects.filter(
+            uuid__in=dataset_uuids, owner=user, is_deleted=False
+        ).values_list("uuid", flat=True)
+    }
+    for dataset_uuid, level in UserSharePermission.objects.filter(
         item_type=ItemType.DATASET,
+        item_uuid__in=dataset_uuids - levels.keys(),
+        shared_with=user,
         is_deleted=False,
         is_enabled=True,
-    ).values_list("item_uuid", flat=True)
+    ).values_list("item_uuid", "permission_level"):
+        current = levels.get(str(dataset_uuid))
+        if current is None or _SHARE_LEVEL_RANK[level] > _SHARE_LEVEL_RANK[current]:
+            levels[str(dataset_uuid)] = level
+    return levels
 
-    user_has_access_to_capture = user_has_access_to_item(
-        user,
-        capture.uuid,
-        ItemType.CAPTURE,
-    )
-
-    # Use centralized function to get datasets (handles both M2M and FK)
-    capture_datasets = relationship_utils.get_capture_datasets(
-        capture, include_deleted=False
-    )
 
-    # Check if any dataset is owned by user or in shared_datasets
-    user_has_access_to_dataset = any(
-        dataset.owner == user or dataset.uuid in shared_datasets
-        for dataset in capture_datasets
-    )
+def get_access_levels(
+    user, item_type: ItemType, item_uuids: Iterable[UUID4 | str]
+) -> dict[str, str]:
+    """
+    Get the permission levels of a user on the accessible items among many.
 
-    return user_has_access_to_capture or user_has_access_to_dataset
+    Files and captures are looked up in the per-user access index (see
+    `access_index`), in one query; datasets from their owner and share
+    permissions, in two. Levels checked during a request are remembered until
+    it finishes, so repeated checks make no queries.
 
+    Args:
+        user: The user to check access for
+        item_type: Type of the items (file, capture or dataset)
+        item_uuids: UUIDs of the items to check
 
-def user_has_access_to_file(user, file: File) -> bool:
-    """
-    Check if a user has access to a file.
-    ...
+    Returns:
+        dict[str, str]: Permission levels by UUID, for the accessible items only
+    Raises:
+        ValueError: When the item type is not supported
     """
-    user_owns_file = file.owner == user
+    if item_type not in (ItemType.FILE, ItemType.CAPTURE, ItemType.DATASET):
+        err_msg = f"Invalid item type: {item_type}"
+        raise ValueError(err_msg)
+    item_uuids = {str(item_uuid) for item_uuid in item_uuids}
+    if not item_uuids or not getattr(user, "is_authenticated", False):
+        return {}
+
+    memo = access_index.get_access_memo(user.pk, item_type)
+    unchecked = item_uuids - memo.keys()
+    if unchecked:
+        if item_type == ItemType.DATASET:
+            levels = _query_dataset_access_levels(user, unchecked)
+        else:
+            levels = {
+                str(item_uuid): level
+                for item_uuid, level in UserAssetAccess.objects.filter(
+                    user=user, item_type=item_type, item_uuid__in=unchecked
+                ).values_list("item_uuid", "permission_level")
+            }
+        memo.update({item_uuid: levels.get(item_uuid) for item_uuid in unchecked})
+    return {
+        item_uuid: level
+        for item_uuid in item_uuids
+        if (level := memo[item_uuid]) is not None
+    }
 
-    # Check M2M captures access
-    shared_captures = UserSharePermission.objects.filter(
-        shared_with=user,
-        item_type=ItemType.CAPTURE,
-        is_deleted=False,
-        is_enabled=True,
-    ).values_list("item_uuid", flat=True)
 
-    # Get shared datasets for checking nested relationships
-    shared_datasets = UserSharePermission.objects.filter(
-        shared_with=user,
-        item_type=ItemType.DATASET,
-        is_deleted=False,
-        is_enabled=True,
-    ).values_list("item_uuid", flat=True)
+def user_has_access_to_capture(user, capture: Capture) -> bool:
+    """
+    Check if a user has access to a non-deleted capture.
 
-    # Use centralized function to get captures (handles both M2M and FK)
-    file_captures = relationship_utils.get_file_captures(file, include_deleted=False)
+    See `get_access_levels` to check many captures at once.
+    """
+    return bool(get_access_levels(user, ItemType.CAPTURE, [capture.uuid]))
 
-    # Check if file's captures are accessible (directly shared, owned by user)
-    user_has_access_to_capture = any(
-        capture.owner == user or capture.uuid in shared_captures
-        for capture in file_captures
-    )
 
-    # Check if file's captures are in shared datasets (nested relationship)
-    if not user_has_access_to_capture:
-        for capture in file_captures:
-            capture_datasets = relationship_utils.get_capture_datasets(
-                capture, include_deleted=False
-            )
-            if any(
-                dataset.owner == user or dataset.uuid in shared_datasets
-                for dataset in capture_datasets
-            ):
-                user_has_access_to_capture = True
-                break
-
-    # Use centralized function to get datasets (handles both M2M and FK)
-    file_datasets = relationship_utils.get_file_datasets(file, include_deleted=False)
-    user_has_access_to_dataset = any(
-        dataset.owner == user or dataset.uuid in shared_datasets
-        for dataset in file_datasets
-    )
+def user_has_access_to_file(user, file: File) -> bool:
+    """
+    Check if a user has access to a non-deleted file.
 
-    return user_owns_file or user_has_access_to_capture or user_has_access_to_dataset
+    See `get_access_levels` to check many files at once.
+    """
+    return bool(get_access_levels(user, ItemType.FILE, [file.uuid]))
 
 
 def get_accessible_files_queryset(user):
@@ -114,110 +123,18 @@ def get_accessible_files_queryset(user):
     3. The file is part of a dataset that is shared with them, OR
     4. The file is part of a capture that is part of a shared dataset
 
+    Access is read from the per-user access index, see `access_index`.
+
     Args:
         user: The user to check access for
 
     Returns:
         QuerySet[File]: Queryset of accessible files
     """
-    captures_shared_with_user = UserSharePermission.objects.filter(
-        item_type=ItemType.CAPTURE, shared_with=user, is_deleted=False, is_enabled=True
-    ).values_list("item_uuid", flat=True)
-
-    datasets_shared_with_user = UserSharePermission.objects.filter(
-        item_type=ItemType.DATASET, shared_with=user, is_deleted=False, is_enabled=True
-    ).values_list("item_uuid", flat=True)
-
-    # Base queryset for non-deleted files
-    base_queryset = File.objects.filter(is_deleted=False)
-
-    # Build the access control query using Q objects
-    access_query = Q()
-
-    # 1. Files owned by the user (but exclude if they're only accessible through
-    #    shared captures/datasets that the user doesn't have access to)
-    #    Actually, file owners should always see their files per
-    #    test_file_owner_has_access
-    access_query |= Q(owner=user)
-
-    # 2. Files part of captures that are shared with the user
-    # EXPAND: Support both M2M (captures) and FK (capture) relationships
-    capture_shared_query = (
-        # M2M relationship: files.captures
-        (
-            Q(captures__isnull=False, captures__is_deleted=False)
-            & (
-                Q(captures__owner=user)  # Capture owned by user
-                |
-                # Capture directly shared with user
-                Q(captures__uuid__in=captures_shared_with_user)
-                |
-                # Capture part of dataset that is shared with user (via M2M)
-                Q(
-                    captures__datasets__isnull=False,
-                    captures__datasets__is_deleted=False,
-                )
-                & (
-                    Q(captures__datasets__owner=user)  # Dataset owned by user
-                    |
-                    # Dataset directly shared with user
-                    Q(captures__datasets__uuid__in=datasets_shared_with_user)
-                )
-            )
-        )
-        |
-        # FK relationship: files.capture (deprecated, for backward compatibility)
-        # TODO: remove this after migration (expand -> contract)
-        (
-            Q(capture__isnull=False, capture__is_deleted=False)
-            & (
-                Q(capture__owner=user)  # Capture owned by user
-                |
-                # Capture directly shared with user
-                Q(capture__uuid__in=captures_shared_with_user)
-                |
-                # Capture part of dataset that is shared with user (via FK)
-                Q(capture__dataset__isnull=False, capture__dataset__is_deleted=False)
-                & (
-                    Q(capture__dataset__owner=user)  # Dataset owned by user
-                    |
-                    # Dataset directly shared with user
-                    Q(capture__dataset__uuid__in=datasets_shared_with_user)
-                )
-            )
-        )
-    )
-    access_query |= capture_shared_query
-
-    # 3. Files part of datasets that are shared with the user
-    # EXPAND: Support both M2M (datasets) and FK (dataset) relationships
-    dataset_shared_query = (
-        # M2M relationship: files.datasets
-        (
-            Q(datasets__isnull=False, datasets__is_deleted=False)
-            & (
-                Q(datasets__owner=user)  # Dataset owned by user
-                |
-                # Dataset directly shared with user
-                Q(datasets__uuid__in=datasets_shared_with_user)
-            )
-        )
-        |
-        # FK relationship: files.dataset (deprecated, for backward compatibility)
-        # TODO: remove this after migration (expand -> contract)
-        (
-            Q(dataset__isnull=False, dataset__is_deleted=False)
-            & (
-                Q(dataset__owner=user)  # Dataset owned by user
-                |
-                # Dataset directly shared with user
-                Q(dataset__uuid__in=datasets_shared_with_user)
-            )
-        )
+    return File.objects.filter(
+        is_deleted=False,
+        uuid__in=access_index.accessible_item_uuids(user, ItemType.FILE),
     )
-    access_query |= dataset_shared_query
-
-    return base_queryset.filter(access_query).distinct()
 
 
 def get_accessible_captures_queryset(user):
@@ -229,61 +146,18 @@ def get_accessible_captures_queryset(user):
     2. The capture is shared with them, OR
     3. The capture is part of a dataset that is shared with them
 
+    Access is read from the per-user access index, see `access_index`.
+
     Args:
         user: The user to check access for
 
     Returns:
         QuerySet[Capture]: Queryset of accessible captures
     """
-    captures_shared_with_user = UserSharePermission.objects.filter(
-        item_type=ItemType.CAPTURE, shared_with=user, is_deleted=False, is_enabled=True
-    ).values_list("item_uuid", flat=True)
-
-    datasets_shared_with_user = UserSharePermission.objects.filter(
-        item_type=ItemType.DATASET, shared_with=user, is_deleted=False, is_enabled=True
-    ).values_list("item_uuid", flat=True)
-
-    # Base queryset for non-deleted captures
-    base_queryset = Capture.objects.filter(is_deleted=False)
-
-    # Build the access control query using Q objects
-    access_query = Q()
-
-    # 1. Captures owned by the user
-    access_query |= Q(owner=user)
-
-    # 2. Captures directly shared with the user
-    access_query |= Q(uuid__in=captures_shared_with_user)
-
-    # 3. Captures part of datasets that are shared with the user
-    # EXPAND: Support both M2M (datasets) and FK (dataset) relationships
-    dataset_shared_query = (
-        # M2M relationship: captures.datasets
-        (
-            Q(datasets__isnull=False, datasets__is_deleted=False)
-            & (
-                Q(datasets__owner=user)  # Dataset owned by user
-                |
-                # Dataset directly shared with user
-                Q(datasets__uuid__in=datasets_shared_with_user)
-            )
-        )
-        |
-        # FK relationship: captures.dataset (deprecated, for backward compatibility)
-        # TODO: remove this after migration (expand -> contract)
-        (
-            Q(dataset__isnull=False, dataset__is_deleted=False)
-            & (
-                Q(dataset__owner=user)  # Dataset owned by user
-                |
-                # Dataset directly shared with user
-                Q(dataset__uuid__in=datasets_shared_with_user)
-            )
-        )
+    return Capture.objects.filter(
+        is_deleted=False,
+        uuid__in=access_index.accessible_item_uuids(user, ItemType.CAPTURE),
     )
-    access_query |= dataset_shared_query
-
-    return base_queryset.filter(access_query).distinct()
 
 
 def check_if_shared(item_uuid: UUID4, item_type: ItemType) -> bool:
@@ -356,10 +230,22 @@ def revoke_share_permissions(
         is_enabled=False,
         is_individual_share=False,
     )
+    # update() does not send the signals that maintain the access index
+    access_index.refresh_item_access(item_type, [item_uuid])
 
     return True
 
 
+def _capture_file_uuids(capture: Capture) -> list[UUID4]:
+    """UUIDs of the files linked to a capture, by M2M or FK."""
+    return [
+        *File.captures.through.objects.filter(capture_id=capture.pk).values_list(
+            "file_id", flat=True
+        ),
+        *File.objects.filter(capture=capture).values_list("uuid", flat=True),
+    ]
+
+
 def disconnect_files_from_capture(capture: Capture) -> None:
     """Disconnects all files from a capture.
 
@@ -368,9 +254,11 @@ def disconnect_files_from_capture(capture: Capture) -> None:
     Args:
         capture: The capture to disconnect files from.
     """
+    file_uuids = _capture_file_uuids(capture)
     File.captures.through.objects.filter(capture_id=capture.pk).delete()
     # TODO: remove FK after contraction
     File.objects.filter(capture=capture).update(capture=None)
+    access_index.refresh_file_access(file_uuids)
 
 
 def disconnect_files_from_dataset(dataset: Dataset) -> None:
@@ -378,9 +266,16 @@ def disconnect_files_from_dataset(dataset: Dataset) -> None:
 
     Clears ``File.datasets`` (M2M) and deprecated ``File.dataset`` (FK).
     """
+    file_uuids = [
+        *File.datasets.through.objects.filter(dataset_id=dataset.pk).values_list(
+            "file_id", flat=True
+        ),
+        *File.objects.filter(dataset=dataset).values_list("uuid", flat=True),
+    ]
     File.datasets.through.objects.filter(dataset_id=dataset.pk).delete()
     # TODO: remove FK after contraction
     File.objects.filter(dataset=dataset).update(dataset=None)
+    access_index.refresh_file_access(file_uuids)
 
 
 def disconnect_captures_from_dataset(dataset: Dataset) -> None:
@@ -402,6 +297,7 @@ def disconnect_captures_from_dataset(dataset: Dataset) -> None:
     Capture.datasets.through.objects.filter(dataset_id=dataset.pk).delete()
     # TODO: remove FK after contraction
     Capture.objects.filter(dataset=dataset).update(dataset=None)
+    access_index.refresh_capture_access(capture_pks)
 
     reindex_captures_after_dataset_unlink(capture_pks)
 
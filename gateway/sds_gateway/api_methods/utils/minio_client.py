@@ -2,11 +2,14 @@
 
 import hashlib
 import logging
+from functools import cache
+from importlib.metadata import version as package_version
 from typing import Any
 from urllib.parse import urlparse
 
 from django.conf import settings
 from minio import Minio
+from minio.datatypes import Part
 
 from .storage_errors import is_missing_object_error as _is_missing_object_error
 
@@ -16,6 +19,32 @@ _BUCKET_NAME_POSITION = 0
 _OBJECT_NAME_POSITION = 1
 _BUCKET_AND_OBJECT_ARGUMENT_COUNT = 2
 
+# minio only runs multipart uploads within a single put_object() call: uploads
+#   whose parts arrive over several requests (see upload_sessions) call the
+#   private methods implementing its S3 multipart API instead. Their signatures
+#   are only relied on for the minor versions they were checked against, which
+#   gateway/pyproject.toml pins.
+_MULTIPART_MINIO_VERSIONS = ((7, 2),)
+_MULTIPART_MINIO_METHODS = (
+    "_create_multipart_upload",
+    "_upload_part",
+    "_complete_multipart_upload",
+    "_abort_multipart_upload",
+)
+
+
+class MultipartUploadUnsupportedError(Exception):
+    """Raised when the installed minio can't run multipart uploads across requests."""
+
+
+@cache
+def _supports_multipart_uploads() -> bool:
+    """Whether the private multipart methods of minio are known to be usable."""
+    minor_version = tuple(int(part) for part in package_version("minio").split(".")[:2])
+    return minor_version in _MULTIPART_MINIO_VERSIONS and all(
+        hasattr(Minio, method_name) for method_name in _MULTIPART_MINIO_METHODS
+    )
+
 
 def _normalize_endpoint(endpoint: str) -> str:
     """Convert endpoint URL to host:port format accepted by MinIO client."""
@@ -38,6 +67,7 @@ def _build_minio_client(
     access_key: str,
     secret_key: str,
     secure: bool,
+    region: str | None = None,
 ) -> Minio:
     """Build a MinIO API-compatible client."""
     return Minio(
@@ -45,6 +75,7 @@ def _build_minio_client(
         access_key=access_key,
         secret_key=secret_key,
         secure=secure,
+        region=region,
     )
 
 
@@ -248,6 +279,71 @@ class ObjectStoreFacade:
         """Remove object from primary store with optional dual-write behavior."""
         return self._delete_from_both_stores(*args, **kwargs)
 
+    # multipart uploads only target the primary store: callers refuse them while
+    #   writing to both stores, as parts can't be mirrored to the secondary one
+    def create_multipart_upload(self, object_name: str) -> str:
+        """Start a multipart upload in the primary store, returning its ID.
+
+        Raises:
+            MultipartUploadUnsupportedError: When the installed minio version
+                was not checked for the private methods used here.
+        """
+        if not _supports_multipart_uploads():
+            msg = (
+                f"Multipart uploads are not supported with minio "
+                f"{package_version('minio')}"
+            )
+            raise MultipartUploadUnsupportedError(msg)
+        return self._primary_client._create_multipart_upload(  # noqa: SLF001
+            settings.PRIMARY_STORAGE_BUCKET_NAME,
+            object_name,
+            {"Content-Type": "application/octet-stream"},
+        )
+
+    def upload_part(
+        self,
+        *,
+        object_name: str,
+        upload_id: str,
+        part_number: int,
+        data: bytes | bytearray,
+    ) -> str:
+        """Upload a part of a multipart upload, returning its ETag.
+
+        Buffers are sent without copying them.
+        """
+        return self._primary_client._upload_part(  # noqa: SLF001
+            bucket_name=settings.PRIMARY_STORAGE_BUCKET_NAME,
+            object_name=object_name,
+            data=data,
+            headers=None,
+            upload_id=upload_id,
+            part_number=part_number,
+        )
+
+    def complete_multipart_upload(
+        self,
+        *,
+        object_name: str,
+        upload_id: str,
+        parts: list[Part],
+    ) -> Any:
+        """Assemble the uploaded parts into a single object."""
+        return self._primary_client._complete_multipart_upload(  # noqa: SLF001
+            settings.PRIMARY_STORAGE_BUCKET_NAME,
+            object_name,
+            upload_id,
+            parts,
+        )
+
+    def abort_multipart_upload(self, *, object_name: str, upload_id: str) -> None:
+        """Abort a multipart upload, discarding the parts uploaded so far."""
+        self._primary_client._abort_multipart_upload(  # noqa: SLF001
+            settings.PRIMARY_STORAGE_BUCKET_NAME,
+            object_name,
+            upload_id,
+        )
+
     def __getattr__(self, name: str) -> Any:
         """Delegate unknown methods to the primary client for compatibility."""
         return getattr(self._primary_client, name)
@@ -298,3 +394,18 @@ def get_minio_client() -> ObjectStoreFacade:
         write_both_enabled=settings.OBJECT_STORE_WRITE_BOTH_ENABLED,
         dual_write_strict=settings.OBJECT_STORE_DUAL_WRITE_STRICT,
     )
+
+
+def get_presigning_client() -> Minio:
+    """Return a client that signs URLs for the client-reachable primary endpoint.
+
+    Presigning is a local operation: setting the region avoids a network lookup.
+    """
+    endpoint_url = settings.PRESIGNED_S3_ENDPOINT_URL
+    return _build_minio_client(
+        endpoint=endpoint_url,
+        access_key=settings.PRIMARY_ACCESS_KEY_ID,
+        secret_key=settings.PRIMARY_SECRET_ACCESS_KEY,
+        secure=urlparse(endpoint_url).scheme == "https",
+        region=settings.AWS_S3_REGION_NAME,
+    )
@@ -272,6 +272,17 @@ example_file_content_check_request = {
     "sum_blake3": "3fa85f64-5717-4562-b3fc-2c963f66afa6",
 }
 
+example_file_content_check_batch_request = {
+    "files": [
+        example_file_content_check_request,
+        {
+            "directory": "/path/to/file",
+            "name": "other_file.h5",
+            "sum_blake3": "55c6dac98fbc9a388f619f5f4ffc4c9fdd3eb37eab48afd68b65da90ef3070b1",
+        },
+    ],
+}
+
 capture_list_request_example_schema = {
     "capture_type": CaptureType.DigitalRF,
     "metadata_filters": [
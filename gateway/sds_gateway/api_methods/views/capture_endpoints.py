@@ -1,4 +1,5 @@
 import concurrent.futures
+import functools
 import json
 import re
 import tempfile
@@ -21,6 +22,7 @@ from drf_spectacular.utils import OpenApiParameter
 from drf_spectacular.utils import OpenApiResponse
 from drf_spectacular.utils import extend_schema
 from loguru import logger as log
+from minio.error import MinioException
 from opensearchpy import exceptions as os_exceptions
 from rest_framework import status
 from rest_framework import viewsets
@@ -29,6 +31,9 @@ from rest_framework.decorators import action
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param
+from rest_framework.utils.urls import replace_query_param
 
 import sds_gateway.api_methods.utils.swagger_example_schema as example_schema
 from sds_gateway.api_methods.authentication import APIKeyAuthentication
@@ -41,8 +46,19 @@ from sds_gateway.api_methods.helpers.index_handling import retrieve_indexed_meta
 from sds_gateway.api_methods.helpers.reconstruct_file_tree import find_rh_metadata_file
 from sds_gateway.api_methods.helpers.reconstruct_file_tree import reconstruct_tree
 from sds_gateway.api_methods.helpers.rh_schema_generator import load_rh_file
-from sds_gateway.api_methods.helpers.search_captures import get_composite_captures
+from sds_gateway.api_methods.helpers.search_captures import CaptureGroupKey
+from sds_gateway.api_methods.helpers.search_captures import CaptureSearch
+from sds_gateway.api_methods.helpers.search_captures import CaptureSearchCursor
+from sds_gateway.api_methods.helpers.search_captures import count_capture_groups
+from sds_gateway.api_methods.helpers.search_captures import (
+    count_searched_capture_groups,
+)
+from sds_gateway.api_methods.helpers.search_captures import get_capture_groups_page
+from sds_gateway.api_methods.helpers.search_captures import (
+    get_searched_capture_groups_page,
+)
 from sds_gateway.api_methods.helpers.search_captures import search_captures
+from sds_gateway.api_methods.helpers.search_captures import serialize_capture_groups
 from sds_gateway.api_methods.models import Capture
 from sds_gateway.api_methods.models import CaptureType
 from sds_gateway.api_methods.models import ItemType
@@ -72,11 +88,30 @@ from sds_gateway.api_methods.views.file_endpoints import sanitize_path_rel_to_us
 from sds_gateway.users.models import User
 from sds_gateway.visualizations.models import PostProcessedData
 from sds_gateway.visualizations.models import ProcessingStatus
-from sds_gateway.visualizations.processing.utils import reconstruct_drf_files
+from sds_gateway.visualizations.processing.utils import read_stored_range
+from sds_gateway.visualizations.processing.utils import reconstruct_drf_range
 from sds_gateway.visualizations.processing.waterfall import FFT_SIZE
 from sds_gateway.visualizations.processing.waterfall import SAMPLES_PER_SLICE
 from sds_gateway.visualizations.processing.waterfall import compute_slices_on_demand
-from sds_gateway.visualizations.processing.waterfall import get_waterfall_power_bounds
+from sds_gateway.visualizations.processing.waterfall import waterfall_slice_params
+from sds_gateway.visualizations.processing.waterfall import waterfall_slices_from_matrix
+from sds_gateway.visualizations.processing.waterfall_binary import (
+    WATERFALL_STORAGE_SUFFIX,
+)
+from sds_gateway.visualizations.processing.waterfall_binary import WaterfallDType
+from sds_gateway.visualizations.processing.waterfall_binary import WaterfallMatrixFile
+from sds_gateway.visualizations.processing.waterfall_binary import (
+    encode_waterfall_slices,
+)
+from sds_gateway.visualizations.processing.waterfall_binary import (
+    stack_waterfall_slices,
+)
+from sds_gateway.visualizations.processing.waterfall_pyramid import (
+    WATERFALL_PYRAMID_FACTOR,
+)
+from sds_gateway.visualizations.processing.waterfall_pyramid import WaterfallPooling
+from sds_gateway.visualizations.processing.waterfall_pyramid import open_pyramid_level
+from sds_gateway.visualizations.renderers import WaterfallBinaryRenderer
 from sds_gateway.visualizations.serializers import PostProcessedDataSerializer
 
 MAX_CAPTURE_NAME_LENGTH = 255  # Maximum length for capture names
@@ -85,6 +120,27 @@ MAX_SLICE_BATCH_SIZE = (
 )
 # Timeout for on-demand slice computation to avoid long-running requests
 SLICE_COMPUTE_TIMEOUT_SECONDS = 60
+# Number of following ranges of the same size prefetched for streamed waterfalls
+STREAM_PREFETCH_RANGES = 2
+# waterfall slices are sent as JSON, or in the binary format when negotiated
+WATERFALL_RENDERER_CLASSES = [
+    *api_settings.DEFAULT_RENDERER_CLASSES,
+    WaterfallBinaryRenderer,
+]
+WATERFALL_BINARY_PARAMETERS = [
+    OpenApiParameter(
+        name="dtype",
+        type=OpenApiTypes.STR,
+        location=OpenApiParameter.QUERY,
+        required=False,
+        enum=[str(dtype) for dtype in WaterfallDType],
+        description=(
+            "Value type of the binary format (Accept: "
+            f"{WaterfallBinaryRenderer.media_type}): uint8 is quantized "
+            "between the power bounds (default: float32)"
+        ),
+    ),
+]
 
 
 def _validate_slice_indices(
@@ -200,6 +256,257 @@ def _extract_waterfall_slice_range(
     return requested_slices, total_slices
 
 
+def _read_precomputed_waterfall(
+    processed_data: PostProcessedData,
+    start_index: int,
+    end_index: int,
+    *,
+    as_matrix: bool = False,
+) -> dict[str, Any]:
+    """Read a range of slices of a precomputed waterfall.
+
+    Waterfalls stored in the binary format are read with ranged requests for
+    their header and the rows of the range only; JSON files of older waterfalls
+    are stream-parsed with `_extract_waterfall_slice_range`.
+
+    Returns:
+        dict with 'slices' and 'total_slices'; with as_matrix, 'spectra' and
+            'slice_runs' replace 'slices'.
+
+    Raises:
+        ValueError: If start_index >= total slices, or the file is invalid.
+        ijson.JSONError: On invalid JSON.
+    """
+    if not processed_data.data_file.name.endswith(WATERFALL_STORAGE_SUFFIX):
+        total_slices_from_metadata = (processed_data.metadata or {}).get("total_slices")
+        with processed_data.data_file.open("rb") as f:
+            requested_slices, total_slices = _extract_waterfall_slice_range(
+                f,
+                start_index,
+                end_index,
+                None
+                if total_slices_from_metadata is None
+                else int(total_slices_from_metadata),
+            )
+        if not as_matrix:
+            return {"slices": requested_slices, "total_slices": total_slices}
+        spectra, slice_runs = stack_waterfall_slices(requested_slices, start_index)
+        return {
+            "spectra": spectra,
+            "slice_runs": slice_runs,
+            "total_slices": total_slices,
+        }
+
+    stored = WaterfallMatrixFile(
+        functools.partial(read_stored_range, processed_data.data_file.name)
+    )
+    if start_index >= stored.total_slices:
+        msg = (
+            f"start_index ({start_index}) exceeds total slices ({stored.total_slices})"
+        )
+        raise ValueError(msg)
+    spectra, slice_runs = stored.read_slices(start_index, end_index)
+    if as_matrix:
+        return {
+            "spectra": spectra,
+            "slice_runs": slice_runs,
+            "total_slices": stored.total_slices,
+        }
+    return {
+        "slices": waterfall_slices_from_matrix(
+            waterfall_slice_params(stored.header["slice_params"]), spectra, slice_runs
+        ),
+        "total_slices": stored.total_slices,
+    }
+
+
+def _get_waterfall_binary_dtype(
+    request: Request,
+) -> WaterfallDType | Response | None:
+    """Parse the dtype of the binary format, when the client negotiated it.
+
+    Returns:
+        The dtype to encode slices with, None for JSON responses, or a
+        Response with an error when the dtype is invalid.
+    """
+    if not isinstance(request.accepted_renderer, WaterfallBinaryRenderer):
+        return None
+    try:
+        return WaterfallDType(request.query_params.get("dtype", WaterfallDType.Float32))
+    except ValueError:
+        return Response(
+            {"error": f"dtype must be one of {[str(d) for d in WaterfallDType]}"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+
+def _get_waterfall_pyramid_options(
+    request: Request,
+) -> tuple[int, WaterfallPooling] | Response:
+    """Parse the level and pooling of the waterfall pyramid to read slices from.
+
+    Returns:
+        The level, 0 for full-resolution slices, and the pooling; or a Response
+        with an error when the options are invalid.
+    """
+    try:
+        level = int(request.query_params.get("level", 0))
+        pooling = WaterfallPooling(
+            request.query_params.get("pooling", WaterfallPooling.Max)
+        )
+    except ValueError:
+        level = -1
+        pooling = WaterfallPooling.Max
+    if level < 0:
+        return Response(
+            {
+                "error": (
+                    "level must be a non-negative integer and pooling one of "
+                    f"{[str(p) for p in WaterfallPooling]}"
+                )
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return level, pooling
+
+
+def _waterfall_pyramid_response(
+    capture: Capture,
+    level: int,
+    pooling: WaterfallPooling,
+    start_index: int,
+    end_index: int,
+    *,
+    binary_dtype: WaterfallDType | None,
+) -> Response:
+    """Respond with a range of slices of a level of the waterfall pyramid.
+
+    Pyramids are built after the waterfall of the capture is processed; each
+    range is read with ranged requests for its rows only.
+    """
+    processed_data = (
+        capture.visualization_post_processed_data.filter(
+            processing_type=ProcessingType.Waterfall.value,
+            processing_status=ProcessingStatus.Completed.value,
+        )
+        .order_by("-created_at")
+        .first()
+    )
+    pyramid = (processed_data.metadata or {}).get("pyramid") if processed_data else None
+    if not pyramid:
+        return Response(
+            {"error": "No waterfall pyramid found for this capture."},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+    # storage errors reading the pyramid are transient: clients retry the range
+    try:
+        stored = open_pyramid_level(
+            functools.partial(read_stored_range, pyramid["object_name"]),
+            pyramid,
+            level,
+            pooling,
+        )
+        total_slices = stored.total_slices
+        if start_index >= total_slices:
+            return Response(
+                {
+                    "error": (
+                        f"start_index ({start_index}) exceeds total slices "
+                        f"({total_slices}) of level {level}"
+                    )
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        spectra, slice_runs = stored.read_slices(start_index, end_index)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except MinioException as e:
+        log.error(f"Failed to read waterfall pyramid of capture {capture.uuid}: {e}")
+        return Response(
+            {"error": "Failed to read waterfall pyramid"},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+    end_index = min(end_index, total_slices)
+    metadata = {
+        **{
+            key: value
+            for key, value in processed_data.metadata.items()
+            if key != "pyramid"
+        },
+        "total_slices": total_slices,
+        "level": level,
+        "pooling": str(pooling),
+        "slices_per_row": pyramid["factor"] ** level,
+    }
+
+    if binary_dtype is not None:
+        return _waterfall_binary_response(
+            spectra,
+            slice_runs,
+            total_slices=total_slices,
+            start_index=start_index,
+            end_index=end_index,
+            metadata=metadata,
+            binary_dtype=binary_dtype,
+        )
+    return Response(
+        {
+            "slices": waterfall_slices_from_matrix(
+                waterfall_slice_params(stored.header["slice_params"]),
+                spectra,
+                slice_runs,
+            ),
+            "total_slices": total_slices,
+            "start_index": start_index,
+            "end_index": end_index,
+            "metadata": metadata,
+        },
+        status=status.HTTP_200_OK,
+    )
+
+
+def _stored_power_metadata(capture: Capture) -> dict[str, Any]:
+    """Power bounds and statistics stored with the latest processed waterfall."""
+    stored = (
+        capture.visualization_post_processed_data.filter(
+            processing_type=ProcessingType.Waterfall.value,
+            processing_status=ProcessingStatus.Completed.value,
+        )
+        .order_by("-created_at")
+        .values_list("metadata", flat=True)
+        .first()
+    ) or {}
+    return {
+        key: stored[key] for key in ("power_bounds", "power_stats") if key in stored
+    }
+
+
+def _waterfall_binary_response(
+    spectra: Any,
+    slice_runs: list[tuple[int, int]],
+    *,
+    total_slices: int,
+    start_index: int,
+    end_index: int,
+    metadata: dict[str, Any],
+    binary_dtype: WaterfallDType,
+) -> Response:
+    """Encode waterfall slices in the binary transport format."""
+    payload = encode_waterfall_slices(
+        spectra,
+        slice_runs,
+        header={
+            "total_slices": total_slices,
+            "start_index": start_index,
+            "end_index": end_index,
+            "metadata": metadata,
+        },
+        dtype=binary_dtype,
+        scale=metadata.get("power_bounds"),
+    )
+    return Response(payload, status=status.HTTP_200_OK)
+
+
 class CapturePagination(PageNumberPagination):
     page_size = 30
     page_size_query_param = "page_size"
@@ -695,64 +1002,151 @@ class CaptureViewSet(viewsets.ViewSet):
         captures: QuerySet[Capture],
         request: Request,
     ) -> Response:
-        """Paginate and serialize composite capture results."""
+        """Paginate and serialize composite capture results.
 
-        # Bulk-load OpenSearch metadata for all captures before
-        # grouping and serialization. This replaces O(n) individual
-        # round-trips (one per capture) with 2 bulk queries
-        # (DRF + RadioHound) and caches results on each instance.
-        capture_list = list(captures)
-        log.debug(
-            "Bulk-loading OpenSearch metadata for %d captures",
-            len(capture_list),
+        Pages are taken over groups of captures in the database (see
+        `get_capture_groups_page`), so only the captures of the page are loaded
+        and serialized. The "next" link continues after the last group of the
+        page with a cursor; "page" numbers are also accepted.
+        """
+        paginator = CapturePagination()
+        page_size = cast("int", paginator.get_page_size(request))
+
+        cursor = request.query_params.get("cursor")
+        if cursor:
+            after, page_number = CaptureGroupKey.from_cursor(cursor)
+            offset = 0
+        else:
+            after = None
+            page_number = cast(
+                "int",
+                paginator.get_page_number(request, paginator=paginator),  # pyright: ignore[reportArgumentType]
+            )
+            try:
+                page_number = max(int(page_number), 1)
+            except ValueError as err:
+                msg = "'page' must be a number."
+                raise ValueError(msg) from err
+            offset = (page_number - 1) * page_size
+
+        groups, has_more = get_capture_groups_page(
+            captures, page_size, after=after, offset=offset
         )
-        bulk_metadata = Capture.bulk_load_frequency_metadata(captures)
-        Capture.set_bulk_metadata_cache(capture_list, bulk_metadata)
-
-        # Get composite captures — pass the materialized list to
-        # guarantee instance identity so the per-instance cache
-        # populated by set_bulk_metadata_cache is visible in the
-        # serialization path.
-        composite_captures = get_composite_captures(
-            capture_list,
+
+        url = remove_query_param(request.build_absolute_uri(), "page")
+        url = replace_query_param(url, "page_size", page_size)
+        next_url = None
+        previous_url = None
+        if has_more:
+            next_url = replace_query_param(
+                url, "cursor", groups[-1][0].to_cursor(page_number + 1)
+            )
+        if page_number > 1:
+            previous_url = replace_query_param(
+                remove_query_param(url, "cursor"), "page", page_number - 1
+            )
+
+        return self._composite_captures_page_response(
+            [group for _, group in groups],
             request=request,
-            bulk_metadata=bulk_metadata,
+            count=count_capture_groups(captures),
+            next_url=next_url,
+            previous_url=previous_url,
         )
 
-        # Manual pagination for composite captures
+    def _paginate_searched_captures(
+        self,
+        search: CaptureSearch,
+        request: Request,
+    ) -> Response:
+        """Paginate and serialize composite captures matching a metadata search.
+
+        Groups of captures are listed in the order of the OpenSearch hits, which
+        are paged with `search_after` (see `get_searched_capture_groups_page`),
+        so listings of any size are complete and only a page is held in memory.
+        The "next" link continues after the last group of the page with a cursor,
+        which also carries the count taken for the first page.
+        """
         paginator = CapturePagination()
         page_size = cast("int", paginator.get_page_size(request))
-        page_number = cast(
-            "int",
-            paginator.get_page_number(request, paginator=paginator),  # pyright: ignore[reportArgumentType]
-        )
-
-        start_index = (page_number - 1) * page_size
-        end_index = start_index + page_size
 
-        paginated_composites = composite_captures[start_index:end_index]
+        cursor = request.query_params.get("cursor")
+        if cursor:
+            after, page_number, count = CaptureSearchCursor.from_cursor(cursor)
+            offset = 0
+        else:
+            after = None
+            page_number = cast(
+                "int",
+                paginator.get_page_number(request, paginator=paginator),  # pyright: ignore[reportArgumentType]
+            )
+            try:
+                page_number = max(int(page_number), 1)
+            except ValueError as err:
+                msg = "'page' must be a number."
+                raise ValueError(msg) from err
+            offset = (page_number - 1) * page_size
+            count = count_searched_capture_groups(search)
+
+        groups, has_more = get_searched_capture_groups_page(
+            search, page_size, after=after, offset=offset
+        )
 
-        # Create custom paginated response
-        total_count = len(composite_captures)
+        url = remove_query_param(request.build_absolute_uri(), "page")
+        url = replace_query_param(url, "page_size", page_size)
         next_url = None
         previous_url = None
-
-        if end_index < total_count:
-            next_url = request.build_absolute_uri(
-                f"{request.path}?page={page_number + 1}&page_size={page_size}"
-            )
-
+        if has_more:
+            next_cursor = CaptureSearchCursor(groups[-1][0], page_number + 1, count)
+            next_url = replace_query_param(url, "cursor", next_cursor.to_cursor())
         if page_number > 1:
-            previous_url = request.build_absolute_uri(
-                f"{request.path}?page={page_number - 1}&page_size={page_size}"
+            previous_url = replace_query_param(
+                remove_query_param(url, "cursor"), "page", page_number - 1
             )
 
+        return self._composite_captures_page_response(
+            [group for _, group in groups],
+            request=request,
+            count=count,
+            next_url=next_url,
+            previous_url=previous_url,
+        )
+
+    def _composite_captures_page_response(
+        self,
+        groups: list[list[Capture]],
+        *,
+        request: Request,
+        count: int,
+        next_url: str | None,
+        previous_url: str | None,
+    ) -> Response:
+        """Response with a page of groups of captures, serialized as composites."""
+        # Bulk-load OpenSearch metadata for the captures of the page before
+        # serialization: 2 bulk queries (DRF + RadioHound) instead of one
+        # round-trip per capture, cached on each instance.
+        page_captures = [capture for group in groups for capture in group]
+        log.debug(
+            "Bulk-loading OpenSearch metadata for %d captures",
+            len(page_captures),
+        )
+        bulk_metadata = Capture.bulk_load_frequency_metadata(page_captures)
+        Capture.set_bulk_metadata_cache(page_captures, bulk_metadata)
+
+        # Serialize the same instances, so the per-instance cache populated by
+        # set_bulk_metadata_cache is visible in the serialization path.
+        composite_captures = serialize_capture_groups(
+            groups,
+            request=request,
+            bulk_metadata=bulk_metadata,
+        )
+
         return Response(
             {
-                "count": total_count,
+                "count": count,
                 "next": next_url,
                 "previous": previous_url,
-                "results": paginated_composites,
+                "results": composite_captures,
             }
         )
 
@@ -788,6 +1182,16 @@ class CaptureViewSet(viewsets.ViewSet):
                 description="Number of items per page.",
                 default=CapturePagination.page_size,
             ),
+            OpenApiParameter(
+                name="cursor",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description=(
+                    "Position of the page, from the 'next' link of the previous "
+                    "page. Takes precedence over 'page'."
+                ),
+            ),
         ],
         responses={
             200: CaptureGetSerializer,
@@ -821,12 +1225,16 @@ class CaptureViewSet(viewsets.ViewSet):
             metadata_filters = self._validate_metadata_filters(
                 request.GET.get("metadata_filters"),
             )
-            captures = search_captures(
+            search = search_captures(
                 capture_type=capture_type,
                 metadata_filters=metadata_filters,
                 request_user=cast("User", request.user),
             )
-            return self._paginate_composite_captures(captures=captures, request=request)
+            if search.os_query is None:
+                return self._paginate_composite_captures(
+                    captures=search.captures, request=request
+                )
+            return self._paginate_searched_captures(search=search, request=request)
         except (ValueError, TypeError) as err:
             return Response(
                 {"detail": str(err)},
@@ -1329,6 +1737,7 @@ class CaptureViewSet(viewsets.ViewSet):
                 required=False,
                 description="Type of post-processing (default: 'waterfall')",
             ),
+            *WATERFALL_BINARY_PARAMETERS,
         ],
         responses={
             200: OpenApiResponse(description="Waterfall slices data"),
@@ -1340,11 +1749,13 @@ class CaptureViewSet(viewsets.ViewSet):
         summary="Get waterfall slices by range",
         description=(
             "Get a range of waterfall slices for streaming. "
-            "Returns slices from start_index (inclusive) to end_index (exclusive)."
+            "Returns slices from start_index (inclusive) to end_index (exclusive). "
+            "Slices are sent as a binary matrix when requested with Accept: "
+            f"{WaterfallBinaryRenderer.media_type} or ?format=waterfall."
         ),
     )
-    @action(detail=True, methods=["get"])
-    def waterfall_slices(self, request: Request, pk: str | None = None) -> Response:
+    @action(detail=True, methods=["get"], renderer_classes=WATERFALL_RENDERER_CLASSES)
+    def waterfall_slices(self, request: Request, pk: str | None = None) -> Response:  # noqa: PLR0911
         """Get waterfall slices by index range for streaming."""
         # Get query parameters
         processing_type = request.query_params.get("processing_type", "waterfall")
@@ -1356,6 +1767,9 @@ class CaptureViewSet(viewsets.ViewSet):
         if isinstance(validation_result, Response):
             return validation_result
         start_index, end_index = validation_result
+        binary_dtype = _get_waterfall_binary_dtype(request)
+        if isinstance(binary_dtype, Response):
+            return binary_dtype
 
         try:
             _, processed_data = self._get_processed_data_for_capture(
@@ -1363,32 +1777,44 @@ class CaptureViewSet(viewsets.ViewSet):
             )
 
             metadata = processed_data.metadata or {}
-            total_slices_from_metadata = metadata.get("total_slices")
-            if total_slices_from_metadata is not None:
-                total_slices_from_metadata = int(total_slices_from_metadata)
-
             try:
-                with processed_data.data_file.open("rb") as f:
-                    requested_slices, total_slices = _extract_waterfall_slice_range(
-                        f,
-                        start_index,
-                        end_index,
-                        total_slices_from_metadata,
-                    )
+                waterfall_range = _read_precomputed_waterfall(
+                    processed_data,
+                    start_index,
+                    end_index,
+                    as_matrix=binary_dtype is not None,
+                )
             except ValueError as e:
                 return Response(
                     {"error": str(e)},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
-            except (OSError, ijson.JSONError, json.JSONDecodeError) as e:
-                log.error(f"Failed to read waterfall JSON file for capture {pk}: {e}")
+            except (
+                OSError,
+                MinioException,
+                ijson.JSONError,
+                json.JSONDecodeError,
+            ) as e:
+                log.error(f"Failed to read waterfall data file for capture {pk}: {e}")
                 return Response(
                     {"error": "Failed to read waterfall data file"},
                     status=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 )
+            total_slices = waterfall_range["total_slices"]
+
+            if binary_dtype is not None:
+                return _waterfall_binary_response(
+                    waterfall_range["spectra"],
+                    waterfall_range["slice_runs"],
+                    total_slices=total_slices,
+                    start_index=start_index,
+                    end_index=min(end_index, total_slices),
+                    metadata=metadata,
+                    binary_dtype=binary_dtype,
+                )
 
             response_data = {
-                "slices": requested_slices,
+                "slices": waterfall_range["slices"],
                 "total_slices": total_slices,
                 "start_index": start_index,
                 "end_index": min(end_index, total_slices),
@@ -1470,9 +1896,10 @@ class CaptureViewSet(viewsets.ViewSet):
                 required=False,
                 default=False,
                 description=(
-                    "If true, compute power_bounds (min/max dB) by sampling DRF "
-                    "data, which may trigger MinIO download and processing. Omit "
-                    "or false for fast metadata-only response."
+                    "If true, include power_bounds (min/max dB) and power_stats "
+                    "(min, max, mean, percentiles and histogram of the power) "
+                    "stored when the waterfall was post-processed; omitted when "
+                    "it has not been processed yet."
                 ),
             ),
         ],
@@ -1488,8 +1915,8 @@ class CaptureViewSet(viewsets.ViewSet):
         description=(
             "Get metadata for waterfall visualization without triggering "
             "preprocessing. Returns total_slices, frequency bounds, and other "
-            "metadata immediately. By default avoids MinIO/file access for speed. "
-            "Set include_power_bounds=true to also get power_bounds (may be slow)."
+            "metadata immediately, without MinIO/file access. Set "
+            "include_power_bounds=true to also get the stored power statistics."
         ),
     )
     @action(detail=True, methods=["get"], url_path="waterfall_metadata_stream")
@@ -1499,9 +1926,8 @@ class CaptureViewSet(viewsets.ViewSet):
         """Get waterfall metadata without preprocessing for streaming visualization.
 
         This endpoint computes metadata from capture properties stored in OpenSearch,
-        avoiding the need to download files from MinIO. This makes it very fast when
-        include_power_bounds is false (default). Set include_power_bounds=true only
-        when the client needs scale bounds; that path may reconstruct DRF and use MinIO.
+        avoiding the need to download files from MinIO. With include_power_bounds,
+        the power statistics stored with the processed waterfall are included.
         """
 
         try:
@@ -1578,29 +2004,14 @@ class CaptureViewSet(viewsets.ViewSet):
                 "channel": capture.channel,
             }
 
-            # Optional: power_bounds (3-slice sample) for frontend scale. Expensive:
-            # can trigger DRF reconstruction and MinIO download on cache miss.
+            # Optional: power_bounds for frontend scale, with the power statistics
+            #   measured when the waterfall was post-processed; answered from the
+            #   stored summary, without reading the capture
             include_power_bounds = request.query_params.get(
                 "include_power_bounds", "false"
             ).lower() in ("true", "1", "yes")
             if include_power_bounds:
-                try:
-                    capture_files = get_capture_files(capture, include_deleted=False)
-                    if capture_files.exists():
-                        dummy_temp_path = Path(tempfile.gettempdir()) / "unused"
-                        drf_path = reconstruct_drf_files(
-                            capture, capture_files, dummy_temp_path
-                        )
-                        power_bounds = get_waterfall_power_bounds(
-                            drf_path, capture.channel
-                        )
-                        if power_bounds is not None:
-                            metadata["power_bounds"] = power_bounds
-                except (ValueError, OSError, KeyError, UnknownIndexError) as e:
-                    log.debug(
-                        "Could not compute power_bounds for streaming metadata: %s",
-                        e,
-                    )
+                metadata.update(_stored_power_metadata(capture))
 
             log.info(
                 f"Streaming metadata for capture {pk}: {total_slices} total slices, "
@@ -1641,6 +2052,27 @@ class CaptureViewSet(viewsets.ViewSet):
                 required=True,
                 description="Ending slice index (exclusive)",
             ),
+            OpenApiParameter(
+                name="level",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description=(
+                    "Level of the waterfall pyramid: slices of level L pool "
+                    f"{WATERFALL_PYRAMID_FACTOR}**L full-resolution slices, and are "
+                    "read from the pyramid built when the waterfall was processed "
+                    "(default: 0, slices computed on-demand)"
+                ),
+            ),
+            OpenApiParameter(
+                name="pooling",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                enum=[str(pooling) for pooling in WaterfallPooling],
+                description="Pooling of the slices of pyramid levels (default: max)",
+            ),
+            *WATERFALL_BINARY_PARAMETERS,
         ],
         responses={
             200: OpenApiResponse(
@@ -1666,7 +2098,9 @@ class CaptureViewSet(viewsets.ViewSet):
         description=(
             "Compute and return waterfall slices on-demand without preprocessing. "
             "This endpoint computes FFTs in real-time for the requested slice range. "
-            f"Maximum batch size is {MAX_SLICE_BATCH_SIZE} slices per request."
+            f"Maximum batch size is {MAX_SLICE_BATCH_SIZE} slices per request. "
+            "Slices are sent as a binary matrix when requested with Accept: "
+            f"{WaterfallBinaryRenderer.media_type} or ?format=waterfall."
         ),
     )
     @action(
@@ -1674,8 +2108,9 @@ class CaptureViewSet(viewsets.ViewSet):
         methods=["get"],
         url_path="waterfall_slices_stream",
         throttle_classes=[VisStreamThrottle],
+        renderer_classes=WATERFALL_RENDERER_CLASSES,
     )
-    def waterfall_slices_stream(
+    def waterfall_slices_stream(  # noqa: PLR0911
         self, request: Request, pk: str | None = None
     ) -> Response:
         """Compute and return waterfall slices on-demand for streaming visualization."""
@@ -1701,12 +2136,29 @@ class CaptureViewSet(viewsets.ViewSet):
             if isinstance(validation_result, Response):
                 return validation_result
             start_index, end_index = validation_result
+            binary_dtype = _get_waterfall_binary_dtype(request)
+            if isinstance(binary_dtype, Response):
+                return binary_dtype
+            pyramid_options = _get_waterfall_pyramid_options(request)
+            if isinstance(pyramid_options, Response):
+                return pyramid_options
+            level, pooling = pyramid_options
             log.debug(
-                "Waterfall slices stream: capture={} range=[{}, {})",
+                "Waterfall slices stream: capture={} range=[{}, {}) level={}",
                 pk,
                 start_index,
                 end_index,
+                level,
             )
+            if level > 0:
+                return _waterfall_pyramid_response(
+                    capture,
+                    level,
+                    pooling,
+                    start_index,
+                    end_index,
+                    binary_dtype=binary_dtype,
+                )
 
             # Get capture files (M2M + FK so both current and legacy links work)
             capture_files = get_capture_files(capture, include_deleted=False)
@@ -1716,11 +2168,17 @@ class CaptureViewSet(viewsets.ViewSet):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            # Reconstruct DRF files and compute slices on-demand
-            # Note: reconstruct_drf_files uses persistent cache, but temp_path parameter
-            # is required for API compatibility. We pass a dummy path since it's unused.
-            dummy_temp_path = Path(tempfile.gettempdir()) / "unused"
-            drf_path = reconstruct_drf_files(capture, capture_files, dummy_temp_path)
+            # Reconstruct only the DRF files covering the requested range, and
+            # prefetch the files of the next ranges the client will scroll to
+            drf_path = reconstruct_drf_range(
+                capture,
+                capture_files,
+                start_index * SAMPLES_PER_SLICE,
+                end_index * SAMPLES_PER_SLICE,
+                prefetch_samples=(end_index - start_index)
+                * SAMPLES_PER_SLICE
+                * STREAM_PREFETCH_RANGES,
+            )
             # Range is already capped by _validate_slice_indices (MAX_SLICE_BATCH_SIZE).
             # Request rate is limited by VisStreamThrottle. Run compute with timeout.
             with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
@@ -1730,6 +2188,8 @@ class CaptureViewSet(viewsets.ViewSet):
                     capture.channel,
                     start_index,
                     end_index,
+                    as_matrix=binary_dtype is not None,
+                    capture_uuid=str(capture.uuid),
                 )
                 try:
                     result = future.result(timeout=SLICE_COMPUTE_TIMEOUT_SECONDS)
@@ -1746,6 +2206,16 @@ class CaptureViewSet(viewsets.ViewSet):
                         status=status.HTTP_408_REQUEST_TIMEOUT,
                     )
 
+            if binary_dtype is not None:
+                return _waterfall_binary_response(
+                    result["spectra"],
+                    result["slice_runs"],
+                    total_slices=result["total_slices"],
+                    start_index=result["start_index"],
+                    end_index=result["end_index"],
+                    metadata=result["metadata"],
+                    binary_dtype=binary_dtype,
+                )
             return Response(result, status=status.HTTP_200_OK)
 
         except (ValueError, OSError, KeyError) as e:
@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING
 from typing import Any
 from typing import cast
 
+from django.conf import settings
+from django.db import transaction
 from django.db.models import CharField
 from django.db.models import F as FExpression
 from django.db.models import ProtectedError
@@ -14,6 +16,7 @@ from django.db.models import QuerySet
 from django.db.models import Value as WrappedValue
 from django.db.models.functions import Concat
 from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiExample
@@ -21,6 +24,7 @@ from drf_spectacular.utils import OpenApiParameter
 from drf_spectacular.utils import OpenApiResponse
 from drf_spectacular.utils import extend_schema
 from loguru import logger as log
+from minio.error import MinioException
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.pagination import PageNumberPagination
@@ -31,17 +35,55 @@ from rest_framework.viewsets import ViewSet
 
 import sds_gateway.api_methods.utils.swagger_example_schema as example_schema
 from sds_gateway.api_methods.authentication import APIKeyAuthentication
-from sds_gateway.api_methods.helpers.download_file import download_file
+from sds_gateway.api_methods.helpers.download_file import RangeNotSatisfiableError
+from sds_gateway.api_methods.helpers.download_file import get_file_etag
+from sds_gateway.api_methods.helpers.download_file import parse_range_header
+from sds_gateway.api_methods.helpers.download_file import stream_file
+from sds_gateway.api_methods.helpers.presigned_transfers import PresignedTransferError
+from sds_gateway.api_methods.helpers.presigned_transfers import (
+    PresignedTransferUnavailableError,
+)
+from sds_gateway.api_methods.helpers.presigned_transfers import StagedUpload
+from sds_gateway.api_methods.helpers.presigned_transfers import discard_staged_upload
+from sds_gateway.api_methods.helpers.presigned_transfers import finish_staged_upload
+from sds_gateway.api_methods.helpers.presigned_transfers import load_staged_upload
+from sds_gateway.api_methods.helpers.presigned_transfers import lock_staged_upload
+from sds_gateway.api_methods.helpers.presigned_transfers import presign_download
+from sds_gateway.api_methods.helpers.presigned_transfers import presign_upload
+from sds_gateway.api_methods.helpers.presigned_transfers import verify_staged_upload
 from sds_gateway.api_methods.helpers.temporal_filtering import (
     filter_files_by_temporal_bounds,
 )
+from sds_gateway.api_methods.helpers.upload_sessions import UploadSessionError
+from sds_gateway.api_methods.helpers.upload_sessions import (
+    UploadSessionUnavailableError,
+)
+from sds_gateway.api_methods.helpers.upload_sessions import abort_upload_session
+from sds_gateway.api_methods.helpers.upload_sessions import complete_upload_session
+from sds_gateway.api_methods.helpers.upload_sessions import create_upload_session
+from sds_gateway.api_methods.helpers.upload_sessions import finish_upload_session
+from sds_gateway.api_methods.helpers.upload_sessions import receive_part
 from sds_gateway.api_methods.models import DRF_RF_FILENAME_REGEX_STR
 from sds_gateway.api_methods.models import File
+from sds_gateway.api_methods.models import FileUploadSession
 from sds_gateway.api_methods.serializers.file_serializers import (
     FileCheckResponseSerializer,
 )
+from sds_gateway.api_methods.serializers.file_serializers import (
+    FileContentsCheckBatchResponseSerializer,
+)
+from sds_gateway.api_methods.serializers.file_serializers import (
+    FileContentsCheckBatchSerializer,
+)
 from sds_gateway.api_methods.serializers.file_serializers import FileGetSerializer
 from sds_gateway.api_methods.serializers.file_serializers import FilePostSerializer
+from sds_gateway.api_methods.serializers.file_serializers import (
+    PresignedUploadRequestSerializer,
+)
+from sds_gateway.api_methods.serializers.file_serializers import (
+    PresignedUrlResponseSerializer,
+)
+from sds_gateway.api_methods.serializers.file_serializers import UploadSessionSerializer
 from sds_gateway.api_methods.utils.asset_access_control import (
     get_accessible_files_queryset,
 )
@@ -133,6 +175,17 @@ class FileViewSet(ViewSet):
                 context={"request_user": request.user},
             )
 
+        if serializer.is_valid(raise_exception=False):
+            serializer.save()
+            return self._created_file_response(request, serializer)
+        log.warning(f"File upload 400: {serializer.errors}")
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    @staticmethod
+    def _created_file_response(
+        request: Request, serializer: FilePostSerializer
+    ) -> Response:
+        """Build the 201 response of a newly created file."""
         attrs_to_return = [
             "uuid",
             "name",
@@ -149,21 +202,17 @@ class FileViewSet(ViewSet):
             "Expected request.user to be an instance of the custom User model"
         )
         user_dir = f"/files/{request.user.email}"
-        if serializer.is_valid(raise_exception=False):
-            serializer.save()
-            returned_object = {}
-            for key, value in serializer.data.items():
-                if key not in attrs_to_return:
-                    continue
-                if key == "directory":
-                    # return path with user_dir as the "root"
-                    rel_path = str(Path(value).relative_to(user_dir))
-                    returned_object[key] = str(Path("/" + rel_path))
-                else:
-                    returned_object[key] = value
-            return Response(returned_object, status=status.HTTP_201_CREATED)
-        log.warning(f"File upload 400: {serializer.errors}")
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        returned_object = {}
+        for key, value in serializer.data.items():
+            if key not in attrs_to_return:
+                continue
+            if key == "directory":
+                # return path with user_dir as the "root"
+                rel_path = str(Path(value).relative_to(user_dir))
+                returned_object[key] = str(Path("/" + rel_path))
+            else:
+                returned_object[key] = value
+        return Response(returned_object, status=status.HTTP_201_CREATED)
 
     @extend_schema(
         parameters=[
@@ -639,22 +688,47 @@ class FileViewSet(ViewSet):
                 required=True,
                 type=str,
             ),
+            OpenApiParameter(
+                name="Range",
+                description=(
+                    "Optional single byte range to download, e.g. 'bytes=1024-'."
+                ),
+                required=False,
+                type=str,
+                location=OpenApiParameter.HEADER,
+            ),
+            OpenApiParameter(
+                name="If-Range",
+                description=(
+                    "Optional ETag of a previous response: the Range header is "
+                    "only honored when it still matches the file contents."
+                ),
+                required=False,
+                type=str,
+                location=OpenApiParameter.HEADER,
+            ),
         ],
         responses={
             200: OpenApiResponse(description="HTTP File Response"),
+            206: OpenApiResponse(description="Partial Content of the file"),
             404: OpenApiResponse(description="Not Found"),
+            416: OpenApiResponse(description="Requested Range Not Satisfiable"),
             500: OpenApiResponse(
                 description="Internal Server Error - File download failed"
             ),
         },
         description=(
             "Download a file from the server. Returns the file content as an HTTP "
-            "response with appropriate headers."
+            "response with appropriate headers. Single byte ranges are supported "
+            "through the Range and If-Range headers to resume interrupted "
+            "downloads or to fetch a file in parallel chunks."
         ),
         summary="Download File",
     )
     @action(detail=True, methods=["get"], url_path="download", url_name="download")
-    def download_file(self, request: Request, pk: str | None = None) -> HttpResponse:
+    def download_file(
+        self, request: Request, pk: str | None = None
+    ) -> HttpResponse | StreamingHttpResponse:
         """Downloads a file from the server."""
         if pk is None:
             return Response(
@@ -674,27 +748,408 @@ class FileViewSet(ViewSet):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
+        # a stale If-Range validator means the whole file must be sent again
+        etag = get_file_etag(target_file)
+        range_header = request.headers.get("Range")
+        if_range = request.headers.get("If-Range")
+        if if_range is not None and (etag is None or if_range != etag):
+            range_header = None
         try:
-            # Use the helper function to download the file
-            file_content = download_file(target_file)
-
-            # Create HTTP response with the file content
-            http_response = HttpResponse(
-                file_content,
-                content_type=target_file.media_type,
-            )
-            http_response["Content-Disposition"] = (
-                f'attachment; filename="{target_file.name}"'
+            byte_range = parse_range_header(range_header, file_size=target_file.size)
+        except RangeNotSatisfiableError:
+            unsatisfiable_response = HttpResponse(
+                status=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
             )
+            unsatisfiable_response["Content-Range"] = f"bytes */{target_file.size}"
+            return unsatisfiable_response
 
-        except (OSError, ValueError):
+        try:
+            # stream contents from the object store without buffering them here
+            file_chunks = stream_file(target_file, byte_range=byte_range)
+        except (OSError, ValueError, MinioException):
             log.exception("Error downloading file %s", target_file.name)
             return Response(
                 {"detail": "Failed to download file"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
-        else:
-            return http_response
+
+        http_response = StreamingHttpResponse(
+            file_chunks,
+            content_type=target_file.media_type,
+            status=(
+                status.HTTP_200_OK
+                if byte_range is None
+                else status.HTTP_206_PARTIAL_CONTENT
+            ),
+        )
+        http_response["Content-Disposition"] = (
+            f'attachment; filename="{target_file.name}"'
+        )
+        http_response["Content-Length"] = str(
+            target_file.size if byte_range is None else byte_range.length
+        )
+        http_response["Accept-Ranges"] = "bytes"
+        if etag is not None:
+            http_response["ETag"] = etag
+        if byte_range is not None:
+            http_response["Content-Range"] = byte_range.content_range(target_file.size)
+        return http_response
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="id",
+                description="File UUID",
+                required=True,
+                type=str,
+                location=OpenApiParameter.PATH,
+            ),
+        ],
+        responses={
+            200: PresignedUrlResponseSerializer,
+            403: OpenApiResponse(description="Forbidden"),
+            404: OpenApiResponse(description="Not Found"),
+            409: OpenApiResponse(
+                description="Presigned transfers unavailable: use /download/"
+            ),
+        },
+        description=(
+            "Get a short-lived URL to download the file contents directly from "
+            "object storage, bypassing the gateway."
+        ),
+        summary="Get File Download URL",
+    )
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path="download-url",
+        url_name="download-url",
+    )
+    def download_url(self, request: Request, pk: str | None = None) -> Response:
+        """Authorizes a direct download of the file contents from object storage."""
+        if not settings.PRESIGNED_TRANSFERS_ENABLED:
+            return Response(
+                {"detail": "Presigned transfers are not enabled."},
+                status=status.HTTP_409_CONFLICT,
+            )
+        target_file = get_object_or_404(File, pk=pk, is_deleted=False)
+        if not user_has_access_to_file(request.user, target_file):
+            return Response(
+                {"detail": "You do not have permission to download this file."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+        try:
+            url = presign_download(target_file)
+        except PresignedTransferUnavailableError as err:
+            return Response({"detail": str(err)}, status=status.HTTP_409_CONFLICT)
+        return Response(
+            {"url": url, "expires_in": settings.PRESIGNED_URL_EXPIRY_SECONDS},
+            status=status.HTTP_200_OK,
+        )
+
+    @extend_schema(
+        request=PresignedUploadRequestSerializer,
+        responses={
+            200: PresignedUrlResponseSerializer,
+            400: OpenApiResponse(description="Bad Request"),
+            409: OpenApiResponse(
+                description="Presigned transfers unavailable: upload to /files/"
+            ),
+        },
+        description=(
+            "Get a short-lived form to upload file contents directly to object "
+            "storage, bypassing the gateway: POST the `fields` to `url` as "
+            "multipart/form-data, followed by the contents as the `file` field. "
+            "The form only accepts contents of the announced size. The returned "
+            "upload token must be sent to upload-complete with the file metadata "
+            "once contents are uploaded."
+        ),
+        summary="Get File Upload URL",
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="upload-url",
+        url_name="upload-url",
+    )
+    def upload_url(self, request: Request) -> Response:
+        """Authorizes a direct upload of file contents to object storage."""
+        if not settings.PRESIGNED_TRANSFERS_ENABLED:
+            return Response(
+                {"detail": "Presigned transfers are not enabled."},
+                status=status.HTTP_409_CONFLICT,
+            )
+        request_serializer = PresignedUploadRequestSerializer(data=request.data)
+        if not request_serializer.is_valid(raise_exception=False):
+            return Response(
+                request_serializer.errors, status=status.HTTP_400_BAD_REQUEST
+            )
+        assert isinstance(request.user, User), (
+            "Expected request.user to be an instance of the custom User model"
+        )
+        try:
+            url, form_fields, upload_token = presign_upload(
+                user=request.user,
+                sum_blake3=request_serializer.validated_data["sum_blake3"],
+                size=request_serializer.validated_data["size"],
+            )
+        except PresignedTransferUnavailableError as err:
+            return Response({"detail": str(err)}, status=status.HTTP_409_CONFLICT)
+        return Response(
+            {
+                "url": url,
+                "fields": form_fields,
+                "expires_in": settings.PRESIGNED_URL_EXPIRY_SECONDS,
+                "upload_token": upload_token,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    @extend_schema(
+        request=FilePostSerializer,
+        responses={
+            201: FilePostSerializer,
+            400: OpenApiResponse(description="Bad Request"),
+        },
+        description=(
+            "Create a file from contents uploaded through a presigned URL. Takes "
+            "the same metadata as a file upload, plus the upload token instead "
+            "of the file contents. The contents are verified against the "
+            "checksum and size announced when requesting the upload URL."
+        ),
+        summary="Complete File Upload",
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="upload-complete",
+        url_name="upload-complete",
+    )
+    def upload_complete(self, request: Request) -> Response:
+        """Creates a file from contents uploaded through a presigned URL."""
+        assert isinstance(request.user, User), (
+            "Expected request.user to be an instance of the custom User model"
+        )
+        try:
+            staged_upload = load_staged_upload(
+                user=request.user,
+                upload_token=str(request.data.get("upload_token", "")),
+            )
+            verify_staged_upload(staged_upload)
+            # completions with the same token create a single file
+            with transaction.atomic():
+                lock_staged_upload(staged_upload)
+                response = self._create_file_from_staged_upload(request, staged_upload)
+                if response.status_code == status.HTTP_201_CREATED:
+                    finish_staged_upload(staged_upload)
+        except PresignedTransferError as err:
+            return Response({"detail": str(err)}, status=status.HTTP_400_BAD_REQUEST)
+        return response
+
+    def _create_file_from_staged_upload(
+        self, request: Request, staged_upload: StagedUpload
+    ) -> Response:
+        """Create a file pointing to verified contents uploaded to the store.
+
+        Contents are kept when the file can't be created, so the request can be
+        retried with new metadata until the upload expires.
+        """
+        request_data = request.data.copy()
+        for key in ("upload_token", "sibling_uuid", "sum_blake3", "size", "file"):
+            request_data.pop(key, None)
+        request_data.update(
+            file=File(file=staged_upload.object_name).file,
+            owner=request.user.pk,
+        )
+        serializer = FilePostSerializer(
+            data=request_data,
+            context={
+                "request_user": request.user,
+                "verified_sum_blake3": staged_upload.sum_blake3,
+            },
+        )
+        if not serializer.is_valid(raise_exception=False):
+            log.warning(f"File upload completion 400: {serializer.errors}")
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        file_instance = serializer.save()
+        # contents already owned by the user are reused instead of the upload
+        if file_instance.file.name != staged_upload.object_name:
+            discard_staged_upload(staged_upload)
+        return self._created_file_response(request, serializer)
+
+    @extend_schema(
+        request=PresignedUploadRequestSerializer,
+        responses={
+            201: UploadSessionSerializer,
+            400: OpenApiResponse(description="Bad Request"),
+            409: OpenApiResponse(
+                description="Upload sessions unavailable: upload to /files/"
+            ),
+        },
+        description=(
+            "Start a chunked upload of the contents of a large file. Parts of "
+            "`part_size` bytes are then uploaded to the session, in any order "
+            "and possibly concurrently, before completing it with the file "
+            "metadata. Interrupted uploads resume by uploading the parts "
+            "listed as missing by the session."
+        ),
+        summary="Start Chunked File Upload",
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="upload-sessions",
+        url_name="upload-sessions",
+    )
+    def upload_sessions(self, request: Request) -> Response:
+        """Starts a chunked upload session."""
+        request_serializer = PresignedUploadRequestSerializer(data=request.data)
+        if not request_serializer.is_valid(raise_exception=False):
+            return Response(
+                request_serializer.errors, status=status.HTTP_400_BAD_REQUEST
+            )
+        assert isinstance(request.user, User), (
+            "Expected request.user to be an instance of the custom User model"
+        )
+        try:
+            session = create_upload_session(
+                user=request.user,
+                sum_blake3=request_serializer.validated_data["sum_blake3"],
+                size=request_serializer.validated_data["size"],
+            )
+        except UploadSessionUnavailableError as err:
+            return Response({"detail": str(err)}, status=status.HTTP_409_CONFLICT)
+        return Response(
+            UploadSessionSerializer(session).data, status=status.HTTP_201_CREATED
+        )
+
+    @staticmethod
+    def _get_upload_session(request: Request, session_id: str) -> FileUploadSession:
+        return get_object_or_404(
+            FileUploadSession,
+            pk=session_id,
+            owner=request.user,
+            is_deleted=False,
+        )
+
+    @extend_schema(
+        responses={
+            200: UploadSessionSerializer,
+            404: OpenApiResponse(description="Not Found"),
+        },
+        description=(
+            "Get the state of a chunked upload session, including the parts "
+            "uploaded so far and the ones still missing."
+        ),
+        summary="Get Chunked File Upload",
+    )
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path=r"upload-sessions/(?P<session_id>[^/.]+)",
+        url_name="upload-session",
+    )
+    def upload_session(self, request: Request, session_id: str) -> Response:
+        """Returns the state of an upload session."""
+        session = self._get_upload_session(request, session_id)
+        return Response(UploadSessionSerializer(session).data)
+
+    @extend_schema(
+        responses={
+            204: OpenApiResponse(description="Upload session aborted"),
+            404: OpenApiResponse(description="Not Found"),
+        },
+        summary="Abort Chunked File Upload",
+    )
+    @upload_session.mapping.delete
+    def abort_upload_session(self, request: Request, session_id: str) -> Response:
+        """Aborts an upload session, discarding the parts uploaded so far."""
+        session = self._get_upload_session(request, session_id)
+        abort_upload_session(session)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @extend_schema(
+        request={"application/octet-stream": OpenApiTypes.BINARY},
+        parameters=[
+            OpenApiParameter(
+                name="X-Part-Blake3",
+                type=str,
+                location=OpenApiParameter.HEADER,
+                required=False,
+                description="BLAKE3 checksum the part contents must match.",
+            ),
+        ],
+        responses={
+            200: OpenApiResponse(description="Part uploaded"),
+            400: OpenApiResponse(description="Bad Request"),
+            404: OpenApiResponse(description="Not Found"),
+        },
+        description=(
+            "Upload a part of a chunked upload as the raw request body. Every "
+            "part but the last must have exactly `part_size` bytes. Uploading "
+            "a part again replaces it."
+        ),
+        summary="Upload File Part",
+    )
+    @action(
+        detail=False,
+        methods=["put"],
+        url_path=r"upload-sessions/(?P<session_id>[^/.]+)/parts/(?P<part_number>\d+)",
+        url_name="upload-session-part",
+    )
+    def upload_session_part(
+        self, request: Request, session_id: str, part_number: str
+    ) -> Response:
+        """Receives a part of an upload session, streaming it to object storage."""
+        session = self._get_upload_session(request, session_id)
+        try:
+            part = receive_part(
+                session=session,
+                part_number=int(part_number),
+                # read the raw body: parsing it would load the whole part at once
+                stream=request.stream,
+                part_sum_blake3=request.headers.get("X-Part-Blake3"),
+            )
+        except UploadSessionError as err:
+            return Response({"detail": str(err)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(
+            {"part_number": int(part_number), **part}, status=status.HTTP_200_OK
+        )
+
+    @extend_schema(
+        request=FilePostSerializer,
+        responses={
+            201: FilePostSerializer,
+            400: OpenApiResponse(description="Bad Request"),
+            404: OpenApiResponse(description="Not Found"),
+        },
+        description=(
+            "Create a file from the parts of a chunked upload. Takes the same "
+            "metadata as a file upload, without the file contents. The "
+            "assembled contents are verified against the checksum and size "
+            "announced when starting the session. When the metadata is "
+            "rejected, the session keeps its contents until it expires and "
+            "can be completed again with corrected metadata."
+        ),
+        summary="Complete Chunked File Upload",
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path=r"upload-sessions/(?P<session_id>[^/.]+)/complete",
+        url_name="upload-session-complete",
+    )
+    def upload_session_complete(self, request: Request, session_id: str) -> Response:
+        """Creates a file from the parts of an upload session."""
+        session = self._get_upload_session(request, session_id)
+        try:
+            staged_upload = complete_upload_session(session)
+        except UploadSessionError as err:
+            return Response({"detail": str(err)}, status=status.HTTP_400_BAD_REQUEST)
+        response = self._create_file_from_staged_upload(request, staged_upload)
+        if response.status_code == status.HTTP_201_CREATED:
+            finish_upload_session(session)
+        return response
 
 
 class CheckFileContentsExistView(APIView):
@@ -811,4 +1266,91 @@ class CheckFileContentsExistView(APIView):
         return Response(conditions, status=status.HTTP_200_OK)
 
 
+class CheckFileContentsExistBatchView(APIView):
+    authentication_classes = [APIKeyAuthentication]
+
+    @extend_schema(
+        request=FileContentsCheckBatchSerializer,
+        responses={
+            200: FileContentsCheckBatchResponseSerializer,
+            400: OpenApiResponse(description="Bad Request"),
+        },
+        examples=[
+            OpenApiExample(
+                "Example Batch File Contents Check Request",
+                summary="Batch File Contents Check Request Body",
+                description="Checks the contents of two files in one request.",
+                value=example_schema.example_file_content_check_batch_request,
+                request_only=True,
+            ),
+        ],
+        description=(
+            "Check if the contents of many files exist on the server. "
+            f"Up to {FileContentsCheckBatchSerializer.MAX_FILES} files per request."
+        ),
+        summary="Check File Contents Exist (Batch)",
+    )
+    def post(self, request: Request) -> Response:
+        """Checks if the contents of many files exist on the server at once.
+
+        Batch version of `CheckFileContentsExistView`, so clients uploading many
+            files can decide how to upload each of them without one request per
+            file. All files are checked with a single database query.
+
+        Example request data:
+            {
+                "files": [
+                    {
+                        "directory": "/path/to/file",
+                        "name": "file.h5",
+                        "sum_blake3": "55c6dac98fbc9a388f619f5f4ffc4c9fdd3eb37eab48afd68b65da90ef3070b1",
+                    },
+                ]
+            }
+        Example response:
+            {
+                "results": [
+                    {
+                        "file_exists_in_tree": False,
+                        "file_contents_exist_for_user": True,
+                        "user_mutable_attributes_differ": True,
+                        "asset_id": "3fa85f64-5717-4562-b3fc-2c963f66afa6",
+                    },
+                ]
+            }
+        Results are in the same order as the files in the request, and have the
+            same meaning as the ones from `CheckFileContentsExistView`.
+        """  # noqa: E501
+        user = cast("User", request.user)
+        request_serializer = FileContentsCheckBatchSerializer(data=request.data)
+        if not request_serializer.is_valid():
+            return Response(
+                request_serializer.errors, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        entries: list[dict[str, Any]] = request_serializer.validated_data["files"]
+        for entry in entries:
+            # ensure the resolved path is within the user's files directory
+            user_rel_path = sanitize_path_rel_to_user(
+                unsafe_path=entry["directory"],
+                request=request,
+            )
+            if user_rel_path is None:
+                return Response(
+                    {
+                        "detail": "The provided paths must be in the "
+                        "user's files directory.",
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            entry["directory"] = user_rel_path
+
+        results = FilePostSerializer().check_files_contents_exist(
+            entries=entries,
+            user=user,
+        )
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+
 check_contents_exist = CheckFileContentsExistView.as_view()
+check_contents_exist_batch = CheckFileContentsExistBatchView.as_view()
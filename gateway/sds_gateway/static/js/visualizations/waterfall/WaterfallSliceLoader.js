@@ -9,6 +9,10 @@ import {
     get_waterfall_slices_endpoint,
     get_waterfall_slices_stream_endpoint,
 } from "./constants.js"
+import {
+    WATERFALL_BINARY_MEDIA_TYPE,
+    decodeWaterfallPayload,
+} from "./waterfallBinary.js"
 
 class WaterfallSliceLoader {
     constructor(captureUuid, cache, onSliceLoaded = null) {
@@ -290,7 +294,8 @@ class WaterfallSliceLoader {
                     method: "GET",
                     credentials: "same-origin",
                     headers: {
-                        "Content-Type": "application/json",
+                        // slices as one binary matrix instead of base64 in JSON
+                        Accept: WATERFALL_BINARY_MEDIA_TYPE,
                         "X-CSRFToken": this._getCSRFToken(),
                     },
                     signal: controller.signal,
@@ -331,7 +336,7 @@ class WaterfallSliceLoader {
                 throw new Error(errMsg)
             }
 
-            return await response.json()
+            return await this._readSlicesResponse(response)
         } catch (error) {
             if (requestEpoch !== this.cancelEpoch) {
                 throw new Error("WaterfallSliceLoader cancelled")
@@ -365,6 +370,23 @@ class WaterfallSliceLoader {
         }
     }
 
+    /**
+     * Read a response with slices, in the binary format or as JSON
+     * @private
+     * @param {Response} response - Successful response of a slices endpoint
+     * @returns {Promise<Object>} Ranges of the response, with its slices
+     */
+    async _readSlicesResponse(response) {
+        const contentType = response.headers?.get("Content-Type") ?? ""
+        if (contentType.startsWith(WATERFALL_BINARY_MEDIA_TYPE)) {
+            const { header, slices } = decodeWaterfallPayload(
+                await response.arrayBuffer(),
+            )
+            return { ...header, slices }
+        }
+        return await response.json()
+    }
+
     /**
      * Batch indices into optimal request sizes.
      *
@@ -25,6 +25,10 @@ import {
     get_waterfall_result_endpoint,
     get_waterfall_status_endpoint,
 } from "./constants.js"
+import {
+    decodeWaterfallPayload,
+    isWaterfallPayload,
+} from "./waterfallBinary.js"
 
 class WaterfallVisualization {
     constructor(captureUuid) {
@@ -791,7 +795,7 @@ class WaterfallVisualization {
                     : `Failed to download waterfall data: ${dataResponse.status}`,
             )
         }
-        const waterfallJson = await dataResponse.json()
+        const waterfallJson = await this._readWaterfallFile(dataResponse)
         this.waterfallData = waterfallJson
         this.totalSlices = waterfallJson.length
         this.parsedWaterfallData = this.waterfallData.map((slice) =>
@@ -1191,7 +1195,7 @@ class WaterfallVisualization {
                 )
             }
 
-            const waterfallJson = await response.json()
+            const waterfallJson = await this._readWaterfallFile(response)
 
             this.waterfallData = waterfallJson
             this.totalSlices = waterfallJson.length
@@ -1505,9 +1509,27 @@ class WaterfallVisualization {
     }
 
     /**
-     * Parse base64 waterfall data
+     * Read the slices of a precomputed waterfall file
+     * @private
+     * @param {Response} response - Response with the waterfall file, stored
+     *     in the binary format or as JSON by older processing
+     * @returns {Promise<Array>} Slice objects
+     */
+    async _readWaterfallFile(response) {
+        const buffer = await response.arrayBuffer()
+        if (isWaterfallPayload(buffer)) {
+            return decodeWaterfallPayload(buffer).slices
+        }
+        return JSON.parse(new TextDecoder().decode(buffer))
+    }
+
+    /**
+     * Parse waterfall data: base64, or already decoded from the binary format
      */
     parseWaterfallData(base64Data) {
+        if (ArrayBuffer.isView(base64Data)) {
+            return Array.from(base64Data)
+        }
         try {
             const binaryString = atob(base64Data)
             const bytes = new Uint8Array(binaryString.length)
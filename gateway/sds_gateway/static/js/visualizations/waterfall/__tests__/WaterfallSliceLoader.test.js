@@ -148,6 +148,43 @@ describe("WaterfallSliceLoader", () => {
             )
         })
 
+        test("should request and decode slices in the binary format", async () => {
+            const header = {
+                start_index: 4,
+                end_index: 6,
+                total_slices: 10,
+                shape: [2, 2],
+                slice_runs: [[4, 2]],
+                dtype: "float32",
+                compression: "none",
+                metadata: { center_frequency: 1e9 },
+            }
+            const headerBytes = new TextEncoder().encode(JSON.stringify(header))
+            const matrix = new Uint8Array(new Float32Array([1, 2, 3, 4]).buffer)
+            const payload = new Uint8Array(9 + headerBytes.length + matrix.length)
+            payload.set(new TextEncoder().encode("SDSW"), 0)
+            new DataView(payload.buffer).setUint8(4, 1)
+            new DataView(payload.buffer).setUint32(5, headerBytes.length, true)
+            payload.set(headerBytes, 9)
+            payload.set(matrix, 9 + headerBytes.length)
+
+            mockFetch.mockResolvedValueOnce({
+                ok: true,
+                headers: {
+                    get: jest.fn(() => "application/vnd.sds.waterfall"),
+                },
+                arrayBuffer: async () => payload.buffer,
+            })
+
+            const result = await loader.loadSliceRange(4, 6, "waterfall")
+
+            const [, options] = mockFetch.mock.calls[0]
+            expect(options.headers.Accept).toBe("application/vnd.sds.waterfall")
+            expect(result).toHaveLength(2)
+            expect(Array.from(cache.getSlice(5).data)).toEqual([3, 4])
+            expect(cache.getSlice(4).center_frequency).toBe(1e9)
+        })
+
         test("should batch large requests", async () => {
             // Mock 3 API responses
             for (let i = 0; i < 3; i++) {
@@ -0,0 +1,75 @@
+/**
+ * Jest tests for decoding waterfalls in the binary format
+ */
+
+import { decodeWaterfallPayload, isWaterfallPayload } from "../waterfallBinary.js"
+
+/**
+ * Build a payload the way the backend encodes it
+ */
+function buildPayload(header, matrixBytes) {
+    const headerBytes = new TextEncoder().encode(JSON.stringify(header))
+    const buffer = new ArrayBuffer(9 + headerBytes.length + matrixBytes.length)
+    const bytes = new Uint8Array(buffer)
+    bytes.set(new TextEncoder().encode("SDSW"), 0)
+    const view = new DataView(buffer)
+    view.setUint8(4, 1)
+    view.setUint32(5, headerBytes.length, true)
+    bytes.set(headerBytes, 9)
+    bytes.set(matrixBytes, 9 + headerBytes.length)
+    return buffer
+}
+
+describe("waterfallBinary", () => {
+    const metadata = { center_frequency: 1e9, sample_rate: 1e7 }
+
+    test("should decode float32 slices with their indices", () => {
+        const matrix = new Float32Array([1, 2, 3, 4, 5, 6])
+        const buffer = buildPayload(
+            {
+                shape: [3, 2],
+                slice_runs: [
+                    [0, 1],
+                    [4, 2],
+                ],
+                dtype: "float32",
+                compression: "none",
+                metadata,
+            },
+            new Uint8Array(matrix.buffer),
+        )
+
+        const { slices } = decodeWaterfallPayload(buffer)
+
+        expect(slices.map((slice) => slice.custom_fields.slice_index)).toEqual([
+            0, 4, 5,
+        ])
+        expect(Array.from(slices[2].data)).toEqual([5, 6])
+        expect(slices[0].center_frequency).toBe(1e9)
+        expect(slices[0].sample_rate).toBe(1e7)
+    })
+
+    test("should dequantize uint8 slices between the scale bounds", () => {
+        const buffer = buildPayload(
+            {
+                shape: [1, 3],
+                slice_runs: [[7, 1]],
+                dtype: "uint8",
+                compression: "none",
+                scale: { min: -100, max: 2 },
+                metadata,
+            },
+            new Uint8Array([0, 255, 5]),
+        )
+
+        const { slices } = decodeWaterfallPayload(buffer)
+
+        expect(Array.from(slices[0].data)).toEqual([-100, 2, -98])
+    })
+
+    test("should tell JSON files apart from binary payloads", () => {
+        const json = new TextEncoder().encode("[]").buffer
+        expect(isWaterfallPayload(json)).toBe(false)
+        expect(() => decodeWaterfallPayload(json)).toThrow()
+    })
+})
@@ -71,7 +71,7 @@ export const get_waterfall_slices_endpoint = (
 }
 
 // Streaming endpoints - compute FFT on-demand without preprocessing
-// include_power_bounds: when true, backend may do expensive DRF sample for scale (slower).
+// include_power_bounds: when true, adds the power stats stored with the processed waterfall.
 export const get_waterfall_metadata_stream_endpoint = (
     capture_uuid,
     include_power_bounds = false,
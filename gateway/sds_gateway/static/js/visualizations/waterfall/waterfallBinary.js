@@ -0,0 +1,123 @@
+/**
+ * Decoding of waterfalls in the binary format
+ * (see sds_gateway/visualizations/processing/waterfall_binary.py)
+ */
+
+export const WATERFALL_BINARY_MEDIA_TYPE = "application/vnd.sds.waterfall"
+
+const MAGIC = "SDSW"
+const SUPPORTED_VERSION = 1
+// magic (4 bytes), version (1 byte), header length (uint32)
+const PREFIX_SIZE = 9
+const UINT8_LEVELS = 255
+
+/**
+ * Whether a buffer holds a waterfall in the binary format
+ * @param {ArrayBuffer} buffer
+ * @returns {boolean}
+ */
+export function isWaterfallPayload(buffer) {
+    if (buffer.byteLength < PREFIX_SIZE) {
+        return false
+    }
+    const magic = new Uint8Array(buffer, 0, MAGIC.length)
+    return String.fromCharCode(...magic) === MAGIC
+}
+
+/**
+ * Convert an IEEE 754 half-precision value to a number
+ * @param {number} half - The 16 bits of the value
+ * @returns {number}
+ */
+function halfToFloat(half) {
+    const sign = half & 0x8000 ? -1 : 1
+    const exponent = (half >> 10) & 0x1f
+    const fraction = half & 0x3ff
+    if (exponent === 0) {
+        return sign * 2 ** -14 * (fraction / 1024)
+    }
+    if (exponent === 0x1f) {
+        return fraction ? Number.NaN : sign * Number.POSITIVE_INFINITY
+    }
+    return sign * 2 ** (exponent - 15) * (1 + fraction / 1024)
+}
+
+/**
+ * Read the slice matrix of a payload as float32 dB values
+ * @param {ArrayBuffer} buffer - Matrix bytes, starting at offset 0
+ * @param {Object} header - Header of the payload
+ * @returns {Float32Array}
+ */
+function readMatrix(buffer, header) {
+    switch (header.dtype) {
+        case "float32":
+            return new Float32Array(buffer)
+        case "float16": {
+            const halves = new Uint16Array(buffer)
+            return Float32Array.from(halves, halfToFloat)
+        }
+        case "uint8": {
+            const { min, max } = header.scale
+            const step = (max - min) / UINT8_LEVELS
+            return Float32Array.from(
+                new Uint8Array(buffer),
+                (level) => min + level * step,
+            )
+        }
+        default:
+            throw new Error(`Unsupported waterfall dtype: ${header.dtype}`)
+    }
+}
+
+/**
+ * Decode a waterfall payload into slice objects
+ *
+ * Slices have their power spectrum as a Float32Array in .data, and the
+ * frequency fields of the header metadata; slices left out due to data gaps
+ * are not included.
+ *
+ * @param {ArrayBuffer} buffer - The payload
+ * @returns {{header: Object, slices: Array<Object>}}
+ */
+export function decodeWaterfallPayload(buffer) {
+    if (!isWaterfallPayload(buffer)) {
+        throw new Error("Not a waterfall payload")
+    }
+    const view = new DataView(buffer)
+    const version = view.getUint8(MAGIC.length)
+    if (version !== SUPPORTED_VERSION) {
+        throw new Error(`Unsupported waterfall format version: ${version}`)
+    }
+    const headerLength = view.getUint32(MAGIC.length + 1, true)
+    const headerBytes = new Uint8Array(buffer, PREFIX_SIZE, headerLength)
+    const header = JSON.parse(new TextDecoder().decode(headerBytes))
+    if (header.compression !== "none") {
+        throw new Error(`Unsupported waterfall compression: ${header.compression}`)
+    }
+
+    // copy the matrix so typed arrays over it are aligned
+    const matrix = buffer.slice(PREFIX_SIZE + headerLength)
+    const values = readMatrix(matrix, header)
+    const fftSize = header.shape[1]
+    const metadata = header.metadata ?? {}
+    const slices = []
+    let row = 0
+    for (const [firstIndex, count] of header.slice_runs) {
+        for (let offset = 0; offset < count; offset++, row++) {
+            slices.push({
+                data: values.subarray(row * fftSize, (row + 1) * fftSize),
+                data_type: "float32",
+                center_frequency: metadata.center_frequency,
+                sample_rate: metadata.sample_rate,
+                min_frequency: metadata.min_frequency,
+                max_frequency: metadata.max_frequency,
+                custom_fields: {
+                    channel_name: metadata.channel,
+                    fft_size: fftSize,
+                    slice_index: firstIndex + offset,
+                },
+            })
+        }
+    }
+    return { header, slices }
+}
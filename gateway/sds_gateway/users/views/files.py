@@ -7,6 +7,7 @@ from django.http import HttpRequest
 from django.http import HttpResponse
 from django.http import HttpResponseRedirect
 from django.http import JsonResponse
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.shortcuts import redirect
 from django.shortcuts import render
@@ -16,7 +17,8 @@ from loguru import logger as log
 from minio.error import MinioException
 
 from sds_gateway.api_methods.helpers.download_file import FileDownloadError
-from sds_gateway.api_methods.helpers.download_file import download_file
+from sds_gateway.api_methods.helpers.download_file import get_file_etag
+from sds_gateway.api_methods.helpers.download_file import stream_file
 from sds_gateway.api_methods.helpers.file_helpers import (
     check_file_contents_exist_helper,
 )
@@ -72,7 +74,9 @@ user_file_detail_view = FileDetailView.as_view()
 class FileDownloadView(Auth0LoginRequiredMixin, View):
     """Session-authenticated file download for the Users UI."""
 
-    def get(self, request: HttpRequest, uuid: str, *args, **kwargs) -> HttpResponse:
+    def get(
+        self, request: HttpRequest, uuid: str, *args, **kwargs
+    ) -> HttpResponse | StreamingHttpResponse:
         file_obj = get_object_or_404(File, uuid=uuid, is_deleted=False)
 
         # Access control: owner or shared via capture/dataset
@@ -82,16 +86,19 @@ class FileDownloadView(Auth0LoginRequiredMixin, View):
             return JsonResponse({"error": "Not found or access denied"}, status=404)
 
         try:
-            content = download_file(file_obj)
+            file_chunks = stream_file(file_obj)
         except (MinioException, FileDownloadError) as e:
             log.warning(f"Error downloading file {file_obj.name}: {e}")
             return JsonResponse({"error": "Failed to download file"}, status=500)
 
-        response = HttpResponse(
-            content,
+        response = StreamingHttpResponse(
+            file_chunks,
             content_type=file_obj.media_type or "application/octet-stream",
         )
         response["Content-Disposition"] = f'attachment; filename="{file_obj.name}"'
+        response["Content-Length"] = str(file_obj.size)
+        if etag := get_file_etag(file_obj):
+            response["ETag"] = etag
         return response
 
 
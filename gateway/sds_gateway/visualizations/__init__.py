@@ -1,11 +1,15 @@
 from .cog_pipelines import process_spectrogram_data_cog
+from .cog_pipelines import process_visualization_data_cog
 from .cog_pipelines import process_waterfall_data_cog
+from .cog_pipelines import process_waterfall_pyramid_cog
 from .cog_pipelines import setup_post_processing_cog
 from .cog_pipelines import visualization_error_handler
 
 __all__ = [
     "process_spectrogram_data_cog",
+    "process_visualization_data_cog",
     "process_waterfall_data_cog",
+    "process_waterfall_pyramid_cog",
     "setup_post_processing_cog",
     "visualization_error_handler",
 ]
@@ -31,6 +31,8 @@ from .models import PostProcessedData
 from .models import ProcessingStatus
 from .models import ProcessingType
 from .post_processing import launch_visualization_processing
+from .processing.waterfall_binary import WATERFALL_BINARY_MEDIA_TYPE
+from .processing.waterfall_binary import WATERFALL_STORAGE_SUFFIX
 from .serializers import PostProcessedDataSerializer
 
 
@@ -831,12 +833,19 @@ class VisualizationViewSet(ViewSet):
                     status=status.HTTP_404_NOT_FOUND,
                 )
 
-            # Return the file
+            # Return the file: stored in the binary format, or as JSON by
+            #   older processing
+            if processing_job.data_file.name.endswith(WATERFALL_STORAGE_SUFFIX):
+                content_type = WATERFALL_BINARY_MEDIA_TYPE
+                suffix = WATERFALL_STORAGE_SUFFIX
+            else:
+                content_type = "application/json"
+                suffix = ".json"
             file_response = FileResponse(
-                processing_job.data_file, content_type="application/json"
+                processing_job.data_file, content_type=content_type
             )
             file_response["Content-Disposition"] = (
-                f'attachment; filename="waterfall_{pk}.json"'
+                f'attachment; filename="waterfall_{pk}{suffix}"'
             )
             return file_response  # noqa: TRY300
 
@@ -1,5 +1,6 @@
 """Django-cog pipeline configurations for visualization processing."""
 
+import functools
 import json
 import tempfile
 import time
@@ -13,8 +14,19 @@ from loguru import logger
 
 from sds_gateway.visualizations.errors import ConfigurationError
 from sds_gateway.visualizations.processing.waterfall import (
-    convert_drf_to_waterfall_json,
+    convert_drf_to_waterfall_matrix,
 )
+from sds_gateway.visualizations.processing.waterfall_binary import (
+    WATERFALL_STORAGE_SUFFIX,
+)
+from sds_gateway.visualizations.processing.waterfall_binary import WaterfallMatrixFile
+from sds_gateway.visualizations.processing.waterfall_binary import (
+    encode_waterfall_slices,
+)
+from sds_gateway.visualizations.processing.waterfall_pyramid import (
+    build_waterfall_pyramid,
+)
+from sds_gateway.visualizations.processing.waterfall_pyramid import pyramid_num_levels
 
 
 # Pipeline configuration functions for Django admin setup
@@ -31,16 +43,21 @@ def get_visualization_pipeline_config() -> dict[str, Any]:
 
     Stages:
     1. "setup_stage" - setup_post_processing_cog (validates capture, creates records)
-    2. "waterfall_stage" - process_waterfall_data_cog (processes waterfall data)
-    3. "spectrogram_stage" - process_spectrogram_data_cog (processes spectrogram data)
+    2. "processing_stage" - process_visualization_data_cog (processes waterfall and
+       spectrogram data in a single pass over the capture)
+    3. "pyramid_stage" - process_waterfall_pyramid_cog (builds the multi-resolution
+       pyramid of the waterfall for zoomed-out views)
 
     Tasks in each stage:
     - setup_stage: setup_post_processing_cog (capture_uuid and processing_types passed
       as runtime args)
-    - waterfall_stage: process_waterfall_data_cog (capture_uuid passed as runtime arg,
-      depends on setup_stage)
-    - spectrogram_stage: process_spectrogram_data_cog (capture_uuid passed as runtime
-      arg, depends on setup_stage, independent of waterfall_stage)
+    - processing_stage: process_visualization_data_cog (capture_uuid passed as runtime
+      arg, depends on setup_stage)
+    - pyramid_stage: process_waterfall_pyramid_cog (capture_uuid passed as runtime
+      arg, depends on the stage processing the waterfall)
+
+    process_waterfall_data_cog and process_spectrogram_data_cog remain registered
+    for pipelines set up by earlier versions, which process each type on its own.
     """
 
     return {
@@ -69,17 +86,25 @@ def get_visualization_pipeline_config() -> dict[str, Any]:
                 "depends_on": ["setup_stage"],
                 "tasks": [
                     {
-                        "name": "process_waterfall",
-                        "cog": "process_waterfall_data_cog",
+                        "name": "process_visualizations",
+                        "cog": "process_visualization_data_cog",
                         "args": {},
-                        "description": "Process waterfall data",
+                        "description": "Process waterfall and spectrogram data in "
+                        "a single pass",
                         "prevent_overlapping_calls": False,
                     },
+                ],
+            },
+            {
+                "name": "pyramid_stage",
+                "description": "Build the multi-resolution pyramid of the waterfall",
+                "depends_on": ["processing_stage"],
+                "tasks": [
                     {
-                        "name": "process_spectrogram",
-                        "cog": "process_spectrogram_data_cog",
+                        "name": "build_waterfall_pyramid",
+                        "cog": "process_waterfall_pyramid_cog",
                         "args": {},
-                        "description": "Process spectrogram data",
+                        "description": "Build waterfall pyramid",
                         "prevent_overlapping_calls": False,
                     },
                 ],
@@ -203,33 +228,47 @@ def setup_post_processing_cog(
         raise
 
 
-def _process_waterfall_json_data(capture, processed_data_obj, temp_path):
-    """Process waterfall JSON data and return result."""
+def _process_waterfall_data(capture, processed_data_obj, temp_path):
+    """Process waterfall data and return result."""
     from sds_gateway.visualizations.processing.utils import reconstruct_drf_files
 
     capture_files = capture.files.filter(is_deleted=False)
     reconstructed_path = reconstruct_drf_files(capture, capture_files, temp_path)
 
-    return convert_drf_to_waterfall_json(
+    return convert_drf_to_waterfall_matrix(
         reconstructed_path,
         capture.channel,
     )
 
 
-def _store_waterfall_json_file(capture_uuid, waterfall_result):
-    """Store waterfall JSON file and return result."""
+def _store_waterfall_file(capture_uuid, waterfall_result):
+    """Store the waterfall file and return its temporary path.
+
+    The slices are stored as an uncompressed float32 matrix in the binary
+    waterfall format, so ranges of slices can be read without the whole file.
+    """
     from sds_gateway.visualizations.models import ProcessingType
     from sds_gateway.visualizations.processing.utils import store_processed_data
 
     with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".json", delete=False
+        mode="wb", suffix=WATERFALL_STORAGE_SUFFIX, delete=False
     ) as temp_file:
-        json.dump(waterfall_result["json_data"], temp_file, indent=2)
+        temp_file.write(
+            encode_waterfall_slices(
+                waterfall_result["spectra"],
+                waterfall_result["slice_runs"],
+                header={
+                    "total_slices": waterfall_result["metadata"]["total_slices"],
+                    "metadata": waterfall_result["metadata"],
+                    "slice_params": waterfall_result["slice_params"],
+                },
+            )
+        )
         temp_file_path = temp_file.name
-        logger.info(f"Created temporary JSON file at {temp_file_path}")
+        logger.info(f"Created temporary waterfall file at {temp_file_path}")
 
     try:
-        new_filename = f"waterfall_{capture_uuid}.json"
+        new_filename = f"waterfall_{capture_uuid}{WATERFALL_STORAGE_SUFFIX}"
         store_processed_data(
             capture_uuid,
             ProcessingType.Waterfall.value,
@@ -300,10 +339,10 @@ def process_waterfall_data_cog(
         temp_path = Path(temp_dir)
         temp_file_path = None
         try:
-            waterfall_result = _process_waterfall_json_data(
+            waterfall_result = _process_waterfall_data(
                 capture, processed_data_obj, temp_path
             )
-            temp_file_path = _store_waterfall_json_file(capture_uuid, waterfall_result)
+            temp_file_path = _store_waterfall_file(capture_uuid, waterfall_result)
 
             processed_data_obj.mark_processing_completed()
             logger.info(f"Completed waterfall processing for capture {capture_uuid}")
@@ -314,6 +353,205 @@ def process_waterfall_data_cog(
                 logger.info(f"Cleaned up temporary file {temp_file_path}")
 
 
+def _get_processed_data(capture, processing_config, processing_type):
+    """Get the PostProcessedData record of a processing type from the config."""
+    from sds_gateway.visualizations.models import PostProcessedData
+
+    processed_data_id = processing_config[processing_type].get("processed_data_id")
+    if not processed_data_id:
+        error_msg = (
+            f"processed_data_id is required for {processing_type} processing. "
+            "PostProcessedData records must be created before starting the pipeline."
+        )
+        raise ValueError(error_msg)
+
+    try:
+        return PostProcessedData.objects.get(
+            uuid=processed_data_id,
+            capture=capture,
+            processing_type=processing_type,
+        )
+    except PostProcessedData.DoesNotExist:
+        error_msg = f"PostProcessedData with ID {processed_data_id} not found"
+        raise ValueError(error_msg) from None
+
+
+@cog
+def process_visualization_data_cog(
+    capture_uuid: str,
+    processing_config: dict[str, dict[str, Any]],
+) -> None:
+    """Process the waterfall and spectrogram data of a capture in a single pass.
+
+    The capture is reconstructed once, and each block of its samples is read once
+    to compute all the requested visualizations, spread across a process pool
+    (see `single_pass`). The throughput of the pass is stored in the metadata of
+    each result.
+
+    Args:
+        capture_uuid: UUID of the capture to process
+        processing_config: Dict with processing configurations
+
+    Returns:
+        None
+    """
+    from sds_gateway.visualizations.models import ProcessingType
+
+    processing_types = [
+        processing_type
+        for processing_type in (ProcessingType.Waterfall, ProcessingType.Spectrogram)
+        if processing_type.value in processing_config
+    ]
+    if not processing_types:
+        logger.info(
+            f"Skipping visualization processing for capture {capture_uuid} - not "
+            "requested"
+        )
+        return
+
+    from sds_gateway.api_methods.models import Capture
+    from sds_gateway.visualizations.processing.single_pass import (
+        process_capture_single_pass,
+    )
+    from sds_gateway.visualizations.processing.utils import reconstruct_drf_files
+    from sds_gateway.visualizations.processing.utils import store_processed_data
+
+    capture = Capture.objects.get(uuid=capture_uuid, is_deleted=False)
+    processed_data_objs = {
+        processing_type: _get_processed_data(
+            capture, processing_config, processing_type.value
+        )
+        for processing_type in processing_types
+    }
+    for processed_data_obj in processed_data_objs.values():
+        processed_data_obj.mark_processing_started()
+
+    with tempfile.TemporaryDirectory(
+        prefix=f"visualizations_{capture_uuid}_"
+    ) as temp_dir:
+        capture_files = capture.files.filter(is_deleted=False)
+        reconstructed_path = reconstruct_drf_files(
+            capture, capture_files, Path(temp_dir)
+        )
+        result = process_capture_single_pass(
+            reconstructed_path,
+            capture.channel,
+            waterfall=ProcessingType.Waterfall in processed_data_objs,
+            spectrogram_parameters=processing_config.get(
+                ProcessingType.Spectrogram.value
+            ),
+        )
+
+    stored_files = {
+        ProcessingType.Waterfall: (
+            "waterfall",
+            "file_path",
+            f"waterfall_{capture_uuid}{WATERFALL_STORAGE_SUFFIX}",
+        ),
+        ProcessingType.Spectrogram: (
+            "spectrogram",
+            "image_path",
+            f"spectrogram_{capture_uuid}.png",
+        ),
+    }
+    try:
+        for processing_type, processed_data_obj in processed_data_objs.items():
+            result_key, path_key, new_filename = stored_files[processing_type]
+            store_processed_data(
+                capture_uuid,
+                processing_type.value,
+                result[result_key][path_key],
+                new_filename,
+                {
+                    **result[result_key]["metadata"],
+                    "throughput": result["throughput"],
+                },
+            )
+            processed_data_obj.mark_processing_completed()
+            logger.info(
+                f"Completed {processing_type.value} processing for capture "
+                f"{capture_uuid}"
+            )
+    finally:
+        for result_key, path_key, _ in stored_files.values():
+            if result_key in result:
+                Path(result[result_key][path_key]).unlink(missing_ok=True)
+
+
+@cog
+def process_waterfall_pyramid_cog(
+    capture_uuid: str,
+    processing_config: dict[str, dict[str, Any]],
+) -> None:
+    """Build the multi-resolution pyramid of the processed waterfall of a capture.
+
+    The stored waterfall is read in batches of slices, so the pyramid is built
+    with bounded memory. Waterfalls stored as JSON by earlier versions, or small
+    enough to be shown whole, get no pyramid.
+
+    Args:
+        capture_uuid: UUID of the capture to process
+        processing_config: Dict with processing configurations
+
+    Returns:
+        None
+    """
+    from sds_gateway.visualizations.models import PostProcessedData
+    from sds_gateway.visualizations.models import ProcessingStatus
+    from sds_gateway.visualizations.models import ProcessingType
+    from sds_gateway.visualizations.processing.utils import read_stored_range
+    from sds_gateway.visualizations.processing.utils import store_waterfall_pyramid
+
+    processed_data_id = processing_config.get(ProcessingType.Waterfall.value, {}).get(
+        "processed_data_id"
+    )
+    if not processed_data_id:
+        logger.info(
+            f"Skipping waterfall pyramid for capture {capture_uuid} - not requested"
+        )
+        return
+
+    processed_data_obj = PostProcessedData.objects.get(
+        uuid=processed_data_id,
+        capture__uuid=capture_uuid,
+        processing_type=ProcessingType.Waterfall.value,
+    )
+    if processed_data_obj.processing_status != ProcessingStatus.Completed.value or (
+        not processed_data_obj.data_file.name.endswith(WATERFALL_STORAGE_SUFFIX)
+    ):
+        logger.info(
+            f"Skipping waterfall pyramid for capture {capture_uuid} - no stored "
+            "waterfall matrix"
+        )
+        return
+
+    source = WaterfallMatrixFile(
+        functools.partial(read_stored_range, processed_data_obj.data_file.name)
+    )
+    if pyramid_num_levels(source.total_slices) == 0:
+        logger.info(
+            f"Skipping waterfall pyramid for capture {capture_uuid} - "
+            f"{source.total_slices} slices"
+        )
+        return
+
+    with tempfile.NamedTemporaryFile(
+        mode="w+b", suffix=WATERFALL_STORAGE_SUFFIX
+    ) as temp_file:
+        pyramid = build_waterfall_pyramid(source, temp_file)
+        temp_file.flush()
+        store_waterfall_pyramid(
+            processed_data_obj,
+            temp_file.name,
+            f"waterfall_pyramid_{capture_uuid}{WATERFALL_STORAGE_SUFFIX}",
+            pyramid,
+        )
+    logger.info(
+        f"Completed waterfall pyramid for capture {capture_uuid} with "
+        f"{len(pyramid['levels'])} levels"
+    )
+
+
 @cog
 def process_spectrogram_data_cog(
     capture_uuid: str, processing_config: dict[str, dict[str, Any]]
@@ -0,0 +1,35 @@
+"""Management command to inspect and prune the DRF reconstruction cache."""
+
+from django.core.management.base import BaseCommand
+
+from sds_gateway.visualizations.processing.drf_cache import evict_drf_cache
+from sds_gateway.visualizations.processing.drf_cache import get_drf_cache_stats
+
+
+class Command(BaseCommand):
+    """Show usage and hit, miss and eviction stats of the DRF cache."""
+
+    help = "Show DRF reconstruction cache stats, optionally evicting entries"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--evict",
+            action="store_true",
+            help="Evict least recently used entries until the cache fits its budget",
+        )
+        parser.add_argument(
+            "--max-bytes",
+            type=int,
+            default=None,
+            help="Budget to evict to, instead of DRF_CACHE_MAX_BYTES",
+        )
+
+    def handle(self, *args, **options):
+        """Handle the command."""
+        if options["evict"]:
+            evicted = evict_drf_cache(options["max_bytes"])
+            self.stdout.write(self.style.SUCCESS(f"Evicted {evicted} entries"))
+
+        for name, value in get_drf_cache_stats().items():
+            self.stdout.write(f"{name}: {value}")
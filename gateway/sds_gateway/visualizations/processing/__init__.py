@@ -2,8 +2,10 @@
 
 from .spectrogram import generate_spectrogram_from_drf
 from .waterfall import convert_drf_to_waterfall_json
+from .waterfall import convert_drf_to_waterfall_matrix
 
 __all__ = [
     "convert_drf_to_waterfall_json",
+    "convert_drf_to_waterfall_matrix",
     "generate_spectrogram_from_drf",
 ]
@@ -0,0 +1,291 @@
+"""Size-bounded cache of DigitalRF captures reconstructed from storage.
+
+Layout, under DRF_CACHE_DIR:
+
+    <capture uuid>/                     reconstructed files of a capture
+    <capture uuid>/.sds_cache.json      manifest, written once the entry is complete
+    .locks/<capture uuid>.lock          lock files for cross-process locking
+    .staging/                           files downloaded without holding a lock
+
+The manifest records the fingerprint of the capture's file set (file UUIDs and
+BLAKE3 checksums), the size of the entry, its DigitalRF root, and whether all
+files were downloaded or only the ones covering some sample ranges; the time it
+was last modified is the last access to the entry, used for LRU eviction.
+Directories without a manifest are being reconstructed, or were left by
+versions without manifests, and are rebuilt.
+"""
+
+import contextlib
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import time
+from collections.abc import Iterable
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from loguru import logger
+
+MANIFEST_NAME = ".sds_cache.json"
+DEFAULT_DRF_CACHE_MAX_BYTES = 50 * 1024**3
+# entries used this recently are not evicted: their readers may still be open
+DRF_CACHE_EVICTION_GRACE_SECONDS = 600
+
+_LOCKS_DIR_NAME = ".locks"
+_STAGING_DIR_NAME = ".staging"
+_STATS_KEY_PREFIX = "drf_cache:stats:"
+_STAT_NAMES = ("hits", "misses", "evictions")
+
+
+def get_drf_cache_dir() -> Path:
+    """Get the directory for caching reconstructed DRF files.
+
+    Uses DRF_CACHE_DIR (outside MEDIA_ROOT) so cached capture data is never
+    exposed via MEDIA_URL. Default is <project_root>/cache/drf; override with
+    DRF_CACHE_DIR in production (e.g. /var/cache/sds-gateway/drf).
+    """
+    cache_dir = Path(settings.DRF_CACHE_DIR)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def get_drf_staging_dir() -> Path:
+    """Directory for files downloaded before being moved into an entry.
+
+    It is on the same filesystem as the entries, so staged files can be moved
+    into them atomically.
+    """
+    staging_dir = get_drf_cache_dir() / _STAGING_DIR_NAME
+    staging_dir.mkdir(exist_ok=True)
+    return staging_dir
+
+
+def get_drf_cache_max_bytes() -> int:
+    """Byte budget of the cache, from DRF_CACHE_MAX_BYTES."""
+    return int(getattr(settings, "DRF_CACHE_MAX_BYTES", DEFAULT_DRF_CACHE_MAX_BYTES))
+
+
+def capture_files_fingerprint(capture_files: Iterable[Any]) -> str:
+    """Fingerprint of the file set of a capture, from file UUIDs and checksums."""
+    file_keys = sorted(
+        f"{file_obj.uuid}:{file_obj.sum_blake3}" for file_obj in capture_files
+    )
+    return hashlib.sha256("\n".join(file_keys).encode()).hexdigest()
+
+
+def _increment_stat(name: str) -> None:
+    key = _STATS_KEY_PREFIX + name
+    try:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+    except Exception as e:  # noqa: BLE001 - cache backends can raise various errors
+        logger.debug(f"Failed to update DRF cache stats: {e}")
+
+
+def _lock_path(capture_uuid: str) -> Path:
+    return get_drf_cache_dir() / _LOCKS_DIR_NAME / f"{capture_uuid}.lock"
+
+
+@contextlib.contextmanager
+def drf_cache_lock(capture_uuid: str, *, blocking: bool = True) -> Iterator[bool]:
+    """Hold the cross-process lock of a cache entry.
+
+    Lock files are removed with evicted entries: a lock taken on a file that
+    was removed while waiting for it is taken again on the new file.
+
+    Yields:
+        bool: Whether the lock was acquired; always True when blocking.
+    """
+    lock_path = _lock_path(capture_uuid)
+    lock_path.parent.mkdir(exist_ok=True)
+    while True:
+        with lock_path.open("a") as lock_file:
+            flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+            try:
+                fcntl.flock(lock_file, flags)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                is_current = (
+                    os.fstat(lock_file.fileno()).st_ino == lock_path.stat().st_ino
+                )
+            except FileNotFoundError:
+                is_current = False
+            if not is_current:
+                continue
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            return
+
+
+def _read_manifest(entry_dir: Path) -> dict[str, Any] | None:
+    try:
+        return json.loads((entry_dir / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def read_entry_manifest(capture_uuid: str) -> dict[str, Any] | None:
+    """Manifest of the entry of a capture, None when there is no usable entry."""
+    return _read_manifest(get_drf_cache_dir() / str(capture_uuid))
+
+
+def find_cached_entry(capture_uuid: str, fingerprint: str) -> Path | None:
+    """DigitalRF root of a complete entry for this file set, marking it as used.
+
+    Does not update the hit and miss stats (see `get_cached_drf_path`).
+    """
+    entry_dir = get_drf_cache_dir() / str(capture_uuid)
+    manifest = _read_manifest(entry_dir)
+    if (
+        manifest is None
+        or manifest.get("fingerprint") != fingerprint
+        or not manifest.get("complete", True)
+    ):
+        return None
+    drf_root = entry_dir / manifest["drf_root"]
+    if not drf_root.is_dir():
+        return None
+    with contextlib.suppress(OSError):
+        (entry_dir / MANIFEST_NAME).touch()
+    return drf_root
+
+
+def get_cached_drf_path(capture_uuid: str, fingerprint: str) -> Path | None:
+    """Check if reconstructed DRF files of this file set are already cached.
+
+    Returns:
+        Path to cached DRF root directory if it exists and is valid, None otherwise.
+    """
+    drf_root = find_cached_entry(capture_uuid, fingerprint)
+    _increment_stat("hits" if drf_root else "misses")
+    if drf_root:
+        logger.info(f"Using cached DRF files at: {drf_root}")
+    return drf_root
+
+
+def discard_entry(capture_uuid: str) -> None:
+    """Remove the files of an entry; hold its lock when calling."""
+    shutil.rmtree(get_drf_cache_dir() / str(capture_uuid), ignore_errors=True)
+
+
+def _directory_size(directory: Path) -> int:
+    size = 0
+    for root, _dirs, files in os.walk(directory):
+        for name in files:
+            with contextlib.suppress(OSError):
+                size += (Path(root) / name).stat().st_size
+    return size
+
+
+def record_entry(
+    capture_uuid: str, fingerprint: str, drf_root: Path, *, complete: bool = True
+) -> None:
+    """Write the manifest of an entry, with its current size.
+
+    Args:
+        complete: Whether all files of the capture were downloaded, or only the
+            ones covering some sample ranges.
+    """
+    entry_dir = get_drf_cache_dir() / str(capture_uuid)
+    manifest = {
+        "fingerprint": fingerprint,
+        "drf_root": str(drf_root.relative_to(entry_dir)),
+        "size_bytes": _directory_size(entry_dir),
+        "complete": complete,
+        "created_at": time.time(),
+    }
+    temp_path = entry_dir / f"{MANIFEST_NAME}.tmp"
+    temp_path.write_text(json.dumps(manifest))
+    temp_path.replace(entry_dir / MANIFEST_NAME)
+
+
+def _list_entries() -> list[dict[str, Any]]:
+    """Entries of the cache, least recently used first."""
+    entries = []
+    for entry_dir in get_drf_cache_dir().iterdir():
+        if (
+            entry_dir.name in (_LOCKS_DIR_NAME, _STAGING_DIR_NAME)
+            or not entry_dir.is_dir()
+        ):
+            continue
+        manifest = _read_manifest(entry_dir)
+        access_path = entry_dir / MANIFEST_NAME if manifest else entry_dir
+        try:
+            last_access = access_path.stat().st_mtime
+        except OSError:
+            continue
+        entries.append(
+            {
+                "capture_uuid": entry_dir.name,
+                "complete": manifest is not None and manifest.get("complete", True),
+                "size_bytes": (
+                    manifest["size_bytes"] if manifest else _directory_size(entry_dir)
+                ),
+                "last_access": last_access,
+            }
+        )
+    return sorted(entries, key=lambda entry: entry["last_access"])
+
+
+def evict_drf_cache(max_bytes: int | None = None, *, keep: Iterable[str] = ()) -> int:
+    """Evict least recently used entries until the cache fits in its budget.
+
+    Entries being reconstructed (locked), used in the last
+    DRF_CACHE_EVICTION_GRACE_SECONDS, or in `keep` are not evicted.
+
+    Returns:
+        int: Number of evicted entries.
+    """
+    max_bytes = get_drf_cache_max_bytes() if max_bytes is None else max_bytes
+    kept = {str(capture_uuid) for capture_uuid in keep}
+    entries = _list_entries()
+    total_bytes = sum(entry["size_bytes"] for entry in entries)
+    evicted = 0
+    for entry in entries:
+        if total_bytes <= max_bytes:
+            break
+        if (
+            entry["capture_uuid"] in kept
+            or time.time() - entry["last_access"] < DRF_CACHE_EVICTION_GRACE_SECONDS
+        ):
+            continue
+        with drf_cache_lock(entry["capture_uuid"], blocking=False) as acquired:
+            if not acquired:
+                continue
+            discard_entry(entry["capture_uuid"])
+            # removed while held: processes waiting for it lock a new file
+            _lock_path(entry["capture_uuid"]).unlink(missing_ok=True)
+        total_bytes -= entry["size_bytes"]
+        evicted += 1
+        _increment_stat("evictions")
+        logger.info(
+            f"Evicted cached DRF files of capture {entry['capture_uuid']} "
+            f"({entry['size_bytes']} bytes)"
+        )
+    return evicted
+
+
+def get_drf_cache_stats() -> dict[str, Any]:
+    """Usage of the cache, and hit, miss and eviction counts of all workers."""
+    entries = _list_entries()
+    stats: dict[str, Any] = {
+        "entries": sum(1 for entry in entries if entry["complete"]),
+        "incomplete_entries": sum(1 for entry in entries if not entry["complete"]),
+        "size_bytes": sum(entry["size_bytes"] for entry in entries),
+        "max_bytes": get_drf_cache_max_bytes(),
+    }
+    for name in _STAT_NAMES:
+        try:
+            stats[name] = cache.get(_STATS_KEY_PREFIX + name, 0)
+        except Exception:  # noqa: BLE001 - cache backends can raise various errors
+            stats[name] = None
+    return stats
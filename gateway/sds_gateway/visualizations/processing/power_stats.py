@@ -0,0 +1,114 @@
+"""Power statistics of waterfalls, accumulated from their spectra as computed.
+
+Statistics are measured once, from the float32 power spectra (dB) of all slices
+while a waterfall is post-processed, and stored in its metadata: metadata
+requests then answer from the stored summary, without reading the capture.
+
+The histogram has fixed bins of POWER_HISTOGRAM_BIN_DB over
+[POWER_HISTOGRAM_MIN_DB, POWER_HISTOGRAM_MAX_DB), so statistics of segments
+computed separately merge exactly; power outside of this range is counted in
+the first or last bin. Percentiles are interpolated within the histogram bins,
+so they are exact to a bin.
+"""
+
+from typing import Any
+
+import numpy as np
+
+POWER_HISTOGRAM_MIN_DB = -250.0
+POWER_HISTOGRAM_MAX_DB = 150.0
+POWER_HISTOGRAM_BIN_DB = 0.25
+POWER_PERCENTILES = (1, 5, 25, 50, 75, 95, 99)
+# margin around the power range in color scale bounds, as calculatePowerBounds()
+POWER_BOUNDS_MARGIN = 0.05
+
+_NUM_BINS = round(
+    (POWER_HISTOGRAM_MAX_DB - POWER_HISTOGRAM_MIN_DB) / POWER_HISTOGRAM_BIN_DB
+)
+
+
+def power_bounds_with_margin(
+    global_min: float, global_max: float, margin_fraction: float = POWER_BOUNDS_MARGIN
+) -> dict[str, float] | None:
+    """Color scale bounds from the power range of a waterfall, with a margin.
+
+    Returns:
+        {"min": float, "max": float} or None when no power was measured
+    """
+    if global_min == float("inf") or global_max == float("-inf"):
+        return None
+    margin = (global_max - global_min) * margin_fraction
+    return {"min": global_min - margin, "max": global_max + margin}
+
+
+class PowerStats:
+    """Accumulates the power statistics of the spectra of a waterfall."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.min = float("inf")
+        self.max = float("-inf")
+        self.sum = 0.0
+        self.histogram = np.zeros(_NUM_BINS, dtype=np.int64)
+
+    def add(self, spectra: np.ndarray) -> None:
+        """Add power values in dB; non-finite values are ignored."""
+        finite = spectra[np.isfinite(spectra)]
+        if finite.size == 0:
+            return
+        self.count += finite.size
+        self.min = min(self.min, float(finite.min()))
+        self.max = max(self.max, float(finite.max()))
+        self.sum += float(finite.sum(dtype=np.float64))
+        positions = (finite - POWER_HISTOGRAM_MIN_DB) / POWER_HISTOGRAM_BIN_DB
+        bins = np.clip(np.floor(positions).astype(np.int64), 0, _NUM_BINS - 1)
+        self.histogram += np.bincount(bins, minlength=_NUM_BINS)
+
+    def merge(self, other: "PowerStats") -> None:
+        """Add the values accumulated by another instance, e.g. of a segment."""
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sum += other.sum
+        self.histogram += other.histogram
+
+    def percentile(self, percent: float) -> float:
+        """Power below which `percent` % of the values are, within a bin."""
+        cumulative = np.cumsum(self.histogram)
+        rank = percent / 100 * self.count
+        bin_index = min(int(np.searchsorted(cumulative, rank)), _NUM_BINS - 1)
+        below = cumulative[bin_index - 1] if bin_index > 0 else 0
+        fraction = (rank - below) / self.histogram[bin_index]
+        value = POWER_HISTOGRAM_MIN_DB + (bin_index + fraction) * POWER_HISTOGRAM_BIN_DB
+        return float(np.clip(value, self.min, self.max))
+
+    def power_bounds(self) -> dict[str, float] | None:
+        """Color scale bounds of the waterfall (see `power_bounds_with_margin`)."""
+        return power_bounds_with_margin(self.min, self.max)
+
+    def summary(self) -> dict[str, Any] | None:
+        """Statistics to store, None when no power was measured.
+
+        Returns:
+            dict: The "count", "min", "max" and "mean" of the power in dB, its
+                "percentiles" by percent, and its "histogram": the "counts" of
+                bins of "bin_db" dB from "start_db", trimmed to non-empty bins.
+        """
+        if self.count == 0:
+            return None
+        non_empty = np.flatnonzero(self.histogram)
+        first_bin, last_bin = int(non_empty[0]), int(non_empty[-1])
+        return {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.sum / self.count,
+            "percentiles": {
+                str(percent): self.percentile(percent) for percent in POWER_PERCENTILES
+            },
+            "histogram": {
+                "start_db": POWER_HISTOGRAM_MIN_DB + first_bin * POWER_HISTOGRAM_BIN_DB,
+                "bin_db": POWER_HISTOGRAM_BIN_DB,
+                "counts": self.histogram[first_bin : last_bin + 1].tolist(),
+            },
+        }
@@ -0,0 +1,104 @@
+"""Per-process pool of open DigitalRF readers, reused across requests.
+
+Opening a capture builds a DigitalRFReader, which scans its directory tree, and
+reads its properties (see `validate_digitalrf_data`). Streamed slice requests
+reuse the readers and parameters opened by earlier requests for the same
+capture and channel, so they only pay for their sample reads.
+
+Entries are tagged with the DRF cache entry they were opened from: the
+fingerprint of its file set and the inode of its DigitalRF root. An entry is
+reopened when the capture's files change, or when its cache entry was evicted
+and rebuilt. Files downloaded into a partial entry (see `reconstruct_drf_range`)
+do not change it: DigitalRF readers look files up as samples are read.
+
+Up to DRF_READER_POOL_SIZE entries are kept, evicting the least recently used.
+A reader is used by one thread at a time: concurrent requests for the same
+capture and channel wait for each other.
+"""
+
+import contextlib
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+
+from django.conf import settings
+
+from .drf_cache import read_entry_manifest
+from .utils import DigitalRFParams
+from .utils import validate_digitalrf_data
+
+DEFAULT_DRF_READER_POOL_SIZE = 8
+
+
+@dataclass
+class _PoolEntry:
+    generation: tuple[str, str, int]
+    params: DigitalRFParams | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+_pool: OrderedDict[tuple[str, str], _PoolEntry] = OrderedDict()
+_pool_lock = threading.Lock()
+
+
+def get_drf_reader_pool_size() -> int:
+    """Maximum number of open readers, from DRF_READER_POOL_SIZE."""
+    return int(getattr(settings, "DRF_READER_POOL_SIZE", DEFAULT_DRF_READER_POOL_SIZE))
+
+
+def _entry_generation(capture_uuid: str, drf_path: Path) -> tuple[str, str, int] | None:
+    """Identity of the DRF cache entry of a capture, None when it is not cached."""
+    manifest = read_entry_manifest(capture_uuid)
+    if manifest is None:
+        return None
+    try:
+        inode = drf_path.stat().st_ino
+    except OSError:
+        return None
+    return manifest["fingerprint"], str(drf_path), inode
+
+
+@contextlib.contextmanager
+def pooled_drf_params(
+    capture_uuid: str, drf_path: Path, channel: str
+) -> Iterator[DigitalRFParams]:
+    """DigitalRF parameters of a channel, with a reader kept open across requests.
+
+    Captures outside of the DRF cache are opened for this use only.
+
+    Args:
+        capture_uuid: UUID of the capture, whose DRF cache entry is at drf_path
+        drf_path: DigitalRF root of the capture
+        channel: Channel name to read
+
+    Yields:
+        DigitalRFParams: Validated parameters, for use within the context only
+    """
+    generation = _entry_generation(str(capture_uuid), drf_path)
+    if generation is None or get_drf_reader_pool_size() <= 0:
+        yield validate_digitalrf_data(drf_path, channel)
+        return
+
+    key = (str(capture_uuid), channel)
+    with _pool_lock:
+        entry = _pool.get(key)
+        if entry is None or entry.generation != generation:
+            entry = _PoolEntry(generation)
+            _pool[key] = entry
+        _pool.move_to_end(key)
+        while len(_pool) > get_drf_reader_pool_size():
+            _pool.popitem(last=False)
+
+    with entry.lock:
+        if entry.params is None:
+            entry.params = validate_digitalrf_data(drf_path, channel)
+        yield entry.params
+
+
+def clear_drf_reader_pool() -> None:
+    """Drop all open readers of this process."""
+    with _pool_lock:
+        _pool.clear()
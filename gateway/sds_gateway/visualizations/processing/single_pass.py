@@ -0,0 +1,415 @@
+"""Waterfall and spectrogram post-processing in a single pass over a capture.
+
+The capture is split in segments of SEGMENT_SLICES waterfall slices, processed
+by a pool of processes. Each segment is read from disk once, and its samples
+feed the waterfall spectra, the spectrogram columns and the power statistics
+together. Results are merged in order as segments complete, with the spectra of
+the waterfall streamed to a file, so memory is bounded by the segments in flight.
+"""
+
+import collections
+import functools
+import math
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from digital_rf import DigitalRFReader
+from django.conf import settings
+from loguru import logger
+from pydantic import BaseModel
+from pydantic import ConfigDict
+
+from sds_gateway.visualizations.errors import SourceDataError
+
+from .power_stats import PowerStats
+from .spectrogram import SpectrogramLayout
+from .spectrogram import SpectrogramOptions
+from .spectrogram import render_spectrogram
+from .spectrogram import spectrogram_layout
+from .spectrogram import spectrogram_slice_sums
+from .waterfall import FFT_SIZE
+from .waterfall import compute_waterfall_matrix
+from .waterfall import processed_waterfall_metadata
+from .waterfall import stored_slice_params
+from .waterfall import validate_waterfall_data
+from .waterfall import waterfall_slice_params
+from .waterfall_binary import WATERFALL_STORAGE_SUFFIX
+from .waterfall_binary import add_slice_run
+from .waterfall_binary import stored_waterfall_prefix
+
+# waterfall slices per segment: 1 Mi samples, 8 MiB of complex64 samples
+SEGMENT_SLICES = 1024
+# segments submitted ahead of the one being merged, per worker
+_SEGMENTS_IN_FLIGHT_PER_WORKER = 2
+_STAGES = ("read", "waterfall", "spectrogram")
+
+
+class SinglePassTask(BaseModel):
+    """What to compute from the segments of a capture, sent to worker processes."""
+
+    model_config = ConfigDict(frozen=True)
+
+    drf_path: Path
+    channel: str
+    start_sample: int
+    total_samples: int
+    samples_per_slice: int
+    # stored slice parameters of the waterfall (see `waterfall_slice_params`)
+    waterfall_params: dict[str, Any] | None = None
+    spectrogram: SpectrogramLayout | None = None
+
+    @property
+    def num_segments(self) -> int:
+        """Number of segments of the capture."""
+        return max(
+            1,
+            math.ceil(self.total_samples / (SEGMENT_SLICES * self.samples_per_slice)),
+        )
+
+    def segment_samples(self, segment: int) -> tuple[int, int]:
+        """Offsets of the first and past the last samples of a segment."""
+        segment_size = SEGMENT_SLICES * self.samples_per_slice
+        return (
+            segment * segment_size,
+            min((segment + 1) * segment_size, self.total_samples),
+        )
+
+
+class _SegmentReader:
+    """Samples of a segment of a capture held in memory, read like a reader.
+
+    As with DigitalRFReader, reading samples missing due to data gaps (or out of
+    the segment) raises OSError.
+    """
+
+    def __init__(
+        self, reader: DigitalRFReader, channel: str, start: int, end: int
+    ) -> None:
+        self.start = start
+        self.samples = np.zeros(end - start, dtype=np.complex64)
+        self.has_data = np.zeros(end - start, dtype=bool)
+        try:
+            self.samples[:] = reader.read_vector(start, end - start, channel, 0)
+            self.has_data[:] = True
+        except OSError:
+            continuous_blocks = reader.get_continuous_blocks(start, end - 1, channel)
+            for block_start, block_length in continuous_blocks.items():
+                first = max(block_start, start)
+                last = min(block_start + block_length, end)
+                if first >= last:
+                    continue
+                self.samples[first - start : last - start] = reader.read_vector(
+                    first, last - first, channel, 0
+                )
+                self.has_data[first - start : last - start] = True
+
+    def read_vector(
+        self, start: int, num_samples: int, channel: str, sub_channel: int
+    ) -> np.ndarray:
+        offset = start - self.start
+        if (
+            offset < 0
+            or offset + num_samples > len(self.samples)
+            or not self.has_data[offset : offset + num_samples].all()
+        ):
+            msg = f"No data for samples [{start}, {start + num_samples})"
+            raise OSError(msg)
+        return self.samples[offset : offset + num_samples]
+
+    def get_continuous_blocks(self, start: int, end: int, channel: str) -> dict:
+        """Blocks of samples with data in [start, end], end inclusive."""
+        first = max(start - self.start, 0)
+        last = min(end + 1 - self.start, len(self.samples))
+        if first >= last:
+            return {}
+        edges = np.diff(self.has_data[first:last].astype(np.int8), prepend=0, append=0)
+        block_starts = np.flatnonzero(edges == 1)
+        block_ends = np.flatnonzero(edges == -1)
+        return {
+            int(self.start + first + block_start): int(block_end - block_start)
+            for block_start, block_end in zip(block_starts, block_ends, strict=True)
+        }
+
+
+@functools.lru_cache(maxsize=1)
+def _open_reader(drf_path: str) -> DigitalRFReader:
+    return DigitalRFReader(drf_path)
+
+
+def process_segment(
+    task: SinglePassTask, segment: int, reader: DigitalRFReader | None = None
+) -> dict[str, Any]:
+    """Read a segment of the capture once, and compute all its results.
+
+    Without a reader, one is opened from `task.drf_path` (once per process), so
+    this can run in a separate process.
+
+    Returns:
+        dict: The "segment", and its results: the "waterfall" spectra and slice
+            runs with their `PowerStats`, the "spectrogram" slice sums (see
+            `spectrogram_slice_sums`), and the "seconds" spent in each stage
+    """
+    if reader is None:
+        reader = _open_reader(str(task.drf_path))
+    first_sample, end_sample = task.segment_samples(segment)
+    seconds = dict.fromkeys(_STAGES, 0.0)
+    result: dict[str, Any] = {"segment": segment, "seconds": seconds}
+
+    # STFT windows of the slices of the segment reach into its neighbors
+    margin = 0
+    if task.spectrogram is not None:
+        margin = task.spectrogram.fft_size + task.spectrogram.hop_size
+    started = time.perf_counter()
+    segment_reader = _SegmentReader(
+        reader,
+        task.channel,
+        task.start_sample + max(first_sample - margin, 0),
+        task.start_sample + min(end_sample + margin, task.total_samples),
+    )
+    seconds["read"] = time.perf_counter() - started
+
+    if task.waterfall_params is not None:
+        started = time.perf_counter()
+        params = waterfall_slice_params(task.waterfall_params).model_copy(
+            update={"reader": segment_reader}
+        )
+        spectra, slice_runs = compute_waterfall_matrix(
+            params,
+            first_sample // task.samples_per_slice,
+            end_sample // task.samples_per_slice,
+        )
+        power_stats = PowerStats()
+        power_stats.add(spectra)
+        result["waterfall"] = {
+            "spectra": spectra,
+            "slice_runs": slice_runs,
+            "power_stats": power_stats,
+        }
+        seconds["waterfall"] = time.perf_counter() - started
+
+    if task.spectrogram is not None:
+        started = time.perf_counter()
+        layout = task.spectrogram
+        # STFT slices are assigned to the segment holding the sample they start at
+        first_slice = (
+            layout.slice_range[0]
+            if first_sample == 0
+            else -(-first_sample // layout.hop_size)
+        )
+        end_slice = (
+            layout.slice_range[1]
+            if end_sample == task.total_samples
+            else -(-end_sample // layout.hop_size)
+        )
+        result["spectrogram"] = spectrogram_slice_sums(
+            layout, segment_reader, first_slice, end_slice
+        )
+        seconds["spectrogram"] = time.perf_counter() - started
+    return result
+
+
+def get_post_processing_max_workers() -> int:
+    """Processes to spread segments across, from POST_PROCESSING_MAX_WORKERS.
+
+    0 sizes the pool to the cores available to the worker. Daemonic processes,
+    such as prefork celery workers, cannot start child processes: segments are
+    then processed in the worker itself.
+    """
+    max_workers = int(getattr(settings, "POST_PROCESSING_MAX_WORKERS", 0))
+    if max_workers <= 0:
+        max_workers = os.process_cpu_count() or 1
+    if max_workers > 1 and multiprocessing.current_process().daemon:
+        logger.info("Post-processing in a daemonic process: processing segments in it")
+        return 1
+    return max_workers
+
+
+class _InProcessExecutor(Executor):
+    """Runs submitted calls right away, for processing without a pool."""
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:  # noqa: BLE001 - raised by future.result()
+            future.set_exception(e)
+        return future
+
+
+def _iter_segment_results(
+    task: SinglePassTask, reader: DigitalRFReader, max_workers: int
+):
+    """Results of the segments of a capture, in order, with a bounded look-ahead."""
+    if max_workers > 1:
+        executor: Executor = ProcessPoolExecutor(max_workers=max_workers)
+        process = functools.partial(process_segment, task)
+    else:
+        executor = _InProcessExecutor()
+        process = functools.partial(process_segment, task, reader=reader)
+    in_flight: collections.deque[Future] = collections.deque()
+    segments = iter(range(task.num_segments))
+    with executor:
+        for segment in segments:
+            in_flight.append(executor.submit(process, segment))
+            if len(in_flight) >= max_workers * _SEGMENTS_IN_FLIGHT_PER_WORKER:
+                break
+        while in_flight:
+            result = in_flight.popleft().result()
+            segment = next(segments, None)
+            if segment is not None:
+                in_flight.append(executor.submit(process, segment))
+            yield result
+
+
+def process_capture_single_pass(
+    drf_path: Path,
+    channel: str,
+    *,
+    waterfall: bool = True,
+    spectrogram_parameters: dict[str, Any] | None = None,
+    max_workers: int | None = None,
+) -> dict[str, Any]:
+    """Compute the waterfall and spectrogram of a capture, reading it once.
+
+    Args:
+        drf_path: Path to the DigitalRF directory
+        channel: Channel name to process
+        waterfall: Whether to compute the waterfall
+        spectrogram_parameters: Parameters of the spectrogram (see
+            `generate_spectrogram_from_drf`); None to skip it
+        max_workers: Processes to spread segments across; defaults to
+            `get_post_processing_max_workers()`
+
+    Returns:
+        dict: For each computed result, "waterfall" with the "file_path" of the
+            stored waterfall (see `waterfall_binary`) and "spectrogram" with the
+            "image_path" of its image, along with their "metadata"; and the
+            "throughput" of the pass, in samples per second.
+
+    Raises:
+        SourceDataError: If the waterfall is requested and no slice has data.
+    """
+    if max_workers is None:
+        max_workers = get_post_processing_max_workers()
+    params = validate_waterfall_data(drf_path, channel, FFT_SIZE)
+    total_slices = params.total_samples // params.samples_per_slice
+    spectrogram_options = (
+        SpectrogramOptions.model_validate(spectrogram_parameters)
+        if spectrogram_parameters is not None
+        else None
+    )
+    task = SinglePassTask(
+        drf_path=drf_path,
+        channel=channel,
+        start_sample=params.start_sample,
+        total_samples=params.total_samples,
+        samples_per_slice=params.samples_per_slice,
+        waterfall_params=(stored_slice_params(params) if waterfall else None),
+        spectrogram=(
+            spectrogram_layout(drf_path, params, spectrogram_options)
+            if spectrogram_options is not None
+            else None
+        ),
+    )
+    logger.info(
+        f"Processing {task.num_segments} segments of channel {channel} with "
+        f"{max_workers} workers (waterfall: {waterfall}, spectrogram: "
+        f"{spectrogram_options is not None})"
+    )
+
+    started = time.perf_counter()
+    seconds = dict.fromkeys(_STAGES, 0.0)
+    slice_runs: list[tuple[int, int]] = []
+    slices_processed = 0
+    power_stats = PowerStats()
+    layout = task.spectrogram
+    column_sums = np.zeros((layout.fft_size, layout.num_columns)) if layout else None
+    column_counts = np.zeros(layout.num_columns) if layout else None
+
+    with tempfile.TemporaryFile() as rows_file:
+        for result in _iter_segment_results(task, params.reader, max_workers):
+            for stage in _STAGES:
+                seconds[stage] += result["seconds"][stage]
+            if "waterfall" in result:
+                segment_waterfall = result["waterfall"]
+                rows_file.write(segment_waterfall["spectra"].astype("<f4").tobytes())
+                for first_index, count in segment_waterfall["slice_runs"]:
+                    add_slice_run(slice_runs, first_index, count)
+                slices_processed += len(segment_waterfall["spectra"])
+                power_stats.merge(segment_waterfall["power_stats"])
+            if "spectrogram" in result:
+                first_column, sums, counts = result["spectrogram"]
+                end_column = first_column + len(counts)
+                column_sums[:, first_column:end_column] += sums
+                column_counts[first_column:end_column] += counts
+        elapsed = time.perf_counter() - started
+
+        throughput = _throughput(task, seconds, elapsed, max_workers)
+        logger.info(f"Processed channel {channel} in {elapsed:.1f}s: {throughput}")
+        results: dict[str, Any] = {"throughput": throughput}
+
+        if waterfall and slices_processed == 0:
+            msg = "No valid waterfall slices found"
+            raise SourceDataError(msg)
+        if layout is not None:
+            results["spectrogram"] = render_spectrogram(
+                column_sums / column_counts, layout, params, spectrogram_options
+            )
+        if waterfall:
+            metadata = processed_waterfall_metadata(
+                params,
+                total_slices,
+                slices_processed,
+                total_slices - slices_processed,
+                power_stats,
+            )
+            with tempfile.NamedTemporaryFile(
+                mode="wb", suffix=WATERFALL_STORAGE_SUFFIX, delete=False
+            ) as waterfall_file:
+                waterfall_file.write(
+                    stored_waterfall_prefix(
+                        (slices_processed, params.fft_size),
+                        slice_runs,
+                        header={
+                            "total_slices": total_slices,
+                            "metadata": metadata,
+                            "slice_params": task.waterfall_params,
+                        },
+                    )
+                )
+                rows_file.seek(0)
+                shutil.copyfileobj(rows_file, waterfall_file)
+            results["waterfall"] = {
+                "file_path": waterfall_file.name,
+                "metadata": metadata,
+            }
+    return results
+
+
+def _throughput(
+    task: SinglePassTask,
+    seconds: dict[str, float],
+    elapsed: float,
+    max_workers: int,
+) -> dict[str, Any]:
+    """Samples per second of the pass, and of each stage in one worker."""
+    samples_per_second = {
+        stage: task.total_samples / stage_seconds
+        for stage, stage_seconds in seconds.items()
+        if stage_seconds > 0
+    }
+    samples_per_second["total"] = task.total_samples / elapsed if elapsed > 0 else 0.0
+    return {
+        "workers": max_workers,
+        "segments": task.num_segments,
+        "samples_per_second": samples_per_second,
+    }
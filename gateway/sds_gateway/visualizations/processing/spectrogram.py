@@ -1,28 +1,266 @@
 """Spectrogram processing logic for visualizations."""
 
+import functools
+import math
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 import numpy as np
+from digital_rf import DigitalRFReader
+from django.conf import settings
 from loguru import logger
+from pydantic import BaseModel
+from pydantic import ConfigDict
 from scipy.signal import ShortTimeFFT
 from scipy.signal.windows import gaussian
 
+from sds_gateway.visualizations.errors import SourceDataError
+
+from .utils import DigitalRFParams
 from .utils import validate_digitalrf_data
 
+# Samples read at once while computing spectrograms, bounding their memory use
+SPECTROGRAM_CHUNK_SAMPLES = 2**20
+# Resolution of saved spectrogram images
+SPECTROGRAM_IMAGE_DPI = 150
+
+
+class SpectrogramLayout(BaseModel):
+    """Parameters of a spectrogram computed in chunks of output columns.
+
+    The STFT slices of the capture are averaged into `num_columns` columns of
+    consecutive slices, one per horizontal pixel of the output image at most.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    drf_path: Path
+    channel: str
+    start_sample: int
+    total_samples: int
+    sample_rate: float
+    fft_size: int
+    std_dev: float
+    hop_size: int
+    max_columns: int
+
+    def short_time_fft(self) -> ShortTimeFFT:
+        """Short-time Fourier transform of the spectrogram."""
+        return ShortTimeFFT(
+            gaussian(self.fft_size, std=self.std_dev, sym=True),
+            hop=self.hop_size,
+            fs=self.sample_rate,
+            mfft=self.fft_size,
+            fft_mode="centered",
+        )
+
+    @functools.cached_property
+    def slice_range(self) -> tuple[int, int]:
+        """Indices of the first and past the last STFT slices of the capture."""
+        short_time_fft = self.short_time_fft()
+        return short_time_fft.p_min, short_time_fft.p_max(self.total_samples)
+
+    @property
+    def num_slices(self) -> int:
+        """Number of STFT slices of the capture."""
+        first_slice, end_slice = self.slice_range
+        return end_slice - first_slice
+
+    @property
+    def num_columns(self) -> int:
+        """Number of columns of the spectrogram."""
+        return max(1, min(self.max_columns, self.num_slices))
+
+    def first_slice_of(self, column: int) -> int:
+        """Index of the first STFT slice averaged into a column."""
+        return self.slice_range[0] + math.ceil(
+            column * self.num_slices / self.num_columns
+        )
+
+
+def _read_padded_samples(
+    reader: DigitalRFReader, layout: SpectrogramLayout, start: int, end: int
+) -> np.ndarray:
+    """Samples [start, end) of the capture, zero-padded outside of it and in gaps."""
+    samples = np.zeros(end - start, dtype=np.complex64)
+    read_start = max(start, 0)
+    read_end = min(end, layout.total_samples)
+    if read_start >= read_end:
+        return samples
+    try:
+        samples[read_start - start : read_end - start] = reader.read_vector(
+            layout.start_sample + read_start,
+            read_end - read_start,
+            layout.channel,
+            0,
+        )
+    except OSError:
+        # data gaps: only the continuous blocks can be read
+        continuous_blocks = reader.get_continuous_blocks(
+            layout.start_sample + read_start,
+            layout.start_sample + read_end - 1,
+            layout.channel,
+        )
+        for block_start, block_length in continuous_blocks.items():
+            offset = block_start - layout.start_sample
+            samples[offset - start : offset - start + block_length] = (
+                reader.read_vector(block_start, block_length, layout.channel, 0)
+            )
+    return samples
+
+
+def spectrogram_slice_sums(
+    layout: SpectrogramLayout,
+    reader: DigitalRFReader,
+    first_slice: int,
+    end_slice: int,
+) -> tuple[int, np.ndarray, np.ndarray]:
+    """Sum the STFT slices [first_slice, end_slice) into the columns they belong to.
+
+    Samples are read in chunks of about SPECTROGRAM_CHUNK_SAMPLES, overlapping by
+    one STFT window. Columns spanning past either end of the range are partial:
+    their sums are completed by the slices of the neighboring ranges.
+
+    Returns:
+        tuple: The first column the slices belong to, and the (fft_size, columns)
+            sums and (columns,) counts of the slices summed into each column
+    """
+    short_time_fft = layout.short_time_fft()
+    hop_size = layout.hop_size
+    # slices before a chunk whose windows reach into it
+    lead_slices = math.ceil(short_time_fft.m_num_mid / hop_size)
+    chunk_slices = max(1, SPECTROGRAM_CHUNK_SAMPLES // hop_size)
+
+    def column_of(slice_index: np.ndarray | int) -> np.ndarray | int:
+        return (
+            (slice_index - layout.slice_range[0])
+            * layout.num_columns
+            // layout.num_slices
+        )
+
+    first_column = int(column_of(first_slice))
+    num_columns = (
+        int(column_of(end_slice - 1)) - first_column + 1
+        if end_slice > first_slice
+        else 0
+    )
+    sums = np.zeros((layout.fft_size, num_columns))
+    counts = np.zeros(num_columns)
+    for chunk_start in range(first_slice, end_slice, chunk_slices):
+        chunk_end = min(chunk_start + chunk_slices, end_slice)
+        samples = _read_padded_samples(
+            reader,
+            layout,
+            (chunk_start - lead_slices) * hop_size,
+            (chunk_end - 1) * hop_size - short_time_fft.m_num_mid + layout.fft_size,
+        )
+        chunk = short_time_fft.spectrogram(
+            samples, p0=lead_slices, p1=chunk_end - chunk_start + lead_slices
+        )
+        # sum the slices of each column
+        columns = column_of(np.arange(chunk_start, chunk_end)) - first_column
+        column_starts = np.flatnonzero(np.diff(columns, prepend=-1))
+        sums[:, columns[column_starts]] += np.add.reduceat(chunk, column_starts, axis=1)
+        counts[columns[column_starts]] += np.diff(column_starts, append=len(columns))
+    return first_column, sums, counts
+
+
+def compute_spectrogram_columns(
+    layout: SpectrogramLayout,
+    first_column: int,
+    end_column: int,
+    reader: DigitalRFReader | None = None,
+) -> tuple[int, np.ndarray]:
+    """Compute the columns [first_column, end_column) of a spectrogram.
+
+    Without a reader, one is opened from `layout.drf_path`, so this can run in
+    a separate process.
+
+    Returns:
+        tuple: first_column, and the (fft_size, end_column - first_column) array
+            of the power of the columns
+    """
+    if reader is None:
+        reader = DigitalRFReader(str(layout.drf_path))
+    _, sums, counts = spectrogram_slice_sums(
+        layout,
+        reader,
+        layout.first_slice_of(first_column),
+        layout.first_slice_of(end_column),
+    )
+    return first_column, sums / counts
+
+
+def compute_spectrogram(
+    layout: SpectrogramLayout,
+    reader: DigitalRFReader | None = None,
+    max_workers: int = 1,
+) -> np.ndarray:
+    """Compute a spectrogram in chunks, with memory bounded by its chunk and size.
+
+    Args:
+        layout: Parameters of the spectrogram
+        reader: Reader of the capture, used when computing in this process
+        max_workers: Number of processes computing chunks of columns; with 1,
+            chunks are computed in this process
+
+    Returns:
+        np.ndarray: (fft_size, num_columns) array of the power of the spectrogram
+
+    Raises:
+        SourceDataError: If the capture has no samples to compute slices from
+    """
+    if layout.num_slices <= 0:
+        msg = "No samples to compute a spectrogram from"
+        raise SourceDataError(msg)
+    num_columns = layout.num_columns
+    # columns computed per task, covering about one chunk of samples
+    chunk_slices = max(1, SPECTROGRAM_CHUNK_SAMPLES // layout.hop_size)
+    task_columns = max(1, chunk_slices * num_columns // layout.num_slices)
+    first_columns = range(0, num_columns, task_columns)
+    end_columns = [
+        min(first_column + task_columns, num_columns) for first_column in first_columns
+    ]
+
+    spectrogram = np.empty((layout.fft_size, num_columns))
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(
+                executor.map(
+                    functools.partial(compute_spectrogram_columns, layout),
+                    first_columns,
+                    end_columns,
+                )
+            )
+    else:
+        results = [
+            compute_spectrogram_columns(layout, first_column, end_column, reader)
+            for first_column, end_column in zip(first_columns, end_columns, strict=True)
+        ]
+    for first_column, columns in results:
+        spectrogram[:, first_column : first_column + columns.shape[1]] = columns
+    return spectrogram
+
+
+def _figure_size_inches(dimensions: dict[str, Any] | None) -> tuple[float, float]:
+    """Size of the spectrogram figure, from the requested dimensions in pixels."""
+    if dimensions and "width" in dimensions and "height" in dimensions:
+        # Convert pixels to inches (assuming 100 DPI for conversion)
+        return dimensions["width"] / 100.0, dimensions["height"] / 100.0
+    return 10.0, 6.0
+
 
 def _generate_spectrogram_plot(
     spectrogram, extent, center_freq, channel, colormap, dimensions
 ):
     """Generate the matplotlib plot for the spectrogram."""
     # Create figure with requested dimensions or default
+    width_inches, height_inches = _figure_size_inches(dimensions)
     if dimensions and "width" in dimensions and "height" in dimensions:
-        # Convert pixels to inches (assuming 100 DPI for conversion)
-        width_inches = dimensions["width"] / 100.0
-        height_inches = dimensions["height"] / 100.0
         logger.info(
             f"Using requested dimensions: "
             f"{dimensions['width']}x{dimensions['height']} pixels"
@@ -30,8 +268,6 @@ def _generate_spectrogram_plot(
         )
     else:
         # Use default dimensions
-        width_inches = 10.0
-        height_inches = 6.0
         logger.info(
             f"Using default dimensions: {width_inches:.1f}x{height_inches:.1f} inches"
         )
@@ -64,78 +300,63 @@ def _generate_spectrogram_plot(
     return figure
 
 
-def generate_spectrogram_from_drf(
-    drf_path: Path, channel: str, processing_parameters: dict[str, Any] | None = None
-) -> dict[str, Any]:
-    """Generate a spectrogram from DigitalRF data.
-
-    Args:
-        drf_path: Path to the DigitalRF directory
-        channel: Channel name to process
-        processing_parameters: Dict containing spectrogram parameters
-            (fft_size, std_dev, hop_size, colormap)
-
-    Returns:
-        Dict with status and spectrogram data
-    """
-    logger.info(f"Generating spectrogram from DigitalRF data for channel {channel}")
+class SpectrogramOptions(BaseModel):
+    """Spectrogram parameters of a processing request, with their defaults."""
 
-    # Spectrogram parameters - use passed parameters or defaults
-    if processing_parameters is None:
-        processing_parameters = {}
+    fft_size: int = 1024
+    std_dev: float = 100
+    hop_size: int = 500
+    colormap: str = "magma"
+    dimensions: dict[str, Any] | None = None
 
-    fft_size = processing_parameters.get("fft_size", 1024)
-    std_dev = processing_parameters.get("std_dev", 100)
-    hop_size = processing_parameters.get("hop_size", 500)
-    colormap = processing_parameters.get("colormap", "magma")
-    dimensions = processing_parameters.get("dimensions")
 
-    # Validate DigitalRF data and get validated parameters
-    params = validate_digitalrf_data(drf_path, channel, fft_size)
+def spectrogram_layout(
+    drf_path: Path, params: DigitalRFParams, options: SpectrogramOptions
+) -> SpectrogramLayout:
+    """Layout of the spectrogram of a capture, one column per pixel at most."""
+    width_inches, _ = _figure_size_inches(options.dimensions)
+    return SpectrogramLayout(
+        drf_path=drf_path,
+        channel=params.channel,
+        start_sample=params.start_sample,
+        total_samples=params.total_samples,
+        sample_rate=params.sample_rate,
+        fft_size=options.fft_size,
+        std_dev=options.std_dev,
+        hop_size=options.hop_size,
+        max_columns=int(width_inches * SPECTROGRAM_IMAGE_DPI),
+    )
 
-    # Extract values from validated parameters
-    reader = params.reader
-    start_sample = params.start_sample
-    total_samples = params.total_samples
-    sample_rate = params.sample_rate
-    center_freq = params.center_freq
 
-    logger.info(
-        f"Using spectrogram parameters: fft_size={params.fft_size}, "
-        f"std_dev={std_dev}, hop_size={hop_size}, colormap={colormap}, "
-        f"dimensions={dimensions}"
-    )
+def render_spectrogram(
+    spectrogram: np.ndarray,
+    layout: SpectrogramLayout,
+    params: DigitalRFParams,
+    options: SpectrogramOptions,
+) -> dict[str, Any]:
+    """Save the image of a computed spectrogram to a temporary PNG file.
 
+    Returns:
+        Dict with the "image_path" of the image and its "metadata"
+    """
     # Generate spectrogram using matplotlib
     mpl.use("Agg")  # Use non-interactive backend
 
-    data_array = reader.read_vector(start_sample, total_samples, channel, 0)
-
-    # Create Gaussian window
-    gaussian_window = gaussian(params.fft_size, std=std_dev, sym=True)
-
-    # Create ShortTimeFFT object
-    short_time_fft = ShortTimeFFT(
-        gaussian_window,
-        hop=hop_size,
-        fs=sample_rate,
-        mfft=params.fft_size,
-        fft_mode="centered",
-    )
-
-    # Generate spectrogram
-    spectrogram = short_time_fft.spectrogram(data_array)
-
-    extent = short_time_fft.extent(total_samples)
+    extent = layout.short_time_fft().extent(layout.total_samples)
 
     # Generate the spectrogram plot
     figure = _generate_spectrogram_plot(
-        spectrogram, extent, center_freq, channel, colormap, dimensions
+        spectrogram,
+        extent,
+        params.center_freq,
+        params.channel,
+        options.colormap,
+        options.dimensions,
     )
 
     # Save to temporary file
     with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp_file:
-        figure.savefig(tmp_file.name, dpi=150, bbox_inches="tight")
+        figure.savefig(tmp_file.name, dpi=SPECTROGRAM_IMAGE_DPI, bbox_inches="tight")
         image_path = tmp_file.name
 
     # Clean up matplotlib figure
@@ -149,11 +370,12 @@ def generate_spectrogram_from_drf(
         "max_frequency": params.max_frequency,
         "total_samples": params.total_samples,
         "samples_processed": params.total_samples,
-        "fft_size": params.fft_size,
-        "window_std_dev": std_dev,
-        "hop_size": hop_size,
-        "colormap": colormap,
-        "dimensions": dimensions,
+        "fft_size": layout.fft_size,
+        "window_std_dev": options.std_dev,
+        "hop_size": options.hop_size,
+        "time_columns": layout.num_columns,
+        "colormap": options.colormap,
+        "dimensions": options.dimensions,
         "channel": params.channel,
     }
 
@@ -161,3 +383,43 @@ def generate_spectrogram_from_drf(
         "image_path": image_path,
         "metadata": metadata,
     }
+
+
+def generate_spectrogram_from_drf(
+    drf_path: Path, channel: str, processing_parameters: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Generate a spectrogram from DigitalRF data.
+
+    Args:
+        drf_path: Path to the DigitalRF directory
+        channel: Channel name to process
+        processing_parameters: Dict containing spectrogram parameters
+            (fft_size, std_dev, hop_size, colormap)
+
+    Returns:
+        Dict with status and spectrogram data
+    """
+    logger.info(f"Generating spectrogram from DigitalRF data for channel {channel}")
+
+    # Spectrogram parameters - use passed parameters or defaults
+    options = SpectrogramOptions.model_validate(processing_parameters or {})
+
+    # Validate DigitalRF data and get validated parameters
+    params = validate_digitalrf_data(drf_path, channel, options.fft_size)
+
+    logger.info(
+        f"Using spectrogram parameters: fft_size={params.fft_size}, "
+        f"std_dev={options.std_dev}, hop_size={options.hop_size}, "
+        f"colormap={options.colormap}, dimensions={options.dimensions}"
+    )
+
+    # Compute the spectrogram in chunks of samples, averaging STFT slices down
+    # to the width of the image, instead of reading the whole capture
+    layout = spectrogram_layout(drf_path, params, options)
+    spectrogram = compute_spectrogram(
+        layout,
+        reader=params.reader,
+        max_workers=getattr(settings, "SPECTROGRAM_MAX_WORKERS", 1),
+    )
+
+    return render_spectrogram(spectrogram, layout, params, options)
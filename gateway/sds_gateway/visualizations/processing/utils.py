@@ -3,7 +3,9 @@
 import contextlib
 import datetime
 import os
+import shutil
 import tempfile
+import threading
 from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures import as_completed
 from pathlib import Path
@@ -13,6 +15,7 @@ from typing import cast
 import h5py
 from digital_rf import DigitalRFReader
 from django.conf import settings
+from django.core.files import File
 from loguru import logger
 from pydantic import BaseModel
 from pydantic import ConfigDict
@@ -24,6 +27,16 @@ from pydantic import model_validator
 from sds_gateway.api_methods.utils.minio_client import get_minio_client
 from sds_gateway.visualizations.errors import ConfigurationError
 from sds_gateway.visualizations.errors import SourceDataError
+from sds_gateway.visualizations.processing.drf_cache import capture_files_fingerprint
+from sds_gateway.visualizations.processing.drf_cache import discard_entry
+from sds_gateway.visualizations.processing.drf_cache import drf_cache_lock
+from sds_gateway.visualizations.processing.drf_cache import evict_drf_cache
+from sds_gateway.visualizations.processing.drf_cache import find_cached_entry
+from sds_gateway.visualizations.processing.drf_cache import get_cached_drf_path
+from sds_gateway.visualizations.processing.drf_cache import get_drf_cache_dir
+from sds_gateway.visualizations.processing.drf_cache import get_drf_staging_dir
+from sds_gateway.visualizations.processing.drf_cache import read_entry_manifest
+from sds_gateway.visualizations.processing.drf_cache import record_entry
 
 
 class DigitalRFParams(BaseModel):
@@ -160,18 +173,6 @@ def validate_digitalrf_data(
     )
 
 
-def _get_drf_cache_dir() -> Path:
-    """Get the directory for caching reconstructed DRF files.
-
-    Uses DRF_CACHE_DIR (outside MEDIA_ROOT) so cached capture data is never
-    exposed via MEDIA_URL. Default is <project_root>/cache/drf; override with
-    DRF_CACHE_DIR in production (e.g. /var/cache/sds-gateway/drf).
-    """
-    cache_dir = Path(settings.DRF_CACHE_DIR)
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    return cache_dir
-
-
 def _find_drf_root(directory: Path) -> Path | None:
     """Find DigitalRF root directory by locating drf_properties.h5.
 
@@ -198,6 +199,13 @@ def _find_drf_root(directory: Path) -> Path | None:
 # Tune based on MinIO/server capacity; 8-16 is usually safe.
 DRF_DOWNLOAD_MAX_WORKERS = 8
 
+# Background downloads of DRF files ahead of streamed ranges
+_prefetch_executor = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="drf-prefetch"
+)
+_prefetch_lock = threading.Lock()
+_prefetching_paths: set[Path] = set()
+
 
 def _download_one_drf_file(
     minio_client: Any,
@@ -235,26 +243,13 @@ def _download_one_drf_file(
                 logger.warning("Could not remove temp file %s", temp_path)
 
 
-def get_cached_drf_path(capture_uuid: str) -> Path | None:
-    """Check if reconstructed DRF files are already cached.
-
-    Returns:
-        Path to cached DRF root directory if it exists and is valid, None otherwise.
-    """
-    cache_dir = _get_drf_cache_dir()
-    capture_cache = cache_dir / str(capture_uuid)
-
-    drf_root = _find_drf_root(capture_cache)
-    if drf_root:
-        logger.info(f"Using cached DRF files at: {drf_root}")
-    return drf_root
-
-
 def reconstruct_drf_files(capture, capture_files, temp_path: Path) -> Path:
     """Reconstruct DigitalRF directory structure from SDS files.
 
-    This function now supports persistent caching - if files are already cached,
-    it returns the cached path immediately.
+    Reconstructed captures are kept in the DRF cache (see `drf_cache`): when the
+    same file set is already cached, its path is returned immediately. Workers
+    reconstructing the same capture wait for each other, and the least recently
+    used captures are evicted to keep the cache within DRF_CACHE_MAX_BYTES.
 
     Note:
         The ``temp_path`` parameter is **intentionally ignored**. It is retained
@@ -274,13 +269,101 @@ def reconstruct_drf_files(capture, capture_files, temp_path: Path) -> Path:
         SourceDataError: If reconstruction fails due to data issues
     """
     # Check cache first
-    cached_path = get_cached_drf_path(capture.uuid)
+    fingerprint = capture_files_fingerprint(capture_files)
+    cached_path = get_cached_drf_path(capture.uuid, fingerprint)
     if cached_path:
         return cached_path
 
-    logger.info("Reconstructing DigitalRF directory structure (not cached)")
+    with drf_cache_lock(capture.uuid):
+        # another worker may have reconstructed it while this one waited
+        cached_path = find_cached_entry(capture.uuid, fingerprint)
+        if cached_path:
+            return cached_path
+        # files of outdated entries may not match the file set; the files of
+        #   partial entries of this file set are reused
+        manifest = read_entry_manifest(capture.uuid)
+        if manifest is None or manifest.get("fingerprint") != fingerprint:
+            discard_entry(capture.uuid)
+
+        logger.info("Reconstructing DigitalRF directory structure (not cached)")
+        _check_drf_properties_file(capture_files)
+        _download_drf_files(capture.uuid, capture_files)
+        drf_root = _get_drf_root(capture.uuid)
+        record_entry(capture.uuid, fingerprint, drf_root)
+
+    evict_drf_cache(keep={str(capture.uuid)})
+    return drf_root
+
+
+def reconstruct_drf_range(
+    capture,
+    capture_files,
+    start_offset: int,
+    end_offset: int,
+    *,
+    prefetch_samples: int = 0,
+) -> Path:
+    """Reconstruct only the DigitalRF files needed to read a range of samples.
 
-    # First, check if we have the required drf_properties.h5 file
+    Downloads the non-data files (properties and metadata), the first and last
+    rf@ data files for the bounds of the capture, and the data files covering
+    samples [start_offset, end_offset), counted from the start of the capture.
+    Data files of the following `prefetch_samples` are downloaded in the
+    background. DigitalRFReader reads data files that were not downloaded as
+    data gaps, so only the requested range should be read from the result.
+
+    Entries of the DRF cache that are complete are used as they are.
+
+    Returns:
+        Path: Path to the DigitalRF root directory
+
+    Raises:
+        SourceDataError: If reconstruction fails due to data issues
+    """
+    fingerprint = capture_files_fingerprint(capture_files)
+    cached_path = get_cached_drf_path(capture.uuid, fingerprint)
+    if cached_path:
+        return cached_path
+
+    data_files: list[tuple[int, Any]] = []
+    other_files = []
+    for file_obj in capture_files:
+        file_ms = _drf_data_file_ms(file_obj.name)
+        if file_ms is None:
+            other_files.append(file_obj)
+        else:
+            data_files.append((file_ms, file_obj))
+    data_files.sort(key=lambda data_file: data_file[0])
+    bound_files = [data_files[0][1], data_files[-1][1]] if data_files else []
+
+    with drf_cache_lock(capture.uuid):
+        manifest = read_entry_manifest(capture.uuid)
+        if manifest is None or manifest.get("fingerprint") != fingerprint:
+            discard_entry(capture.uuid)
+        _check_drf_properties_file(capture_files)
+        _download_drf_files(capture.uuid, [*other_files, *bound_files])
+        drf_root = _get_drf_root(capture.uuid)
+        range_files = _drf_data_files_in_range(
+            drf_root / capture.channel, data_files, start_offset, end_offset
+        )
+        _download_drf_files(capture.uuid, range_files)
+        record_entry(capture.uuid, fingerprint, drf_root, complete=False)
+
+    if prefetch_samples > 0:
+        prefetch_files = _drf_data_files_in_range(
+            drf_root / capture.channel,
+            data_files,
+            end_offset,
+            end_offset + prefetch_samples,
+        )
+        _prefetch_drf_files(capture.uuid, fingerprint, drf_root, prefetch_files)
+
+    evict_drf_cache(keep={str(capture.uuid)})
+    return drf_root
+
+
+def _check_drf_properties_file(capture_files) -> None:
+    """Raise SourceDataError when the capture has no drf_properties.h5 file."""
     has_properties_file = any(
         file_obj.name == "drf_properties.h5" for file_obj in capture_files
     )
@@ -292,17 +375,63 @@ def reconstruct_drf_files(capture, capture_files, temp_path: Path) -> Path:
         logger.error(error_msg)
         raise SourceDataError(error_msg)
 
-    minio_client = get_minio_client()
-    bucket_name = settings.AWS_STORAGE_BUCKET_NAME
 
-    # Use persistent cache directory instead of temp directory
-    cache_dir = _get_drf_cache_dir()
-    capture_dir = cache_dir / str(capture.uuid)
-    capture_dir.mkdir(parents=True, exist_ok=True)
+def _drf_data_file_ms(name: str) -> int | None:
+    """Start time in milliseconds of a rf@SECONDS.MILLISECONDS.h5 data file."""
+    # imported here: temporal_filtering imports models, and this module is
+    #   imported while the app registry is being populated
+    from sds_gateway.api_methods.helpers.temporal_filtering import (
+        DRF_RF_FILENAME_PATTERN,
+    )
 
-    # Build list of (file_obj, file_path) that need downloading (skip existing)
-    to_download: list[tuple[Any, Path]] = []
-    for file_obj in capture_files:
+    match = DRF_RF_FILENAME_PATTERN.match(name)
+    if match is None:
+        return None
+    return int(match.group(1)) * 1000 + int(match.group(2))
+
+
+def _drf_data_files_in_range(
+    channel_dir: Path,
+    data_files: list[tuple[int, Any]],
+    start_offset: int,
+    end_offset: int,
+) -> list[Any]:
+    """Data files holding samples [start_offset, end_offset) of a capture.
+
+    Sample offsets are converted to times from the start of the first data file,
+    which may start up to one file cadence before the first sample: one more
+    file cadence is included on each side of the range.
+    """
+    if not data_files:
+        return []
+    with h5py.File(channel_dir / "drf_properties.h5", "r") as f:
+        sample_rate_numerator = int(f.attrs["sample_rate_numerator"])
+        sample_rate_denominator = int(f.attrs["sample_rate_denominator"])
+        file_cadence_ms = int(f.attrs["file_cadence_millisecs"])
+
+    first_file_ms = data_files[0][0]
+
+    def offset_ms(offset: int) -> int:
+        return (
+            first_file_ms
+            + offset * 1000 * sample_rate_denominator // sample_rate_numerator
+        )
+
+    range_start_ms = offset_ms(start_offset) - file_cadence_ms
+    range_end_ms = offset_ms(end_offset) + file_cadence_ms
+    return [
+        file_obj
+        for file_ms, file_obj in data_files
+        if range_start_ms < file_ms <= range_end_ms
+    ]
+
+
+def _drf_file_paths(capture_uuid: str, files) -> list[tuple[Any, Path]]:
+    """Paths of files in the DRF cache entry of a capture."""
+    cache_dir = get_drf_cache_dir()
+    capture_dir = cache_dir / str(capture_uuid)
+    file_paths: list[tuple[Any, Path]] = []
+    for file_obj in files:
         rel_dir = file_obj.directory.lstrip("/") if file_obj.directory else ""
         file_path = (capture_dir / rel_dir / file_obj.name).resolve()
         if not file_path.is_relative_to(cache_dir):
@@ -312,9 +441,25 @@ def reconstruct_drf_files(capture, capture_files, temp_path: Path) -> Path:
             )
             logger.error(error_msg)
             raise SourceDataError(error_msg)
-        if file_path.exists():
-            continue
-        to_download.append((file_obj, file_path))
+        file_paths.append((file_obj, file_path))
+    return file_paths
+
+
+def _download_drf_files(capture_uuid: str, files) -> None:
+    """Download files of a capture missing from its DRF cache entry."""
+    minio_client = get_minio_client()
+    bucket_name = settings.AWS_STORAGE_BUCKET_NAME
+
+    # Use persistent cache directory instead of temp directory
+    capture_dir = get_drf_cache_dir() / str(capture_uuid)
+    capture_dir.mkdir(parents=True, exist_ok=True)
+
+    # Build list of (file_obj, file_path) that need downloading (skip existing)
+    to_download = [
+        (file_obj, file_path)
+        for file_obj, file_path in _drf_file_paths(capture_uuid, files)
+        if not file_path.exists()
+    ]
 
     # Download missing files in parallel
     total = len(to_download)
@@ -347,8 +492,11 @@ def reconstruct_drf_files(capture, capture_files, temp_path: Path) -> Path:
                     msg = f"Failed to download {file_obj.name}: {e}"
                     raise SourceDataError(msg) from e
 
+
+def _get_drf_root(capture_uuid: str) -> Path:
+    """DigitalRF root directory of the DRF cache entry of a capture."""
     # Find the DigitalRF root directory using shared helper
-    drf_root = _find_drf_root(capture_dir)
+    drf_root = _find_drf_root(get_drf_cache_dir() / str(capture_uuid))
     if drf_root is None:
         # This should never happen since we checked for the file above
         error_msg = "DigitalRF root directory not found after reconstruction"
@@ -359,6 +507,120 @@ def reconstruct_drf_files(capture, capture_files, temp_path: Path) -> Path:
     return drf_root
 
 
+def _prefetched_entry_manifest(
+    capture_uuid: str, fingerprint: str
+) -> dict[str, Any] | None:
+    """Manifest of an entry, None once it no longer holds this file set."""
+    manifest = read_entry_manifest(capture_uuid)
+    # the entry may have been evicted or rebuilt for another file set
+    if manifest is None or manifest.get("fingerprint") != fingerprint:
+        return None
+    return manifest
+
+
+def _stage_drf_files(
+    capture_uuid: str, file_paths: list[tuple[Any, Path]]
+) -> tuple[Path, list[tuple[Path, Path]]]:
+    """Download files to a new staging directory, without any entry lock.
+
+    Returns:
+        The staging directory, and the staged path of each file with the path
+        it goes to in the cache entry.
+    """
+    staging_dir = Path(
+        tempfile.mkdtemp(dir=get_drf_staging_dir(), prefix=f"{capture_uuid}.")
+    )
+    minio_client = get_minio_client()
+    staged_files: list[tuple[Path, Path]] = []
+    try:
+        for idx, (file_obj, file_path) in enumerate(file_paths):
+            staged_path = staging_dir / str(idx)
+            _download_one_drf_file(
+                minio_client,
+                settings.AWS_STORAGE_BUCKET_NAME,
+                file_obj.file.name,
+                staged_path,
+            )
+            staged_files.append((staged_path, file_path))
+    except Exception:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+    return staging_dir, staged_files
+
+
+def _prefetch_drf_files(
+    capture_uuid: str, fingerprint: str, drf_root: Path, files: list[Any]
+) -> None:
+    """Download files of a capture in the background, once at a time per file.
+
+    Files are downloaded to the staging directory without holding the lock of
+    the cache entry, so foreground reconstructions of the capture do not wait
+    for them. The lock is only held to move them into the entry, and only while
+    it still holds this file set.
+    """
+    with _prefetch_lock:
+        to_prefetch = [
+            (file_obj, file_path)
+            for file_obj, file_path in _drf_file_paths(capture_uuid, files)
+            if not file_path.exists() and file_path not in _prefetching_paths
+        ]
+        _prefetching_paths.update(file_path for _, file_path in to_prefetch)
+    if not to_prefetch:
+        return
+
+    def prefetch() -> None:
+        staging_dir = None
+        try:
+            with drf_cache_lock(capture_uuid):
+                if _prefetched_entry_manifest(capture_uuid, fingerprint) is None:
+                    return
+            staging_dir, staged_files = _stage_drf_files(capture_uuid, to_prefetch)
+
+            with drf_cache_lock(capture_uuid):
+                manifest = _prefetched_entry_manifest(capture_uuid, fingerprint)
+                if manifest is None:
+                    return
+                for staged_path, file_path in staged_files:
+                    if not file_path.exists():
+                        file_path.parent.mkdir(parents=True, exist_ok=True)
+                        staged_path.replace(file_path)
+                record_entry(
+                    capture_uuid,
+                    fingerprint,
+                    drf_root,
+                    complete=manifest.get("complete", True),
+                )
+        except Exception as e:  # noqa: BLE001 - prefetching is best-effort
+            logger.warning(f"Failed to prefetch DRF files of {capture_uuid}: {e}")
+        finally:
+            if staging_dir is not None:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+            with _prefetch_lock:
+                _prefetching_paths.difference_update(
+                    file_path for _, file_path in to_prefetch
+                )
+
+    _prefetch_executor.submit(prefetch)
+
+
+def read_stored_range(object_name: str, offset: int, length: int) -> bytes:
+    """Read length bytes from offset of a stored object, with a ranged request.
+
+    Fewer bytes are returned when the range goes past the end of the object.
+    """
+    response = get_minio_client().get_object(
+        bucket_name=settings.AWS_STORAGE_BUCKET_NAME,
+        object_name=object_name,
+        offset=offset,
+        length=length,
+    )
+    try:
+        return response.read()
+    finally:
+        response.close()
+        response.release_conn()
+
+
 def store_processed_data(
     capture_uuid: str,
     processing_type: str,
@@ -420,3 +682,42 @@ def store_processed_data(
     processed_data.save()
 
     logger.info(f"Stored file {new_filename} for {processing_type} data")
+
+
+def store_waterfall_pyramid(
+    processed_data: Any,
+    curr_file_path: str,
+    new_filename: str,
+    pyramid: dict[str, Any],
+) -> None:
+    """Store the pyramid of a waterfall, recording it in the waterfall's metadata.
+
+    The pyramid is stored next to the waterfall's data file, replacing the one of
+    earlier processing, if any.
+
+    Args:
+        processed_data: PostProcessedData of the waterfall
+        curr_file_path: Path to the pyramid file to store
+        new_filename: New name for the stored file
+        pyramid: Metadata of the pyramid, from `build_waterfall_pyramid`
+    """
+    storage = processed_data.data_file.storage
+    metadata = processed_data.metadata or {}
+    previous_object_name = metadata.get("pyramid", {}).get("object_name")
+
+    with Path(curr_file_path).open("rb") as f:
+        object_name = storage.save(
+            f"{processed_data.data_file.field.upload_to}{new_filename}", File(f)
+        )
+    processed_data.metadata = {
+        **metadata,
+        "pyramid": {**pyramid, "object_name": object_name},
+    }
+    processed_data.save(update_fields=["metadata"])
+
+    if previous_object_name and previous_object_name != object_name:
+        try:
+            storage.delete(previous_object_name)
+        except Exception as e:  # noqa: BLE001 - storage backends raise various errors
+            logger.warning(f"Could not delete previous waterfall pyramid: {e}")
+    logger.info(f"Stored waterfall pyramid {object_name}")
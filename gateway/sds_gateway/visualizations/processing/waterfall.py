@@ -3,7 +3,9 @@
 import base64
 import contextlib
 import datetime
+import itertools
 import time
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -16,11 +18,29 @@ from pydantic import computed_field
 
 from sds_gateway.visualizations.errors import SourceDataError
 
+from .power_stats import POWER_BOUNDS_MARGIN
+from .power_stats import PowerStats
+from .power_stats import power_bounds_with_margin
+from .reader_pool import pooled_drf_params
 from .utils import DigitalRFParams
 from .utils import validate_digitalrf_data
+from .waterfall_binary import add_slice_run
 
 SAMPLES_PER_SLICE = 1024
 FFT_SIZE = 1024
+# slices read and transformed together: bounds each block (and its FFT) in memory
+WATERFALL_BATCH_SLICES = 2048
+# WaterfallSliceParams fields stored with precomputed waterfalls
+_STORED_SLICE_PARAMS = {
+    "channel",
+    "start_sample",
+    "end_sample",
+    "fft_size",
+    "center_freq",
+    "sample_rate_numerator",
+    "sample_rate_denominator",
+    "samples_per_slice",
+}
 
 
 class WaterfallSliceParams(DigitalRFParams):
@@ -71,8 +91,13 @@ def validate_waterfall_data(
     """
     # Get base DigitalRF parameters
     base_params = validate_digitalrf_data(drf_path, channel, fft_size)
+    return _waterfall_params_from(base_params, fft_size)
 
-    # Create WaterfallSliceParams with waterfall-specific defaults
+
+def _waterfall_params_from(
+    base_params: DigitalRFParams, fft_size: int
+) -> WaterfallSliceParams:
+    """WaterfallSliceParams with waterfall-specific defaults, sharing the reader."""
     return WaterfallSliceParams(
         reader=base_params.reader,
         channel=base_params.channel,
@@ -87,6 +112,18 @@ def validate_waterfall_data(
     )
 
 
+@contextlib.contextmanager
+def _open_waterfall_params(
+    drf_path: Path, channel: str, capture_uuid: str | None
+) -> Iterator[WaterfallSliceParams]:
+    """Waterfall parameters of a channel, from the reader pool with a capture UUID."""
+    if capture_uuid is None:
+        yield validate_waterfall_data(drf_path, channel, FFT_SIZE)
+        return
+    with pooled_drf_params(capture_uuid, drf_path, channel) as base_params:
+        yield _waterfall_params_from(base_params, FFT_SIZE)
+
+
 def _process_waterfall_slice(params: WaterfallSliceParams) -> dict[str, Any] | None:
     """Process a single waterfall slice.
 
@@ -111,40 +148,165 @@ def _process_waterfall_slice(params: WaterfallSliceParams) -> dict[str, Any] | N
         # Data gap or missing file - return None to indicate slice unavailable
         return None
 
-    # Perform FFT processing
-    fft_data = np.fft.fft(data_array, n=params.fft_size)
+    power_spectrum_db = _power_spectra_db(
+        data_array.reshape(1, -1), fft_size=params.fft_size
+    )[0]
+    return _build_slice(params, params.slice_idx, power_spectrum_db)
+
+
+def _power_spectra_db(samples: np.ndarray, fft_size: int) -> np.ndarray:
+    """Compute the power spectra in dB of slices, one slice per row.
+
+    All rows are transformed, shifted and converted as single array operations.
+    """
+    fft_data = np.fft.fft(samples, n=fft_size, axis=1)
     # Shift so DC is centered (required for correct frequency display)
-    fft_data_shifted = np.fft.fftshift(fft_data)
+    fft_data_shifted = np.fft.fftshift(fft_data, axes=1)
     power_spectrum = np.abs(fft_data_shifted) ** 2
 
     # Convert to dB
-    power_spectrum_db = 10 * np.log10(power_spectrum + 1e-12)
+    return (10 * np.log10(power_spectrum + 1e-12)).astype(np.float32)
+
+
+def _build_slice(
+    params: WaterfallSliceParams, slice_idx: int, power_spectrum_db: np.ndarray
+) -> dict[str, Any]:
+    """Build the WaterfallFile dict of a slice from its power spectrum."""
+    slice_start_sample = params.start_sample + slice_idx * params.samples_per_slice
+    slice_num_samples = min(
+        params.samples_per_slice, params.end_sample - slice_start_sample
+    )
+    sample_rate = params.sample_rate
 
     # Convert power spectrum to binary string for transmission
-    data_bytes = power_spectrum_db.astype(np.float32).tobytes()
-    data_string = base64.b64encode(data_bytes).decode("utf-8")
+    data_string = base64.b64encode(power_spectrum_db.tobytes()).decode("utf-8")
 
     # Build WaterfallFile format with enhanced metadata
     return {
         "data": data_string,
         "data_type": "float32",
-        "timestamp": params.timestamp,
+        "timestamp": datetime.datetime.fromtimestamp(
+            slice_start_sample / sample_rate, tz=datetime.UTC
+        ).isoformat(),
         "min_frequency": params.min_frequency,
         "max_frequency": params.max_frequency,
-        "num_samples": params.slice_num_samples,
-        "sample_rate": params.sample_rate,
+        "num_samples": slice_num_samples,
+        "sample_rate": sample_rate,
         "center_frequency": params.center_freq,
         "custom_fields": {
             "channel_name": params.channel,
-            "start_sample": params.slice_start_sample,
-            "num_samples": params.slice_num_samples,
+            "start_sample": slice_start_sample,
+            "num_samples": slice_num_samples,
             "fft_size": params.fft_size,
-            "scan_time": params.slice_num_samples / params.sample_rate,
-            "slice_index": params.slice_idx,
+            "scan_time": slice_num_samples / sample_rate,
+            "slice_index": slice_idx,
         },
     }
 
 
+def _read_slice_runs(
+    params: WaterfallSliceParams, start_index: int, end_index: int
+) -> Iterator[tuple[int, np.ndarray]]:
+    """Read runs of consecutive full slices that have data, one block per run.
+
+    Yields the index of the first slice of each run and its samples, shaped as
+        (slices, samples_per_slice). Slices overlapping data gaps are skipped,
+        as reading them one at a time would fail.
+    """
+    samples_per_slice = params.samples_per_slice
+    first_sample = params.start_sample + start_index * samples_per_slice
+    num_samples = (end_index - start_index) * samples_per_slice
+    runs: list[tuple[int, int]] = []
+    try:
+        block = params.reader.read_vector(first_sample, num_samples, params.channel, 0)
+    except OSError:
+        # data gaps: only the slices inside continuous blocks can be read
+        try:
+            continuous_blocks = params.reader.get_continuous_blocks(
+                first_sample, first_sample + num_samples - 1, params.channel
+            )
+        except OSError:
+            continuous_blocks = {}
+        for block_start, block_length in continuous_blocks.items():
+            offset = block_start - params.start_sample
+            run_start = max(start_index, -(-offset // samples_per_slice))
+            run_end = min(end_index, (offset + block_length) // samples_per_slice)
+            if run_start < run_end:
+                runs.append((run_start, run_end))
+    else:
+        yield start_index, block.reshape(-1, samples_per_slice)
+        return
+
+    for run_start, run_end in runs:
+        try:
+            block = params.reader.read_vector(
+                params.start_sample + run_start * samples_per_slice,
+                (run_end - run_start) * samples_per_slice,
+                params.channel,
+                0,
+            )
+        except OSError:
+            continue
+        yield run_start, block.reshape(-1, samples_per_slice)
+
+
+def iter_waterfall_spectra(
+    params: WaterfallSliceParams, start_index: int, end_index: int
+) -> Iterator[tuple[int, np.ndarray]]:
+    """Compute the power spectra of a range of slices in batches.
+
+    Each batch is read as one contiguous block and transformed as a matrix of
+    (slices, fft_size) values, matching the output of processing each slice
+    on its own. Slices without data (gaps) are left out of the batches.
+
+    Args:
+        params: Waterfall parameters of the channel
+        start_index: Starting slice index (inclusive)
+        end_index: Ending slice index (exclusive); slices must be full
+
+    Yields:
+        The index of the first slice of each batch and its power spectra in dB,
+            one float32 row per consecutive slice.
+    """
+    for batch_start in range(start_index, end_index, WATERFALL_BATCH_SLICES):
+        batch_end = min(batch_start + WATERFALL_BATCH_SLICES, end_index)
+        for run_start, samples in _read_slice_runs(params, batch_start, batch_end):
+            yield run_start, _power_spectra_db(samples, fft_size=params.fft_size)
+
+
+def compute_waterfall_slices(
+    params: WaterfallSliceParams, start_index: int, end_index: int
+) -> list[dict[str, Any]]:
+    """Compute the WaterfallFile dicts of a range of full slices, in order.
+
+    Slices that cannot be processed (e.g. due to data gaps) are left out.
+    """
+    return [
+        _build_slice(params, first_idx + row, power_spectrum_db)
+        for first_idx, spectra in iter_waterfall_spectra(params, start_index, end_index)
+        for row, power_spectrum_db in enumerate(spectra)
+    ]
+
+
+def compute_waterfall_matrix(
+    params: WaterfallSliceParams, start_index: int, end_index: int
+) -> tuple[np.ndarray, list[tuple[int, int]]]:
+    """Compute the power spectra of a range of full slices as a single matrix.
+
+    Returns:
+        The float32 matrix with one row per slice with data, and the runs of
+            (first slice index, number of slices) its rows correspond to.
+    """
+    blocks: list[np.ndarray] = []
+    slice_runs: list[tuple[int, int]] = []
+    for first_idx, spectra in iter_waterfall_spectra(params, start_index, end_index):
+        blocks.append(spectra)
+        add_slice_run(slice_runs, first_idx, len(spectra))
+    if not blocks:
+        return np.empty((0, params.fft_size), dtype=np.float32), slice_runs
+    return np.concatenate(blocks), slice_runs
+
+
 @contextlib.contextmanager
 def _waterfall_lock_context(cache_backend: Any, lock_key: str, *, acquired: bool):
     """Context manager that releases the waterfall compute lock on exit.
@@ -167,6 +329,9 @@ def compute_slices_on_demand(  # noqa: C901, PLR0912, PLR0915
     channel: str,
     start_index: int,
     end_index: int,
+    *,
+    as_matrix: bool = False,
+    capture_uuid: str | None = None,
 ) -> dict[str, Any]:
     """Compute waterfall slices on-demand without full preprocessing.
 
@@ -178,9 +343,14 @@ def compute_slices_on_demand(  # noqa: C901, PLR0912, PLR0915
         channel: Channel name to process
         start_index: Starting slice index (inclusive)
         end_index: Ending slice index (exclusive)
+        as_matrix: Return the slices as a matrix for the binary transport,
+            instead of WaterfallFile dicts
+        capture_uuid: UUID of the capture cached at drf_path, to reuse its
+            reader across requests (see `reader_pool`)
 
     Returns:
-        dict with 'slices', 'total_slices', 'start_index', 'end_index', 'metadata'
+        dict with 'slices', 'total_slices', 'start_index', 'end_index', 'metadata';
+            with as_matrix, 'spectra' and 'slice_runs' replace 'slices'
     """
     logger.info(
         f"Computing slices on-demand for channel {channel}: "
@@ -191,6 +361,8 @@ def compute_slices_on_demand(  # noqa: C901, PLR0912, PLR0915
     # Cache key includes drf_path so different captures or cache locations
     # don't collide.
     cache_key = f"waterfall:{drf_path!s}:{channel}:{start_index}:{end_index}"
+    if as_matrix:
+        cache_key += ":matrix"
     cached = None
     try:
         cached = cache.get(cache_key)
@@ -243,18 +415,26 @@ def compute_slices_on_demand(  # noqa: C901, PLR0912, PLR0915
         except Exception:  # noqa: BLE001 - cache backends can raise various
             got_lock = True
 
-    with _waterfall_lock_context(cache, lock_key, acquired=got_lock):
-        # Validate DigitalRF data and get base parameters
-        base_params = validate_waterfall_data(drf_path, channel, FFT_SIZE)
-
+    with (
+        _waterfall_lock_context(cache, lock_key, acquired=got_lock),
+        _open_waterfall_params(drf_path, channel, capture_uuid) as base_params,
+    ):
         # Calculate total slices available
         total_slices = base_params.total_samples // SAMPLES_PER_SLICE
 
         # Validate and clamp indices
         start_index = max(start_index, 0)
         if start_index >= total_slices:
+            empty_slices: dict[str, Any] = (
+                {
+                    "spectra": np.empty((0, base_params.fft_size), dtype=np.float32),
+                    "slice_runs": [],
+                }
+                if as_matrix
+                else {"slices": []}
+            )
             return {
-                "slices": [],
+                **empty_slices,
                 "total_slices": total_slices,
                 "start_index": start_index,
                 "end_index": start_index,
@@ -263,35 +443,36 @@ def compute_slices_on_demand(  # noqa: C901, PLR0912, PLR0915
 
         end_index = min(end_index, total_slices)
 
-        # Process only the requested slice range
-        waterfall_slices = []
-        failed_slices = 0
-        for slice_idx in range(start_index, end_index):
-            # Use shallow copy since we're only updating slice_idx (an integer)
-            # The reader object is excluded from serialization, so no need for deep copy
-            slice_params = base_params.model_copy(update={"slice_idx": slice_idx})
-            waterfall_file = _process_waterfall_slice(slice_params)
-            if waterfall_file:
-                waterfall_slices.append(waterfall_file)
-            else:
-                failed_slices += 1
+        # Process only the requested slice range, in batches
+        computed_slices: dict[str, Any]
+        if as_matrix:
+            spectra, slice_runs = compute_waterfall_matrix(
+                base_params, start_index, end_index
+            )
+            computed_slices = {"spectra": spectra, "slice_runs": slice_runs}
+            num_computed = len(spectra)
+        else:
+            waterfall_slices = compute_waterfall_slices(
+                base_params, start_index, end_index
+            )
+            computed_slices = {"slices": waterfall_slices}
+            num_computed = len(waterfall_slices)
+        failed_slices = (end_index - start_index) - num_computed
 
         if failed_slices > 0:
             logger.warning(
-                f"Computed {len(waterfall_slices)} slices on-demand, "
+                f"Computed {num_computed} slices on-demand, "
                 f"{failed_slices} slices failed (likely data gaps)"
             )
         else:
-            logger.info(f"Computed {len(waterfall_slices)} slices on-demand")
+            logger.info(f"Computed {num_computed} slices on-demand")
 
         result = {
-            "slices": waterfall_slices,
+            **computed_slices,
             "total_slices": total_slices,
             "start_index": start_index,
             "end_index": end_index,
-            "metadata": _build_metadata(
-                base_params, total_slices, len(waterfall_slices)
-            ),
+            "metadata": _build_metadata(base_params, total_slices, num_computed),
         }
 
         # Cache the computed result for a short period to avoid repeat work.
@@ -305,12 +486,13 @@ def compute_slices_on_demand(  # noqa: C901, PLR0912, PLR0915
 
 
 def get_waterfall_power_bounds(
-    drf_path: Path, channel: str, margin_fraction: float = 0.05
+    drf_path: Path, channel: str, margin_fraction: float = POWER_BOUNDS_MARGIN
 ) -> dict[str, float] | None:
     """Compute power bounds from sample slices for color scale.
 
     Samples slices spread across the capture (same idea as master's full-data min/max).
-    Uses 5% margin by default to match master's calculatePowerBounds().
+    Uses 5% margin by default to match master's calculatePowerBounds(). Waterfalls
+    post-processed already have exact bounds in their stored power statistics.
 
     Args:
         drf_path: Path to DigitalRF data directory
@@ -335,29 +517,12 @@ def get_waterfall_power_bounds(
     if not indices:
         return None
 
-    global_min = float("inf")
-    global_max = float("-inf")
+    power_stats = PowerStats()
     for slice_idx in indices:
-        slice_params = base_params.model_copy(update={"slice_idx": slice_idx})
-        slice_data = _process_waterfall_slice(slice_params)
-        if slice_data is None:
-            continue
-        try:
-            data_bytes = base64.b64decode(slice_data["data"])
-            power_db = np.frombuffer(data_bytes, dtype=np.float32)
-            finite = power_db[np.isfinite(power_db)]
-            if finite.size > 0:
-                global_min = min(global_min, float(np.min(finite)))
-                global_max = max(global_max, float(np.max(finite)))
-        except (ValueError, TypeError) as e:
-            logger.debug("Skipping slice %s for power bounds: %s", slice_idx, e)
-            continue
+        for _, spectra in iter_waterfall_spectra(base_params, slice_idx, slice_idx + 1):
+            power_stats.add(spectra)
 
-    if global_min == float("inf") or global_max == float("-inf"):
-        return None
-    span = global_max - global_min
-    margin = span * margin_fraction
-    return {"min": global_min - margin, "max": global_max + margin}
+    return power_bounds_with_margin(power_stats.min, power_stats.max, margin_fraction)
 
 
 def get_waterfall_metadata(drf_path: Path, channel: str) -> dict[str, Any]:
@@ -397,14 +562,67 @@ def _build_metadata(
     }
 
 
-def convert_drf_to_waterfall_json(
-    drf_path: Path, channel: str, max_slices: int | None = None
+def processed_waterfall_metadata(
+    params: WaterfallSliceParams,
+    total_slices: int,
+    slices_processed: int,
+    slices_skipped: int,
+    power_stats: PowerStats,
 ) -> dict[str, Any]:
-    """Convert DigitalRF data to waterfall JSON format similar to SVI implementation."""
-    logger.info(
-        f"Converting DigitalRF data to waterfall JSON format for channel {channel}"
+    """Metadata stored with a precomputed waterfall, with its power statistics."""
+    metadata = {
+        **_build_metadata(params, total_slices, slices_processed),
+        "slices_skipped": slices_skipped,
+    }
+    power_bounds = power_stats.power_bounds()
+    if power_bounds is not None:
+        metadata["power_bounds"] = power_bounds
+        metadata["power_stats"] = power_stats.summary()
+    return metadata
+
+
+def stored_slice_params(params: WaterfallSliceParams) -> dict[str, Any]:
+    """Slice parameters to store with a waterfall (see `waterfall_slice_params`)."""
+    return params.model_dump(include=_STORED_SLICE_PARAMS)
+
+
+def waterfall_slice_params(slice_params: dict[str, Any]) -> WaterfallSliceParams:
+    """Slice parameters stored with a waterfall, to build its WaterfallFile dicts.
+
+    No DigitalRF reader is needed: the parameters are not validated again.
+    """
+    return WaterfallSliceParams.model_construct(
+        reader=None, slice_idx=0, **slice_params
     )
 
+
+def waterfall_slices_from_matrix(
+    params: WaterfallSliceParams,
+    spectra: np.ndarray,
+    slice_runs: list[tuple[int, int]],
+) -> list[dict[str, Any]]:
+    """Build the WaterfallFile dicts of a matrix of slice power spectra."""
+    slice_indices = itertools.chain.from_iterable(
+        range(first, first + count) for first, count in slice_runs
+    )
+    return [
+        _build_slice(params, slice_idx, power_spectrum_db)
+        for slice_idx, power_spectrum_db in zip(slice_indices, spectra, strict=True)
+    ]
+
+
+def convert_drf_to_waterfall_matrix(
+    drf_path: Path, channel: str, max_slices: int | None = None
+) -> dict[str, Any]:
+    """Convert DigitalRF data to a matrix of slice power spectra.
+
+    Returns:
+        dict with 'spectra' (one row per slice with data), 'slice_runs' (the
+            slice indices of the rows), 'metadata', and 'slice_params' (see
+            `waterfall_slice_params`).
+    """
+    logger.info(f"Converting DigitalRF data to a waterfall for channel {channel}")
+
     # Validate DigitalRF data and get base parameters
     base_params = validate_waterfall_data(drf_path, channel, FFT_SIZE)
 
@@ -419,92 +637,75 @@ def convert_drf_to_waterfall_json(
         f"{SAMPLES_PER_SLICE} samples per slice"
     )
 
-    # Process slices and create JSON data
-    waterfall_data = []
-    skipped_slices = 0
+    # Process slices in batches; power statistics are computed from all slices
+    #   along the way for consistent color scaling
+    blocks: list[np.ndarray] = []
+    slice_runs: list[tuple[int, int]] = []
+    slices_processed = 0
+    power_stats = PowerStats()
     last_log_time = time.time()
 
-    for slice_idx in range(slices_to_process):
-        # Create slice-specific parameters by updating the base params
-        # Use shallow copy since we're only updating slice_idx (an integer)
-        slice_params = base_params.model_copy(update={"slice_idx": slice_idx})
-        waterfall_file = _process_waterfall_slice(slice_params)
-        if waterfall_file:
-            waterfall_data.append(waterfall_file)
-        else:
-            skipped_slices += 1
+    for first_idx, spectra in iter_waterfall_spectra(base_params, 0, slices_to_process):
+        blocks.append(spectra)
+        add_slice_run(slice_runs, first_idx, len(spectra))
+        slices_processed += len(spectra)
+        power_stats.add(spectra)
 
         # Log progress every 3 seconds
         current_time = time.time()
         log_interval = 3.0
         if current_time - last_log_time >= log_interval:
             logger.debug(
-                f"Processed {slice_idx + 1}/{slices_to_process} slices "
-                f"(skipped: {skipped_slices})"
+                f"Processed {first_idx + len(spectra)}/{slices_to_process} slices "
+                f"(skipped: {first_idx + len(spectra) - slices_processed})"
             )
             last_log_time = current_time
+    skipped_slices = slices_to_process - slices_processed
 
-    if len(waterfall_data) == 0:
+    if slices_processed == 0:
         msg = "No valid waterfall slices found"
         raise SourceDataError(msg)
 
-    # Calculate power bounds from all slices for consistent color scaling
-    global_min = float("inf")
-    global_max = float("-inf")
-
-    for slice_data in waterfall_data:
-        # Decode the base64 data to calculate bounds
-        data_bytes = base64.b64decode(slice_data["data"])
-        power_spectrum_db = np.frombuffer(data_bytes, dtype=np.float32)
-
-        slice_min = float(np.min(power_spectrum_db))
-        slice_max = float(np.max(power_spectrum_db))
-
-        global_min = min(global_min, slice_min)
-        global_max = max(global_max, slice_max)
-
     # Apply 5% margin so stored scale matches master
     # (calculatePowerBounds uses same margin)
-    margin_frac = 0.05
-    if global_min != float("inf") and global_max != float("-inf"):
-        span = global_max - global_min
-        margin = span * margin_frac
-        power_scale_min = global_min - margin
-        power_scale_max = global_max + margin
-    else:
-        power_scale_min = None
-        power_scale_max = None
+    power_bounds = power_stats.power_bounds()
 
     # Log final summary
-    if power_scale_min is not None and power_scale_max is not None:
+    if power_bounds is not None:
         logger.info(
-            f"Waterfall processing complete: {len(waterfall_data)} slices processed, "
+            f"Waterfall processing complete: {slices_processed} slices processed, "
             f"{skipped_slices} slices skipped due to data issues. "
-            f"Power bounds: [{power_scale_min:.2f}, {power_scale_max:.2f}] dB"
+            f"Power bounds: [{power_bounds['min']:.2f}, {power_bounds['max']:.2f}] dB"
         )
     else:
         logger.warning(
-            f"Waterfall processing complete: {len(waterfall_data)} slices processed, "
+            f"Waterfall processing complete: {slices_processed} slices processed, "
             f"{skipped_slices} slices skipped due to data issues. "
             "Power bounds could not be calculated."
         )
 
-    metadata = {
-        "center_frequency": base_params.center_freq,
-        "sample_rate": base_params.sample_rate,
-        "min_frequency": base_params.min_frequency,
-        "max_frequency": base_params.max_frequency,
-        "total_slices": total_slices,
-        "slices_processed": len(waterfall_data),
-        "slices_skipped": skipped_slices,
-        "fft_size": base_params.fft_size,
-        "samples_per_slice": SAMPLES_PER_SLICE,
-        "channel": channel,
-    }
-    if power_scale_min is not None and power_scale_max is not None:
-        metadata["power_bounds"] = {"min": power_scale_min, "max": power_scale_max}
+    metadata = processed_waterfall_metadata(
+        base_params, total_slices, slices_processed, skipped_slices, power_stats
+    )
 
     return {
-        "json_data": waterfall_data,
+        "spectra": np.concatenate(blocks),
+        "slice_runs": slice_runs,
         "metadata": metadata,
+        "slice_params": stored_slice_params(base_params),
+    }
+
+
+def convert_drf_to_waterfall_json(
+    drf_path: Path, channel: str, max_slices: int | None = None
+) -> dict[str, Any]:
+    """Convert DigitalRF data to waterfall JSON format similar to SVI implementation."""
+    waterfall_result = convert_drf_to_waterfall_matrix(drf_path, channel, max_slices)
+    return {
+        "json_data": waterfall_slices_from_matrix(
+            waterfall_slice_params(waterfall_result["slice_params"]),
+            waterfall_result["spectra"],
+            waterfall_result["slice_runs"],
+        ),
+        "metadata": waterfall_result["metadata"],
     }
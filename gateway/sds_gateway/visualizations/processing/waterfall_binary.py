@@ -0,0 +1,290 @@
+"""Binary transport format for waterfall slices.
+
+Slices are sent as one contiguous matrix of power spectra instead of a JSON list
+of base64-encoded slices, each carrying its own copy of the metadata.
+
+Layout (little-endian):
+
+    offset  size  contents
+    0       4     magic: b"SDSW"
+    4       1     format version
+    5       4     length N of the JSON header, as an unsigned integer
+    9       N     JSON header (UTF-8)
+    9 + N  ...    slice matrix of shape `header["shape"]` = (slices, fft_size),
+                  row-major, with values of `header["dtype"]`; uncompressed,
+                  as `header["compression"]` is always "none"
+
+Besides the ranges and metadata of the JSON responses, the header has:
+
+    "slice_runs":   [[first slice index, number of slices], ...] for the rows of
+                    the matrix, in order: slices missing due to data gaps are
+                    the ones outside of these runs.
+    "scale":        {"min": ..., "max": ...} dB mapped to 0 and 255 by uint8
+                    quantization, when the dtype is "uint8".
+
+Precomputed waterfalls are stored in the same format, as uncompressed float32:
+rows then have a fixed size, so `WaterfallMatrixFile` finds the bytes of any
+slice range from the slice runs of the header and reads only those.
+"""
+
+import base64
+import bisect
+import itertools
+import json
+import struct
+from collections.abc import Callable
+from enum import StrEnum
+from typing import Any
+
+import numpy as np
+
+WATERFALL_BINARY_MEDIA_TYPE = "application/vnd.sds.waterfall"
+WATERFALL_BINARY_VERSION = 1
+# file name suffix of precomputed waterfalls stored in this format
+WATERFALL_STORAGE_SUFFIX = ".sdsw"
+_MAGIC = b"SDSW"
+_PREFIX = struct.Struct("<4sBI")
+_UINT8_LEVELS = 255
+# first read of stored waterfalls: usually covers the whole header
+_HEADER_READ_SIZE = 64 * 1024
+
+
+class WaterfallDType(StrEnum):
+    """Value types of the slice matrix."""
+
+    Float32 = "float32"
+    Float16 = "float16"
+    Uint8 = "uint8"  # quantized between the "scale" bounds of the header
+
+
+class WaterfallCompression(StrEnum):
+    """Compression of the slice matrix, in the header for future versions."""
+
+    NoCompression = "none"
+
+
+def add_slice_run(runs: list[tuple[int, int]], first_index: int, count: int) -> None:
+    """Append consecutive slices to runs, extending the last run when adjacent."""
+    if runs and runs[-1][0] + runs[-1][1] == first_index:
+        runs[-1] = (runs[-1][0], runs[-1][1] + count)
+    else:
+        runs.append((first_index, count))
+
+
+def stack_waterfall_slices(
+    slices: list[dict[str, Any]], start_index: int
+) -> tuple[np.ndarray, list[tuple[int, int]]]:
+    """Stack WaterfallFile dicts (with base64 data) into a matrix and its runs."""
+    rows: list[np.ndarray] = []
+    runs: list[tuple[int, int]] = []
+    for position, waterfall_slice in enumerate(slices):
+        custom_fields = waterfall_slice.get("custom_fields") or {}
+        slice_idx = int(custom_fields.get("slice_index", start_index + position))
+        rows.append(
+            np.frombuffer(base64.b64decode(waterfall_slice["data"]), dtype=np.float32)
+        )
+        add_slice_run(runs, slice_idx, 1)
+    if not rows:
+        return np.empty((0, 0), dtype=np.float32), runs
+    return np.vstack(rows), runs
+
+
+def _quantization_scale(
+    spectra: np.ndarray, scale: dict[str, float] | None
+) -> dict[str, float]:
+    if scale is not None:
+        return {"min": float(scale["min"]), "max": float(scale["max"])}
+    finite = spectra[np.isfinite(spectra)]
+    if finite.size == 0:
+        return {"min": 0.0, "max": 0.0}
+    return {"min": float(finite.min()), "max": float(finite.max())}
+
+
+def encode_waterfall_slices(
+    spectra: np.ndarray,
+    slice_runs: list[tuple[int, int]],
+    *,
+    header: dict[str, Any],
+    dtype: WaterfallDType = WaterfallDType.Float32,
+    scale: dict[str, float] | None = None,
+) -> bytes:
+    """
+    Encode a matrix of slice power spectra in the binary transport format.
+
+    Args:
+        spectra: Power spectra in dB, one row per slice
+        slice_runs: Runs of consecutive slice indices covered by the rows
+        header: Ranges and metadata to send along with the slices
+        dtype: Value type to send the spectra as
+        scale: dB bounds for uint8 quantization, e.g. the power bounds of the
+            capture. Defaults to the bounds of the spectra.
+
+    Returns:
+        bytes: The encoded payload.
+    """
+    full_header: dict[str, Any] = {
+        **header,
+        "shape": list(spectra.shape),
+        "slice_runs": [list(run) for run in slice_runs],
+        "dtype": str(dtype),
+    }
+    if dtype == WaterfallDType.Uint8:
+        full_header["scale"] = _quantization_scale(spectra, scale)
+        low, high = full_header["scale"]["min"], full_header["scale"]["max"]
+        step = (high - low) / _UINT8_LEVELS or 1.0
+        levels = np.rint((np.nan_to_num(spectra, nan=low) - low) / step)
+        values = np.clip(levels, 0, _UINT8_LEVELS).astype(np.uint8)
+    else:
+        values = spectra.astype(np.dtype(str(dtype)).newbyteorder("<"))
+    full_header["compression"] = str(WaterfallCompression.NoCompression)
+
+    return _encode_prefix(full_header) + values.tobytes()
+
+
+def _encode_prefix(full_header: dict[str, Any]) -> bytes:
+    header_bytes = json.dumps(full_header, separators=(",", ":")).encode("utf-8")
+    return (
+        _PREFIX.pack(_MAGIC, WATERFALL_BINARY_VERSION, len(header_bytes)) + header_bytes
+    )
+
+
+def stored_waterfall_prefix(
+    shape: tuple[int, int],
+    slice_runs: list[tuple[int, int]],
+    *,
+    header: dict[str, Any],
+) -> bytes:
+    """Encode the start of a stored waterfall, for its matrix to be written after.
+
+    The matrix must follow as little-endian float32 rows, uncompressed; this
+    allows writing waterfalls too large to encode in memory.
+    """
+    return _encode_prefix(
+        {
+            **header,
+            "shape": list(shape),
+            "slice_runs": [list(run) for run in slice_runs],
+            "dtype": str(WaterfallDType.Float32),
+            "compression": str(WaterfallCompression.NoCompression),
+        }
+    )
+
+
+def is_waterfall_payload(data: bytes) -> bool:
+    """Whether data starts like a payload in the binary transport format."""
+    return data[: len(_MAGIC)] == _MAGIC
+
+
+def decode_waterfall_slices(payload: bytes) -> tuple[dict[str, Any], np.ndarray]:
+    """
+    Decode a binary waterfall payload.
+
+    Returns:
+        tuple: The header, and the slice matrix as float32 dB values
+            (dequantized when sent as uint8).
+
+    Raises:
+        ValueError: If the payload is not in the binary transport format.
+    """
+    magic, version, header_length = _PREFIX.unpack_from(payload)
+    if magic != _MAGIC or version != WATERFALL_BINARY_VERSION:
+        msg = "Not a waterfall payload of a supported version"
+        raise ValueError(msg)
+    header_end = _PREFIX.size + header_length
+    header = json.loads(payload[_PREFIX.size : header_end])
+    body = payload[header_end:]
+    if header["compression"] != WaterfallCompression.NoCompression:
+        msg = f"Unsupported waterfall compression: {header['compression']}"
+        raise ValueError(msg)
+
+    dtype = WaterfallDType(header["dtype"])
+    values = np.frombuffer(body, dtype=np.dtype(str(dtype)).newbyteorder("<"))
+    values = values.reshape(header["shape"])
+    if dtype == WaterfallDType.Uint8:
+        low, high = header["scale"]["min"], header["scale"]["max"]
+        return header, (
+            low + values.astype(np.float32) * ((high - low) / _UINT8_LEVELS)
+        ).astype(np.float32)
+    return header, values.astype(np.float32)
+
+
+class WaterfallMatrixFile:
+    """Random access to the slices of a waterfall stored in the binary format.
+
+    Args:
+        read_range: Returns `length` bytes of the stored file from `offset`,
+            or fewer at the end of the file; e.g. a ranged object store read.
+
+    Raises:
+        ValueError: If the file is not an uncompressed float32 waterfall.
+    """
+
+    def __init__(self, read_range: Callable[[int, int], bytes]) -> None:
+        self._read_range = read_range
+        head = read_range(0, _HEADER_READ_SIZE)
+        if len(head) < _PREFIX.size or not is_waterfall_payload(head):
+            msg = "Not a waterfall stored in the binary format"
+            raise ValueError(msg)
+        _, version, header_length = _PREFIX.unpack_from(head)
+        if version != WATERFALL_BINARY_VERSION:
+            msg = f"Unsupported waterfall format version: {version}"
+            raise ValueError(msg)
+        self._data_offset = _PREFIX.size + header_length
+        if len(head) < self._data_offset:
+            head += read_range(len(head), self._data_offset - len(head))
+        self.header: dict[str, Any] = json.loads(head[_PREFIX.size : self._data_offset])
+        if (
+            self.header["dtype"] != WaterfallDType.Float32
+            or self.header["compression"] != WaterfallCompression.NoCompression
+        ):
+            msg = "Stored waterfalls must be uncompressed float32 matrices"
+            raise ValueError(msg)
+
+        self.fft_size: int = self.header["shape"][1]
+        self._slice_runs = [
+            (first, count) for first, count in self.header["slice_runs"]
+        ]
+        self._run_firsts = [first for first, _ in self._slice_runs]
+        self._run_rows = list(
+            itertools.accumulate((count for _, count in self._slice_runs), initial=0)
+        )
+
+    @property
+    def total_slices(self) -> int:
+        """Number of slices of the waterfall, including the ones left out."""
+        return int(self.header.get("total_slices", self.header["shape"][0]))
+
+    def _rows_before(self, slice_index: int) -> int:
+        """Number of stored rows for slices before slice_index."""
+        run = bisect.bisect_right(self._run_firsts, slice_index) - 1
+        if run < 0:
+            return 0
+        first, count = self._slice_runs[run]
+        return self._run_rows[run] + min(slice_index - first, count)
+
+    def read_slices(
+        self, start_index: int, end_index: int
+    ) -> tuple[np.ndarray, list[tuple[int, int]]]:
+        """Read the spectra of slices [start_index, end_index) with a single read.
+
+        Returns:
+            tuple: The spectra, one row per stored slice, and their slice runs.
+        """
+        first_row = self._rows_before(start_index)
+        end_row = self._rows_before(end_index)
+        row_bytes = self.fft_size * np.dtype(np.float32).itemsize
+        data = b""
+        if end_row > first_row:
+            data = self._read_range(
+                self._data_offset + first_row * row_bytes,
+                (end_row - first_row) * row_bytes,
+            )
+        spectra = np.frombuffer(data, dtype="<f4").reshape(-1, self.fft_size)
+
+        slice_runs: list[tuple[int, int]] = []
+        for first, count in self._slice_runs:
+            run_start = max(first, start_index)
+            run_end = min(first + count, end_index)
+            if run_start < run_end:
+                add_slice_run(slice_runs, run_start, run_end - run_start)
+        return spectra.astype(np.float32), slice_runs
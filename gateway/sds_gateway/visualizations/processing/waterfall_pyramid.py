@@ -0,0 +1,250 @@
+"""Multi-resolution pyramids of precomputed waterfalls, for zoomed-out views.
+
+Each row of level L of a pyramid pools WATERFALL_PYRAMID_FACTOR**L consecutive
+slices of the full-resolution waterfall (level 0): slice i of level L covers
+slices [i * factor**L, (i + 1) * factor**L). Rows are pooled both with the
+maximum power, which keeps short signals visible when zoomed out, and with the
+mean power, which keeps the noise floor. Levels are added until one has at most
+WATERFALL_PYRAMID_MIN_ROWS rows.
+
+A pyramid is stored as one object holding a waterfall per level and pooling, each
+in the stored format of `waterfall_binary`; their byte ranges in the object are
+recorded in the metadata of the waterfall (see `build_waterfall_pyramid`).
+"""
+
+import math
+import shutil
+import tempfile
+from collections.abc import Callable
+from enum import StrEnum
+from typing import IO
+from typing import Any
+from typing import NamedTuple
+
+import numpy as np
+
+from .waterfall_binary import WaterfallMatrixFile
+from .waterfall_binary import add_slice_run
+from .waterfall_binary import stored_waterfall_prefix
+
+WATERFALL_PYRAMID_FACTOR = 4
+WATERFALL_PYRAMID_MIN_ROWS = 512
+# full-resolution slices read at once while building pyramids
+_READ_SLICES = 4096
+
+
+class WaterfallPooling(StrEnum):
+    """How the power of slices is pooled into the rows of pyramid levels."""
+
+    Max = "max"
+    Mean = "mean"
+
+
+class _Rows(NamedTuple):
+    """Rows of a level, with what is needed to pool them into the next one."""
+
+    indices: np.ndarray  # slice indices of the rows, increasing
+    max_db: np.ndarray
+    power_sum: np.ndarray  # linear power, summed over the pooled slices
+    counts: np.ndarray  # number of pooled slices with data
+
+
+def pyramid_num_levels(total_slices: int) -> int:
+    """Number of levels above the full-resolution waterfall of a pyramid."""
+    levels = 0
+    rows = total_slices
+    while rows > WATERFALL_PYRAMID_MIN_ROWS:
+        rows = math.ceil(rows / WATERFALL_PYRAMID_FACTOR)
+        levels += 1
+    return levels
+
+
+class _PyramidLevel:
+    """Rows of one level of a pyramid, pooled as the rows below are streamed in.
+
+    Rows are written to temporary files, one per pooling, as float32 dB.
+    """
+
+    def __init__(self, level: int, fft_size: int) -> None:
+        self.level = level
+        self.num_rows = 0
+        self.slice_runs: list[tuple[int, int]] = []
+        self.files = {
+            pooling: tempfile.TemporaryFile()  # noqa: SIM115 - closed in close()
+            for pooling in WaterfallPooling
+        }
+        # last row, which may still pool rows of the next batch
+        self._pending = _Rows(
+            np.empty(0, dtype=np.int64),
+            np.empty((0, fft_size), dtype=np.float32),
+            np.empty((0, fft_size)),
+            np.empty(0),
+        )
+
+    def add(self, rows: _Rows, *, final: bool = False) -> _Rows:
+        """Pool rows of the level below, returning the rows completed by them."""
+        combined = _Rows(
+            np.concatenate(
+                [self._pending.indices, rows.indices // WATERFALL_PYRAMID_FACTOR]
+            ),
+            np.concatenate([self._pending.max_db, rows.max_db]),
+            np.concatenate([self._pending.power_sum, rows.power_sum]),
+            np.concatenate([self._pending.counts, rows.counts]),
+        )
+        if len(combined.indices) == 0:
+            return combined
+        starts = np.flatnonzero(np.diff(combined.indices, prepend=-1))
+        pooled = _Rows(
+            combined.indices[starts],
+            np.maximum.reduceat(combined.max_db, starts, axis=0),
+            np.add.reduceat(combined.power_sum, starts, axis=0),
+            np.add.reduceat(combined.counts, starts),
+        )
+        done = len(starts) if final else len(starts) - 1
+        self._pending = _Rows(*(values[done:] for values in pooled))
+        completed = _Rows(*(values[:done] for values in pooled))
+        self._write(completed)
+        return completed
+
+    def _write(self, rows: _Rows) -> None:
+        if len(rows.indices) == 0:
+            return
+        mean_db = 10 * np.log10(rows.power_sum / rows.counts[:, np.newaxis])
+        self.files[WaterfallPooling.Max].write(rows.max_db.astype("<f4").tobytes())
+        self.files[WaterfallPooling.Mean].write(mean_db.astype("<f4").tobytes())
+        self.num_rows += len(rows.indices)
+        run_starts = np.flatnonzero(np.diff(rows.indices, prepend=-2) != 1)
+        run_ends = [*run_starts[1:], len(rows.indices)]
+        for run_start, run_end in zip(run_starts, run_ends, strict=True):
+            add_slice_run(
+                self.slice_runs, int(rows.indices[run_start]), int(run_end - run_start)
+            )
+
+    def close(self) -> None:
+        for temp_file in self.files.values():
+            temp_file.close()
+
+
+def _full_resolution_rows(
+    spectra: np.ndarray, slice_runs: list[tuple[int, int]]
+) -> _Rows:
+    indices = np.concatenate(
+        [np.arange(first, first + count) for first, count in slice_runs]
+        or [np.empty(0, dtype=np.int64)]
+    )
+    return _Rows(
+        indices,
+        spectra,
+        np.power(10.0, spectra.astype(np.float64) / 10.0),
+        np.ones(len(indices)),
+    )
+
+
+def build_waterfall_pyramid(
+    source: WaterfallMatrixFile, output: IO[bytes]
+) -> dict[str, Any]:
+    """Build the pyramid of a stored waterfall, reading it in batches of slices.
+
+    Args:
+        source: The full-resolution waterfall
+        output: Binary file the pyramid is written to
+
+    Returns:
+        dict: Metadata of the pyramid: its "factor", and its "levels" with the
+            "level", "total_slices", and for each pooling the "offset" and "size"
+            of the waterfall of the level in the output.
+    """
+    total_slices = source.total_slices
+    levels = [
+        _PyramidLevel(level, source.fft_size)
+        for level in range(1, pyramid_num_levels(total_slices) + 1)
+    ]
+    try:
+        for start_index in range(0, total_slices, _READ_SLICES):
+            rows = _full_resolution_rows(
+                *source.read_slices(
+                    start_index, min(start_index + _READ_SLICES, total_slices)
+                )
+            )
+            for level in levels:
+                rows = level.add(rows)
+        rows = _full_resolution_rows(np.empty((0, source.fft_size)), [])
+        for level in levels:
+            rows = level.add(rows, final=True)
+
+        slice_params = source.header.get("slice_params")
+        pyramid_levels = []
+        for level in levels:
+            slices_per_row = WATERFALL_PYRAMID_FACTOR**level.level
+            header: dict[str, Any] = {
+                "total_slices": math.ceil(total_slices / slices_per_row),
+                "level": level.level,
+            }
+            if slice_params:
+                header["slice_params"] = {
+                    **slice_params,
+                    "samples_per_slice": slice_params["samples_per_slice"]
+                    * slices_per_row,
+                }
+            level_metadata: dict[str, Any] = {
+                "level": level.level,
+                "total_slices": header["total_slices"],
+            }
+            for pooling, temp_file in level.files.items():
+                offset = output.tell()
+                output.write(
+                    stored_waterfall_prefix(
+                        (level.num_rows, source.fft_size),
+                        level.slice_runs,
+                        header={**header, "pooling": str(pooling)},
+                    )
+                )
+                temp_file.seek(0)
+                shutil.copyfileobj(temp_file, output)
+                level_metadata[str(pooling)] = {
+                    "offset": offset,
+                    "size": output.tell() - offset,
+                }
+            pyramid_levels.append(level_metadata)
+    finally:
+        for level in levels:
+            level.close()
+    return {"factor": WATERFALL_PYRAMID_FACTOR, "levels": pyramid_levels}
+
+
+def open_pyramid_level(
+    read_range: Callable[[int, int], bytes],
+    pyramid: dict[str, Any],
+    level: int,
+    pooling: WaterfallPooling = WaterfallPooling.Max,
+) -> WaterfallMatrixFile:
+    """Random access to the slices of a level of a stored pyramid.
+
+    Args:
+        read_range: Reads a range of bytes of the stored pyramid
+        pyramid: Metadata of the pyramid, from `build_waterfall_pyramid`
+
+    Raises:
+        ValueError: If the pyramid has no such level.
+    """
+    level_metadata = next(
+        (
+            level_metadata
+            for level_metadata in pyramid.get("levels", [])
+            if level_metadata["level"] == level
+        ),
+        None,
+    )
+    if level_metadata is None:
+        msg = f"The waterfall pyramid has no level {level}"
+        raise ValueError(msg)
+    offset = level_metadata[str(pooling)]["offset"]
+    size = level_metadata[str(pooling)]["size"]
+
+    def read_level_range(start: int, length: int) -> bytes:
+        length = min(length, size - start)
+        if length <= 0:
+            return b""
+        return read_range(offset + start, length)
+
+    return WaterfallMatrixFile(read_level_range)
@@ -0,0 +1,36 @@
+"""Renderers for visualization data."""
+
+from typing import Any
+
+from rest_framework.renderers import BaseRenderer
+from rest_framework.renderers import JSONRenderer
+
+from sds_gateway.visualizations.processing.waterfall_binary import (
+    WATERFALL_BINARY_MEDIA_TYPE,
+)
+
+
+class WaterfallBinaryRenderer(BaseRenderer):
+    """Renders waterfall slices encoded in the binary transport format.
+
+    Selected with `Accept: application/vnd.sds.waterfall` or `?format=waterfall`.
+    Views encode the payload themselves; error responses are still sent as JSON.
+    """
+
+    media_type = WATERFALL_BINARY_MEDIA_TYPE
+    format = "waterfall"
+    charset = None
+    render_style = "binary"
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: dict[str, Any] | None = None,
+    ) -> bytes:
+        if isinstance(data, bytes):
+            return data
+        response = (renderer_context or {}).get("response")
+        if response is not None:
+            response["Content-Type"] = JSONRenderer.media_type
+        return JSONRenderer().render(data, JSONRenderer.media_type, renderer_context)
@@ -0,0 +1,206 @@
+"""Tests for the DRF reconstruction cache."""
+
+import os
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import h5py
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from django.test import override_settings
+
+from sds_gateway.visualizations.processing.drf_cache import (
+    DRF_CACHE_EVICTION_GRACE_SECONDS,
+)
+from sds_gateway.visualizations.processing.drf_cache import MANIFEST_NAME
+from sds_gateway.visualizations.processing.drf_cache import capture_files_fingerprint
+from sds_gateway.visualizations.processing.drf_cache import drf_cache_lock
+from sds_gateway.visualizations.processing.drf_cache import evict_drf_cache
+from sds_gateway.visualizations.processing.drf_cache import get_cached_drf_path
+from sds_gateway.visualizations.processing.drf_cache import get_drf_cache_stats
+from sds_gateway.visualizations.processing.drf_cache import record_entry
+from sds_gateway.visualizations.processing.utils import reconstruct_drf_files
+from sds_gateway.visualizations.processing.utils import reconstruct_drf_range
+
+
+def _capture_file(name: str, directory: str, sum_blake3: str = "0" * 64):
+    return SimpleNamespace(
+        uuid=uuid.uuid4(),
+        name=name,
+        directory=directory,
+        sum_blake3=sum_blake3,
+        file=SimpleNamespace(name=f"files/{name}"),
+    )
+
+
+def _fget_object(bucket_name: str, object_name: str, file_path: str) -> None:
+    if object_name.endswith("drf_properties.h5"):
+        # 1 kHz samples, in files of one second
+        with h5py.File(file_path, "w") as f:
+            f.attrs["sample_rate_numerator"] = 1000
+            f.attrs["sample_rate_denominator"] = 1
+            f.attrs["file_cadence_millisecs"] = 1000
+        return
+    Path(file_path).write_bytes(b"x" * 100)
+
+
+class DRFCacheTestCases(SimpleTestCase):
+    """Test cases for entries, invalidation and eviction of the DRF cache."""
+
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.cache_dir = Path(temp_dir.name)
+        settings_override = override_settings(
+            DRF_CACHE_DIR=str(self.cache_dir), DRF_CACHE_MAX_BYTES=10_000
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        cache.clear()
+
+        self.capture = SimpleNamespace(uuid=uuid.uuid4())
+        self.capture_files = [
+            _capture_file("drf_properties.h5", "/capture/ch0"),
+            _capture_file("rf@1.h5", "/capture/ch0/2024-01-01T00-00-00"),
+        ]
+        minio_client = MagicMock()
+        minio_client.fget_object.side_effect = _fget_object
+        self.minio_client = minio_client
+        client_patch = patch(
+            "sds_gateway.visualizations.processing.utils.get_minio_client",
+            return_value=minio_client,
+        )
+        client_patch.start()
+        self.addCleanup(client_patch.stop)
+
+    def _add_entry(self, size: int, last_access: float) -> str:
+        capture_uuid = str(uuid.uuid4())
+        drf_root = self.cache_dir / capture_uuid / "capture"
+        (drf_root / "ch0").mkdir(parents=True)
+        (drf_root / "ch0" / "data.h5").write_bytes(b"x" * size)
+        record_entry(capture_uuid, "fingerprint", drf_root)
+        manifest_path = self.cache_dir / capture_uuid / MANIFEST_NAME
+        os.utime(manifest_path, (last_access, last_access))
+        return capture_uuid
+
+    def test_reconstruction_is_reused(self) -> None:
+        """Captures are downloaded once, then served from the cache."""
+        drf_root = reconstruct_drf_files(self.capture, self.capture_files, Path())
+        downloads = self.minio_client.fget_object.call_count
+
+        assert drf_root == self.cache_dir / str(self.capture.uuid) / "capture"
+        assert reconstruct_drf_files(self.capture, self.capture_files, Path()) == (
+            drf_root
+        )
+        assert self.minio_client.fget_object.call_count == downloads
+        stats = get_drf_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+    def test_changed_files_invalidate_entries(self) -> None:
+        """Entries are rebuilt when the checksums of the capture's files change."""
+        reconstruct_drf_files(self.capture, self.capture_files, Path())
+        changed_files = [
+            self.capture_files[0],
+            _capture_file("rf@1.h5", "/capture/ch0/2024-01-01T00-00-00", "1" * 64),
+        ]
+
+        assert (
+            get_cached_drf_path(
+                self.capture.uuid, capture_files_fingerprint(changed_files)
+            )
+            is None
+        )
+        downloads = self.minio_client.fget_object.call_count
+        reconstruct_drf_files(self.capture, changed_files, Path())
+        assert self.minio_client.fget_object.call_count == downloads + 2
+
+    def test_least_recently_used_entries_are_evicted(self) -> None:
+        """Eviction removes the oldest entries until the cache fits its budget."""
+        old = time.time() - 2 * DRF_CACHE_EVICTION_GRACE_SECONDS
+        oldest = self._add_entry(size=4_000, last_access=old - 10)
+        older = self._add_entry(size=4_000, last_access=old)
+        recent = self._add_entry(size=4_000, last_access=time.time())
+
+        assert evict_drf_cache() == 1
+        assert not (self.cache_dir / oldest).exists()
+        assert not (self.cache_dir / ".locks" / f"{oldest}.lock").exists()
+        assert (self.cache_dir / older).exists()
+        # recently used entries are kept even when over budget
+        assert evict_drf_cache(max_bytes=0) == 1
+        assert (self.cache_dir / recent).exists()
+        assert get_drf_cache_stats()["evictions"] == 2  # noqa: PLR2004
+
+    def test_ranges_download_covering_files(self) -> None:
+        """Streamed ranges download only the data files around the range."""
+        capture = SimpleNamespace(uuid=uuid.uuid4(), channel="ch0")
+        capture_files = [
+            _capture_file("drf_properties.h5", "/capture/ch0"),
+            *(
+                _capture_file(f"rf@{second}.000.h5", "/capture/ch0/2024-01-01T00-00-00")
+                for second in range(10)
+            ),
+        ]
+
+        reconstruct_drf_range(capture, capture_files, 3_000, 4_000)
+
+        downloaded = {
+            call.kwargs["object_name"].removeprefix("files/")
+            for call in self.minio_client.fget_object.call_args_list
+        }
+        # the properties, the first and last files, and the range with a file
+        #   of margin on both sides
+        assert downloaded == {
+            "drf_properties.h5",
+            "rf@0.000.h5",
+            "rf@9.000.h5",
+            "rf@3.000.h5",
+            "rf@4.000.h5",
+            "rf@5.000.h5",
+        }
+        # partial entries are completed, not downloaded again
+        fingerprint = capture_files_fingerprint(capture_files)
+        assert get_cached_drf_path(capture.uuid, fingerprint) is None
+        reconstruct_drf_files(capture, capture_files, Path())
+        assert self.minio_client.fget_object.call_count == len(capture_files)
+        assert get_cached_drf_path(capture.uuid, fingerprint) is not None
+
+    def test_prefetch_downloads_without_entry_lock(self) -> None:
+        """Prefetched files are downloaded without holding the entry lock."""
+        capture = SimpleNamespace(uuid=uuid.uuid4(), channel="ch0")
+        capture_files = [
+            _capture_file("drf_properties.h5", "/capture/ch0"),
+            *(
+                _capture_file(f"rf@{second}.000.h5", "/capture/ch0/2024-01-01T00-00-00")
+                for second in range(10)
+            ),
+        ]
+        reconstruct_drf_range(capture, capture_files, 3_000, 4_000)
+
+        lock_free: list[bool] = []
+
+        def fget_unlocked(bucket_name: str, object_name: str, file_path: str) -> None:
+            with drf_cache_lock(capture.uuid, blocking=False) as acquired:
+                lock_free.append(acquired)
+            _fget_object(bucket_name, object_name, file_path)
+
+        self.minio_client.fget_object.side_effect = fget_unlocked
+        executor = MagicMock()
+        executor.submit.side_effect = lambda prefetch: prefetch()
+        with patch(
+            "sds_gateway.visualizations.processing.utils._prefetch_executor",
+            executor,
+        ):
+            drf_root = reconstruct_drf_range(
+                capture, capture_files, 3_000, 4_000, prefetch_samples=2_000
+            )
+
+        assert lock_free == [True, True]
+        data_dir = drf_root / "ch0" / "2024-01-01T00-00-00"
+        assert (data_dir / "rf@6.000.h5").exists()
+        assert (data_dir / "rf@7.000.h5").exists()
+        assert not any((self.cache_dir / ".staging").iterdir())
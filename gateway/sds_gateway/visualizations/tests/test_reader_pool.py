@@ -0,0 +1,81 @@
+"""Tests for the pool of open DigitalRF readers."""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from django.test import override_settings
+
+from sds_gateway.visualizations.processing.reader_pool import clear_drf_reader_pool
+from sds_gateway.visualizations.processing.reader_pool import pooled_drf_params
+
+_MODULE = "sds_gateway.visualizations.processing.reader_pool"
+
+
+class DRFReaderPoolTestCases(SimpleTestCase):
+    """Test cases for reuse, eviction and invalidation of pooled readers."""
+
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.drf_path = Path(temp_dir.name)
+        self.fingerprints = {"a": "f1", "b": "f1", "c": "f1"}
+
+        manifest_patcher = patch(
+            f"{_MODULE}.read_entry_manifest",
+            side_effect=lambda capture_uuid: (
+                {"fingerprint": self.fingerprints[capture_uuid]}
+                if capture_uuid in self.fingerprints
+                else None
+            ),
+        )
+        manifest_patcher.start()
+        self.addCleanup(manifest_patcher.stop)
+        validate_patcher = patch(
+            f"{_MODULE}.validate_digitalrf_data",
+            side_effect=lambda drf_path, channel: MagicMock(channel=channel),
+        )
+        self.mock_validate = validate_patcher.start()
+        self.addCleanup(validate_patcher.stop)
+        settings_override = override_settings(DRF_READER_POOL_SIZE=2)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        clear_drf_reader_pool()
+        self.addCleanup(clear_drf_reader_pool)
+
+    def _params(self, capture_uuid: str, channel: str = "ch0"):
+        with pooled_drf_params(capture_uuid, self.drf_path, channel) as params:
+            return params
+
+    def test_reader_is_reused(self) -> None:
+        """Requests for the same capture and channel share a reader."""
+        first = self._params("a")
+
+        assert self._params("a") is first
+        assert self._params("a", "ch1") is not first
+        assert self.mock_validate.call_count == 2  # noqa: PLR2004
+
+    def test_least_recently_used_reader_is_evicted(self) -> None:
+        """Readers above DRF_READER_POOL_SIZE are dropped, least recent first."""
+        first_a = self._params("a")
+        first_b = self._params("b")
+        self._params("a")
+        self._params("c")
+
+        assert self._params("a") is first_a
+        assert self._params("b") is not first_b
+
+    def test_reader_is_reopened_when_cache_entry_changes(self) -> None:
+        """A reader opened from a replaced DRF cache entry is not reused."""
+        first = self._params("a")
+        self.fingerprints["a"] = "f2"
+
+        assert self._params("a") is not first
+
+    def test_uncached_capture_is_not_pooled(self) -> None:
+        """Captures outside of the DRF cache are opened for each use."""
+        first = self._params("uncached")
+
+        assert self._params("uncached") is not first
@@ -0,0 +1,111 @@
+"""Tests for single-pass waterfall and spectrogram post-processing."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from sds_gateway.visualizations.processing.single_pass import (
+    process_capture_single_pass,
+)
+from sds_gateway.visualizations.processing.spectrogram import SpectrogramOptions
+from sds_gateway.visualizations.processing.spectrogram import compute_spectrogram
+from sds_gateway.visualizations.processing.spectrogram import spectrogram_layout
+from sds_gateway.visualizations.processing.waterfall import SAMPLES_PER_SLICE
+from sds_gateway.visualizations.processing.waterfall import WaterfallSliceParams
+from sds_gateway.visualizations.processing.waterfall import compute_waterfall_matrix
+from sds_gateway.visualizations.processing.waterfall_binary import (
+    decode_waterfall_slices,
+)
+from sds_gateway.visualizations.tests.test_waterfall_processing import (
+    FakeDigitalRFReader,
+)
+
+_MODULE = "sds_gateway.visualizations.processing.single_pass"
+
+
+class SinglePassProcessingTestCases(SimpleTestCase):
+    """Test cases for computing all visualizations in one pass over a capture."""
+
+    def setUp(self) -> None:
+        start_sample = 5_000
+        num_samples = 40 * SAMPLES_PER_SLICE + 300
+        self.reader = FakeDigitalRFReader(
+            start_sample,
+            num_samples,
+            gaps=[(start_sample + 9_000, start_sample + 12_500)],
+        )
+        self.params = WaterfallSliceParams(
+            reader=self.reader,
+            channel="ch0",
+            slice_idx=0,
+            start_sample=start_sample,
+            samples_per_slice=SAMPLES_PER_SLICE,
+            end_sample=start_sample + num_samples,
+            fft_size=1024,
+            center_freq=1e9,
+            sample_rate_numerator=1_000_000,
+            sample_rate_denominator=1,
+        )
+        self.spectrogram_parameters = {
+            "fft_size": 256,
+            "std_dev": 30,
+            "hop_size": 100,
+            "dimensions": {"width": 100, "height": 50},
+            "processed_data_id": "unused",
+        }
+        self.rendered: list[np.ndarray] = []
+        for target, kwargs in (
+            ("SEGMENT_SLICES", {"new": 8}),
+            ("validate_waterfall_data", {"return_value": self.params}),
+            ("render_spectrogram", {"side_effect": self._render_spectrogram}),
+        ):
+            patcher = patch(f"{_MODULE}.{target}", **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _render_spectrogram(self, spectrogram, layout, params, options):
+        self.rendered.append(spectrogram)
+        return {"image_path": "/unused.png", "metadata": {}}
+
+    def test_single_pass_matches_separate_processing(self) -> None:
+        """Segments merge into the waterfall and spectrogram of the whole capture."""
+        result = process_capture_single_pass(
+            Path("/unused"),
+            "ch0",
+            spectrogram_parameters=self.spectrogram_parameters,
+            max_workers=1,
+        )
+        waterfall_path = Path(result["waterfall"]["file_path"])
+        self.addCleanup(waterfall_path.unlink)
+
+        header, spectra = decode_waterfall_slices(waterfall_path.read_bytes())
+        expected_spectra, expected_runs = compute_waterfall_matrix(self.params, 0, 40)
+        np.testing.assert_array_equal(spectra, expected_spectra)
+        assert header["slice_runs"] == [list(run) for run in expected_runs]
+        metadata = result["waterfall"]["metadata"]
+        assert metadata["slices_processed"] == len(expected_spectra)
+        assert metadata["power_bounds"]["min"] < expected_spectra.min()
+        assert metadata["power_stats"]["count"] == expected_spectra.size
+        assert metadata["power_stats"]["max"] == expected_spectra.max()
+
+        layout = spectrogram_layout(
+            Path("/unused"),
+            self.params,
+            SpectrogramOptions.model_validate(self.spectrogram_parameters),
+        )
+        np.testing.assert_allclose(
+            self.rendered[0], compute_spectrogram(layout, reader=self.reader), rtol=1e-5
+        )
+        assert result["throughput"]["segments"] == 6  # noqa: PLR2004
+        assert result["throughput"]["samples_per_second"]["total"] > 0
+
+    def test_skipped_visualizations_are_not_computed(self) -> None:
+        """Only the requested visualizations are computed."""
+        result = process_capture_single_pass(
+            Path("/unused"), "ch0", waterfall=False, max_workers=1
+        )
+
+        assert set(result) == {"throughput"}
+        assert not self.rendered
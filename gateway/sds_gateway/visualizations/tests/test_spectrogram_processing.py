@@ -0,0 +1,78 @@
+"""Tests for spectrogram processing."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from django.test import SimpleTestCase
+
+from sds_gateway.visualizations.errors import SourceDataError
+from sds_gateway.visualizations.processing.spectrogram import SpectrogramLayout
+from sds_gateway.visualizations.processing.spectrogram import compute_spectrogram
+from sds_gateway.visualizations.tests.test_waterfall_processing import (
+    FakeDigitalRFReader,
+)
+
+
+class ComputeSpectrogramTestCases(SimpleTestCase):
+    """Test cases for computing spectrograms in chunks."""
+
+    def setUp(self) -> None:
+        self.start_sample = 1_000
+        self.total_samples = 100_003
+        self.reader = FakeDigitalRFReader(self.start_sample, self.total_samples)
+
+    def _layout(self, max_columns: int) -> SpectrogramLayout:
+        return SpectrogramLayout(
+            drf_path=Path("/unused"),
+            channel="ch0",
+            start_sample=self.start_sample,
+            total_samples=self.total_samples,
+            sample_rate=1e6,
+            fft_size=256,
+            std_dev=30,
+            hop_size=100,
+            max_columns=max_columns,
+        )
+
+    def test_chunks_match_whole_capture(self) -> None:
+        """Chunked spectrograms match the one of the whole capture."""
+        layout = self._layout(max_columns=5_000)
+        expected = layout.short_time_fft().spectrogram(self.reader.samples)
+
+        with patch(
+            "sds_gateway.visualizations.processing.spectrogram."
+            "SPECTROGRAM_CHUNK_SAMPLES",
+            4_096,
+        ):
+            spectrogram = compute_spectrogram(layout, reader=self.reader)
+
+        assert spectrogram.shape == expected.shape
+        np.testing.assert_allclose(spectrogram, expected, rtol=1e-6)
+
+    def test_slices_are_averaged_to_image_width(self) -> None:
+        """Spectrograms have one column per pixel, averaging STFT slices."""
+        layout = self._layout(max_columns=37)
+        full = layout.short_time_fft().spectrogram(self.reader.samples)
+        slice_columns = np.arange(full.shape[1]) * 37 // full.shape[1]
+        expected = np.stack(
+            [full[:, slice_columns == column].mean(axis=1) for column in range(37)],
+            axis=1,
+        )
+
+        with patch(
+            "sds_gateway.visualizations.processing.spectrogram."
+            "SPECTROGRAM_CHUNK_SAMPLES",
+            4_096,
+        ):
+            spectrogram = compute_spectrogram(layout, reader=self.reader)
+
+        np.testing.assert_allclose(spectrogram, expected, rtol=1e-6)
+
+    def test_empty_captures_are_rejected(self) -> None:
+        """Captures without samples have no slices to compute columns from."""
+        layout = self._layout(max_columns=37).model_copy(update={"total_samples": 0})
+
+        with pytest.raises(SourceDataError, match="No samples"):
+            compute_spectrogram(layout, reader=self.reader)
@@ -0,0 +1,414 @@
+"""Tests for waterfall processing."""
+
+import io
+import json
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from django.test import SimpleTestCase
+
+from sds_gateway.visualizations.processing.power_stats import POWER_HISTOGRAM_BIN_DB
+from sds_gateway.visualizations.processing.power_stats import PowerStats
+from sds_gateway.visualizations.processing.waterfall import SAMPLES_PER_SLICE
+from sds_gateway.visualizations.processing.waterfall import WaterfallSliceParams
+from sds_gateway.visualizations.processing.waterfall import _process_waterfall_slice
+from sds_gateway.visualizations.processing.waterfall import compute_waterfall_matrix
+from sds_gateway.visualizations.processing.waterfall import compute_waterfall_slices
+from sds_gateway.visualizations.processing.waterfall import waterfall_slice_params
+from sds_gateway.visualizations.processing.waterfall import waterfall_slices_from_matrix
+from sds_gateway.visualizations.processing.waterfall_binary import WaterfallDType
+from sds_gateway.visualizations.processing.waterfall_binary import WaterfallMatrixFile
+from sds_gateway.visualizations.processing.waterfall_binary import (
+    decode_waterfall_slices,
+)
+from sds_gateway.visualizations.processing.waterfall_binary import (
+    encode_waterfall_slices,
+)
+from sds_gateway.visualizations.processing.waterfall_binary import (
+    stack_waterfall_slices,
+)
+from sds_gateway.visualizations.processing.waterfall_pyramid import WaterfallPooling
+from sds_gateway.visualizations.processing.waterfall_pyramid import (
+    build_waterfall_pyramid,
+)
+from sds_gateway.visualizations.processing.waterfall_pyramid import open_pyramid_level
+
+
+class FakeDigitalRFReader:
+    """In-memory stand-in for DigitalRFReader, with optional data gaps."""
+
+    def __init__(self, start_sample: int, num_samples: int, gaps=()) -> None:
+        rng = np.random.default_rng(seed=0)
+        self.start_sample = start_sample
+        self.samples = (
+            rng.standard_normal(num_samples) + 1j * rng.standard_normal(num_samples)
+        ).astype(np.complex64)
+        self.has_data = np.ones(num_samples, dtype=bool)
+        for gap_start, gap_end in gaps:
+            self.has_data[gap_start - start_sample : gap_end - start_sample] = False
+
+    def get_channels(self) -> list[str]:
+        return ["ch0"]
+
+    def read_vector(self, start, num_samples, channel, sub_channel):
+        offset = start - self.start_sample
+        if not self.has_data[offset : offset + num_samples].all():
+            msg = "Data gap"
+            raise OSError(msg)
+        return self.samples[offset : offset + num_samples].copy()
+
+    def get_continuous_blocks(self, start, end, channel):
+        blocks = {}
+        offset = start - self.start_sample
+        in_block = False
+        for index in range(offset, end - self.start_sample + 1):
+            if self.has_data[index] and not in_block:
+                block_start = index + self.start_sample
+                blocks[block_start] = 0
+            if self.has_data[index]:
+                blocks[block_start] += 1
+            in_block = bool(self.has_data[index])
+        return blocks
+
+
+class ComputeWaterfallSlicesTestCases(SimpleTestCase):
+    """Test cases for the batched waterfall slice computation."""
+
+    def setUp(self) -> None:
+        start_sample = 10_000
+        num_slices = 40
+        self.reader = FakeDigitalRFReader(
+            start_sample=start_sample,
+            num_samples=num_slices * SAMPLES_PER_SLICE,
+            gaps=[
+                (start_sample + 5_000, start_sample + 5_100),
+                (start_sample + 20 * SAMPLES_PER_SLICE, start_sample + 23_600),
+            ],
+        )
+        self.params = WaterfallSliceParams(
+            reader=self.reader,
+            channel="ch0",
+            slice_idx=0,
+            start_sample=start_sample,
+            samples_per_slice=SAMPLES_PER_SLICE,
+            end_sample=start_sample + num_slices * SAMPLES_PER_SLICE,
+            fft_size=1024,
+            center_freq=1e9,
+            sample_rate_numerator=10_000_000,
+            sample_rate_denominator=1,
+        )
+
+    def _slices_one_at_a_time(self, start_index: int, end_index: int) -> list:
+        return [
+            waterfall_slice
+            for slice_idx in range(start_index, end_index)
+            if (
+                waterfall_slice := _process_waterfall_slice(
+                    self.params.model_copy(update={"slice_idx": slice_idx})
+                )
+            )
+        ]
+
+    def test_batched_slices_match_single_slices(self) -> None:
+        """Batches produce the same slices as processing each slice on its own."""
+        with patch(
+            "sds_gateway.visualizations.processing.waterfall.WATERFALL_BATCH_SLICES",
+            16,
+        ):
+            for start_index, end_index in [(0, 40), (2, 6), (18, 26)]:
+                assert compute_waterfall_slices(
+                    self.params, start_index, end_index
+                ) == self._slices_one_at_a_time(start_index, end_index)
+
+    def test_slices_with_data_gaps_are_left_out(self) -> None:
+        """Slices overlapping data gaps are skipped, as when processed one by one."""
+        slice_indices = [
+            waterfall_slice["custom_fields"]["slice_index"]
+            for waterfall_slice in compute_waterfall_slices(self.params, 0, 40)
+        ]
+
+        assert 4 not in slice_indices  # noqa: PLR2004
+        assert not {20, 21, 22, 23} & set(slice_indices)
+        assert len(slice_indices) == 40 - 5
+
+
+class WaterfallBinaryTestCases(SimpleTestCase):
+    """Test cases for the binary transport format of waterfall slices."""
+
+    def setUp(self) -> None:
+        start_sample = 0
+        self.params = WaterfallSliceParams(
+            reader=FakeDigitalRFReader(
+                start_sample=start_sample,
+                num_samples=12 * SAMPLES_PER_SLICE,
+                gaps=[(3 * SAMPLES_PER_SLICE, 4 * SAMPLES_PER_SLICE)],
+            ),
+            channel="ch0",
+            slice_idx=0,
+            start_sample=start_sample,
+            samples_per_slice=SAMPLES_PER_SLICE,
+            end_sample=start_sample + 12 * SAMPLES_PER_SLICE,
+            fft_size=1024,
+            center_freq=1e9,
+            sample_rate_numerator=10_000_000,
+            sample_rate_denominator=1,
+        )
+
+    def test_matrix_matches_json_slices(self) -> None:
+        """The matrix and its runs hold the same spectra as the JSON slices."""
+        spectra, slice_runs = compute_waterfall_matrix(self.params, 0, 12)
+        stacked, stacked_runs = stack_waterfall_slices(
+            compute_waterfall_slices(self.params, 0, 12), start_index=0
+        )
+
+        assert slice_runs == [(0, 3), (4, 8)]
+        assert stacked_runs == slice_runs
+        np.testing.assert_array_equal(spectra, stacked)
+
+    def test_round_trip(self) -> None:
+        """Payloads decode to the encoded spectra, within quantization error."""
+        spectra, slice_runs = compute_waterfall_matrix(self.params, 0, 12)
+        max_error = {
+            WaterfallDType.Float32: 0.0,
+            WaterfallDType.Float16: 0.1,
+            WaterfallDType.Uint8: float(np.ptp(spectra)) / 255,
+        }
+        for dtype, tolerance in max_error.items():
+            payload = encode_waterfall_slices(
+                spectra,
+                slice_runs,
+                header={"start_index": 0, "end_index": 12},
+                dtype=dtype,
+            )
+            header, decoded = decode_waterfall_slices(payload)
+
+            assert header["dtype"] == dtype
+            assert header["slice_runs"] == [[0, 3], [4, 8]]
+            assert header["start_index"] == 0
+            assert decoded.shape == spectra.shape
+            assert np.abs(decoded - spectra).max() <= tolerance
+
+    def test_payload_is_smaller_than_json(self) -> None:
+        """A float32 payload is smaller than the base64-encoded JSON slices."""
+        slices = compute_waterfall_slices(self.params, 0, 12)
+        spectra, slice_runs = compute_waterfall_matrix(self.params, 0, 12)
+        payload = encode_waterfall_slices(spectra, slice_runs, header={})
+
+        assert len(payload) < len(json.dumps(slices)) * 0.8
+
+
+class WaterfallMatrixFileTestCases(SimpleTestCase):
+    """Test cases for random access to waterfalls stored in the binary format."""
+
+    def setUp(self) -> None:
+        num_slices = 40
+        self.params = WaterfallSliceParams(
+            reader=FakeDigitalRFReader(
+                start_sample=0,
+                num_samples=num_slices * SAMPLES_PER_SLICE,
+                gaps=[(10 * SAMPLES_PER_SLICE, 12 * SAMPLES_PER_SLICE)],
+            ),
+            channel="ch0",
+            slice_idx=0,
+            start_sample=0,
+            samples_per_slice=SAMPLES_PER_SLICE,
+            end_sample=num_slices * SAMPLES_PER_SLICE,
+            fft_size=1024,
+            center_freq=1e9,
+            sample_rate_numerator=10_000_000,
+            sample_rate_denominator=1,
+        )
+        spectra, slice_runs = compute_waterfall_matrix(self.params, 0, num_slices)
+        self.payload = encode_waterfall_slices(
+            spectra,
+            slice_runs,
+            header={
+                "total_slices": num_slices,
+                "slice_params": self.params.model_dump(
+                    include={
+                        "channel",
+                        "start_sample",
+                        "end_sample",
+                        "fft_size",
+                        "center_freq",
+                        "sample_rate_numerator",
+                        "sample_rate_denominator",
+                        "samples_per_slice",
+                    }
+                ),
+            },
+        )
+        self.reads: list[tuple[int, int]] = []
+
+    def _read_range(self, offset: int, length: int) -> bytes:
+        self.reads.append((offset, length))
+        return self.payload[offset : offset + length]
+
+    def test_ranges_match_computed_slices(self) -> None:
+        """Slices read from the stored matrix match the computed ones."""
+        stored = WaterfallMatrixFile(self._read_range)
+        slice_params = waterfall_slice_params(stored.header["slice_params"])
+
+        assert stored.total_slices == 40  # noqa: PLR2004
+        for start_index, end_index in [(0, 40), (5, 15), (10, 12), (36, 40)]:
+            spectra, slice_runs = stored.read_slices(start_index, end_index)
+            assert waterfall_slices_from_matrix(
+                slice_params, spectra, slice_runs
+            ) == compute_waterfall_slices(self.params, start_index, end_index)
+
+    def test_reads_only_the_rows_of_a_range(self) -> None:
+        """A range is read with a single read of the bytes of its rows."""
+        stored = WaterfallMatrixFile(self._read_range)
+        self.reads.clear()
+
+        spectra, slice_runs = stored.read_slices(30, 34)
+
+        assert slice_runs == [(30, 4)]
+        assert len(self.reads) == 1
+        assert self.reads[0][1] == spectra.nbytes == 4 * 1024 * 4
+
+    def test_rejects_json_files(self) -> None:
+        """JSON files of older waterfalls are not mistaken for stored matrices."""
+        with pytest.raises(ValueError, match="binary format"):
+            WaterfallMatrixFile(lambda offset, length: b'[{"data": ""}]')
+
+
+class WaterfallPyramidTestCases(SimpleTestCase):
+    """Test cases for multi-resolution pyramids of stored waterfalls."""
+
+    def setUp(self) -> None:
+        # 1000 slices of 8 bins, with a data gap over slices [200, 260)
+        rng = np.random.default_rng(seed=0)
+        self.slice_runs = [(0, 200), (260, 740)]
+        self.spectra = rng.uniform(-100, 0, (940, 8)).astype(np.float32)
+        self.full = np.full((1000, 8), np.nan)
+        self.full[:200] = self.spectra[:200]
+        self.full[260:] = self.spectra[200:]
+        payload = encode_waterfall_slices(
+            self.spectra,
+            self.slice_runs,
+            header={
+                "total_slices": 1000,
+                "slice_params": {"start_sample": 0, "samples_per_slice": 1024},
+            },
+        )
+        output = io.BytesIO()
+        with (
+            patch(
+                "sds_gateway.visualizations.processing.waterfall_pyramid."
+                "WATERFALL_PYRAMID_MIN_ROWS",
+                10,
+            ),
+            patch(
+                "sds_gateway.visualizations.processing.waterfall_pyramid._READ_SLICES",
+                64,
+            ),
+        ):
+            self.pyramid = build_waterfall_pyramid(
+                WaterfallMatrixFile(
+                    lambda offset, length: payload[offset : offset + length]
+                ),
+                output,
+            )
+        self.stored = output.getvalue()
+
+    def _level(self, level: int, pooling: WaterfallPooling) -> WaterfallMatrixFile:
+        return open_pyramid_level(
+            lambda offset, length: self.stored[offset : offset + length],
+            self.pyramid,
+            level,
+            pooling,
+        )
+
+    def test_levels_pool_full_resolution_slices(self) -> None:
+        """Rows of each level pool the power of the slices they cover."""
+        assert [level["total_slices"] for level in self.pyramid["levels"]] == [
+            250,
+            63,
+            16,
+            4,
+        ]
+        for level in (1, 3):
+            slices_per_row = 4**level
+            max_level = self._level(level, WaterfallPooling.Max)
+            mean_level = self._level(level, WaterfallPooling.Mean)
+            max_db, slice_runs = max_level.read_slices(0, max_level.total_slices)
+            mean_db, _ = mean_level.read_slices(0, mean_level.total_slices)
+
+            rows = [
+                index
+                for first, count in slice_runs
+                for index in range(first, first + count)
+            ]
+            for row, index in enumerate(rows):
+                pooled = self.full[
+                    index * slices_per_row : (index + 1) * slices_per_row
+                ]
+                pooled = pooled[~np.isnan(pooled[:, 0])]
+                np.testing.assert_allclose(max_db[row], pooled.max(axis=0))
+                np.testing.assert_allclose(
+                    mean_db[row],
+                    10 * np.log10(np.mean(10 ** (pooled / 10), axis=0)),
+                    rtol=1e-5,
+                )
+            assert (
+                max_level.header["slice_params"]["samples_per_slice"]
+                == 1024 * slices_per_row
+            )
+
+    def test_rows_covering_only_gaps_are_left_out(self) -> None:
+        """Rows of slices all missing due to data gaps are left out of levels."""
+        _, slice_runs = self._level(1, WaterfallPooling.Max).read_slices(0, 250)
+
+        assert slice_runs == [(0, 50), (65, 185)]
+
+    def test_rejects_missing_levels(self) -> None:
+        """Levels above the top of the pyramid are rejected."""
+        with pytest.raises(ValueError, match="no level 5"):
+            self._level(5, WaterfallPooling.Max)
+
+
+class PowerStatsTestCases(SimpleTestCase):
+    """Test cases for the power statistics stored with waterfalls."""
+
+    def setUp(self) -> None:
+        rng = np.random.default_rng(seed=0)
+        self.spectra = rng.normal(-80, 12, size=(300, 64)).astype(np.float32)
+        self.spectra[5, 3] = -np.inf
+
+    def test_summary_matches_spectra(self) -> None:
+        """Statistics match the finite power values, percentiles within a bin."""
+        power_stats = PowerStats()
+        power_stats.add(self.spectra)
+        summary = power_stats.summary()
+
+        finite = self.spectra[np.isfinite(self.spectra)]
+        assert summary["count"] == finite.size
+        assert (summary["min"], summary["max"]) == (finite.min(), finite.max())
+        np.testing.assert_allclose(summary["mean"], finite.mean(dtype=np.float64))
+        for percent, value in summary["percentiles"].items():
+            assert abs(value - np.percentile(finite, float(percent))) <= (
+                POWER_HISTOGRAM_BIN_DB
+            )
+        assert sum(summary["histogram"]["counts"]) == finite.size
+        assert summary["histogram"]["start_db"] <= finite.min()
+        assert power_stats.power_bounds()["min"] < finite.min()
+
+    def test_merged_segments_match_whole(self) -> None:
+        """Statistics of segments merge into the ones of the whole waterfall."""
+        whole = PowerStats()
+        whole.add(self.spectra)
+        merged = PowerStats()
+        for segment in np.array_split(self.spectra, 7):
+            segment_stats = PowerStats()
+            segment_stats.add(segment)
+            merged.merge(segment_stats)
+
+        merged_summary = merged.summary()
+        whole_summary = whole.summary()
+        np.testing.assert_allclose(
+            merged_summary.pop("mean"), whole_summary.pop("mean")
+        )
+        assert merged_summary == whole_summary
+        assert PowerStats().summary() is None
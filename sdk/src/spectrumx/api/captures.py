@@ -10,6 +10,8 @@ from datetime import datetime
 from pathlib import PurePosixPath
 from typing import TYPE_CHECKING
 from typing import Any
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
 
 from loguru import logger as log
 from pydantic import ValidationError
@@ -355,7 +357,7 @@ class CaptureAPI:
                             }
                             ```
         Returns:
-            A list of captures matching the query.
+            A list of captures matching the query, from all pages of results.
         """
 
         # TODO: adapt this function to return a Paginator[Capture] object
@@ -370,28 +372,34 @@ class CaptureAPI:
                 for _ in range(5)
             ]
 
-        search_results_raw = self.gateway.captures_advanced_search(
-            field_path=field_path,
-            query_type=query_type,
-            filter_value=filter_value,
-        )
-        search_results_obj = json.loads(search_results_raw)
         captures: list[Capture] = []
-        if "results" not in search_results_obj:
-            msg = "Unexpected search result format."
-            raise CaptureError(msg)
-        search_results = search_results_obj["results"]
-        for result_raw in search_results:
-            try:
-                capture = Capture.model_validate(result_raw)
-            except ValidationError as err:
-                log_user_warning(
-                    f"Validation error loading search result: {result_raw}"
-                )
-                log.bind(cat=LogCategory.FILESYSTEM).exception(err)
-                continue
-            else:
-                captures.append(capture)
+        cursor: str | None = None
+        while True:
+            search_results_raw = self.gateway.captures_advanced_search(
+                field_path=field_path,
+                query_type=query_type,
+                filter_value=filter_value,
+                cursor=cursor,
+            )
+            search_results_obj = json.loads(search_results_raw)
+            if "results" not in search_results_obj:
+                msg = "Unexpected search result format."
+                raise CaptureError(msg)
+            search_results = search_results_obj["results"]
+            for result_raw in search_results:
+                try:
+                    capture = Capture.model_validate(result_raw)
+                except ValidationError as err:
+                    log_user_warning(
+                        f"Validation error loading search result: {result_raw}"
+                    )
+                    log.bind(cat=LogCategory.FILESYSTEM).exception(err)
+                    continue
+                else:
+                    captures.append(capture)
+            cursor = _extract_cursor(search_results_obj.get("next"))
+            if cursor is None:
+                break
         if self.verbose:
             log.bind(cat=LogCategory.FILESYSTEM).debug(
                 f"Search returned {len(captures)} captures"
@@ -399,6 +407,14 @@ class CaptureAPI:
         return captures
 
 
+def _extract_cursor(next_url: str | None) -> str | None:
+    """Extracts the cursor of the next page from its URL, if any."""
+    if not next_url:
+        return None
+    cursors = parse_qs(urlparse(next_url).query).get("cursor")
+    return cursors[0] if cursors else None
+
+
 def _extract_page_from_payload(
     capture_result_raw: bytes,
 ) -> tuple[list[dict[str, Any]], bool | None]:
@@ -10,6 +10,7 @@ from loguru import logger as log
 
 from spectrumx.models.datasets import Dataset
 from spectrumx.models.files import File
+from spectrumx.ops.pagination import DEFAULT_PREFETCH_PAGES
 from spectrumx.ops.pagination import Paginator
 from spectrumx.utils import LogCategory
 from spectrumx.utils import log_user
@@ -144,6 +145,7 @@ class DatasetAPI:
             list_kwargs=list_kwargs,
             dry_run=self.dry_run,
             verbose=self.verbose,
+            prefetch_pages=DEFAULT_PREFETCH_PAGES,
         )
 
         return pagination
@@ -4,9 +4,13 @@
 # pyright: reportPrivateUsage=false
 
 import collections.abc
+import functools
+import math
 import os
 import tempfile
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC
 from datetime import datetime
 from enum import Enum
@@ -19,17 +23,33 @@ from loguru import logger as log
 from pydantic import UUID4
 
 from spectrumx.api.uploads import UploadPersistenceManager
+from spectrumx.api.uploads import UploadSessionStore
 from spectrumx.client import Client
+from spectrumx.errors import FileError
+from spectrumx.errors import NetworkError
 from spectrumx.errors import SDSError
+from spectrumx.errors import ServiceError
+from spectrumx.gateway import FILE_CONTENTS_CHECK_BATCH_SIZE
+from spectrumx.gateway import FileContentsCheck
+from spectrumx.gateway import UploadSession
 from spectrumx.models.files import File
 from spectrumx.ops import files
+from spectrumx.ops.pagination import DEFAULT_PREFETCH_PAGES
 from spectrumx.ops.pagination import Paginator
 from spectrumx.utils import LogCategory
 from spectrumx.utils import log_user
 from spectrumx.utils import log_user_warning
+from spectrumx.utils import sum_blake3
 
 log.trace("Placeholder log to avoid reimporting or resolving unused import warnings.")
 
+# how many times a dropped download is resumed before giving up
+DOWNLOAD_RESUME_ATTEMPTS: int = 3
+# files are only split in ranged parts when each part is at least this large
+DOWNLOAD_MIN_PART_SIZE: int = 64 * 1024 * 1024  # 64 MiB
+# how many times the upload of a part of a large file is attempted
+UPLOAD_PART_ATTEMPTS: int = 3
+
 
 def file_list_time_query_param(value: datetime) -> str:
     """Format a datetime for Gateway file list temporal query params (ISO 8601, UTC)."""
@@ -156,6 +176,7 @@ def list_files(
         },
         dry_run=client.dry_run,
         verbose=verbose,
+        prefetch_pages=DEFAULT_PREFETCH_PAGES,
     )
 
     return pagination
@@ -167,6 +188,7 @@ def upload_file(
     local_file: File | Path | str,
     sds_path: PurePosixPath | Path | str = "/",
     progress_callback: collections.abc.Callable[[int], None] | None = None,
+    contents_check: FileContentsCheck | None = None,
 ) -> File:
     """Uploads a file to SDS.
 
@@ -181,9 +203,63 @@ def upload_file(
     Args:
         local_file:     The local file to upload.
         sds_path:       The virtual directory on SDS to upload the file to.
+        contents_check: Result of `check_contents_exist_in_batches()` for this
+                            file, to skip checking its contents with SDS again.
     Returns:
         The file instance with updated attributes, or a sample when in dry run.
     """
+    file_instance = __compose_upload_instance(local_file=local_file, sds_path=sds_path)
+    return __upload_file_mux(
+        client=client,
+        file_instance=file_instance,
+        progress_callback=progress_callback,
+        contents_check=contents_check,
+    )
+
+
+def check_contents_exist_in_batches(
+    *,
+    client: Client,
+    local_files: list[File],
+    sds_path: PurePosixPath | Path | str = "/",
+) -> list[FileContentsCheck] | None:
+    """Checks which file contents SDS already has, with one request per batch.
+
+    Args:
+        local_files:    The local files that will be uploaded.
+        sds_path:       The virtual directory on SDS the files will be uploaded to,
+                            composed with their directories as in `upload_file()`.
+    Returns:
+        One FileContentsCheck per file, in the same order, to be passed to
+            `upload_file()`; OR None when in dry-run mode or when the gateway
+            doesn't support batch checks.
+    """
+    if client.dry_run:
+        return None
+    contents_checks: list[FileContentsCheck] = []
+    for batch_start in range(0, len(local_files), FILE_CONTENTS_CHECK_BATCH_SIZE):
+        batch = [
+            __compose_upload_instance(local_file=local_file, sds_path=sds_path)
+            for local_file in local_files[
+                batch_start : batch_start + FILE_CONTENTS_CHECK_BATCH_SIZE
+            ]
+        ]
+        batch_checks = client._gateway.check_files_contents_exist(file_instances=batch)
+        if batch_checks is None:
+            log.bind(cat=LogCategory.UPLOAD).debug(
+                "Batch contents checks unavailable: checking files one by one"
+            )
+            return None
+        contents_checks.extend(batch_checks)
+    return contents_checks
+
+
+def __compose_upload_instance(
+    *,
+    local_file: File | Path | str,
+    sds_path: PurePosixPath | Path | str,
+) -> File:
+    """Builds the file instance to upload, under `sds_path` in SDS."""
     # validate inputs
     if not isinstance(local_file, (File, Path, str)):
         msg = f"file_path must be a Path, str, or File instance, not {type(local_file)}"
@@ -197,13 +273,8 @@ def upload_file(
         if file_instance.directory:
             composed_sds_path = PurePosixPath(f"{sds_path}/{file_instance.directory}")
             file_instance.directory = composed_sds_path
-    else:
-        file_instance = files.construct_file(local_file, sds_path=sds_path)
-    del local_file
-
-    return __upload_file_mux(
-        client=client, file_instance=file_instance, progress_callback=progress_callback
-    )
+        return file_instance
+    return files.construct_file(local_file, sds_path=sds_path)
 
 
 def detach_file_from_datasets(
@@ -314,6 +385,9 @@ def __download_file_contents_if_applicable(
         target_path=valid_local_path_or_none,
         contents_lock=file_instance.contents_lock,  # pyright: ignore[reportPrivateUsage]
         progress_callback=progress_callback,
+        expected_size=file_instance.size,
+        expected_sum_blake3=file_instance.sum_blake3,
+        max_parts=client._config.max_download_parts,
     )
     file_instance.local_path = downloaded_path
 
@@ -325,6 +399,9 @@ def __download_file_contents(
     contents_lock: RLock,
     target_path: Path | None = None,
     progress_callback: collections.abc.Callable[[int], None] | None = None,
+    expected_size: int | None = None,
+    expected_sum_blake3: str | None = None,
+    max_parts: int = 1,
 ) -> Path:
     """Downloads the contents of a file from SDS to a location on disk.
 
@@ -332,13 +409,19 @@ def __download_file_contents(
     When provided, the parent of target_path will be created if it does not exist.
 
     Downloads to a temporary file first, then atomically moves it to target_path
-    to ensure partial downloads don't leave incomplete files in place.
+    to ensure partial downloads don't leave incomplete files in place. The partial
+    file is kept when the connection drops, and later downloads of the same file
+    to the same target resume from its last byte with an HTTP range request.
 
     Args:
         file_uuid:          The UUID of the file to download from SDS.
         target_path:        The local path to save the downloaded file to.
         progress_callback:  Optional callable invoked with byte count as
             chunks are received from the stream (for progress tracking).
+        expected_size:      Size of the file in SDS, used to resume or split it.
+        expected_sum_blake3: Checksum the downloaded contents must match.
+        max_parts:          Maximum number of ranged parts downloaded in
+            parallel for large files. 1 disables parallel parts.
     Returns:
         The local path to the downloaded file.
     """
@@ -364,40 +447,221 @@ def __download_file_contents(
 
     # The path to download is a temporary file: this prevents partial downloads from
     #   showing up as valid files. When the target path itself is temporary, that is
-    #   used directly for downloads.
+    #   used directly for downloads. Its name is deterministic so an interrupted
+    #   download can be resumed by the next attempt.
     if is_temp_target:
         download_path = target_path
     else:
         # NOTE: this temporary location might not have enough space to download large
         #   files. We're not handling that case, as it's uncommon and will be raised
         #   as an OSError during download for the user to take action.
-        file_desc, temp_file_name = tempfile.mkstemp(
-            dir=target_path.parent, prefix=".tmp-", suffix=".downloading"
+        download_path = (
+            target_path.parent
+            / f".tmp-{target_path.name}.{uuid_to_set.hex}.downloading"
         )
-        os.close(file_desc)
-        download_path = Path(temp_file_name)
+
+    fetch_contents = __get_contents_fetcher(
+        client=client,
+        file_uuid=uuid_to_set,
+        expected_sum_blake3=expected_sum_blake3,
+    )
+    is_parallel = (
+        max_parts > 1
+        and expected_size is not None
+        and expected_size >= 2 * DOWNLOAD_MIN_PART_SIZE
+    )
 
     try:
-        # download contents
-        with download_path.open(mode="wb") as file_ptr, contents_lock:
-            for chunk in client._gateway.get_file_contents_by_id(uuid=uuid_to_set.hex):
-                file_ptr.write(chunk)
-                if progress_callback:
-                    progress_callback(len(chunk))
-            file_ptr.flush()
-            os.fsync(file_ptr.fileno())
+        with contents_lock:
+            if is_parallel:
+                __download_contents_in_parts(
+                    fetch_contents=fetch_contents,
+                    download_path=download_path,
+                    file_size=expected_size or 0,
+                    max_parts=max_parts,
+                    progress_callback=progress_callback,
+                )
+            else:
+                __download_contents_resumable(
+                    fetch_contents=fetch_contents,
+                    file_uuid=uuid_to_set,
+                    download_path=download_path,
+                    expected_size=expected_size,
+                    progress_callback=progress_callback,
+                )
+
+            if expected_sum_blake3:
+                __verify_downloaded_checksum(
+                    file_uuid=uuid_to_set,
+                    download_path=download_path,
+                    expected_sum_blake3=expected_sum_blake3,
+                )
 
         # move to target path if needed
         if not is_temp_target:
             download_path.replace(target_path)
     except Exception:
-        if not is_temp_target:
+        is_resumable = (
+            not is_temp_target
+            and not is_parallel
+            and download_path.exists()
+            and download_path.stat().st_size > 0
+        )
+        if is_resumable:
+            log.bind(cat=LogCategory.DOWNLOAD).warning(
+                f"Download of {uuid_to_set} interrupted: kept partial file "
+                f"'{download_path}' to resume on the next attempt"
+            )
+        elif not is_temp_target:
             download_path.unlink(missing_ok=True)
         raise
 
     return target_path
 
 
+def __get_contents_fetcher(
+    *, client: Client, file_uuid: UUID4, expected_sum_blake3: str | None
+) -> collections.abc.Callable[..., collections.abc.Iterator[bytes]]:
+    """Returns a callable streaming byte ranges of the file contents.
+
+    The callable takes `start_byte` and `end_byte` keyword arguments. Contents
+        come from a presigned object storage URL when presigned transfers are
+        enabled and available for this file, or through the gateway otherwise.
+    """
+    if client._config.presigned_transfers:
+        presigned_url = client._gateway.get_file_download_url(uuid=file_uuid.hex)
+        if presigned_url is not None:
+            return functools.partial(
+                client._gateway.get_presigned_contents, presigned_url
+            )
+        log.bind(cat=LogCategory.DOWNLOAD).debug(
+            f"Presigned download unavailable for {file_uuid}: using the gateway"
+        )
+    # contents are immutable, so their checksum validates resumed ranges
+    return functools.partial(
+        client._gateway.get_file_contents_by_id,
+        uuid=file_uuid.hex,
+        if_range=f'"{expected_sum_blake3}"' if expected_sum_blake3 else None,
+    )
+
+
+def __verify_downloaded_checksum(
+    *, file_uuid: UUID4, download_path: Path, expected_sum_blake3: str
+) -> None:
+    """Discards the downloaded contents when they don't match the SDS checksum."""
+    downloaded_sum = sum_blake3(download_path)
+    if downloaded_sum == expected_sum_blake3:
+        return
+    download_path.unlink(missing_ok=True)
+    msg = (
+        f"Checksum mismatch for downloaded file {file_uuid}: "
+        f"expected {expected_sum_blake3}, got {downloaded_sum}"
+    )
+    raise FileError(msg)
+
+
+def __download_contents_resumable(  # noqa: C901
+    *,
+    fetch_contents: collections.abc.Callable[..., collections.abc.Iterator[bytes]],
+    file_uuid: UUID4,
+    download_path: Path,
+    expected_size: int | None,
+    progress_callback: collections.abc.Callable[[int], None] | None,
+) -> None:
+    """Streams file contents to download_path, resuming from any partial contents.
+
+    Dropped connections are resumed up to DOWNLOAD_RESUME_ATTEMPTS times.
+    """
+    bytes_credited: int = 0
+    for attempt in range(1, DOWNLOAD_RESUME_ATTEMPTS + 1):
+        offset = download_path.stat().st_size if download_path.exists() else 0
+        if expected_size is not None and offset > expected_size:
+            # not a prefix of this file: start over
+            download_path.unlink()
+            offset = 0
+        # partial bytes from an earlier attempt count towards progress
+        if progress_callback and offset > bytes_credited:
+            progress_callback(offset - bytes_credited)
+        bytes_credited = max(bytes_credited, offset)
+        if expected_size is not None and 0 < expected_size == offset:
+            return
+        if offset > 0:
+            log.bind(cat=LogCategory.DOWNLOAD).debug(
+                f"Resuming download of {file_uuid} from byte {offset}"
+            )
+        try:
+            with download_path.open(mode="ab") as file_ptr:
+                for chunk in fetch_contents(start_byte=offset):
+                    file_ptr.write(chunk)
+                    bytes_credited += len(chunk)
+                    if progress_callback:
+                        progress_callback(len(chunk))
+                file_ptr.flush()
+                os.fsync(file_ptr.fileno())
+        except NetworkError as err:
+            if attempt == DOWNLOAD_RESUME_ATTEMPTS:
+                raise
+            log.bind(cat=LogCategory.DOWNLOAD).warning(
+                f"Download of {file_uuid} interrupted ({err}); resuming "
+                f"(attempt {attempt + 1}/{DOWNLOAD_RESUME_ATTEMPTS})"
+            )
+        else:
+            return
+
+
+def __download_contents_in_parts(
+    *,
+    fetch_contents: collections.abc.Callable[..., collections.abc.Iterator[bytes]],
+    download_path: Path,
+    file_size: int,
+    max_parts: int,
+    progress_callback: collections.abc.Callable[[int], None] | None,
+) -> None:
+    """Downloads a large file as ranged parts in parallel into download_path.
+
+    Each part is written at its offset of a pre-allocated file, and resumed on
+        its own when its connection drops.
+    """
+    part_size = max(math.ceil(file_size / max_parts), DOWNLOAD_MIN_PART_SIZE)
+    part_ranges = [
+        (start, min(start + part_size, file_size) - 1)
+        for start in range(0, file_size, part_size)
+    ]
+    with download_path.open(mode="wb") as file_ptr:
+        file_ptr.truncate(file_size)
+
+    progress_lock = threading.Lock()
+
+    def _download_part(part_range: tuple[int, int]) -> None:
+        position, end_byte = part_range
+        for attempt in range(1, DOWNLOAD_RESUME_ATTEMPTS + 1):
+            try:
+                with download_path.open(mode="r+b") as part_ptr:
+                    part_ptr.seek(position)
+                    for chunk in fetch_contents(start_byte=position, end_byte=end_byte):
+                        part_ptr.write(chunk)
+                        position += len(chunk)
+                        if progress_callback:
+                            with progress_lock:
+                                progress_callback(len(chunk))
+            except NetworkError:
+                if attempt == DOWNLOAD_RESUME_ATTEMPTS:
+                    raise
+            else:
+                return
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_parts, len(part_ranges)),
+        thread_name_prefix="sds-download-part",
+    ) as executor:
+        # consuming the results re-raises the first failure
+        for _ in executor.map(_download_part, part_ranges):
+            pass
+
+    with download_path.open(mode="rb+") as file_ptr:
+        os.fsync(file_ptr.fileno())
+
+
 def __extract_download_info_from_file_instance(
     file_instance: File,
     *,
@@ -420,12 +684,16 @@ def __extract_download_info_from_file_instance(
 
 
 def __get_upload_mode_and_asset(
-    *, client: Client, file_instance: File
+    *,
+    client: Client,
+    file_instance: File,
+    contents_check: FileContentsCheck | None = None,
 ) -> tuple[FileUploadMode, uuid.UUID | None]:
     """Determines how to upload a file into SDS.
 
     Args:
         file_instance:  The file instance to get the upload mode for.
+        contents_check: A previous contents check for this file, if any.
     Returns:
         The mode to upload the file in. Modes are:
             FileUploadMode.SKIP
@@ -453,8 +721,10 @@ def __get_upload_mode_and_asset(
             None,
         )
 
-    file_contents_check = client._gateway.check_file_contents_exist(
-        file_instance=file_instance
+    file_contents_check = (
+        contents_check
+        if contents_check is not None
+        else client._gateway.check_file_contents_exist(file_instance=file_instance)
     )
     asset_id = file_contents_check.asset_id
 
@@ -504,12 +774,13 @@ def __upload_file_mux(  # noqa: C901
     client: Client,
     file_instance: File,
     progress_callback: collections.abc.Callable[[int], None] | None = None,
+    contents_check: FileContentsCheck | None = None,
 ) -> File:
     """Uploads a file instance to SDS, choosing the right upload mode."""
     file_path = file_instance.local_path
     # check whether sds already has this file for this user
     upload_mode, asset_id = __get_upload_mode_and_asset(
-        client=client, file_instance=file_instance
+        client=client, file_instance=file_instance, contents_check=contents_check
     )
     verbose = client.verbose
 
@@ -576,14 +847,143 @@ def __upload_contents_and_metadata(
         return file_instance
 
     assert not client.dry_run, "Internal error: expected dry run to be disabled."
-    file_response = client._gateway.upload_new_file(
-        file_instance=file_instance, progress_callback=progress_callback
-    )
+    file_response: bytes | None = None
+    threshold = client._config.chunked_upload_threshold
+    if (
+        threshold > 0
+        and file_instance.local_path is not None
+        and file_instance.local_path.stat().st_size >= threshold
+    ):
+        file_response = __upload_contents_in_parts(
+            client=client,
+            file_instance=file_instance,
+            progress_callback=progress_callback,
+        )
+        if file_response is None:
+            log.bind(cat=LogCategory.UPLOAD).debug(
+                "Upload sessions unavailable: uploading the whole file"
+            )
+    if file_response is None and client._config.presigned_transfers:
+        file_response = client._gateway.upload_new_file_presigned(
+            file_instance=file_instance, progress_callback=progress_callback
+        )
+        if file_response is None:
+            log.bind(cat=LogCategory.UPLOAD).debug(
+                "Presigned upload unavailable: uploading through the gateway"
+            )
+    if file_response is None:
+        file_response = client._gateway.upload_new_file(
+            file_instance=file_instance, progress_callback=progress_callback
+        )
     uploaded_file = File.model_validate_json(file_response)
     uploaded_file.local_path = file_instance.local_path
     return uploaded_file
 
 
+def __upload_contents_in_parts(
+    *,
+    client: Client,
+    file_instance: File,
+    progress_callback: collections.abc.Callable[[int], None] | None = None,
+) -> bytes | None:
+    """UPLOADS a large file in parts through a resumable upload session.
+
+    Uploads interrupted in an earlier run resume from the parts missing in
+        their session, and each part is retried on its own when it fails.
+
+    Returns:
+        The response content from SDS Gateway, or None when the gateway
+            doesn't support upload sessions or the file can't be checksummed.
+    """
+    local_path = file_instance.local_path
+    assert local_path is not None, "Expected a local file to upload"
+    sum_blake3 = file_instance.compute_sum_blake3()
+    if sum_blake3 is None:
+        # sessions are keyed by checksum: upload the whole file instead
+        log.bind(cat=LogCategory.UPLOAD).debug(
+            f"Could not checksum '{local_path}' for an upload session"
+        )
+        return None
+    session_store = UploadSessionStore()
+    session = __get_resumable_upload_session(
+        client=client,
+        local_path=local_path,
+        sum_blake3=sum_blake3,
+        session_store=session_store,
+    )
+    if session is None:
+        return None
+
+    if progress_callback:
+        missing_bytes = sum(
+            session.part_range(part_number)[1] for part_number in session.missing_parts
+        )
+        progress_callback(session.size - missing_bytes)
+    with local_path.open("rb") as file_ptr:
+        for part_number in session.missing_parts:
+            offset, part_size = session.part_range(part_number)
+            file_ptr.seek(offset)
+            data = file_ptr.read(part_size)
+            __upload_session_part(
+                client=client, session=session, part_number=part_number, data=data
+            )
+            if progress_callback:
+                progress_callback(len(data))
+
+    # sessions stay recorded when completing fails: the gateway keeps the
+    #   contents of sessions whose metadata was rejected, and sessions that
+    #   can't be completed anymore are replaced when the upload is retried
+    file_response = client._gateway.complete_upload_session(
+        file_instance, session_id=session.uuid
+    )
+    session_store.remove(local_path, sum_blake3)
+    return file_response
+
+
+def __get_resumable_upload_session(
+    *,
+    client: Client,
+    local_path: Path,
+    sum_blake3: str,
+    session_store: UploadSessionStore,
+) -> UploadSession | None:
+    """Returns the session of an interrupted upload of a file, or a new one."""
+    if (session_id := session_store.get(local_path, sum_blake3)) is not None:
+        session = client._gateway.get_upload_session(uuid.UUID(session_id))
+        if session is not None and session.is_resumable:
+            log.bind(cat=LogCategory.UPLOAD).debug(
+                f"Resuming upload of '{local_path}': "
+                f"{len(session.missing_parts)}/{session.num_parts} parts missing"
+            )
+            return session
+    session = client._gateway.create_upload_session(
+        sum_blake3=sum_blake3, size=local_path.stat().st_size
+    )
+    if session is not None:
+        session_store.set(local_path, sum_blake3, session.uuid.hex)
+    return session
+
+
+def __upload_session_part(
+    *, client: Client, session: UploadSession, part_number: int, data: bytes
+) -> None:
+    """Uploads a part of an upload session, retrying when it fails."""
+    for attempt in range(1, UPLOAD_PART_ATTEMPTS + 1):
+        try:
+            client._gateway.upload_session_part(
+                session_id=session.uuid, part_number=part_number, data=data
+            )
+        except (NetworkError, ServiceError) as err:
+            if attempt == UPLOAD_PART_ATTEMPTS:
+                raise
+            log.bind(cat=LogCategory.UPLOAD).warning(
+                f"Upload of part {part_number} failed ({err}); retrying "
+                f"(attempt {attempt + 1}/{UPLOAD_PART_ATTEMPTS})"
+            )
+        else:
+            return
+
+
 def __update_existing_file_metadata_only(
     *, client: Client, file_instance: File, asset_id: UUID4 | None
 ) -> File:
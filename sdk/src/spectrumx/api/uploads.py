@@ -6,6 +6,7 @@ import asyncio
 import contextlib
 import hashlib
 import json
+import os
 import sys
 import threading
 from datetime import UTC
@@ -18,8 +19,11 @@ from anyio import Path as AsyncPath
 from loguru import logger as log
 from pydantic import BaseModel
 from pydantic import Field
+from pydantic import PrivateAttr
 from tqdm import tqdm
 
+from spectrumx.checksums import checksum_persistence
+from spectrumx.checksums import get_checksum_cache
 from spectrumx.client import (
     Client,  # noqa: TC001
     # pydantic complains if not defined out of type checking block
@@ -27,6 +31,10 @@ from spectrumx.client import (
 from spectrumx.errors import Result
 from spectrumx.errors import SDSError
 from spectrumx.errors import UploadError
+from spectrumx.gateway import (
+    FileContentsCheck,  # noqa: TC001
+    # pydantic complains if not defined out of type checking block
+)
 from spectrumx.models.files.file import (
     File,  # noqa: TC001
     # pydantic complains if not defined out of type checking block
@@ -51,6 +59,7 @@ upload_prog_bar_kwargs = {
 
 
 MAX_DAYS_FOR_RESUMING_UPLOAD = 30
+UPLOAD_SESSIONS_FILENAME = "upload_sessions.json"
 
 
 class PersistedUploadFile(BaseModel):
@@ -272,6 +281,70 @@ class UploadPersistenceManager(BaseModel):
             log_user_warning(f"Failed to clean persisted uploads by checksum: {err}")
 
 
+# files upload concurrently, each with its own store: they share this lock
+_upload_sessions_lock = threading.Lock()
+
+
+class UploadSessionStore:
+    """Remembers the sessions of files being uploaded in parts.
+
+    Interrupted uploads of large files resume in their session instead of
+        starting over. Sessions are keyed by the resolved path and checksum of
+        the file, so changed files start a new session.
+    """
+
+    def __init__(self, store_path: Path | None = None) -> None:
+        self.store_path = store_path or self.get_default_store_path()
+
+    @staticmethod
+    def get_default_store_path() -> Path:
+        """Store location, next to the persisted upload records."""
+        return xdg_state_home() / "spectrumx" / "uploads" / UPLOAD_SESSIONS_FILENAME
+
+    @staticmethod
+    def _key(local_path: Path, sum_blake3: str) -> str:
+        return f"{local_path.resolve()}:{sum_blake3}"
+
+    def get(self, local_path: Path, sum_blake3: str) -> str | None:
+        """Returns the ID of the session uploading a file, if any."""
+        with _upload_sessions_lock:
+            return self._load().get(self._key(local_path, sum_blake3))
+
+    def set(self, local_path: Path, sum_blake3: str, session_id: str) -> None:
+        """Records the session uploading a file."""
+        with _upload_sessions_lock:
+            sessions = self._load()
+            sessions[self._key(local_path, sum_blake3)] = session_id
+            self._save(sessions)
+
+    def remove(self, local_path: Path, sum_blake3: str) -> None:
+        """Forgets the session uploading a file."""
+        with _upload_sessions_lock:
+            sessions = self._load()
+            if sessions.pop(self._key(local_path, sum_blake3), None) is not None:
+                self._save(sessions)
+
+    def _load(self) -> dict[str, str]:
+        if not self.store_path.exists():
+            return {}
+        try:
+            sessions = json.loads(self.store_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as err:
+            log_user_warning(f"Failed to load upload sessions: {err}")
+            return {}
+        return sessions if isinstance(sessions, dict) else {}
+
+    def _save(self, sessions: dict[str, str]) -> None:
+        # replaced at once, so other processes never read a partial store
+        tmp_path = self.store_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.store_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(sessions), encoding="utf-8")
+            tmp_path.replace(self.store_path)
+        except OSError as err:
+            log_user_warning(f"Failed to persist upload sessions: {err}")
+
+
 class UploadWorkload(BaseModel):
     """Serializable representation of an upload workload."""
 
@@ -281,6 +354,7 @@ class UploadWorkload(BaseModel):
     max_concurrent_uploads: int = 5
     persist_state: bool = True
     progress_log_period_secs: int = 30
+    checksum_workers: int = 1
 
     # file buffers
     fq_discovered: list[File] = Field(default_factory=list)
@@ -302,6 +376,8 @@ class UploadWorkload(BaseModel):
     ) = None
     _persistence_manager: UploadPersistenceManager | None = None
     _progress_log_task: asyncio.Task[None] | None = None
+    # results of batch contents checks, by local path of discovered files
+    _contents_checks: dict[Path, FileContentsCheck] = PrivateAttr(default_factory=dict)
 
     model_config = {
         "populate_by_name": True,
@@ -437,6 +513,7 @@ class UploadWorkload(BaseModel):
             )
 
         self.discovery_finished_at = datetime.now(UTC)
+        await self._precompute_checksums()
 
         if self.verbose:
             log_user(
@@ -450,6 +527,29 @@ class UploadWorkload(BaseModel):
 
         return list(self.fq_discovered)
 
+    async def _precompute_checksums(self) -> None:
+        """Hash discovered files in parallel, warming up the checksum cache.
+
+        Uploads need each file's checksum more than once; computing them all here
+            with multiple processes avoids hashing files one by one later.
+        """
+        if self.checksum_workers <= 1 or not self.fq_discovered:
+            return
+        local_paths = [
+            sds_file.local_path
+            for sds_file in self.fq_discovered
+            if sds_file.local_path is not None
+        ]
+        log.bind(cat=LogCategory.UPLOAD).debug(
+            f"Computing checksums of {len(local_paths):,} files "
+            f"with {self.checksum_workers} workers"
+        )
+        await asyncio.to_thread(
+            get_checksum_cache().sum_many,
+            local_paths,
+            max_workers=self.checksum_workers,
+        )
+
     @property
     def total_bytes_human(self) -> str:
         """Returns the total bytes in human-readable format."""
@@ -608,6 +708,11 @@ class UploadWorkload(BaseModel):
                     local_file=next_file,
                     sds_path=self.sds_path,
                     progress_callback=_throttled_update if bar is not None else None,
+                    contents_check=(
+                        self._contents_checks.get(next_file.local_path)
+                        if next_file.local_path
+                        else None
+                    ),
                 )
             )
             # Flush any remaining bytes that didn't reach the threshold
@@ -680,6 +785,39 @@ class UploadWorkload(BaseModel):
                 skipped=skipped,
             )
 
+    async def _check_contents_in_batches(self) -> None:
+        """Check which discovered files SDS already has, before uploading them.
+
+        Checking files in large batches here saves workers from making one
+            request per file to decide how to upload it. When batch checks are
+            unavailable or fail, workers check files one by one instead.
+        """
+        self._contents_checks.clear()
+        local_files = [
+            sds_file for sds_file in self.fq_discovered if sds_file.local_path
+        ]
+        if not local_files:
+            return
+        try:
+            contents_checks = await asyncio.to_thread(
+                self.client._sds_files.check_contents_exist_in_batches,  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+                client=self.client,
+                local_files=local_files,
+                sds_path=self.sds_path,
+            )
+        except SDSError as err:
+            log_user_warning(f"Failed to check file contents in batches: {err}")
+            return
+        if contents_checks is None:
+            return
+        self._contents_checks = {
+            sds_file.local_path: contents_check
+            for sds_file, contents_check in zip(
+                local_files, contents_checks, strict=True
+            )
+            if sds_file.local_path is not None
+        }
+
     async def _execute_uploads(self) -> None:
         """Execute uploads concurrently using worker coroutines."""
         await self._reset_progress()
@@ -687,6 +825,8 @@ class UploadWorkload(BaseModel):
         # Start periodic progress logger
         self._progress_log_task = asyncio.create_task(self._periodic_progress_logger())
 
+        # one connection per worker, so they are reused instead of reopened
+        self.client._gateway.ensure_pool_size(self.max_concurrent_uploads)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
         workers = [self._upload_worker(i) for i in range(self.max_concurrent_uploads)]
         try:
             await asyncio.gather(*workers)
@@ -738,11 +878,16 @@ class UploadWorkload(BaseModel):
             List of results for each uploaded file.
         """
         self.client = client
-        with log_context(
-            upload_id=self._workload_id,
-            upload_dir=str(self.local_root),
+        with (
+            log_context(
+                upload_id=self._workload_id,
+                upload_dir=str(self.local_root),
+            ),
+            # checksums are persisted as upload records are, not in dry runs
+            checksum_persistence(enabled=not client.dry_run or is_test_env()),
         ):
             await self._discover_files()
+            await self._check_contents_in_batches()
             await self._execute_uploads()
 
             # Completion summary
@@ -755,6 +900,7 @@ class UploadWorkload(BaseModel):
                 uploaded_bytes / elapsed_sec if elapsed_sec > 0 else None
             )
             status = "clean" if len(self.fq_failed) == 0 else "interrupted"
+            connection_stats = self.client._gateway.connection_stats()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
             log.bind(
                 cat=LogCategory.UPLOAD,
                 total_files=len(self.fq_discovered),
@@ -764,6 +910,8 @@ class UploadWorkload(BaseModel):
                 skipped=len(self.fq_skipped),
                 elapsed_seconds=elapsed_sec,
                 avg_speed_bps=avg_speed_bps,
+                connections_opened=connection_stats.connections,
+                connections_reused=connection_stats.reused_connections,
                 status=status,
             ).info(
                 "Upload complete",
@@ -843,6 +991,7 @@ def upload_resumable(
         warn_skipped=warn_skipped,
         persist_state=persist_state,
         progress_log_period_secs=client.config.progress_log_period_secs,
+        checksum_workers=client.config.checksum_workers,
     )
 
     return asyncio.run(upload_workload.run(client=client))
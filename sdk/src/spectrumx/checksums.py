@@ -0,0 +1,300 @@
+"""Persistent cache of local file checksums for the SpectrumX SDK.
+
+Uploads need the BLAKE3 checksum of each file several times (content checks,
+metadata-only uploads, resumption). Checksums are cached by the file's resolved
+path, size, modification time, and inode, so a file that is changed, replaced,
+or moved is hashed again, while unchanged files are only read once.
+
+Entries of files that are missing or changed are dropped when the cache is
+loaded. Checksums computed in dry runs are only cached in memory (see
+`checksum_persistence`).
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from loguru import logger as log
+from pydantic import BaseModel
+from pydantic import ValidationError
+
+from spectrumx.utils import LogCategory
+from spectrumx.utils import log_user_warning
+from spectrumx.utils import sum_blake3
+from spectrumx.vendor.xdg_base_dirs import xdg_state_home
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+CHECKSUM_CACHE_FILENAME = "checksums.jsonl"
+
+# whether checksums computed in the current context are written to the cache file
+_persist_checksums: ContextVar[bool] = ContextVar("persist_checksums", default=True)
+
+
+@contextmanager
+def checksum_persistence(*, enabled: bool) -> Iterator[None]:
+    """Sets whether checksums computed within this context are written to disk.
+
+    When disabled, e.g. in dry runs, checksums are still cached in memory.
+    Asyncio tasks and threads started with `asyncio.to_thread` in this context
+        inherit the setting.
+    """
+    token = _persist_checksums.set(enabled)
+    try:
+        yield
+    finally:
+        _persist_checksums.reset(token)
+
+
+class CachedChecksum(BaseModel):
+    """BLAKE3 checksum of a local file, valid while its stat info is unchanged."""
+
+    resolved_path: str
+    size: int
+    mtime_ns: int
+    inode: int
+    sum_blake3: str
+
+    def matches(self, stat_result: os.stat_result) -> bool:
+        """Whether this entry still describes a file with the given stat info."""
+        return (
+            self.size == stat_result.st_size
+            and self.mtime_ns == stat_result.st_mtime_ns
+            and self.inode == stat_result.st_ino
+        )
+
+
+class ChecksumCache:
+    """Caches BLAKE3 checksums of local files in a JSONL file.
+
+    Entries are appended as files are hashed; the latest entry of each path wins.
+    When loaded, entries of files that are missing or changed are dropped, and
+    the cache file is compacted if any were, or if most of its lines are
+    outdated.
+    """
+
+    def __init__(self, cache_path: Path) -> None:
+        self.cache_path = cache_path
+        self._entries: dict[str, CachedChecksum] | None = None
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def get_default_cache_path() -> Path:
+        """Cache location, next to the persisted upload records."""
+        return xdg_state_home() / "spectrumx" / "uploads" / CHECKSUM_CACHE_FILENAME
+
+    def sum_blake3(self, file_path: Path) -> str:
+        """Returns the BLAKE3 checksum of a file, hashing it only when needed."""
+        resolved_path = file_path.resolve()
+        try:
+            stat_before = resolved_path.stat()
+        except OSError:
+            self._discard(resolved_path)
+            raise
+        if (cached := self._get_entry(resolved_path, stat_before)) is not None:
+            return cached
+        checksum = sum_blake3(resolved_path)
+        self._store(resolved_path, stat_before=stat_before, checksum=checksum)
+        return checksum
+
+    def sum_many(
+        self, file_paths: Iterable[Path], *, max_workers: int = 1
+    ) -> dict[Path, str]:
+        """Returns the BLAKE3 checksums of many files.
+
+        Files not in the cache are hashed in a process pool when `max_workers` is
+            greater than 1. Files that can't be read are left out of the result.
+
+        Args:
+            file_paths:     Paths of the files to hash.
+            max_workers:    Maximum number of processes hashing files at once.
+        Returns:
+            A mapping of each readable path in `file_paths` to its checksum.
+        """
+        checksums: dict[Path, str] = {}
+        misses: dict[Path, tuple[Path, os.stat_result]] = {}
+        for file_path in file_paths:
+            resolved_path = file_path.resolve()
+            try:
+                stat_result = resolved_path.stat()
+            except OSError as err:
+                self._discard(resolved_path)
+                log.bind(cat=LogCategory.FILESYSTEM).warning(
+                    f"Skipping checksum of '{file_path}': {err}"
+                )
+                continue
+            if (cached := self._get_entry(resolved_path, stat_result)) is not None:
+                checksums[file_path] = cached
+            else:
+                misses[file_path] = (resolved_path, stat_result)
+
+        if not misses:
+            return checksums
+        miss_paths = list(misses)
+        resolved_paths = [misses[file_path][0] for file_path in miss_paths]
+        if max_workers > 1 and len(miss_paths) > 1:
+            # callers run this from worker threads, where forking is unsafe
+            with ProcessPoolExecutor(
+                max_workers=min(max_workers, len(miss_paths)),
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                results = list(
+                    executor.map(_sum_blake3_or_none, resolved_paths, chunksize=8)
+                )
+        else:
+            results = [_sum_blake3_or_none(path) for path in resolved_paths]
+
+        for file_path, checksum in zip(miss_paths, results, strict=True):
+            if checksum is None:
+                continue
+            resolved_path, stat_result = misses[file_path]
+            self._store(resolved_path, stat_before=stat_result, checksum=checksum)
+            checksums[file_path] = checksum
+        return checksums
+
+    def _get_entry(
+        self, resolved_path: Path, stat_result: os.stat_result
+    ) -> str | None:
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(str(resolved_path))
+            if entry is None:
+                return None
+            if not entry.matches(stat_result):
+                # the file changed: its new checksum replaces the entry
+                del entries[entry.resolved_path]
+                return None
+        return entry.sum_blake3
+
+    def _discard(self, resolved_path: Path) -> None:
+        """Drops the entry of a file that is missing, in memory only.
+
+        Its line in the cache file is dropped when the cache is next loaded.
+        """
+        with self._lock:
+            self._load().pop(str(resolved_path), None)
+
+    def _store(
+        self, resolved_path: Path, *, stat_before: os.stat_result, checksum: str
+    ) -> None:
+        # don't cache the checksum of a file that changed while it was hashed
+        try:
+            stat_after = resolved_path.stat()
+        except OSError:
+            return
+        if (stat_after.st_mtime_ns, stat_after.st_size) != (
+            stat_before.st_mtime_ns,
+            stat_before.st_size,
+        ):
+            return
+        entry = CachedChecksum(
+            resolved_path=str(resolved_path),
+            size=stat_before.st_size,
+            mtime_ns=stat_before.st_mtime_ns,
+            inode=stat_before.st_ino,
+            sum_blake3=checksum,
+        )
+        with self._lock:
+            self._load()[entry.resolved_path] = entry
+            if not _persist_checksums.get():
+                return
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with self.cache_path.open("a", encoding="utf-8") as f:
+                    f.write(entry.model_dump_json() + "\n")
+            except OSError as err:
+                log_user_warning(f"Failed to persist file checksum: {err}")
+
+    def _load(self) -> dict[str, CachedChecksum]:
+        """Loads the cache file once, pruning and compacting it if needed."""
+        if self._entries is not None:
+            return self._entries
+        self._entries = {}
+        if not self.cache_path.exists():
+            return self._entries
+        num_lines = 0
+        try:
+            with self.cache_path.open(encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    num_lines += 1
+                    try:
+                        entry = CachedChecksum(**json.loads(line))
+                    except (json.JSONDecodeError, ValidationError, TypeError):
+                        continue
+                    self._entries[entry.resolved_path] = entry
+        except OSError as err:
+            log_user_warning(f"Failed to load checksum cache: {err}")
+            return self._entries
+        num_entries = len(self._entries)
+        self._entries = {
+            resolved_path: entry
+            for resolved_path, entry in self._entries.items()
+            if _is_unchanged(entry)
+        }
+        pruned = len(self._entries) < num_entries
+        if (pruned or num_lines > 2 * num_entries) and _persist_checksums.get():
+            self._compact()
+        return self._entries
+
+    def _compact(self) -> None:
+        """Rewrites the cache file keeping only the latest entry of each path."""
+        assert self._entries is not None
+        tmp_path = self.cache_path.with_suffix(".jsonl.tmp")
+        try:
+            with tmp_path.open("w", encoding="utf-8") as f:
+                for entry in self._entries.values():
+                    f.write(entry.model_dump_json() + "\n")
+            tmp_path.replace(self.cache_path)
+        except OSError as err:
+            log_user_warning(f"Failed to compact checksum cache: {err}")
+
+
+def _is_unchanged(entry: CachedChecksum) -> bool:
+    """Whether the file of an entry still exists, unchanged."""
+    try:
+        stat_result = Path(entry.resolved_path).stat()
+    except OSError:
+        return False
+    return entry.matches(stat_result)
+
+
+def _sum_blake3_or_none(file_path: Path) -> str | None:
+    """Hashes a file, returning None if it can't be read. Runs in worker processes."""
+    try:
+        return sum_blake3(file_path)
+    except OSError:
+        return None
+
+
+_default_cache: ChecksumCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_checksum_cache() -> ChecksumCache:
+    """Returns the checksum cache at the default location."""
+    global _default_cache  # noqa: PLW0603
+    cache_path = ChecksumCache.get_default_cache_path()
+    with _default_cache_lock:
+        if _default_cache is None or _default_cache.cache_path != cache_path:
+            _default_cache = ChecksumCache(cache_path)
+        return _default_cache
+
+
+__all__ = [
+    "CachedChecksum",
+    "ChecksumCache",
+    "checksum_persistence",
+    "get_checksum_cache",
+]
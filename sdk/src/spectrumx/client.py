@@ -1,9 +1,13 @@
 """Client for the SpectrumX Data System."""
 
+import collections
 import collections.abc
+import threading
 import time
 from collections.abc import Collection
 from collections.abc import Mapping
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC
 from datetime import datetime
 from pathlib import Path
@@ -28,6 +32,7 @@ from spectrumx.ops.pagination import Paginator
 from . import __version__
 from . import utils
 from .config import SDSConfig
+from .gateway import DEFAULT_HTTP_POOL_SIZE
 from .gateway import GatewayClient
 from .models.files import File
 from .ops import files
@@ -83,6 +88,22 @@ def resolve_dataset_capture_filter_params(
 DownloadFileSource = list[File] | Paginator[File]
 
 
+def _log_download_result(*, file_info: File, result: Result[File]) -> None:
+    """Per-file completion log for downloads."""
+    if result:
+        log.bind(cat=LogCategory.DOWNLOAD).info(
+            f"Downloaded: {file_info.name}",
+            file_name=file_info.name,
+            file_size=file_info.size,
+        )
+    else:
+        log.bind(cat=LogCategory.DOWNLOAD).warning(
+            f"Download failed: {file_info.name}",
+            file_name=file_info.name,
+            error=str(result.exception_or(Exception("Unknown"))),
+        )
+
+
 class Client:
     """Instantiates an SDS client."""
 
@@ -145,6 +166,12 @@ class Client:
             api_key=self._config.api_key,
             timeout=self._config.timeout,
             verbose=self.verbose,
+            pool_size=self._config.http_pool_size
+            or max(
+                DEFAULT_HTTP_POOL_SIZE,
+                self._config.max_concurrent_downloads * self._config.max_download_parts,
+            ),
+            http2=self._config.http2,
         )
 
         # create internal API instances
@@ -290,6 +317,7 @@ class Client:
         skip_contents: bool = False,
         overwrite: bool = False,
         verbose: bool = True,
+        max_concurrent_downloads: int | None = None,
     ) -> list[Result[File]]:
         """Downloads files from SDS.
 
@@ -306,6 +334,9 @@ class Client:
             skip_contents:  When True, only the metadata is downloaded.
             overwrite:      Whether to overwrite existing local files.
             verbose:        Show a progress bar.
+            max_concurrent_downloads:   Maximum number of files downloaded at
+                once. Defaults to the `max_concurrent_downloads` config option;
+                values above 1 enable the concurrent download engine.
         Returns:
             A list of results for each file discovered and downloaded.
         """
@@ -337,6 +368,7 @@ class Client:
             skip_contents=skip_contents,
             overwrite=overwrite,
             verbose=verbose,
+            max_concurrent_downloads=max_concurrent_downloads,
         )
 
     def _prepare_download_directory(self, to_local_path: Path) -> None:
@@ -396,18 +428,50 @@ class Client:
         skip_contents: bool,
         overwrite: bool,
         verbose: bool,
+        max_concurrent_downloads: int | None = None,
     ) -> list[Result[File]]:
         """Download the files and return results."""
         prefix = "Dry-run: simulating download:" if self.dry_run else "Downloading:"
 
         total_files = len(files_to_download)
+        max_workers = (
+            self._config.max_concurrent_downloads
+            if max_concurrent_downloads is None
+            else max_concurrent_downloads
+        )
+        if max_workers < 1:
+            msg = f"max_concurrent_downloads must be at least 1, got {max_workers}"
+            raise ValueError(msg)
+        # each download may fetch its parts in parallel, each over a connection
+        self._gateway.ensure_pool_size(max_workers * self._config.max_download_parts)
 
         # Mutable container so per-chunk closure can update byte count
         bytes_downloaded_shared: list[int] = [0]
         _download_start = datetime.now(UTC)
-
+        is_byte_tracked = isinstance(files_to_download, list) or max_workers > 1
+
+        if max_workers > 1:
+            # Paginator sources are consumed while downloading: their byte total
+            #   grows on the progress bar as new pages are fetched.
+            total_bytes_total = (
+                sum(f.size for f in files_to_download)
+                if isinstance(files_to_download, list)
+                else None
+            )
+            results = self._download_files_concurrently(
+                files_to_download=files_to_download,
+                total_bytes_total=total_bytes_total,
+                to_local_path=to_local_path,
+                skip_contents=skip_contents,
+                overwrite=overwrite,
+                verbose=verbose,
+                prefix=prefix,
+                max_workers=max_workers,
+                period=self._config.progress_log_period_secs,
+                bytes_downloaded_shared=bytes_downloaded_shared,
+            )
         # Only compute total bytes for lists; Paginator would be fully consumed.
-        if isinstance(files_to_download, list):
+        elif isinstance(files_to_download, list):
             total_bytes_total = sum(f.size for f in files_to_download)
             results = self._download_files_with_byte_progress(
                 files_to_download=files_to_download,
@@ -437,9 +501,7 @@ class Client:
         failed = len(results) - completed
         elapsed = datetime.now(UTC) - _download_start
         elapsed_sec = elapsed.total_seconds()
-        transferred_bytes = (
-            bytes_downloaded_shared[0] if total_bytes_total is not None else None
-        )
+        transferred_bytes = bytes_downloaded_shared[0] if is_byte_tracked else None
         avg_speed_bps: float | None = (
             transferred_bytes / elapsed_sec
             if transferred_bytes is not None and elapsed_sec > 0
@@ -524,19 +586,7 @@ class Client:
                     bytes_accounted=bytes_downloaded_shared,
                 )
 
-            # Per-file completion log
-            if result:
-                log.bind(cat=LogCategory.DOWNLOAD).info(
-                    f"Downloaded: {file_info.name}",
-                    file_name=file_info.name,
-                    file_size=file_info.size,
-                )
-            else:
-                log.bind(cat=LogCategory.DOWNLOAD).warning(
-                    f"Download failed: {file_info.name}",
-                    file_name=file_info.name,
-                    error=str(result.exception_or(Exception("Unknown"))),
-                )
+            _log_download_result(file_info=file_info, result=result)
 
             # Periodic progress log
             now = time.monotonic()
@@ -587,20 +637,125 @@ class Client:
             )
             results.append(result)
 
-            # Per-file completion log
+            _log_download_result(file_info=file_info, result=result)
+
+        return results
+
+    def _download_files_concurrently(  # noqa: C901, PLR0913, PLR0915
+        self,
+        *,
+        files_to_download: DownloadFileSource,
+        total_bytes_total: int | None,
+        to_local_path: Path,
+        skip_contents: bool,
+        overwrite: bool,
+        verbose: bool,
+        prefix: str,
+        max_workers: int,
+        period: float,
+        bytes_downloaded_shared: list[int],
+    ) -> list[Result[File]]:
+        """Byte-level progress bar with a bounded pool of download workers.
+
+        Files are submitted as they are yielded by `files_to_download`, so a
+            Paginator starts downloading before its whole listing is fetched.
+            At most `2 * max_workers` downloads are queued at once, and results
+            are returned in the same order as the source.
+        """
+        prog_bar = get_prog_bar(
+            total=total_bytes_total,
+            desc=f"{prefix} {max_workers} workers",
+            unit="B",
+            unit_scale=True,
+            unit_divisor=1024,
+            disable=not verbose or utils.is_test_env(),
+        )
+        # guards the progress bar and the shared byte counters across workers
+        bar_lock = threading.Lock()
+        # Throttle callback updates: ~100 KB between tqdm refreshes
+        _acc: list[int] = [0]
+        _throttle = 100_000
+
+        def _download_one(file_info: File) -> Result[File]:
+            """Runs in a worker thread: downloads one file and credits its bytes."""
+            _file_streamed: list[int] = [0]
+
+            def _on_download_bytes(n: int) -> None:
+                _file_streamed[0] += n
+                with bar_lock:
+                    _acc[0] += n
+                    bytes_downloaded_shared[0] += n
+                    if _acc[0] >= _throttle:
+                        prog_bar.update(_acc[0])
+                        _acc[0] = 0
+
+            result = self.download_single_file(
+                file_info=file_info,
+                to_local_path=to_local_path,
+                skip_contents=skip_contents,
+                overwrite=overwrite,
+                progress_callback=_on_download_bytes,
+            )
             if result:
+                with bar_lock:
+                    credit_unstreamed_file_bytes(
+                        file_size=file_info.size,
+                        bytes_streamed=_file_streamed[0],
+                        prog_bar=prog_bar,
+                        bytes_accounted=bytes_downloaded_shared,
+                    )
+            _log_download_result(file_info=file_info, result=result)
+            return result
+
+        results: list[Result[File]] = []
+        in_flight: collections.deque[Future[Result[File]]] = collections.deque()
+        max_in_flight = 2 * max_workers
+        _last_progress_log = 0.0
+
+        def _collect_oldest() -> None:
+            nonlocal _last_progress_log
+            results.append(in_flight.popleft().result())
+            now = time.monotonic()
+            if now - _last_progress_log >= period:
+                _last_progress_log = now
+                completed = sum(1 for r in results if r)
+                with bar_lock:
+                    bytes_downloaded = bytes_downloaded_shared[0]
                 log.bind(cat=LogCategory.DOWNLOAD).info(
-                    f"Downloaded: {file_info.name}",
-                    file_name=file_info.name,
-                    file_size=file_info.size,
-                )
-            else:
-                log.bind(cat=LogCategory.DOWNLOAD).warning(
-                    f"Download failed: {file_info.name}",
-                    file_name=file_info.name,
-                    error=str(result.exception_or(Exception("Unknown"))),
+                    "Download progress",
+                    completed=completed,
+                    total=len(files_to_download),
+                    bytes_downloaded=bytes_downloaded,
+                    bytes_total=total_bytes_total,
+                    failures=len(results) - completed,
                 )
 
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="sds-download"
+        )
+        try:
+            for file_info in files_to_download:
+                if total_bytes_total is None:
+                    with bar_lock:
+                        prog_bar.total = (prog_bar.total or 0) + file_info.size
+                in_flight.append(executor.submit(_download_one, file_info))
+                while len(in_flight) >= max_in_flight:
+                    _collect_oldest()
+            while in_flight:
+                _collect_oldest()
+        except BaseException:
+            # e.g. KeyboardInterrupt or an unexpected error: drop queued downloads
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
+
+        # Flush any remaining accumulated bytes
+        with bar_lock:
+            if _acc[0] > 0:
+                prog_bar.update(_acc[0])
+                _acc[0] = 0
+            prog_bar.refresh()
+
         return results
 
     def download_single_file(
@@ -770,6 +925,7 @@ class Client:
         skip_contents: bool = False,
         overwrite: bool = False,
         verbose: bool = True,
+        max_concurrent_downloads: int | None = None,
     ) -> list[Result[File]]:
         """Downloads files in a dataset using the existing download infrastructure.
 
@@ -791,6 +947,8 @@ class Client:
             skip_contents: When True, only the metadata is downloaded.
             overwrite: Whether to overwrite existing local files.
             verbose: Show progress bars and detailed output.
+            max_concurrent_downloads: Maximum number of files downloaded at once.
+                Defaults to the `max_concurrent_downloads` config option.
 
         If both ``capture_uuids`` and ``top_level_dirs`` are set, a file is included
         when it matches **either** criterion (enforced on the gateway). In dry run
@@ -870,6 +1028,7 @@ class Client:
             skip_contents=skip_contents,
             overwrite=overwrite,
             verbose=verbose,
+            max_concurrent_downloads=max_concurrent_downloads,
         )
 
     def get_dataset(self, dataset_uuid: UUID4 | str) -> Dataset:
@@ -45,6 +45,15 @@ CFG_NAME_LOOKUP: dict[str, Attr] = {
     "sds_host": Attr(attr_name="sds_host"),
     "sds_secret_token": Attr(attr_name="api_key"),
     "progress_log_period_secs": Attr(attr_name="progress_log_period_secs", cast_fn=int),
+    "max_concurrent_downloads": Attr(attr_name="max_concurrent_downloads", cast_fn=int),
+    "max_download_parts": Attr(attr_name="max_download_parts", cast_fn=int),
+    "presigned_transfers": Attr(
+        attr_name="presigned_transfers", cast_fn=into_human_bool
+    ),
+    "checksum_workers": Attr(attr_name="checksum_workers", cast_fn=int),
+    "chunked_upload_threshold": Attr(attr_name="chunked_upload_threshold", cast_fn=int),
+    "http_pool_size": Attr(attr_name="http_pool_size", cast_fn=int),
+    "http2": Attr(attr_name="http2", cast_fn=into_human_bool),
 }
 
 
@@ -79,6 +88,15 @@ class SDSConfig:
     timeout: int = DEFAULT_HTTP_TIMEOUT
     log_file: Path | None = None
     progress_log_period_secs: int = 30
+    max_concurrent_downloads: int = 1
+    max_download_parts: int = 1
+    presigned_transfers: bool = False
+    checksum_workers: int = 1
+    # files of at least this many bytes are uploaded in resumable parts; 0 disables
+    chunked_upload_threshold: int = 256 * 1024 * 1024  # 256 MiB
+    # connections kept alive to the gateway; 0 sizes it from the download options
+    http_pool_size: int = 0
+    http2: bool = False
 
     _active_config: list[Attr]
     _env_file: Path | None = None
@@ -1,10 +1,13 @@
 """Lower level module for interaction with the SpectrumX Data System."""
 
+import io
 import json
 import uuid
 from collections.abc import Callable
 from collections.abc import Collection
 from collections.abc import Iterator
+from datetime import UTC
+from datetime import datetime
 from enum import StrEnum
 from http import HTTPStatus
 from pathlib import Path
@@ -14,10 +17,12 @@ from typing import Any
 from typing import BinaryIO
 
 import requests
+from blake3 import blake3 as Blake3  # noqa: N812
 from loguru import logger as log
 from pydantic import BaseModel
 from pydantic import Field
 from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from urllib3.util import Retry
 
 from spectrumx.models.captures import CaptureType
@@ -39,6 +44,10 @@ from .utils import log_user_warning
 
 API_PATH: str = "/api/"
 API_TARGET_VERSION: str = "v1"
+# maximum number of files in each batch file contents check
+FILE_CONTENTS_CHECK_BATCH_SIZE: int = 1000
+# connections kept alive per host, when not sized from the transfer concurrency
+DEFAULT_HTTP_POOL_SIZE: int = 10
 
 
 class Endpoints(StrEnum):
@@ -57,8 +66,18 @@ class Endpoints(StrEnum):
     )
     EXPERIMENTS = "/assets/experiments"
     FILE_CONTENTS_CHECK = "/assets/utils/check_contents_exist"
+    FILE_CONTENTS_CHECK_BATCH = "/assets/utils/check_contents_exist_batch"
     FILE_DETACH_FROM_DATASETS = "/assets/files/{uuid}/detach-from-datasets"
     FILE_DOWNLOAD = "/assets/files/{uuid}/download"
+    FILE_DOWNLOAD_URL = "/assets/files/{uuid}/download-url"
+    FILE_UPLOAD_COMPLETE = "/assets/files/upload-complete"
+    FILE_UPLOAD_SESSION = "/assets/files/upload-sessions/{session_id}"
+    FILE_UPLOAD_SESSION_COMPLETE = "/assets/files/upload-sessions/{session_id}/complete"
+    FILE_UPLOAD_SESSION_PART = (
+        "/assets/files/upload-sessions/{session_id}/parts/{part_number}"
+    )
+    FILE_UPLOAD_SESSIONS = "/assets/files/upload-sessions"
+    FILE_UPLOAD_URL = "/assets/files/upload-url"
     FILES = "/assets/files"
     SEARCH = "/search"
 
@@ -79,6 +98,93 @@ class FileContentsCheck(BaseModel):
     asset_id: Annotated[uuid.UUID | None, Field()] = None
 
 
+class UploadSession(BaseModel):
+    """State of a chunked upload of file contents."""
+
+    uuid: uuid.UUID
+    size: int
+    part_size: int
+    num_parts: int
+    missing_parts: list[int]
+    status: str
+    expires_at: datetime
+
+    @property
+    def is_resumable(self) -> bool:
+        """Whether this session can still be completed.
+
+        Completed sessions keep their contents until a file is created from
+            them, so a completion rejected for its metadata can be retried;
+            assembled ones are verified again when completing them again.
+        """
+        return self.status in {"active", "assembled", "completed"} and (
+            self.expires_at > datetime.now(UTC)
+        )
+
+    def part_range(self, part_number: int) -> tuple[int, int]:
+        """Offset and size in bytes of a part of the contents."""
+        offset = (part_number - 1) * self.part_size
+        return offset, max(min(self.part_size, self.size - offset), 0)
+
+
+class ConnectionStats(BaseModel):
+    """Connection reuse of the HTTP transports of a gateway client."""
+
+    requests: int = 0
+    connections: int = 0
+    http2_requests: int = 0
+
+    @property
+    def reused_connections(self) -> int:
+        """Requests sent over connections already open, without a new handshake."""
+        return max(self.requests - self.connections, 0)
+
+
+def _build_http2_client(*, pool_size: int, timeout: int) -> Any | None:
+    """Builds an httpx client multiplexing requests over HTTP/2 connections.
+
+    Returns None when the optional `http2` dependencies are not installed.
+    """
+    try:
+        import httpx  # pyright: ignore[reportMissingImports]  # pyrefly: ignore[missing-import]
+
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=2,
+            verify=not is_test_env(),
+            limits=httpx.Limits(
+                max_connections=pool_size, max_keepalive_connections=pool_size
+            ),
+        )
+    except ImportError:
+        log_user_warning(
+            "HTTP/2 requires 'httpx[http2]': install it with "
+            "`pip install 'spectrumx[http2]'`. Falling back to HTTP/1.1."
+        )
+        return None
+    return httpx.Client(transport=transport, timeout=timeout)
+
+
+def _without_none_values(mapping: Any) -> Any:
+    """Drops None values, which requests omits but httpx sends as empty strings."""
+    if not isinstance(mapping, dict):
+        return mapping
+    return {key: value for key, value in mapping.items() if value is not None}
+
+
+def _into_requests_response(response: Any) -> requests.Response:
+    """Wraps a complete httpx response in the requests interface callers expect."""
+    converted = requests.Response()
+    converted.status_code = response.status_code
+    converted.headers = CaseInsensitiveDict(response.headers)
+    converted.url = str(response.url)
+    converted.reason = response.reason_phrase
+    converted.encoding = response.encoding
+    converted._content = response.content  # noqa: SLF001
+    converted._content_consumed = True  # noqa: SLF001
+    return converted
+
+
 class _ProgressFileReader:
     """Wraps a binary file to report bytes read via a callback."""
 
@@ -106,6 +212,86 @@ class _ProgressFileReader:
         self._file.close()
 
 
+class _MultipartFormBody:
+    """Streams a multipart/form-data body of form fields followed by a file.
+
+    Only the file contents are read as the body is sent, so large files are not
+        loaded in memory as with the `files` argument of requests.
+    """
+
+    def __init__(self, fields: dict[str, str], file: BinaryIO, file_size: int):
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        head = "".join(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"'
+            f"\r\n\r\n{value}\r\n"
+            for name, value in fields.items()
+        )
+        # the contents must be the last field of object storage POST forms
+        head += (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="file"; '
+            'filename="file"\r\nContent-Type: application/octet-stream\r\n\r\n'
+        )
+        tail = f"\r\n--{boundary}--\r\n"
+        self._parts: list[BinaryIO] = [
+            io.BytesIO(head.encode()),
+            file,
+            io.BytesIO(tail.encode()),
+        ]
+        self._length = len(head.encode()) + file_size + len(tail.encode())
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, n: int = -1) -> bytes:
+        chunks: list[bytes] = []
+        num_read = 0
+        while self._parts and (n < 0 or num_read < n):
+            data = self._parts[0].read(-1 if n < 0 else n - num_read)
+            if not data:
+                self._parts.pop(0)
+                continue
+            chunks.append(data)
+            num_read += len(data)
+        return b"".join(chunks)
+
+
+def _iter_range_of_stream(
+    stream: requests.Response,
+    *,
+    start_byte: int,
+    end_byte: int | None,
+    chunk_size: int,
+    source: str,
+) -> Iterator[bytes]:
+    """Yields the requested byte range from a (possibly full) file response.
+
+    Servers answering a range request with the full contents (200 instead of
+        206) have their stream trimmed to the requested range.
+    """
+    is_partial = stream.status_code == HTTPStatus.PARTIAL_CONTENT
+    # position in the file of the next byte received
+    position = start_byte if is_partial else 0
+    try:
+        for chunk in stream.iter_content(chunk_size=chunk_size):
+            chunk_start = position
+            position += len(chunk)
+            # trim what falls outside the requested range
+            chunk_from = max(start_byte - chunk_start, 0)
+            chunk_to = (
+                len(chunk)
+                if end_byte is None
+                else min(end_byte + 1 - chunk_start, len(chunk))
+            )
+            if chunk_from < chunk_to:
+                yield chunk[chunk_from:chunk_to]
+            if end_byte is not None and position > end_byte:
+                break
+    except requests.exceptions.RequestException as err:
+        msg = f"Network error while downloading {source}: {err}"
+        raise NetworkError(msg) from err
+
+
 class GatewayClient:
     """Communicates with the SDS API."""
 
@@ -126,7 +312,19 @@ class GatewayClient:
         protocol: str | None = None,
         timeout: int = DEFAULT_HTTP_TIMEOUT,
         verbose: bool = False,
+        pool_size: int = DEFAULT_HTTP_POOL_SIZE,
+        http2: bool = False,
     ) -> None:
+        """Initializes the gateway client.
+
+        Args:
+            pool_size:  Connections kept alive per host: at least the number of
+                            concurrent transfers, so connections are reused.
+            http2:      Whether to multiplex small API calls (content checks,
+                            metadata, listings) over HTTP/2 connections. Needs
+                            the optional `http2` dependencies; file transfers
+                            stay on the HTTP/1.1 pool.
+        """
         self.host = host
 
         fallback_protocol = "http" if host == "localhost" else "https"
@@ -138,13 +336,84 @@ class GatewayClient:
         self.timeout = timeout
 
         self._session = requests.Session()
-        retry = Retry(total=2, backoff_factor=0.5, status_forcelist=[])
-        self._session.mount("https://", HTTPAdapter(max_retries=retry))
-        self._session.mount("http://", HTTPAdapter(max_retries=retry))
+        self.pool_size = 0
+        self._retired_stats = ConnectionStats()
+        # set before ensure_pool_size(), which takes the connection stats
+        self._http2_requests = 0
+        self.ensure_pool_size(pool_size)
+        self._http2_client = (
+            _build_http2_client(pool_size=pool_size, timeout=timeout) if http2 else None
+        )
 
         self.verbose = verbose
         self._api_key = api_key
 
+    def ensure_pool_size(self, pool_size: int) -> None:
+        """Keeps at least `pool_size` connections alive per host.
+
+        Connections above the pool size are closed after each request, so
+            callers running concurrent transfers grow the pool to match them.
+        """
+        if pool_size <= self.pool_size:
+            return
+        self._retired_stats = self.connection_stats()
+        retry = Retry(total=2, backoff_factor=0.5, status_forcelist=[])
+        for prefix in ("https://", "http://"):
+            self._session.mount(
+                prefix, HTTPAdapter(pool_maxsize=pool_size, max_retries=retry)
+            )
+        self.pool_size = pool_size
+
+    def connection_stats(self) -> ConnectionStats:
+        """Returns how many requests reused open connections."""
+        stats = self._retired_stats.model_copy()
+        stats.http2_requests = self._http2_requests
+        adapters = {id(adapter): adapter for adapter in self._session.adapters.values()}
+        for adapter in adapters.values():
+            if not isinstance(adapter, HTTPAdapter):
+                continue
+            pools = adapter.poolmanager.pools
+            for pool_key in pools.keys():  # noqa: SIM118 (container is not iterable)
+                try:
+                    pool = pools[pool_key]
+                except KeyError:  # evicted meanwhile
+                    continue
+                stats.requests += pool.num_requests
+                stats.connections += pool.num_connections
+        return stats
+
+    def _is_multiplexable(self, *, stream: bool, kwargs: dict[str, Any]) -> bool:
+        """Whether a request is a small API call that can go through HTTP/2."""
+        return (
+            self._http2_client is not None
+            and not stream
+            and "files" not in kwargs
+            and not isinstance(kwargs.get("data"), bytes | bytearray)
+        )
+
+    def _request_http2(
+        self, *, method: HTTPMethods, payload: dict[str, Any], timeout: int, **kwargs
+    ) -> requests.Response:
+        """Sends a request through the HTTP/2 client."""
+        import httpx  # pyright: ignore[reportMissingImports]  # pyrefly: ignore[missing-import]
+
+        assert self._http2_client is not None, "HTTP/2 client not initialized"
+        for key in ("data", "params", "json"):
+            if key in kwargs:
+                kwargs[key] = _without_none_values(kwargs[key])
+        try:
+            response = self._http2_client.request(
+                method=str(method),
+                url=payload["url"],
+                headers=payload["headers"],
+                timeout=timeout,
+                **kwargs,
+            )
+        except httpx.HTTPError as err:
+            raise requests.exceptions.ConnectionError(str(err)) from err
+        self._http2_requests += 1
+        return _into_requests_response(response)
+
     def _headers(self) -> dict[str, str]:
         """Returns the headers for the request."""
         if not self._api_key:
@@ -205,12 +474,15 @@ class GatewayClient:
             timeout:        The timeout for the request.
             verbose:        Whether to log the request.
             **kwargs:       Additional arguments for the request e.g. URL params.
+                                Any `headers` are merged with the default ones.
         Returns:
             The response from the request.
         """
         payload = self.get_default_payload(
             endpoint=endpoint, asset_id=asset_id, endpoint_args=endpoint_args
         )
+        if extra_headers := kwargs.pop("headers", None):
+            payload["headers"] = {**payload["headers"], **extra_headers}
         if self.verbose or verbose:
             debug_str = f"GWY req: {method} {payload['url']}"
             if "params" in kwargs:
@@ -220,15 +492,24 @@ class GatewayClient:
             log.bind(cat=LogCategory.NETWORK).opt(depth=1).debug(debug_str)
 
         url = payload["url"]
+        request_timeout = self.timeout if timeout is None else timeout
         with LogContext(url=url):
             try:
-                response = self._session.request(
-                    timeout=self.timeout if timeout is None else timeout,
-                    method=method,
-                    stream=stream,
-                    **payload,
-                    **kwargs,
-                )
+                if self._is_multiplexable(stream=stream, kwargs=kwargs):
+                    response = self._request_http2(
+                        method=method,
+                        payload=payload,
+                        timeout=request_timeout,
+                        **kwargs,
+                    )
+                else:
+                    response = self._session.request(
+                        timeout=request_timeout,
+                        method=method,
+                        stream=stream,
+                        **payload,
+                        **kwargs,
+                    )
                 with LogContext(http_status=response.status_code):
                     return response
             except requests.exceptions.RequestException as err:
@@ -287,16 +568,39 @@ class GatewayClient:
         return content
 
     def get_file_contents_by_id(
-        self, uuid: str, *, verbose: bool = False
+        self,
+        uuid: str,
+        *,
+        start_byte: int = 0,
+        end_byte: int | None = None,
+        if_range: str | None = None,
+        verbose: bool = False,
     ) -> Iterator[bytes]:
         """Retrieves file contents from the SDS API.
 
+        When a byte range is requested and the server answers with the full
+            contents instead (e.g. the If-Range validator is stale or ranges
+            are not supported), the stream is trimmed to the requested range.
+
         Args:
-            uuid: The UUID of the file to retrieve as a hex string.
+            uuid:       The UUID of the file to retrieve as a hex string.
+            start_byte: Offset of the first byte to retrieve.
+            end_byte:   Offset of the last byte to retrieve (inclusive), or None
+                            to read until the end of the file.
+            if_range:   ETag the range is conditional on, from a previous response.
         Returns:
             The file contents as a byte stream.
+        Raises:
+            NetworkError: When the connection drops while streaming contents.
         """
         chunk_size: int = 8192
+        is_ranged = start_byte > 0 or end_byte is not None
+        headers: dict[str, str] = {}
+        if is_ranged:
+            range_end = "" if end_byte is None else str(end_byte)
+            headers["Range"] = f"bytes={start_byte}-{range_end}"
+            if if_range:
+                headers["If-Range"] = if_range
         with self._request(
             asset_id=None,  # uuid is passed as an endpoint_args
             endpoint_args={"uuid": uuid},
@@ -304,11 +608,84 @@ class GatewayClient:
             method=HTTPMethods.GET,
             stream=True,
             verbose=verbose,
+            headers=headers,
         ) as stream:
             network.success_or_raise(stream, ContextException=FileError)
-            for chunk in stream.iter_content(chunk_size=chunk_size):
-                if chunk:
-                    yield chunk
+            yield from _iter_range_of_stream(
+                stream,
+                start_byte=start_byte,
+                end_byte=end_byte,
+                chunk_size=chunk_size,
+                source=f"file {uuid}",
+            )
+
+    def get_file_download_url(self, uuid: str, *, verbose: bool = False) -> str | None:
+        """Requests a presigned URL to download file contents from object storage.
+
+        Args:
+            uuid: The UUID of the file as a hex string.
+        Returns:
+            The presigned URL, or None when the gateway can't hand out presigned
+                URLs for this file and it should be downloaded through the gateway.
+        Raises:
+            FileError: If the request fails otherwise.
+        """
+        response = self._request(
+            method=HTTPMethods.GET,
+            endpoint=Endpoints.FILE_DOWNLOAD_URL,
+            endpoint_args={"uuid": uuid},
+            verbose=verbose,
+        )
+        if response.status_code == HTTPStatus.CONFLICT:
+            return None
+        network.success_or_raise(response, ContextException=FileError)
+        return response.json()["url"]
+
+    def get_presigned_contents(
+        self,
+        url: str,
+        *,
+        start_byte: int = 0,
+        end_byte: int | None = None,
+    ) -> Iterator[bytes]:
+        """Streams file contents from a presigned object storage URL.
+
+        Args:
+            url:        The presigned URL from `get_file_download_url()`.
+            start_byte: Offset of the first byte to retrieve.
+            end_byte:   Offset of the last byte to retrieve (inclusive), or None
+                            to read until the end of the file.
+        Returns:
+            The file contents as a byte stream.
+        Raises:
+            NetworkError: When the connection fails or drops while streaming.
+        """
+        chunk_size: int = 8192
+        headers: dict[str, str] = {}
+        if start_byte > 0 or end_byte is not None:
+            range_end = "" if end_byte is None else str(end_byte)
+            headers["Range"] = f"bytes={start_byte}-{range_end}"
+        # presigned URLs carry their own credentials: no SDS auth headers here
+        try:
+            response = self._session.get(
+                url,
+                headers=headers,
+                stream=True,
+                timeout=self.timeout,
+                verify=not is_test_env(),
+            )
+        except requests.exceptions.RequestException as err:
+            msg = f"Network error: GET presigned file URL: {err}"
+            raise NetworkError(msg) from err
+        with response as stream:
+            network.success_or_raise(stream, ContextException=FileError)
+            yield from _iter_range_of_stream(
+                stream,
+                start_byte=start_byte,
+                end_byte=end_byte,
+                chunk_size=chunk_size,
+                source="presigned file URL",
+            )
 
     def list_files(
         self,
@@ -379,6 +756,47 @@ class GatewayClient:
         content: bytes | Any = response.content
         return FileContentsCheck.model_validate_json(content)
 
+    def check_files_contents_exist(
+        self,
+        file_instances: list[File],
+        *,
+        verbose: bool = False,
+    ) -> list[FileContentsCheck] | None:
+        """Checks if the contents of many files exist on the SDS API at once.
+
+        Args:
+            file_instances: The local files to check, up to
+                                `FILE_CONTENTS_CHECK_BATCH_SIZE` of them.
+        Returns:
+            One FileContentsCheck per file, in the same order,
+                OR None when the gateway doesn't support batch checks.
+        """
+        payload = {
+            "files": [
+                {
+                    "directory": str(file_instance.directory),
+                    "media_type": file_instance.media_type,
+                    "name": file_instance.name,
+                    "sum_blake3": file_instance.compute_sum_blake3(),
+                    "permissions": file_instance.permissions,
+                }
+                for file_instance in file_instances
+            ]
+        }
+        response = self._request(
+            method=HTTPMethods.POST,
+            endpoint=Endpoints.FILE_CONTENTS_CHECK_BATCH,
+            json=payload,
+            verbose=verbose,
+        )
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            return None
+        network.success_or_raise(response=response, ContextException=FileError)
+        return [
+            FileContentsCheck.model_validate(result)
+            for result in response.json()["results"]
+        ]
+
     def upload_new_file(
         self,
         file_instance: File,
@@ -428,6 +846,177 @@ class GatewayClient:
 
         return all_chunks
 
+    def upload_new_file_presigned(
+        self,
+        file_instance: File,
+        *,
+        verbose: bool = False,
+        progress_callback: Callable[[int], None] | None = None,
+    ) -> bytes | None:
+        """Uploads a local file straight to object storage through a presigned form.
+
+        The gateway verifies the uploaded contents against their checksum and
+            size before creating the file with the metadata given.
+
+        Args:
+            file_instance:     The file to upload, as a models.File instance.
+            progress_callback: Optional callable invoked with byte count as
+                data is read from the source file (for progress tracking).
+        Returns:
+            The response content from SDS Gateway, or None when presigned
+                uploads are unavailable and `upload_new_file()` should be used.
+        """
+        if file_instance.local_path is None:
+            msg = "Attempting to upload a remote file. Download it first."
+            raise FileError(msg)
+
+        payload = FileUpload.from_file(file_instance).model_dump(
+            context={"mode": PermissionRepresentation.STRING}
+        )
+        file_size = file_instance.local_path.stat().st_size
+        response = self._request(
+            method=HTTPMethods.POST,
+            endpoint=Endpoints.FILE_UPLOAD_URL,
+            json={
+                "sum_blake3": file_instance.compute_sum_blake3(),
+                "size": file_size,
+            },
+            verbose=verbose,
+        )
+        if response.status_code == HTTPStatus.CONFLICT:
+            return None
+        network.success_or_raise(response, ContextException=FileError)
+        upload_grant: dict[str, Any] = response.json()
+
+        file_ptr: BinaryIO = file_instance.local_path.open("rb")
+        if progress_callback is not None:
+            file_ptr = _ProgressFileReader(file_ptr, progress_callback)  # type: ignore[assignment]
+        # presigned forms carry their own credentials: no SDS auth headers here
+        with file_ptr:
+            form_body = _MultipartFormBody(upload_grant["fields"], file_ptr, file_size)
+            try:
+                post_response = self._session.post(
+                    upload_grant["url"],
+                    data=form_body,
+                    headers={
+                        "Content-Type": form_body.content_type,
+                        "Content-Length": str(len(form_body)),
+                    },
+                    timeout=self.timeout,
+                    verify=not is_test_env(),
+                )
+            except requests.exceptions.RequestException as err:
+                msg = f"Network error: POST presigned upload form: {err}"
+                raise NetworkError(msg) from err
+        network.success_or_raise(post_response, ContextException=FileError)
+
+        response = self._request(
+            method=HTTPMethods.POST,
+            endpoint=Endpoints.FILE_UPLOAD_COMPLETE,
+            data={**payload, "upload_token": upload_grant["upload_token"]},
+            verbose=verbose,
+        )
+        network.success_or_raise(response, ContextException=FileError)
+        content: bytes | Any = response.content
+        return content
+
+    def create_upload_session(
+        self, *, sum_blake3: str, size: int, verbose: bool = False
+    ) -> UploadSession | None:
+        """Starts a chunked upload of file contents.
+
+        Args:
+            sum_blake3: BLAKE3 checksum of the contents to upload.
+            size:       Size in bytes of the contents to upload.
+        Returns:
+            The new upload session, or None when the gateway doesn't support
+                upload sessions and `upload_new_file()` should be used.
+        """
+        response = self._request(
+            method=HTTPMethods.POST,
+            endpoint=Endpoints.FILE_UPLOAD_SESSIONS,
+            json={"sum_blake3": sum_blake3, "size": size},
+            verbose=verbose,
+        )
+        # older gateways route this path to a file detail, refusing the POST
+        if response.status_code in {
+            HTTPStatus.CONFLICT,
+            HTTPStatus.METHOD_NOT_ALLOWED,
+            HTTPStatus.NOT_FOUND,
+        }:
+            return None
+        network.success_or_raise(response, ContextException=FileError)
+        return UploadSession.model_validate_json(response.content)
+
+    def get_upload_session(
+        self, session_id: uuid.UUID, *, verbose: bool = False
+    ) -> UploadSession | None:
+        """Gets the state of an upload session, or None if it no longer exists."""
+        response = self._request(
+            method=HTTPMethods.GET,
+            endpoint=Endpoints.FILE_UPLOAD_SESSION,
+            endpoint_args={"session_id": session_id},
+            verbose=verbose,
+        )
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            return None
+        network.success_or_raise(response, ContextException=FileError)
+        return UploadSession.model_validate_json(response.content)
+
+    def upload_session_part(
+        self,
+        *,
+        session_id: uuid.UUID,
+        part_number: int,
+        data: bytes,
+        verbose: bool = False,
+    ) -> None:
+        """Uploads a part of the contents of an upload session.
+
+        The gateway checks the part against its BLAKE3 checksum as it arrives.
+        """
+        response = self._request(
+            method=HTTPMethods.PUT,
+            endpoint=Endpoints.FILE_UPLOAD_SESSION_PART,
+            endpoint_args={"session_id": session_id, "part_number": part_number},
+            data=data,
+            headers={
+                "Content-Type": "application/octet-stream",
+                "X-Part-Blake3": Blake3(data).hexdigest(),
+            },
+            verbose=verbose,
+        )
+        network.success_or_raise(response, ContextException=FileError)
+
+    def complete_upload_session(
+        self,
+        file_instance: File,
+        *,
+        session_id: uuid.UUID,
+        verbose: bool = False,
+    ) -> bytes:
+        """Creates a file from the contents uploaded to an upload session.
+
+        Args:
+            file_instance:  The file to create, as a models.File instance.
+            session_id:     The session all parts of the contents were uploaded to.
+        Returns:
+            The response content from SDS Gateway.
+        """
+        payload = FileUpload.from_file(file_instance).model_dump(
+            context={"mode": PermissionRepresentation.STRING}
+        )
+        response = self._request(
+            method=HTTPMethods.POST,
+            endpoint=Endpoints.FILE_UPLOAD_SESSION_COMPLETE,
+            endpoint_args={"session_id": session_id},
+            data=payload,
+            verbose=verbose,
+        )
+        network.success_or_raise(response, ContextException=FileError)
+        content: bytes | Any = response.content
+        return content
+
     def upload_new_file_metadata_only(
         self,
         file_instance: File,
@@ -645,9 +1234,13 @@ class GatewayClient:
         query_type: str,
         filter_value: str | dict[str, Any],
         verbose: bool = False,
+        cursor: str | None = None,
     ) -> bytes:
         """Advanced searches for captures using the SDS API.
 
+        Args:
+            cursor: Position of the page to get, from the "next" link of the
+                previous page of results; None for the first page.
         Returns:
             The response content from SDS Gateway.
         Raises:
@@ -660,11 +1253,14 @@ class GatewayClient:
                 "filter_value": filter_value,
             }
         ]
+        params: dict[str, str] = {"metadata_filters": json.dumps(metadata_filters)}
+        if cursor is not None:
+            params["cursor"] = cursor
         response = self._request(
             method=HTTPMethods.GET,
             endpoint=Endpoints.CAPTURES,
             verbose=verbose,
-            params={"metadata_filters": json.dumps(metadata_filters)},
+            params=params,
         )
         network.success_or_raise(response, ContextException=CaptureError)
         content: bytes | Any = response.content
@@ -2,7 +2,14 @@
 
 from spectrumx.models.files.file import File
 from spectrumx.models.files.file import FileUpload
+from spectrumx.models.files.listing import FileListing
 from spectrumx.models.files.permission import PermissionRepresentation
 from spectrumx.models.files.permission import UnixPermissionStr
 
-__all__ = ["File", "FileUpload", "PermissionRepresentation", "UnixPermissionStr"]
+__all__ = [
+    "File",
+    "FileListing",
+    "FileUpload",
+    "PermissionRepresentation",
+    "UnixPermissionStr",
+]
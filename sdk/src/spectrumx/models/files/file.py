@@ -10,6 +10,7 @@ from typing import Annotated
 from pydantic import ConfigDict
 from pydantic import Field
 
+from spectrumx import checksums
 from spectrumx import utils
 from spectrumx.models.base import SDSModel
 from spectrumx.models.captures import Capture
@@ -98,15 +99,15 @@ class File(SDSModel):
             The BLAKE3 checksum of the file,
                 OR None if the file is not available locally.
         """
-        # we deliberately don't cache the checksum because the file
-        # might be changed externally by a different process or the user.
+        # the checksum cache is keyed by the file's size, modification time,
+        # and inode, so files changed externally are hashed again.
         with self.contents_lock:
             # content downloads cannot start within this block
             if not self.is_local:
                 return None
             # this should not happen anyway, so let's just assert
             assert self.local_path is not None, "Local path is not set"
-            return utils.sum_blake3(self.local_path)
+            return checksums.get_checksum_cache().sum_blake3(self.local_path)
 
     @property
     def chmod_props(self) -> str:
@@ -0,0 +1,72 @@
+"""Compact records of files in SDS listings."""
+
+from pathlib import PurePosixPath
+from typing import Any
+from typing import NamedTuple
+
+from spectrumx.models.files.file import File
+
+
+class FileListing(NamedTuple):
+    """A file in a listing, without the validation and state of a `File`.
+
+    Records are plain tuples of the values returned by SDS, so very large
+        listings can be iterated with a fraction of the memory and time taken
+        by `File` instances. Timestamps are kept as the ISO 8601 strings sent by
+        SDS; use `to_file()` to get a validated `File` when one is needed.
+    """
+
+    uuid: str | None
+    name: str
+    directory: str
+    size: int
+    sum_blake3: str | None
+    media_type: str
+    permissions: str
+    created_at: str
+    updated_at: str
+    expiration_date: str | None = None
+    # related objects, as returned by SDS
+    owner: dict[str, Any] | None = None
+    captures: list[dict[str, Any]] | None = None
+    datasets: list[dict[str, Any]] | None = None
+
+    @classmethod
+    def from_entry(cls, entry: dict[str, Any]) -> "FileListing":
+        """Creates a record from an entry of a listing response."""
+        return cls(
+            uuid=entry.get("uuid"),
+            name=entry["name"],
+            directory=entry.get("directory", ""),
+            size=entry["size"],
+            sum_blake3=entry.get("sum_blake3"),
+            media_type=entry["media_type"],
+            permissions=entry["permissions"],
+            created_at=entry["created_at"],
+            updated_at=entry["updated_at"],
+            expiration_date=entry.get("expiration_date"),
+            owner=entry.get("owner"),
+            captures=entry.get("captures"),
+            datasets=entry.get("datasets"),
+        )
+
+    @classmethod
+    def from_file(cls, file: File) -> "FileListing":
+        """Creates a record from a `File`, e.g. a sample file in dry-run mode."""
+        return cls.from_entry(
+            file.model_dump(
+                mode="json", exclude={"is_sample", "local_path", "contents_lock"}
+            )
+        )
+
+    @property
+    def path(self) -> PurePosixPath:
+        """Returns the path to the file, relative to the owner's root on SDS."""
+        return PurePosixPath(self.directory) / self.name
+
+    def to_file(self) -> File:
+        """Validates the record into a `File`."""
+        return File(**self._asdict())
+
+
+__all__ = ["FileListing"]
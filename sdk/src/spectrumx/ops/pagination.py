@@ -5,6 +5,8 @@ import json
 import time
 import uuid
 from collections.abc import Callable
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Generic
@@ -17,15 +19,28 @@ from spectrumx.errors import FileError
 from spectrumx.errors import Unset
 from spectrumx.gateway import GatewayClient
 from spectrumx.models import SDSModel
+from spectrumx.models.files import FileListing
 from spectrumx.ops import files
 from spectrumx.utils import LogCategory
 from spectrumx.utils import log_user_warning
 
 if TYPE_CHECKING:
     from collections.abc import Generator
+    from collections.abc import Iterator
+
+try:
+    # optional: decodes large listing pages faster than the standard library
+    import orjson  # pyright: ignore[reportMissingImports]  # pyrefly: ignore[missing-import]
+
+    _loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 T = TypeVar("T", bound=SDSModel)
 
+# pages fetched ahead of the consumer by the file listings of the SDK
+DEFAULT_PREFETCH_PAGES: int = 2
+
 
 class Paginator(Generic[T]):
     """Manages the state for paginating through files in SDS.
@@ -35,6 +50,11 @@ class Paginator(Generic[T]):
     and fetching requests happen once per page. Iterating it also consumes the
     generator, so any yielded content should be stored if needed in the future.
 
+    With `prefetch_pages` set, once the first page is fetched (and with it the
+    total count), up to that many of the following pages are fetched in parallel
+    on background threads while the entries of the current page are consumed.
+    Entries are still yielded in page order.
+
     ## Usage example
 
     ```py
@@ -66,13 +86,18 @@ class Paginator(Generic[T]):
         process_file(my_file)
         # new pages are fetched automatically
 
+    # For large listings, compact records skip building `File` instances
+    for listing in dataset_paginator.listings():
+        if listing.size > 1_000_000:
+            process_file(listing.to_file())
+
     for _my_file in file_paginator:
         msg = "This will not run, as the paginator was consumed."
         raise AssertionError(msg)
     ```
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         *,
         Entry: type[SDSModel],  # noqa: N803
@@ -84,6 +109,7 @@ class Paginator(Generic[T]):
         start_page: int = 1,
         total_matches: int | None = None,
         verbose: bool = False,
+        prefetch_pages: int = 0,
     ) -> None:
         """Initializes the paginator with the required parameters.
 
@@ -98,6 +124,8 @@ class Paginator(Generic[T]):
             start_page:     The page number to start fetching from.
             total_matches:  The total number of entries across all pages.
             verbose:        If True, will log more information about the pagination.
+            prefetch_pages: Maximum number of pages fetched ahead of the consumer,
+                in parallel. Zero fetches each page only when it is needed.
         """
 
         # TODO: generalize this to any SDSModel subclass (too coupled to File now)
@@ -113,6 +141,9 @@ class Paginator(Generic[T]):
         ):  # pragma: no cover
             msg = "Total matches must be an integer."
             raise ValueError(msg)
+        if prefetch_pages < 0:  # pragma: no cover
+            msg = "Prefetch pages must be a non-negative integer."
+            raise ValueError(msg)
         if not callable(list_method):  # pragma: no cover
             msg = "List method must be callable."
             raise TypeError(msg)
@@ -136,14 +167,23 @@ class Paginator(Generic[T]):
         self._page_size = page_size
         self._total_matches = total_matches or 1
         self._verbose: bool = verbose
+        self._prefetch_pages = prefetch_pages
 
         # internal state
         self._has_fetched = False
         self._is_fetching: bool = False
         self._current_page_data: dict[str, Any] | None = None
-        self._current_page_entries: Generator[T] = iter(())
-        self._next_element: T | Unset = Unset()
+        # raw entries from the API, or sample entries in dry-run mode
+        self._current_page_entries: Iterator[dict[str, Any] | T] = iter(())
+        self._next_element: dict[str, Any] | T | Unset = Unset()
         self._yielded_count: int = 0
+        self._prefetch_executor: ThreadPoolExecutor | None = None
+        self._prefetched_pages: dict[int, Future[bytes]] = {}
+
+    def __del__(self) -> None:
+        """Stops fetching pages no one will consume."""
+        if hasattr(self, "_prefetched_pages"):
+            self._stop_prefetching()
 
     def __iter__(self) -> Self:
         """Returns the iterator object."""
@@ -151,6 +191,34 @@ class Paginator(Generic[T]):
 
     def __next__(self) -> T:
         """Returns the next entry in the pagination."""
+        entry = self._next_entry()
+        if isinstance(entry, dict):
+            return self._Entry(**entry)  # pyright: ignore[reportReturnType]
+        return entry
+
+    def listings(self) -> "Generator[FileListing]":
+        """Yields compact records of the remaining files, consuming the paginator.
+
+        Records skip the validation of `File` instances and use a fraction of
+            their memory, for iterating over large listings. They share pages
+            (and the iteration position) with the paginator itself.
+        """
+        if not issubclass(self._Entry, files.File):  # pragma: no cover
+            msg = f"Listing records are only available for files, not {self._Entry}"
+            raise TypeError(msg)
+        while True:
+            try:
+                entry = self._next_entry()
+            except StopIteration:
+                return
+            yield (
+                FileListing.from_entry(entry)
+                if isinstance(entry, dict)
+                else FileListing.from_file(entry)  # pyright: ignore[reportArgumentType]
+            )
+
+    def _next_entry(self) -> dict[str, Any] | T:
+        """Returns the next unparsed entry, fetching new pages as needed."""
         while self._next_element is not Unset or self._has_next_page:
             try:
                 self._next_element = next(self._current_page_entries)
@@ -213,6 +281,7 @@ class Paginator(Generic[T]):
         # try-finally to unset self._is_fetching when done
         try:
             if not self._has_next_page:
+                self._stop_prefetching()
                 msg = "No more pages available."
                 raise StopIteration(msg)
             if self.dry_run:
@@ -221,19 +290,10 @@ class Paginator(Generic[T]):
             else:
                 # try to fetch the next page
                 try:
-                    # Prepare kwargs for the listing method
-                    call_kwargs = self._list_kwargs.copy()
-                    call_kwargs.update(
-                        {
-                            "page": self._next_page,
-                            "page_size": self._page_size,
-                            "verbose": self._verbose,
-                        }
-                    )
-
-                    raw_page = self._list_method(**call_kwargs)
+                    raw_page = self._get_raw_page(self._next_page)
                     self._ingest_new_page(raw_page)
                 except FileError as err:  # pragma: no cover
+                    self._stop_prefetching()
                     # log an unexpected FileError if it happens
                     if "invalid page" not in str(err).lower():
                         msg = "Unexpected error while fetching the next page:"
@@ -242,9 +302,59 @@ class Paginator(Generic[T]):
                     raise StopIteration(msg) from err
             self._next_page += 1
             self._has_fetched = True  # `len(self)` is now valid
+            if not self.dry_run:
+                self._prefetch_following_pages()
         finally:
             self._is_fetching = False
 
+    def _list_page(self, page: int) -> bytes:
+        """Calls the listing method for a page."""
+        call_kwargs = self._list_kwargs.copy()
+        call_kwargs.update(
+            {
+                "page": page,
+                "page_size": self._page_size,
+                "verbose": self._verbose,
+            }
+        )
+        return self._list_method(**call_kwargs)
+
+    def _get_raw_page(self, page: int) -> bytes:
+        """Returns a page, waiting for it if it is being prefetched."""
+        prefetched = self._prefetched_pages.pop(page, None)
+        if prefetched is not None:
+            return prefetched.result()
+        return self._list_page(page)
+
+    def _prefetch_following_pages(self) -> None:
+        """Starts fetching the pages after the current one, up to the prefetch limit.
+
+        Pages past the last one known from the total count are not requested.
+        """
+        if self._prefetch_pages <= 0:
+            return
+        last_page = min(self._next_page + self._prefetch_pages - 1, self._total_pages)
+        for page in range(self._next_page, last_page + 1):
+            if page in self._prefetched_pages:
+                continue
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(
+                    max_workers=self._prefetch_pages,
+                    thread_name_prefix="sds-paginator",
+                )
+            self._prefetched_pages[page] = self._prefetch_executor.submit(
+                self._list_page, page
+            )
+
+    def _stop_prefetching(self) -> None:
+        """Cancels pending page fetches and releases the prefetching threads."""
+        for prefetched in self._prefetched_pages.values():
+            prefetched.cancel()
+        self._prefetched_pages.clear()
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+            self._prefetch_executor = None
+
     def _ingest_fake_page(self) -> None:
         """Loads a fake page into memory for dry-run mode."""
         self._total_matches = int(self._page_size * 2.5)  # targeting 3 pages
@@ -272,8 +382,8 @@ class Paginator(Generic[T]):
             requests, so this will update these control variables accordingly.
         """
         try:
-            self._current_page_data = json.loads(raw_page)
-        except json.JSONDecodeError as err:  # pragma: no cover
+            self._current_page_data = _loads(raw_page)
+        except ValueError as err:  # both decoders raise a subclass  # pragma: no cover
             msg = "Failed to load page data: failed to decode the JSON response."
             raise TypeError(msg) from err
         if not isinstance(self._current_page_data, dict):  # pragma: no cover
@@ -287,14 +397,8 @@ class Paginator(Generic[T]):
                         log_user_warning(w)
         if "count" in self._current_page_data:
             self._total_matches = self._current_page_data["count"]
-        self._current_page_entries = (
-            (
-                self._Entry(**entry_data)
-                for entry_data in self._current_page_data["results"]
-            )
-            if "results" in self._current_page_data
-            else iter(())
-        )
+        # entries are only parsed into models as they are consumed
+        self._current_page_entries = iter(self._current_page_data.get("results", ()))
 
 
 def _process_file_fake(my_file: files.File) -> None:  # pragma: no cover
@@ -140,12 +140,25 @@ def get_random_line(length: int, *, include_punctuation: bool = True) -> str:
     )
 
 
+CHECKSUM_READ_SIZE: int = 1024 * 1024  # 1 MiB
+
+
 def sum_blake3(file_path: Path) -> str:
-    """Calculates the BLAKE3 checksum of a file."""
+    """Calculates the BLAKE3 checksum of a file.
+
+    Files are memory-mapped when possible, falling back to large buffered reads
+        for files that can't be mapped (e.g. pipes or some network filesystems).
+    """
     checksum = Blake3()
-    with file_path.open("rb") as file:
-        for chunk in iter(lambda: file.read(4096), b""):
-            checksum.update(chunk)
+    try:
+        checksum.update_mmap(file_path)
+    except OSError:
+        if not file_path.exists():
+            raise
+        checksum = Blake3()
+        with file_path.open("rb") as file:
+            for chunk in iter(lambda: file.read(CHECKSUM_READ_SIZE), b""):
+                checksum.update(chunk)
     return checksum.hexdigest()
 
 
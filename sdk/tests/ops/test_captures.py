@@ -1141,6 +1141,59 @@ def test_search_captures_exact_match(
     assert capture.capture_type.value == sample_capture_data["capture_type"]
 
 
+def test_search_captures_follows_cursor_pages(
+    client: Client,
+    responses: responses.RequestsMock,
+    sample_capture_data: dict[str, Any],
+) -> None:
+    """Test searching captures returns the results of all pages."""
+    # ARRANGE
+    client.dry_run = False
+    search_endpoint = get_captures_endpoint(client)
+    second_capture_data = {**sample_capture_data, "uuid": str(uuid4())}
+    responses.add(
+        method=responses.GET,
+        url=search_endpoint,
+        status=200,
+        json={
+            "results": [sample_capture_data],
+            "next": f"{search_endpoint}?metadata_filters=%5B%5D&cursor=page-2",
+            "previous": None,
+            "count": 2,
+        },
+    )
+    responses.add(
+        method=responses.GET,
+        url=search_endpoint,
+        status=200,
+        json={
+            "results": [second_capture_data],
+            "next": None,
+            "previous": f"{search_endpoint}?page=1",
+            "count": 2,
+        },
+    )
+
+    # ACT
+    captures = client.captures.advanced_search(
+        field_path="capture_props.center_freq",
+        query_type="range",
+        filter_value={"gte": 1990000000, "lte": 2010000000},
+    )
+
+    # ASSERT
+    assert [str(capture.uuid) for capture in captures] == [
+        sample_capture_data["uuid"],
+        second_capture_data["uuid"],
+    ]
+    assert len(responses.calls) == 2  # noqa: PLR2004
+    first_query = parse_qs(responses.calls[0].request.url.split("?", 1)[1])
+    second_query = parse_qs(responses.calls[1].request.url.split("?", 1)[1])
+    assert "cursor" not in first_query
+    assert second_query["cursor"] == ["page-2"]
+    assert second_query["metadata_filters"] == first_query["metadata_filters"]
+
+
 def test_upload_capture_with_name_dry_run(
     client: Client, tmp_path: Path, test_state_persistence: bool
 ) -> None:
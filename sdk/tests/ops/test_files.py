@@ -5,6 +5,7 @@ import json
 import sys
 import tempfile
 import uuid as uuidlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC
 from datetime import datetime
 from datetime import timedelta
@@ -16,6 +17,7 @@ from unittest.mock import patch
 
 import pytest
 import responses
+from blake3 import blake3 as Blake3  # noqa: N812
 from spectrumx import Client
 from spectrumx.api.sds_files import (  # pyright: ignore[reportPrivateUsage]
     __download_file_contents,
@@ -29,22 +31,29 @@ from spectrumx.api.sds_files import (  # pyright: ignore[reportPrivateUsage]
 from spectrumx.api.sds_files import (  # pyright: ignore[reportPrivateUsage]
     __upload_new_file_metadata_only,
 )
+from spectrumx.api.sds_files import check_contents_exist_in_batches
 from spectrumx.api.sds_files import delete_file
 from spectrumx.api.sds_files import download_file
 from spectrumx.api.sds_files import file_list_time_query_param
 from spectrumx.api.sds_files import list_files
 from spectrumx.api.sds_files import upload_file
 from spectrumx.api.uploads import UploadPersistenceManager
+from spectrumx.api.uploads import UploadSessionStore
 from spectrumx.errors import FileError
+from spectrumx.errors import NetworkError
 from spectrumx.errors import SDSError
 from spectrumx.gateway import API_TARGET_VERSION
+from spectrumx.gateway import FileContentsCheck
+from spectrumx.gateway import UploadSession
 from spectrumx.models.files import File
 from spectrumx.ops.files import (
     _load_undesired_globs,  # pyright: ignore[reportPrivateUsage]
 )
+from spectrumx.ops.files import construct_file
 from spectrumx.ops.files import get_file_permissions
 from spectrumx.ops.files import is_valid_file
 
+from tests.conftest import get_content_check_batch_endpoint
 from tests.conftest import get_content_check_endpoint
 from tests.conftest import get_file_detach_from_datasets_url
 from tests.conftest import get_files_endpoint
@@ -1152,6 +1161,181 @@ def test_download_file_contents_error_cleanup(
     assert len(temp_files) == 0, f"Temp files not cleaned up: {temp_files}"
 
 
+def _remote_file_instance(file_id: uuidlib.UUID, contents: bytes) -> File:
+    """File instance as listed by SDS, with a checksum of the given contents."""
+    now_ts = datetime(2024, 12, 1, 12, 0, 0, tzinfo=UTC)
+    return File(
+        uuid=file_id,
+        name="resumable.bin",
+        media_type="application/octet-stream",
+        size=len(contents),
+        sum_blake3=Blake3(contents).hexdigest(),
+        directory=PurePosixPath("/test/"),
+        permissions="rw-r--r--",
+        created_at=now_ts,
+        updated_at=now_ts,
+        expiration_date=datetime(2026, 12, 1, 12, 0, 0, tzinfo=UTC),
+    )
+
+
+def test_download_file_resumes_from_partial_file(
+    client: Client, tmp_path: Path, responses: responses.RequestsMock
+) -> None:
+    """A partial download left behind is resumed with a conditional range request."""
+    client.dry_run = False
+    file_id = uuidlib.uuid4()
+    contents = b"0123456789" * 10
+    file_instance = _remote_file_instance(file_id, contents)
+    target_path = tmp_path / "resumable.bin"
+    partial_path = tmp_path / f".tmp-{target_path.name}.{file_id.hex}.downloading"
+    partial_path.write_bytes(contents[:40])
+
+    responses.add(
+        method=responses.GET,
+        url=_download_file_endpoint(client, file_id=file_id.hex),
+        status=206,
+        body=contents[40:],
+    )
+    progress: list[int] = []
+    download_file(
+        client=client,
+        file_instance=file_instance,
+        to_local_path=target_path,
+        progress_callback=progress.append,
+    )
+
+    assert target_path.read_bytes() == contents
+    assert not partial_path.exists(), "Partial file must be moved into place"
+    request_headers = responses.calls[0].request.headers
+    assert request_headers["Range"] == "bytes=40-"
+    assert request_headers["If-Range"] == f'"{file_instance.sum_blake3}"'
+    assert sum(progress) == len(contents), "Resumed bytes must count as progress"
+
+
+def test_download_file_keeps_partial_file_when_interrupted(
+    client: Client, tmp_path: Path
+) -> None:
+    """Dropped connections are resumed in-call; the partial file outlives failures."""
+    client.dry_run = False
+    file_id = uuidlib.uuid4()
+    contents = b"abcdefghij" * 3
+    file_instance = _remote_file_instance(file_id, contents)
+    target_path = tmp_path / "resumable.bin"
+    requested_offsets: list[int] = []
+
+    def _dropping_stream(*, uuid: str, start_byte: int = 0, **_kwargs):
+        requested_offsets.append(start_byte)
+        yield contents[start_byte : start_byte + 5]
+        msg = "connection dropped"
+        raise NetworkError(msg)
+
+    with (
+        patch.object(
+            client._gateway,
+            "get_file_contents_by_id",
+            side_effect=_dropping_stream,
+        ),
+        pytest.raises(NetworkError, match="connection dropped"),
+    ):
+        download_file(
+            client=client, file_instance=file_instance, to_local_path=target_path
+        )
+
+    assert requested_offsets == [0, 5, 10], "Each attempt must resume the last one"
+    assert not target_path.exists()
+    partial_files = list(tmp_path.glob("*.downloading"))
+    assert len(partial_files) == 1
+    assert partial_files[0].read_bytes() == contents[:15]
+
+
+def test_download_file_checksum_mismatch(
+    client: Client, tmp_path: Path, responses: responses.RequestsMock
+) -> None:
+    """Contents that don't match the SDS checksum are discarded."""
+    client.dry_run = False
+    file_id = uuidlib.uuid4()
+    file_instance = _remote_file_instance(file_id, b"expected contents")
+    target_path = tmp_path / "resumable.bin"
+
+    responses.add(
+        method=responses.GET,
+        url=_download_file_endpoint(client, file_id=file_id.hex),
+        status=200,
+        body=b"corrupted content",
+    )
+    with pytest.raises(FileError, match="Checksum mismatch"):
+        download_file(
+            client=client, file_instance=file_instance, to_local_path=target_path
+        )
+
+    assert not target_path.exists()
+    assert list(tmp_path.glob("*.downloading")) == []
+
+
+def test_download_file_in_parallel_parts(client: Client, tmp_path: Path) -> None:
+    """Large files are split into ranged parts fetched in parallel."""
+    client.dry_run = False
+    client._config.max_download_parts = 4
+    file_id = uuidlib.uuid4()
+    contents = bytes(range(256)) * 40
+    file_instance = _remote_file_instance(file_id, contents)
+    target_path = tmp_path / "resumable.bin"
+    requested_ranges: list[tuple[int, int | None]] = []
+
+    def _ranged_stream(
+        *, uuid: str, start_byte: int = 0, end_byte: int | None = None, **_kwargs
+    ):
+        requested_ranges.append((start_byte, end_byte))
+        stop = len(contents) if end_byte is None else end_byte + 1
+        yield contents[start_byte:stop]
+
+    with (
+        patch("spectrumx.api.sds_files.DOWNLOAD_MIN_PART_SIZE", 1024),
+        patch.object(
+            client._gateway, "get_file_contents_by_id", side_effect=_ranged_stream
+        ),
+    ):
+        download_file(
+            client=client, file_instance=file_instance, to_local_path=target_path
+        )
+
+    assert target_path.read_bytes() == contents
+    assert sorted(requested_ranges) == [
+        (0, 2559),
+        (2560, 5119),
+        (5120, 7679),
+        (7680, 10239),
+    ]
+
+
+def test_download_file_from_presigned_url(client: Client, tmp_path: Path) -> None:
+    """With presigned transfers enabled, contents come straight from the store."""
+    client.dry_run = False
+    client._config.presigned_transfers = True
+    file_id = uuidlib.uuid4()
+    contents = b"presigned" * 20
+    file_instance = _remote_file_instance(file_id, contents)
+    target_path = tmp_path / "resumable.bin"
+    presigned_url = "https://storage.example.com/files/object?X-Amz-Signature=abc"
+
+    with (
+        patch.object(
+            client._gateway, "get_file_download_url", return_value=presigned_url
+        ),
+        patch.object(
+            client._gateway, "get_presigned_contents", return_value=iter([contents])
+        ) as mock_presigned,
+        patch.object(client._gateway, "get_file_contents_by_id") as mock_gateway,
+    ):
+        download_file(
+            client=client, file_instance=file_instance, to_local_path=target_path
+        )
+
+    assert target_path.read_bytes() == contents
+    mock_presigned.assert_called_once_with(presigned_url, start_byte=0)
+    mock_gateway.assert_not_called()
+
+
 def test_delete_file_get_file_fails(
     client: Client, responses: responses.RequestsMock
 ) -> None:
@@ -2146,6 +2330,270 @@ def test_upload_contents_and_metadata_dry_run_direct(
     assert result is file_instance, "Should return the input file instance unchanged"
 
 
+def test_upload_contents_and_metadata_presigned_fallback(client: Client) -> None:
+    """Uploads go through the gateway when presigned uploads are unavailable."""
+    client.dry_run = False
+    client._config.presigned_transfers = True
+    file_id = uuidlib.uuid4()
+    file_instance = File(
+        uuid=file_id,
+        name="fallback.txt",
+        media_type="text/plain",
+        size=100,
+        directory=PurePosixPath("/fallback"),
+        permissions="rw-r--r--",
+        created_at=datetime(2024, 12, 1, 12, 0, 0, tzinfo=UTC),
+        updated_at=datetime(2024, 12, 1, 12, 0, 0, tzinfo=UTC),
+        expiration_date=datetime(2026, 12, 1, 12, 0, 0, tzinfo=UTC),
+    )
+
+    with (
+        patch.object(
+            client._gateway, "upload_new_file_presigned", return_value=None
+        ) as mock_presigned,
+        patch.object(
+            client._gateway,
+            "upload_new_file",
+            return_value=file_instance.model_dump_json().encode(),
+        ) as mock_upload,
+    ):
+        result = __upload_contents_and_metadata(
+            client=client,
+            file_instance=file_instance,
+        )
+
+    mock_presigned.assert_called_once()
+    mock_upload.assert_called_once()
+    assert result.uuid == file_id
+
+
+def _upload_session(
+    *, size: int, part_size: int, missing_parts: list[int]
+) -> UploadSession:
+    return UploadSession(
+        uuid=uuidlib.uuid4(),
+        size=size,
+        part_size=part_size,
+        num_parts=-(-size // part_size),
+        missing_parts=missing_parts,
+        status="active",
+        expires_at=datetime.now(UTC) + timedelta(days=1),
+    )
+
+
+def test_upload_contents_in_parts_above_threshold(
+    client: Client, tmp_path: Path
+) -> None:
+    """Files above the threshold are uploaded in parts of the session's size."""
+    client.dry_run = False
+    client._config.chunked_upload_threshold = 16
+    local_path = tmp_path / "large.bin"
+    contents = b"0123456789" * 4
+    local_path.write_bytes(contents)
+    file_instance = construct_file(local_path, sds_path=PurePosixPath("/large"))
+    session = _upload_session(size=len(contents), part_size=16, missing_parts=[1, 2, 3])
+    progress: list[int] = []
+
+    with (
+        patch.object(
+            client._gateway, "create_upload_session", return_value=session
+        ) as mock_create,
+        patch.object(client._gateway, "upload_session_part") as mock_part,
+        patch.object(
+            client._gateway,
+            "complete_upload_session",
+            return_value=file_instance.model_dump_json().encode(),
+        ) as mock_complete,
+        patch.object(client._gateway, "upload_new_file") as mock_upload,
+    ):
+        __upload_contents_and_metadata(
+            client=client,
+            file_instance=file_instance,
+            progress_callback=progress.append,
+        )
+
+    mock_create.assert_called_once_with(
+        sum_blake3=file_instance.compute_sum_blake3(), size=len(contents)
+    )
+    sent_parts = [call.kwargs["data"] for call in mock_part.call_args_list]
+    assert sent_parts == [contents[:16], contents[16:32], contents[32:]]
+    mock_complete.assert_called_once_with(file_instance, session_id=session.uuid)
+    mock_upload.assert_not_called()
+    assert sum(progress) == len(contents)
+    assert UploadSessionStore().get(local_path, file_instance.compute_sum_blake3()) is (
+        None
+    )
+
+
+def test_upload_contents_in_parts_resumes_session(
+    client: Client, tmp_path: Path
+) -> None:
+    """Interrupted uploads only send the parts missing from their session."""
+    client.dry_run = False
+    client._config.chunked_upload_threshold = 16
+    local_path = tmp_path / "large.bin"
+    contents = b"0123456789" * 4
+    local_path.write_bytes(contents)
+    file_instance = construct_file(local_path, sds_path=PurePosixPath("/large"))
+    sum_blake3 = file_instance.compute_sum_blake3()
+    session = _upload_session(size=len(contents), part_size=16, missing_parts=[2])
+    UploadSessionStore().set(local_path, sum_blake3, session.uuid.hex)
+
+    with (
+        patch.object(
+            client._gateway, "get_upload_session", return_value=session
+        ) as mock_get,
+        patch.object(client._gateway, "create_upload_session") as mock_create,
+        patch.object(
+            client._gateway,
+            "upload_session_part",
+            side_effect=[NetworkError("connection reset"), None],
+        ) as mock_part,
+        patch.object(
+            client._gateway,
+            "complete_upload_session",
+            return_value=file_instance.model_dump_json().encode(),
+        ),
+    ):
+        __upload_contents_and_metadata(client=client, file_instance=file_instance)
+
+    mock_get.assert_called_once_with(session.uuid)
+    mock_create.assert_not_called()
+    # the failed part is retried on its own
+    assert [call.kwargs["part_number"] for call in mock_part.call_args_list] == [2, 2]
+    assert mock_part.call_args.kwargs["data"] == contents[16:32]
+    assert UploadSessionStore().get(local_path, sum_blake3) is None
+
+
+def test_upload_session_store_shared_by_concurrent_uploads(tmp_path: Path) -> None:
+    """Stores of files uploaded concurrently don't lose each other's sessions."""
+    store_path = tmp_path / "upload_sessions.json"
+    local_paths = [tmp_path / f"file_{idx}.bin" for idx in range(20)]
+
+    def record_session(local_path: Path) -> None:
+        UploadSessionStore(store_path).set(local_path, "0" * 64, local_path.stem)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(record_session, local_paths))
+
+    store = UploadSessionStore(store_path)
+    assert [store.get(local_path, "0" * 64) for local_path in local_paths] == [
+        local_path.stem for local_path in local_paths
+    ]
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_upload_contents_in_parts_fallback(client: Client, tmp_path: Path) -> None:
+    """Large files are uploaded whole when the gateway has no upload sessions."""
+    client.dry_run = False
+    client._config.chunked_upload_threshold = 16
+    local_path = tmp_path / "large.bin"
+    local_path.write_bytes(b"0123456789" * 4)
+    file_instance = construct_file(local_path, sds_path=PurePosixPath("/large"))
+
+    with (
+        patch.object(client._gateway, "create_upload_session", return_value=None),
+        patch.object(
+            client._gateway,
+            "upload_new_file",
+            return_value=file_instance.model_dump_json().encode(),
+        ) as mock_upload,
+    ):
+        __upload_contents_and_metadata(client=client, file_instance=file_instance)
+
+    mock_upload.assert_called_once()
+
+
+def test_check_contents_exist_in_batches(
+    client: Client, tmp_path: Path, responses: responses.RequestsMock
+) -> None:
+    """Contents of many files are checked with one request per batch."""
+    client.dry_run = False
+    local_paths = []
+    for idx in range(3):
+        local_path = tmp_path / f"file_{idx}.txt"
+        local_path.write_text(f"contents {idx}", encoding="utf-8")
+        local_paths.append(local_path)
+    sibling_id = uuidlib.uuid4()
+
+    def _batch_callback(request) -> tuple[int, dict, str]:
+        entries = json.loads(request.body)["files"]
+        results = [
+            {
+                "file_exists_in_tree": False,
+                "file_contents_exist_for_user": entry["name"] == "file_1.txt",
+                "user_mutable_attributes_differ": True,
+                "asset_id": sibling_id.hex if entry["name"] == "file_1.txt" else None,
+            }
+            for entry in entries
+        ]
+        return 200, {}, json.dumps({"results": results})
+
+    responses.add_callback(
+        method=responses.POST,
+        url=get_content_check_batch_endpoint(client),
+        callback=_batch_callback,
+        content_type="application/json",
+    )
+    with patch("spectrumx.api.sds_files.FILE_CONTENTS_CHECK_BATCH_SIZE", 2):
+        contents_checks = check_contents_exist_in_batches(
+            client=client, local_files=local_paths, sds_path="/batch"
+        )
+
+    assert contents_checks is not None
+    assert [check.file_contents_exist_for_user for check in contents_checks] == [
+        False,
+        True,
+        False,
+    ]
+    assert contents_checks[1].asset_id == sibling_id
+    assert len(responses.calls) == 2, "Expected one request per batch"
+    first_batch = json.loads(responses.calls[0].request.body)["files"]
+    assert [entry["name"] for entry in first_batch] == ["file_0.txt", "file_1.txt"]
+    assert first_batch[0]["directory"] == "/batch"
+    assert first_batch[0]["sum_blake3"] == Blake3(b"contents 0").hexdigest()
+
+
+def test_check_contents_exist_in_batches_unsupported(
+    client: Client, tmp_path: Path, responses: responses.RequestsMock
+) -> None:
+    """Gateways without batch checks make uploads check files one by one."""
+    client.dry_run = False
+    local_path = tmp_path / "file.txt"
+    local_path.write_text("contents", encoding="utf-8")
+    responses.add(
+        method=responses.POST,
+        url=get_content_check_batch_endpoint(client),
+        status=404,
+    )
+
+    assert (
+        check_contents_exist_in_batches(client=client, local_files=[local_path]) is None
+    )
+
+
+def test_upload_file_with_contents_check_skips_request(
+    client: Client, tmp_path: Path, responses: responses.RequestsMock
+) -> None:
+    """Files already checked in a batch are not checked again when uploaded."""
+    client.dry_run = False
+    local_path = tmp_path / "file.txt"
+    local_path.write_text("contents", encoding="utf-8")
+    contents_check = FileContentsCheck(
+        file_contents_exist_for_user=True,
+        file_exists_in_tree=True,
+        user_mutable_attributes_differ=False,
+        asset_id=uuidlib.uuid4(),
+    )
+
+    uploaded = upload_file(
+        client=client, local_file=local_path, contents_check=contents_check
+    )
+
+    assert uploaded.local_path == local_path
+    assert len(responses.calls) == 0, "Existing files must be skipped without requests"
+
+
 def test_download_file_temp_target_failure(
     client: Client, responses: responses.RequestsMock
 ) -> None:
@@ -4,6 +4,9 @@
 
 import json
 import logging
+import threading
+import time
+import tracemalloc
 import uuid
 from collections.abc import Generator
 from pathlib import PurePosixPath
@@ -11,9 +14,10 @@ from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
-from loguru import logger as log  # noqa: F401
+from loguru import logger as log
 from spectrumx.gateway import GatewayClient
 from spectrumx.models.files import File
+from spectrumx.models.files import FileListing
 from spectrumx.ops import files as sx_files
 from spectrumx.ops.pagination import Paginator
 
@@ -436,3 +440,119 @@ def test_paginator_logs_api_warnings_on_first_page(
     )
     assert len(paginator) == 1
     assert any(warn_msg in r.getMessage() for r in caplog.records)
+
+
+def test_paginator_prefetches_pages_in_parallel_and_in_order(
+    gateway: GatewayClient,
+) -> None:
+    """Prefetched pages are requested concurrently but yielded in page order."""
+    page_size = 2
+    total_count = 7  # 4 pages
+    sample_files = [
+        sx_files.generate_sample_file(uuid.uuid4()) for _ in range(total_count)
+    ]
+    both_in_flight = threading.Barrier(2, timeout=5)
+    requested_pages: list[int] = []
+
+    def side_effect(**kwargs: object) -> bytes:
+        page = kwargs["page"]
+        assert isinstance(page, int)
+        requested_pages.append(page)
+        if page in (2, 3):
+            # fails unless both prefetched pages are fetched at the same time
+            both_in_flight.wait()
+        if page == 2:
+            time.sleep(0.05)  # finish after page 3
+        start = (page - 1) * page_size
+        results = [
+            json.loads(file_obj.model_dump_json())
+            for file_obj in sample_files[start : start + page_size]
+        ]
+        return json.dumps({"count": total_count, "results": results}).encode()
+
+    gateway.list_files.side_effect = side_effect
+    paginator = Paginator[File](
+        Entry=File,
+        gateway=gateway,
+        list_method=gateway.list_files,
+        list_kwargs={"sds_path": "/path/to/files"},
+        page_size=page_size,
+        dry_run=False,
+        prefetch_pages=2,
+    )
+
+    assert len(paginator) == total_count
+    assert bool(paginator) is True
+    consumed = list(paginator)
+
+    assert [file_obj.uuid for file_obj in consumed] == [
+        file_obj.uuid for file_obj in sample_files
+    ]
+    assert sorted(requested_pages) == [1, 2, 3, 4], "Each page is fetched once"
+    assert paginator._prefetch_executor is None, "Threads released when exhausted"
+
+
+def _listing_page(file_objs: list[File]) -> bytes:
+    results = [json.loads(file_obj.model_dump_json()) for file_obj in file_objs]
+    return json.dumps({"count": len(results), "results": results}).encode()
+
+
+def test_paginator_listings_yield_compact_records(gateway: GatewayClient) -> None:
+    """Listing records hold the entry values and validate into equal files."""
+    sample_files = [sx_files.generate_sample_file(uuid.uuid4()) for _ in range(3)]
+    gateway.list_files.return_value = _listing_page(sample_files)
+    paginator = Paginator[File](
+        Entry=File,
+        gateway=gateway,
+        list_method=gateway.list_files,
+        list_kwargs={"sds_path": "/path/to/files"},
+        dry_run=False,
+    )
+
+    listings = list(paginator.listings())
+
+    assert all(isinstance(listing, FileListing) for listing in listings)
+    assert [listing.uuid for listing in listings] == [
+        str(file_obj.uuid) for file_obj in sample_files
+    ]
+    for listing, file_obj in zip(listings, sample_files, strict=True):
+        assert listing.path == file_obj.path
+        rebuilt = listing.to_file()
+        assert rebuilt.uuid == file_obj.uuid
+        assert rebuilt.size == file_obj.size
+        assert rebuilt.created_at == file_obj.created_at
+    assert list(paginator) == [], "Listing records consume the paginator"
+
+
+def test_paginator_listings_use_less_memory_than_files(
+    gateway: GatewayClient,
+) -> None:
+    """Compact records take a fraction of the memory of `File` instances."""
+    entry_count = 500
+    sample_file = sx_files.generate_sample_file(uuid.uuid4())
+    raw_page = _listing_page([sample_file] * entry_count)
+
+    def retained_bytes(*, compact: bool) -> int:
+        gateway.list_files.return_value = raw_page
+        paginator = Paginator[File](
+            Entry=File,
+            gateway=gateway,
+            list_method=gateway.list_files,
+            list_kwargs={"sds_path": "/path/to/files"},
+            page_size=entry_count + 1,  # a single page
+            dry_run=False,
+        )
+        len(paginator)  # decode the page before measuring
+        tracemalloc.start()
+        try:
+            entries = list(paginator.listings() if compact else paginator)
+            retained, _peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert len(entries) == entry_count
+        return retained
+
+    compact_bytes = retained_bytes(compact=True)
+    file_bytes = retained_bytes(compact=False)
+    log.info(f"{entry_count} entries: {compact_bytes=:,} vs {file_bytes=:,}")
+    assert compact_bytes * 2 < file_bytes
@@ -0,0 +1,200 @@
+"""Tests for the persistent checksum cache."""
+
+# pyright: reportPrivateUsage=false
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from blake3 import blake3 as Blake3  # noqa: N812
+from spectrumx import checksums
+from spectrumx.api.uploads import UploadWorkload
+from spectrumx.checksums import ChecksumCache
+from spectrumx.checksums import checksum_persistence
+from spectrumx.checksums import get_checksum_cache
+from spectrumx.client import Client
+from spectrumx.utils import sum_blake3
+
+
+def _expected_sum(contents: bytes) -> str:
+    return Blake3(contents).hexdigest()
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ChecksumCache:
+    return ChecksumCache(tmp_path / "cache" / "checksums.jsonl")
+
+
+def test_sum_blake3_matches_in_memory_hash(tmp_path: Path) -> None:
+    """Memory-mapped hashing matches hashing the contents in memory."""
+    contents = os.urandom(3 * 1024 * 1024 + 17)
+    file_path = tmp_path / "large.bin"
+    file_path.write_bytes(contents)
+    empty_path = tmp_path / "empty.bin"
+    empty_path.write_bytes(b"")
+
+    assert sum_blake3(file_path) == _expected_sum(contents)
+    assert sum_blake3(empty_path) == _expected_sum(b"")
+
+
+def test_cache_hashes_unchanged_files_once(
+    cache: ChecksumCache, tmp_path: Path
+) -> None:
+    """Repeated lookups of an unchanged file don't read it again."""
+    file_path = tmp_path / "data.bin"
+    file_path.write_bytes(b"spectrum")
+
+    with patch.object(checksums, "sum_blake3", wraps=sum_blake3) as mock_sum:
+        first = cache.sum_blake3(file_path)
+        second = cache.sum_blake3(file_path)
+
+    assert first == second == _expected_sum(b"spectrum")
+    mock_sum.assert_called_once()
+
+
+def test_cache_rehashes_modified_files(cache: ChecksumCache, tmp_path: Path) -> None:
+    """A change in size or modification time invalidates the cached checksum."""
+    file_path = tmp_path / "data.bin"
+    file_path.write_bytes(b"before")
+    assert cache.sum_blake3(file_path) == _expected_sum(b"before")
+
+    file_path.write_bytes(b"after!")
+    stat_result = file_path.stat()
+    os.utime(file_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1000))
+
+    assert cache.sum_blake3(file_path) == _expected_sum(b"after!")
+
+
+def test_cache_persists_across_instances(cache: ChecksumCache, tmp_path: Path) -> None:
+    """Checksums are loaded from the cache file by new cache instances."""
+    file_path = tmp_path / "data.bin"
+    file_path.write_bytes(b"persisted")
+    cache.sum_blake3(file_path)
+
+    new_cache = ChecksumCache(cache.cache_path)
+    with patch.object(checksums, "sum_blake3") as mock_sum:
+        assert new_cache.sum_blake3(file_path) == _expected_sum(b"persisted")
+    mock_sum.assert_not_called()
+
+
+def test_cache_compacts_outdated_entries(cache: ChecksumCache, tmp_path: Path) -> None:
+    """Loading a cache file with mostly outdated lines rewrites it."""
+    file_path = tmp_path / "data.bin"
+    for idx in range(4):
+        file_path.write_bytes(f"version {idx}".encode())
+        stat_result = file_path.stat()
+        os.utime(file_path, ns=(stat_result.st_atime_ns, idx * 10**9))
+        cache.sum_blake3(file_path)
+    assert len(cache.cache_path.read_text().splitlines()) == 4
+
+    ChecksumCache(cache.cache_path)._load()
+
+    lines = cache.cache_path.read_text().splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["sum_blake3"] == _expected_sum(b"version 3")
+
+
+def test_cache_prunes_missing_and_changed_files(
+    cache: ChecksumCache, tmp_path: Path
+) -> None:
+    """Entries of files that were deleted or changed are dropped when loaded."""
+    kept_path = tmp_path / "kept.bin"
+    deleted_path = tmp_path / "deleted.bin"
+    changed_path = tmp_path / "changed.bin"
+    for file_path in (kept_path, deleted_path, changed_path):
+        file_path.write_bytes(file_path.name.encode())
+        cache.sum_blake3(file_path)
+    deleted_path.unlink()
+    changed_path.write_bytes(b"changed contents")
+
+    entries = ChecksumCache(cache.cache_path)._load()
+
+    assert list(entries) == [str(kept_path.resolve())]
+    lines = cache.cache_path.read_text().splitlines()
+    assert [json.loads(line)["resolved_path"] for line in lines] == list(entries)
+
+
+def test_cache_is_not_written_without_persistence(
+    cache: ChecksumCache, tmp_path: Path
+) -> None:
+    """Checksums computed in dry runs are only cached in memory."""
+    file_path = tmp_path / "data.bin"
+    file_path.write_bytes(b"dry run")
+
+    with checksum_persistence(enabled=False):
+        assert cache.sum_blake3(file_path) == _expected_sum(b"dry run")
+        with patch.object(checksums, "sum_blake3") as mock_sum:
+            cache.sum_blake3(file_path)
+        mock_sum.assert_not_called()
+
+    assert not cache.cache_path.exists()
+
+
+def test_cache_ignores_corrupted_lines(cache: ChecksumCache, tmp_path: Path) -> None:
+    """Unparseable lines in the cache file are skipped."""
+    file_path = tmp_path / "data.bin"
+    file_path.write_bytes(b"contents")
+    cache.sum_blake3(file_path)
+    with cache.cache_path.open("a", encoding="utf-8") as f:
+        f.write("not json\n")
+
+    new_cache = ChecksumCache(cache.cache_path)
+    assert new_cache.sum_blake3(file_path) == _expected_sum(b"contents")
+
+
+def test_sum_many_in_process_pool(cache: ChecksumCache, tmp_path: Path) -> None:
+    """Many files are hashed in parallel, skipping files that can't be read."""
+    file_paths = []
+    for idx in range(5):
+        file_path = tmp_path / f"file_{idx}.bin"
+        file_path.write_bytes(f"contents {idx}".encode())
+        file_paths.append(file_path)
+    missing_path = tmp_path / "missing.bin"
+
+    results = cache.sum_many([*file_paths, missing_path], max_workers=2)
+
+    assert results == {
+        file_path: _expected_sum(f"contents {idx}".encode())
+        for idx, file_path in enumerate(file_paths)
+    }
+    with patch.object(checksums, "sum_blake3") as mock_sum:
+        assert cache.sum_blake3(file_paths[0]) == results[file_paths[0]]
+    mock_sum.assert_not_called()
+
+
+def test_default_cache_follows_state_home(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The default cache is stored next to the persisted upload records."""
+    monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path / "other_state"))
+    cache = get_checksum_cache()
+    assert cache.cache_path == (
+        tmp_path / "other_state" / "spectrumx" / "uploads" / "checksums.jsonl"
+    )
+    assert get_checksum_cache() is cache
+
+
+@pytest.mark.anyio
+async def test_discovery_precomputes_checksums(tmp_path: Path, client: Client) -> None:
+    """Discovery hashes files in parallel when more than one worker is set."""
+    root = tmp_path / "upload_root"
+    root.mkdir()
+    for idx in range(3):
+        (root / f"file_{idx}.txt").write_text(f"content {idx}", encoding="utf-8")
+
+    workload = UploadWorkload(
+        client=client, local_root=root, persist_state=False, checksum_workers=2
+    )
+    with patch.object(
+        ChecksumCache, "sum_many", autospec=True, return_value={}
+    ) as mock_sum_many:
+        discovered = await workload._discover_files()
+
+    assert len(discovered) == 3
+    mock_sum_many.assert_called_once()
+    assert mock_sum_many.call_args.kwargs["max_workers"] == 2
+    assert sorted(mock_sum_many.call_args.args[1]) == sorted(
+        sds_file.local_path for sds_file in discovered
+    )
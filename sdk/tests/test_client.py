@@ -3,6 +3,7 @@
 # pyright: reportPrivateUsage=false
 
 import re
+import threading
 import uuid
 from enum import IntEnum
 from pathlib import Path
@@ -1949,3 +1950,125 @@ def test_upload_multichannel_cleanup_none_uuid(
         )
     assert result == []
     assert len(delete_recorder.calls) == 0
+
+
+# ======================================================================
+# Concurrent download engine
+# ======================================================================
+
+
+def test_download_concurrent_preserves_order_and_bytes(
+    client: Client, tmp_path: Path
+) -> None:
+    """Concurrent downloads return results in source order with full byte totals."""
+    client.dry_run = False
+    sample_files = [files.generate_sample_file(uuid.uuid4()) for _ in range(12)]
+    for idx, file_info in enumerate(sample_files):
+        file_info.size = 1000 + idx
+    seen_threads: set[str] = set()
+
+    def fake_download_single_file(*, file_info: File, progress_callback=None, **_):
+        seen_threads.add(threading.current_thread().name)
+        if progress_callback is not None:
+            progress_callback(file_info.size // 2)
+        return Result(value=file_info)
+
+    with patch.object(
+        Client, "download_single_file", side_effect=fake_download_single_file
+    ):
+        results = client.download(
+            files_to_download=sample_files,
+            to_local_path=tmp_path,
+            verbose=False,
+            max_concurrent_downloads=4,
+        )
+
+    assert [result() for result in results] == sample_files
+    assert all(name.startswith("sds-download") for name in seen_threads)
+
+
+def test_download_concurrent_accepts_paginator(client: Client, tmp_path: Path) -> None:
+    """A Paginator source is consumed while downloads are already running."""
+    client.dry_run = False
+    sample_files = [files.generate_sample_file(uuid.uuid4()) for _ in range(5)]
+    paginator = _MockPaginator(sample_files)
+    bytes_downloaded_shared: list[int] = [0]
+    prog_bar = _RecordingProgressBar()
+    prog_bar.total = None  # pyright: ignore[reportAttributeAccessIssue]
+
+    with (
+        patch.object(
+            Client,
+            "download_single_file",
+            side_effect=lambda *, file_info, **_: Result(value=file_info),
+        ),
+        patch("spectrumx.client.get_prog_bar", return_value=prog_bar),
+    ):
+        results = client._download_files_concurrently(
+            files_to_download=paginator,  # pyright: ignore[reportArgumentType]
+            total_bytes_total=None,
+            to_local_path=tmp_path,
+            skip_contents=False,
+            overwrite=False,
+            verbose=True,
+            prefix="Downloading:",
+            max_workers=2,
+            period=30.0,
+            bytes_downloaded_shared=bytes_downloaded_shared,
+        )
+
+    expected_bytes = sum(f.size for f in sample_files)
+    assert len(results) == len(sample_files)
+    assert all(results)
+    assert prog_bar.total == expected_bytes  # pyright: ignore[reportAttributeAccessIssue]
+    assert bytes_downloaded_shared[0] == expected_bytes
+    assert sum(prog_bar.updates) == expected_bytes
+
+
+def test_download_concurrent_records_failures(client: Client, tmp_path: Path) -> None:
+    """Failed files are reported per file without stopping the other workers."""
+    client.dry_run = False
+    sample_files = [files.generate_sample_file(uuid.uuid4()) for _ in range(4)]
+    failing = sample_files[1]
+
+    def fake_download_single_file(*, file_info: File, **_):
+        if file_info is failing:
+            return Result(exception=SDSError("boom"), error_info={"file": file_info})
+        return Result(value=file_info)
+
+    with patch.object(
+        Client, "download_single_file", side_effect=fake_download_single_file
+    ):
+        results = client.download(
+            files_to_download=sample_files,
+            to_local_path=tmp_path,
+            verbose=False,
+            max_concurrent_downloads=3,
+        )
+
+    assert [bool(result) for result in results] == [True, False, True, True]
+
+
+def test_download_concurrent_uses_config_default(tmp_path: Path) -> None:
+    """The config option selects the concurrent engine when no override is given."""
+    client = Client(
+        host="sds-dev.crc.nd.edu",
+        env_config={"MAX_CONCURRENT_DOWNLOADS": "3"},
+    )
+    assert client.config.max_concurrent_downloads == 3
+    with patch.object(
+        Client, "_download_files_concurrently", return_value=[]
+    ) as concurrent_download:
+        client.download(files_to_download=[], to_local_path=tmp_path, verbose=False)
+    assert concurrent_download.call_args.kwargs["max_workers"] == 3
+
+
+def test_download_rejects_invalid_concurrency(client: Client, tmp_path: Path) -> None:
+    """A worker count below one is rejected."""
+    with pytest.raises(ValueError, match="max_concurrent_downloads"):
+        client.download(
+            files_to_download=[],
+            to_local_path=tmp_path,
+            verbose=False,
+            max_concurrent_downloads=0,
+        )
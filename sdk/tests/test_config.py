@@ -260,3 +260,15 @@ def test_deprecated_timeout_key_warns_but_does_not_set_timeout(
     assert "deprecated" in caplog.text
     # The dropped value did not take effect — the default survives.
     assert config.timeout == SDSConfig().timeout
+
+
+def test_connection_options(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """HTTP_POOL_SIZE and HTTP2 configure the connections to the gateway."""
+    monkeypatch.chdir(tmp_path)
+    config = SDSConfig(
+        env_file=None,
+        env_config={"HTTP_POOL_SIZE": "32", "HTTP2": "true"},
+        verbose=False,
+    )
+    assert config.http_pool_size == 32
+    assert config.http2 is True
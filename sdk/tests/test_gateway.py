@@ -6,7 +6,9 @@
 from __future__ import annotations
 
 import io
+import json
 import logging
+import sys
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -19,8 +21,10 @@ from urllib.parse import urlencode
 import pytest
 import requests
 import responses
+from blake3 import blake3 as Blake3  # noqa: N812
 from loguru import logger as loguru_logger
 from pytz import UTC
+from requests.adapters import HTTPAdapter
 from spectrumx.errors import AuthError
 from spectrumx.errors import FileError
 from spectrumx.errors import NetworkError
@@ -29,6 +33,7 @@ from spectrumx.gateway import GatewayClient
 from spectrumx.gateway import HTTPMethods
 from spectrumx.gateway import _ProgressFileReader
 from spectrumx.models.files import File
+from spectrumx.ops.files import construct_file
 
 # ---------------------------------------------------------------------------
 # helpers
@@ -323,6 +328,70 @@ def test_get_file_contents_by_id_skips_empty_chunks() -> None:
         assert chunks == [b"chunk1", b"chunk2"]
 
 
+@responses.activate
+def test_get_file_contents_by_id_sends_range_headers() -> None:
+    """Ranged requests send Range and If-Range and yield the partial content."""
+    gw = _make_gateway()
+    responses.add(
+        responses.GET,
+        "http://localhost:80/api/v1/assets/files/some-uuid/download/",
+        body=b"world",
+        status=206,
+    )
+    chunks = list(
+        gw.get_file_contents_by_id(
+            "some-uuid", start_byte=6, end_byte=10, if_range='"etag"'
+        )
+    )
+    assert b"".join(chunks) == b"world"
+    request_headers = responses.calls[0].request.headers
+    assert request_headers["Range"] == "bytes=6-10"
+    assert request_headers["If-Range"] == '"etag"'
+    assert request_headers["Authorization"].startswith("Api-Key: ")
+
+
+@responses.activate
+def test_get_file_contents_by_id_trims_full_response_to_range() -> None:
+    """When the server ignores the range, the full body is trimmed to it."""
+    gw = _make_gateway()
+    responses.add(
+        responses.GET,
+        "http://localhost:80/api/v1/assets/files/some-uuid/download/",
+        body=b"hello-world",
+        status=200,
+    )
+    with patch.object(
+        requests.Response,
+        "iter_content",
+        return_value=iter([b"hel", b"lo-w", b"orld"]),
+    ):
+        chunks = list(gw.get_file_contents_by_id("some-uuid", start_byte=4, end_byte=8))
+    assert b"".join(chunks) == b"o-wor"
+
+
+@responses.activate
+def test_get_file_contents_by_id_dropped_stream_raises_network_error() -> None:
+    """A connection dropped mid-stream surfaces as a NetworkError."""
+    gw = _make_gateway()
+    responses.add(
+        responses.GET,
+        "http://localhost:80/api/v1/assets/files/some-uuid/download/",
+        body=b"irrelevant",
+        status=200,
+    )
+
+    def _dropped_stream(*_args: Any, **_kwargs: Any):
+        yield b"partial"
+        msg = "connection dropped"
+        raise requests.exceptions.ChunkedEncodingError(msg)
+
+    with (
+        patch.object(requests.Response, "iter_content", _dropped_stream),
+        pytest.raises(NetworkError, match="connection dropped"),
+    ):
+        list(gw.get_file_contents_by_id("some-uuid"))
+
+
 # ---------------------------------------------------------------------------
 # update_existing_file_metadata
 # ---------------------------------------------------------------------------
@@ -420,6 +489,149 @@ def test_upload_new_file_raises_file_error_when_no_local_path() -> None:
         gw.upload_new_file(file_instance)
 
 
+# ---------------------------------------------------------------------------
+# presigned transfers
+# ---------------------------------------------------------------------------
+
+_PRESIGNED_URL = "http://localhost:19000/spectrumx/files/object?X-Amz-Signature=abc"
+
+
+@responses.activate
+def test_get_file_download_url_returns_none_when_unavailable() -> None:
+    """A 409 from the gateway means the file must be downloaded through it."""
+    gw = _make_gateway()
+    responses.add(
+        responses.GET,
+        "http://localhost:80/api/v1/assets/files/some-uuid/download-url/",
+        json={"detail": "Presigned transfers are not enabled."},
+        status=409,
+    )
+    assert gw.get_file_download_url("some-uuid") is None
+
+
+@responses.activate
+def test_get_presigned_contents_skips_sds_credentials() -> None:
+    """Presigned URLs are fetched without SDS auth headers, honouring ranges."""
+    gw = _make_gateway()
+    responses.add(responses.GET, _PRESIGNED_URL, body=b"world", status=206)
+    chunks = list(gw.get_presigned_contents(_PRESIGNED_URL, start_byte=6))
+    assert b"".join(chunks) == b"world"
+    request_headers = responses.calls[0].request.headers
+    assert request_headers["Range"] == "bytes=6-"
+    assert "Authorization" not in request_headers
+
+
+@responses.activate
+def test_upload_new_file_presigned(tmp_path: Path) -> None:
+    """Contents go straight to object storage; the gateway gets the metadata."""
+    gw = _make_gateway()
+    local_file = tmp_path / "presigned.txt"
+    local_file.write_bytes(b"presigned contents")
+    file_instance = construct_file(local_file, sds_path=PurePosixPath("/some/dir"))
+    responses.add(
+        responses.POST,
+        "http://localhost:80/api/v1/assets/files/upload-url/",
+        json={
+            "url": _PRESIGNED_URL,
+            "fields": {"key": "files/object", "policy": "signed-policy"},
+            "expires_in": 900,
+            "upload_token": "tkn",
+        },
+        status=200,
+    )
+    responses.add(responses.POST, _PRESIGNED_URL, status=204)
+    responses.add(
+        responses.POST,
+        "http://localhost:80/api/v1/assets/files/upload-complete/",
+        body=b'{"uuid": "created"}',
+        status=201,
+    )
+    progress: list[int] = []
+
+    result = gw.upload_new_file_presigned(
+        file_instance, progress_callback=progress.append
+    )
+
+    assert result == b'{"uuid": "created"}'
+    url_request, form_request, complete_request = (
+        call.request for call in responses.calls
+    )
+    assert json.loads(url_request.body) == {
+        "sum_blake3": file_instance.compute_sum_blake3(),
+        "size": len(b"presigned contents"),
+    }
+    assert "Authorization" not in form_request.headers
+    assert form_request.headers["Content-Type"].startswith("multipart/form-data")
+    form_body = form_request.body
+    assert isinstance(form_body, bytes)
+    assert int(form_request.headers["Content-Length"]) == len(form_body)
+    # object storage needs the contents after the other fields
+    assert form_body.index(b'name="key"\r\n\r\nfiles/object\r\n') < form_body.index(
+        b"presigned contents"
+    )
+    assert sum(progress) == len(b"presigned contents")
+    complete_payload = parse_qs(complete_request.body)
+    assert complete_payload["upload_token"] == ["tkn"]
+    assert complete_payload["name"] == ["presigned.txt"]
+
+
+@responses.activate
+def test_upload_new_file_presigned_returns_none_when_unavailable(
+    tmp_path: Path,
+) -> None:
+    """No contents are sent when the gateway refuses presigned uploads."""
+    gw = _make_gateway()
+    local_file = tmp_path / "presigned.txt"
+    local_file.write_bytes(b"presigned contents")
+    file_instance = construct_file(local_file, sds_path=PurePosixPath("/some/dir"))
+    responses.add(
+        responses.POST,
+        "http://localhost:80/api/v1/assets/files/upload-url/",
+        json={"detail": "Presigned transfers are not enabled."},
+        status=409,
+    )
+    assert gw.upload_new_file_presigned(file_instance) is None
+    assert len(responses.calls) == 1
+
+
+# ---------------------------------------------------------------------------
+# chunked upload sessions
+# ---------------------------------------------------------------------------
+
+_SESSION_ID = uuid.UUID("00000000-0000-4000-8000-000000000001")
+
+
+@responses.activate
+def test_create_upload_session_returns_none_when_unavailable() -> None:
+    """Refused or unknown upload sessions mean the whole file must be uploaded."""
+    gw = _make_gateway()
+    url = "http://localhost:80/api/v1/assets/files/upload-sessions/"
+    responses.add(responses.POST, url, status=409)
+    responses.add(responses.POST, url, status=405)
+    for _ in range(2):
+        assert gw.create_upload_session(sum_blake3="0" * 64, size=10) is None
+
+
+@responses.activate
+def test_upload_session_part_sends_raw_part_with_checksum() -> None:
+    """Parts are sent as raw request bodies, along with their BLAKE3 checksum."""
+    gw = _make_gateway()
+    responses.add(
+        responses.PUT,
+        f"http://localhost:80/api/v1/assets/files/upload-sessions/{_SESSION_ID}"
+        "/parts/2/",
+        json={"part_number": 2},
+        status=200,
+    )
+    gw.upload_session_part(session_id=_SESSION_ID, part_number=2, data=b"part data")
+
+    request = responses.calls[0].request
+    assert request.body == b"part data"
+    assert request.headers["Content-Type"] == "application/octet-stream"
+    assert request.headers["X-Part-Blake3"] == Blake3(b"part data").hexdigest()
+    assert request.headers["Authorization"].startswith("Api-Key")
+
+
 # ---------------------------------------------------------------------------
 # create_capture
 # ---------------------------------------------------------------------------
@@ -550,3 +762,53 @@ def test_list_files_with_start_end_time() -> None:
         end_time="2024-12-31T23:59:59Z",
     )
     assert result == b'{"files": []}'
+
+
+# ---------------------------------------------------------------------------
+# connection pool
+# ---------------------------------------------------------------------------
+
+
+def _adapter_pool_size(gw: GatewayClient) -> int:
+    adapter = gw._session.get_adapter("https://localhost")
+    assert isinstance(adapter, HTTPAdapter)
+    return adapter._pool_maxsize  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def test_pool_size_sets_adapter_pool() -> None:
+    """The pool size is the number of connections kept alive per host."""
+    gw = _make_gateway(pool_size=24)
+    assert gw.pool_size == 24
+    assert _adapter_pool_size(gw) == 24
+
+
+def test_ensure_pool_size_only_grows_and_keeps_stats() -> None:
+    """Growing the pool remounts adapters without losing their connection stats."""
+    gw = _make_gateway(pool_size=4)
+    adapter = gw._session.get_adapter("http://localhost")
+    assert isinstance(adapter, HTTPAdapter)
+    pool = adapter.poolmanager.connection_from_url("http://localhost:80")
+    pool.num_requests = 5
+    pool.num_connections = 2
+
+    gw.ensure_pool_size(2)
+    assert _adapter_pool_size(gw) == 4
+
+    gw.ensure_pool_size(16)
+    assert _adapter_pool_size(gw) == 16
+    stats = gw.connection_stats()
+    assert stats.requests == 5
+    assert stats.connections == 2
+    assert stats.reused_connections == 3
+
+
+def test_http2_falls_back_without_httpx() -> None:
+    """Without the optional httpx dependency, requests use the HTTP/1.1 pool."""
+    with (
+        patch.dict(sys.modules, {"httpx": None}),
+        patch("spectrumx.gateway.log_user_warning") as warn,
+    ):
+        gw = _make_gateway(http2=True)
+    assert gw._http2_client is None
+    warn.assert_called_once()
+    assert not gw._is_multiplexable(stream=False, kwargs={})
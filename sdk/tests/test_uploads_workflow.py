@@ -20,7 +20,9 @@ from spectrumx.api.uploads import SkippedUpload
 from spectrumx.api.uploads import UploadWorkload
 from spectrumx.api.uploads import create_file_instance
 from spectrumx.errors import Result
+from spectrumx.errors import SDSError
 from spectrumx.errors import UploadError
+from spectrumx.gateway import FileContentsCheck
 from spectrumx.models.files.file import File
 from spectrumx.ops import files as file_ops
 from tqdm import tqdm
@@ -958,8 +960,9 @@ async def test_concurrent_upload_progress_bar_byte_count(
         local_file: File,
         sds_path: PurePosixPath,
         progress_callback: Callable[[int], None] | None = None,
+        contents_check: FileContentsCheck | None = None,
     ) -> File:
-        del client, sds_path
+        del client, sds_path, contents_check
         if progress_callback is not None:
             for _ in range(chunks_per_file):
                 progress_callback(chunk_size)
@@ -977,3 +980,69 @@ async def test_concurrent_upload_progress_bar_byte_count(
         assert workload._prog_uploaded_bytes.n == expected_bytes, (
             "Expected progress bar byte count to match total uploaded bytes"
         )
+
+
+@pytest.mark.anyio
+async def test_contents_checked_in_batches_before_uploads(
+    upload_workload: UploadWorkload, tmp_path: Path
+) -> None:
+    """Files are checked in batches once, and workers reuse the results."""
+    files = [
+        _create_mock_file(name=f"file_{idx}.bin", local_path=tmp_path / f"f{idx}.bin")
+        for idx in range(3)
+    ]
+    for file_obj in files:
+        await upload_workload._register_discovered_file(file_obj)
+    contents_checks = [
+        FileContentsCheck(
+            file_contents_exist_for_user=bool(idx % 2),
+            file_exists_in_tree=False,
+            user_mutable_attributes_differ=True,
+        )
+        for idx in range(len(files))
+    ]
+    received_checks: dict[Path, FileContentsCheck | None] = {}
+
+    def fake_upload_file(
+        *, local_file: File, contents_check: FileContentsCheck | None, **_kwargs
+    ) -> File:
+        received_checks[local_file.local_path] = contents_check
+        return local_file
+
+    with (
+        patch.object(
+            upload_workload.client._sds_files,
+            "check_contents_exist_in_batches",
+            return_value=contents_checks,
+        ) as mock_batch_check,
+        patch.object(
+            upload_workload.client._sds_files,
+            "upload_file",
+            side_effect=fake_upload_file,
+        ),
+    ):
+        await upload_workload._check_contents_in_batches()
+        await upload_workload._execute_uploads()
+
+    mock_batch_check.assert_called_once()
+    assert received_checks == {
+        file_obj.local_path: check
+        for file_obj, check in zip(files, contents_checks, strict=True)
+    }
+
+
+@pytest.mark.anyio
+async def test_contents_check_in_batches_failure_falls_back(
+    upload_workload: UploadWorkload, mock_file: File
+) -> None:
+    """When batch checks fail, workers check each file on their own."""
+    await upload_workload._register_discovered_file(mock_file)
+
+    with patch.object(
+        upload_workload.client._sds_files,
+        "check_contents_exist_in_batches",
+        side_effect=SDSError("batch check failed"),
+    ):
+        await upload_workload._check_contents_in_batches()
+
+    assert upload_workload._contents_checks == {}